@@ -7,7 +7,13 @@ and scale the whole scene uniformly to the target (WIDTH/HEIGHT).
 
 Any new hard pixel values added in QML should normally refer to the logical
 design coordinate system (DESIGN_*), so they will scale automatically.
+
+``flag(name)`` and ``path(name, env)`` at the end read settings with their
+environment overrides.
 """
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
 # TARGET (physical) resolution
 WIDTH = 1280
@@ -23,6 +29,108 @@ SCALE = WIDTH / DESIGN_WIDTH  # = 2/3 for 1280->1920
 # SERIAL
 SERIAL_DEV = "/dev/ttyACM0"
 BAUD = 2_000_000
+# "snapshot": reader publishes the latest frame, GUI applies it once per rendered frame
+# "direct": reader calls Telemetry.updateFromChannels for every frame (legacy)
+FRAME_HANDOFF = "snapshot"
+# "select": block on the port fd and drain all pending bytes per wakeup
+# "poll": fixed 64-byte reads with a 50 ms timeout (legacy)
+SERIAL_READ_MODE = "select"
+SERIAL_READ_MAX = 4096
+SERIAL_SELECT_TIMEOUT_S = 0.5  # only bounds how long stop() takes to be noticed
+SERIAL_STOP_TIMEOUT_S = 1.5  # on exit the GUI thread waits at most this long for the reader (or serial process) to close
+# reconnect: the device directory is watched with inotify (src/hotplug.py); these bound the
+# back-off between open attempts when no event arrives (or inotify is unavailable)
+SERIAL_RETRY_MIN_S = 0.05
+SERIAL_RETRY_MAX_S = 1.0
+STALE_AFTER_S = 0.5  # no frame for this long (or no port): TEL.stale, QML greys the values out
+
+# SERIAL PROCESS (port, decoding, recorder, bus and session log in a child process; see src/io_process.py and src/serial_child.py)
+SERIAL_PROCESS = False  # env SERIAL_PROCESS=1 enables
+SERIAL_PROCESS_SHM = "/dev/shm/virtual-cluster.io"  # snapshots to the Qt process; ".<pid>" is appended
+SERIAL_PROCESS_RESTART_S = 1.0  # respawn delay after the child died
+SERIAL_PROCESS_DISTANCE_KM = 0.001  # the child reports its integrated distance in steps of this
+# CPU affinity: "" = any, else a list like "1" or "2,3"; env SERIAL_CPUS / GUI_CPUS override.
+# SERIAL_CPUS pins the serial process (or the reader thread), GUI_CPUS the Qt process.
+SERIAL_CPUS = ""
+GUI_CPUS = ""
+
+# SETTINGS (data/data.json, one coalescing writer)
+SETTINGS_WRITE_DELAY_S = 1.0
+
+# DISTANCE (integrated per decoded frame, see src/odometer.py)
+DISTANCE_MAX_GAP_S = 1.0  # longer gaps between frames are dropped, not bridged
+
+# DISTANCE JOURNAL (data/distance.journal, compacted into data/data.json)
+# fsync policy: "always" (every record), "interval" (at most every JOURNAL_FSYNC_INTERVAL_S), "never" (OS decides)
+JOURNAL_FSYNC = "interval"
+JOURNAL_FSYNC_INTERVAL_S = 5.0
+JOURNAL_COMPACT_EVERY = 100  # records (0.1 km each) between snapshot rewrites
+
+# TELEMETRY BUS (shared memory for local readers, see src/telemetry_bus.py; off unless set, e.g. "/dev/shm/virtual-cluster.bus";
+# env TELEMETRY_BUS=<path> overrides, 0 disables)
+TELEMETRY_BUS_PATH = None
+
+# IDLE GOVERNOR (lower wakeup/render rate while nothing moves; env IDLE_GOVERNOR=0 disables; see src/idle.py)
+IDLE_GOVERNOR = True
+IDLE_AFTER_S = 5.0  # this long without movement -> idle
+IDLE_CHECK_S = 1.0  # movement check period while active
+IDLE_BANDS = {'rpm': 150, 'leftBlink': 1, 'rightBlink': 1}  # movement bands wider than the channel deadband (idle rpm hunts)
+IDLE_PUBLISH_S = 0.25  # idle: frames within their bands reach Telemetry at most this often (moving ones at once)
+IDLE_DEMO_INTERVAL_MS = 100
+
+# DERIVED CHANNELS (gear, fuel consumption, AFR average, time at redline; see src/derived.py)
+GEARBOX_RATIOS = (3.136, 1.888, 1.330, 1.000, 0.814)  # 1st..top
+FINAL_DRIVE = 4.30
+TYRE_CIRCUMFERENCE_M = 1.94
+GEAR_TOLERANCE = 0.08  # rpm/km/h within +-8 % of a gear's ratio counts as that gear
+GEAR_MIN_KMH = 4.0  # below this the gear shows neutral (0)
+GEAR_CONFIRM_FRAMES = 3  # a new gear must hold this many frames before it is shown
+FUEL_MIN_KMH = 5.0  # instantaneous l/100 km shows 0 below this
+AFR_AVG_TAU_S = 2.0
+REDLINE_RPM = 5994  # redlineTime threshold and TEL.dynamicRedline without a redline map (with one: its lowest, cold value until the input arrives)
+
+# CALIBRATION (sensor curves and the oil temperature redline as dense lookup tables; see src/calibration.py)
+CALIBRATION_PATH = "data/calibration.json"  # relative to the project root; env CALIBRATION=<path> overrides, 0 disables
+
+# SESSION LOG (per drive column chunks + 1/10/60 s pyramids, see src/session_log.py; env SESSION_LOG=<dir> overrides, 0 disables)
+SESSION_LOG_DIR = "data/sessions"  # relative to the project root
+SESSION_CHUNK_ROWS = 8192  # rows per column block handed to the writer thread
+SESSION_QUEUE_CHUNKS = 8  # chunks the writer may fall behind before new ones are dropped
+SESSION_SPLIT_S = 300  # no data for this long (ignition off) closes the session; the next data starts a new one
+SESSION_FLUSH_S = 5.0  # a partial chunk is written after this long at the latest (what a power cut can lose)
+SESSION_MAX_SESSIONS = 200  # oldest sessions are deleted beyond this many (at start and when a session begins; 0 = no limit)
+SESSION_MAX_MB = 2048  # ... or while all sessions together take more than this on disk (0 = no limit)
+
+# RAW FRAME RECORDER (mmap ring file, fixed size; env FRAME_RECORD=<path> overrides)
+FRAME_RECORD_PATH = None  # e.g. "/home/pi/frames.ring"
+FRAME_RECORD_HOURS = 4
+FRAME_RECORD_RATE_HZ = 200
+FRAME_RECORD_SLOT_BYTES = 56  # 13 B slot header + frames up to 43 B (v2 with all 11 channels)
+
+# STATIC LAYER CACHE (pre-rendered gauge scales/backgrounds; env LAYER_CACHE_DIR overrides)
+LAYER_CACHE_DIR = "data/layer_cache"  # relative to the project root
+LAYER_CACHE_MEM_ITEMS = 16
+
+# ICON ATLAS (assets/ pre-scaled to the target resolution in one image; see src/icon_atlas.py)
+ICON_ATLAS_DIR = "data/icon_atlas"  # relative to the project root; env ICON_ATLAS=<dir> overrides, 0 serves the originals
+
+# LATENCY PROBE (serial byte -> frame swapped, shown in DevPanel; env LATENCY_PROBE=1 enables)
+LATENCY_PROBE = False
+LATENCY_WINDOW = 1024  # samples kept per stage
+LATENCY_DUMP_PATH = "data/latency.json"  # written on SIGUSR1, relative to the project root
+
+# SIGNAL STATS (per-channel emits/s, unchanged/held sets and QML handler time; DevPanel, JSON on exit; env SIGNAL_STATS=1 enables)
+SIGNAL_STATS = False
+SIGNAL_STATS_DUMP_PATH = "data/signal_stats.json"  # relative to the project root
+
+# STARTUP (env FAST_BOOT=0 disables; see src/boot.py)
+FAST_BOOT = True
+QML_CACHE_DIR = "data/qmlcache"  # compiled QML (QML_DISK_CACHE_PATH), relative to the project root
+
+# SYNTHETIC DRIVE (demo mode and load tests, see src/synthetic.py)
+SYNTH_RATE_HZ = 100  # rows per second of the precomputed cycle (demo); load tests build their own
+SYNTH_TANK_L = 0.6  # tiny tank so one ~2.5 min cycle drains the gauge visibly
+SYNTH_PROFILE = "sweep"  # demo mode: "sweep" (every gauge through its full range) or "drive" (the cycle); env DEMO_PROFILE overrides
 
 # DEMO
 DEMO_FALLBACK = True
@@ -31,3 +139,26 @@ DEMO_FALLBACK = True
 FRAME_MAGIC = 0xA55A
 FRAME_VERSION = 1
 FRAME_LEN_BYTES = 14
+# v2 frames (VER=2) carry channel records; longer LEN bytes are treated as noise
+FRAME_V2_MAX_LEN = 64
+
+# ENV OVERRIDES
+
+def flag(name: str) -> bool:
+    """On/off setting ``name``; the environment variable of the same name ("1", "true", "yes", "on") overrides it."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return bool(globals()[name])
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+def path(name: str, env: str | None = None) -> str | None:
+    """Path setting ``name`` (environment variable ``env`` overrides), relative ones under the project root.
+
+    None when it is empty or "0" (the feature is off).
+    """
+    raw = os.environ.get(env) if env else None
+    if raw is None:
+        raw = globals()[name] or ""
+    if not raw or raw == "0":
+        return None
+    return raw if os.path.isabs(raw) else os.path.join(PROJECT_ROOT, raw)
@@ -0,0 +1,97 @@
+"""Startup phase tracer and fast-boot settings.
+
+``mark(name)`` stores a monotonic timestamp; ``watch(window)`` adds the
+first swapped frame and the first frame after the cluster content is ready
+("gauges"), then prints the breakdown. Times are relative to process start
+(taken from ``/proc`` where available), so interpreter start-up and the
+PySide6 imports are included.
+
+Import this module before PySide6 so those imports are measured.
+
+Fast boot (``FAST_BOOT``, env ``FAST_BOOT=0`` disables): Main.qml loads the
+cluster asynchronously behind the splash, compiled QML is kept in
+``QML_CACHE_DIR`` (warm it with ``tools/precompile_qml.py`` after a deploy)
+and the DevPanel window is only created once the cluster is up.
+"""
+from __future__ import annotations
+import os, json, time
+
+def _process_start() -> float:
+    """Process start on the ``time.monotonic()`` time base."""
+    now = time.monotonic()
+    try:
+        with open('/proc/self/stat') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        started = int(fields[19]) / os.sysconf('SC_CLK_TCK')  # field 22: start time since boot
+        return now - (time.clock_gettime(time.CLOCK_BOOTTIME) - started)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return now
+
+_T0 = _process_start()
+_marks: list[tuple[str, float]] = []
+_done = False
+
+def mark(name: str, t: float | None = None) -> None:
+    """Record phase ``name`` at ``t`` (``time.monotonic()``, default now)."""
+    _marks.append((name, time.monotonic() if t is None else t))
+
+def phases() -> list[tuple[str, float, float]]:
+    """``(name, ms since process start, ms since previous mark)``."""
+    out = []
+    prev = _T0
+    for name, t in sorted(_marks, key=lambda m: m[1]):  # frame marks are queued from the render thread
+        out.append((name, (t - _T0) * 1e3, (t - prev) * 1e3))
+        prev = t
+    return out
+
+def report() -> None:
+    print(f"[startup] {'phase':<16} {'at ms':>8} {'+ms':>8}")
+    for name, at, step in phases():
+        print(f"[startup] {name:<16} {at:8.1f} {step:8.1f}")
+    if os.environ.get("STARTUP_TRACE_JSON"):
+        print("[startup] json " + json.dumps({name: round(at, 2) for name, at, _ in phases()}))
+
+def watch(window, on_done=None) -> None:
+    """Mark the first frame and the first frame with the gauges on screen.
+
+    ``window`` must have a ``contentReady`` bool property with a notify
+    signal (Main.qml). Reports once, then calls ``on_done`` if given.
+    """
+    from PySide6.QtCore import QObject, Signal, Qt
+
+    class _Watcher(QObject):
+        swapped = Signal(float)
+
+    watcher = _Watcher(window)
+    state = {'first': False, 'ready': None}
+
+    def on_swap():
+        # render thread: only the timestamp; the window is only touched on the GUI thread
+        if not _done:
+            watcher.swapped.emit(time.monotonic())
+
+    def swapped(t: float):
+        global _done
+        if _done:
+            return
+        if not state['first']:
+            state['first'] = True
+            mark('first frame', t)
+        if state['ready'] is not None and t >= state['ready']:
+            _done = True
+            window.frameSwapped.disconnect(on_swap)
+            mark('gauges', t)
+            report()
+            if on_done is not None:
+                on_done()
+
+    def content_ready():
+        if state['ready'] is None and window.property('contentReady'):
+            mark('content ready')
+            state['ready'] = _marks[-1][1]
+            window.update()
+
+    watcher.swapped.connect(swapped, Qt.QueuedConnection)
+    window.contentReadyChanged.connect(content_ready)
+    window.frameSwapped.connect(on_swap, Qt.DirectConnection)
+    content_ready()
@@ -0,0 +1,180 @@
+"""Calibration maps: sensor curves and lookup tables from data/calibration.json.
+
+A map is a piecewise-linear curve (1D: ``x`` breakpoints -> ``y``) or a
+bilinear grid (2D: ``x`` and ``y`` breakpoints -> ``z[i][j]``). At load
+every map is resampled onto a dense, evenly spaced table (``step`` per axis,
+default an eighth of the closest breakpoint spacing, adjusted so the span is
+a whole number of steps), so evaluating it is an index computation and one
+(1D) or three (2D) linear interpolations: O(1) per sample, no search.
+Breakpoints that fall on the dense grid are reproduced exactly; inputs
+outside the breakpoints clamp to the edge values.
+
+File format::
+
+    {"maps": {
+        "redline": {"input": "oilTemp", "x": [30, 35, ...], "y": [2498, 2750, ...]},
+        "fuel":    {"x": [0, 100], "y": [0, 100], "step": 1},
+        "waterTemp": {"enabled": false, "x": [...], "y": [...]}
+    }}
+
+2D: ``"input": [a, b]``, ``"x"``, ``"y"``, ``"z": [[z(x0, y0), z(x0, y1), ...], ...]``,
+``"step": [sx, sy]``. ``"enabled": false`` keeps a map in the file unused.
+Which names the cluster evaluates and on what is up to ``derived``
+(``fuel``, ``waterTemp``, ``oilTemp`` sensor curves, ``redline``).
+
+    python src/calibration.py [PATH]      # list the maps and their table sizes
+"""
+from __future__ import annotations
+import os, sys, json, math, bisect
+from array import array
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))  # config
+import config
+
+DEFAULT_STEPS = 8  # dense points per closest breakpoint interval
+MAX_TABLE = 1 << 20
+
+def interp(xs, ys, x: float) -> float:
+    """Reference piecewise-linear interpolation on the breakpoints (bisect), clamped."""
+    if x <= xs[0]:
+        return float(ys[0])
+    if x >= xs[-1]:
+        return float(ys[-1])
+    i = bisect.bisect_right(xs, x) - 1
+    t = (x - xs[i]) / (xs[i + 1] - xs[i])
+    return ys[i] + t * (ys[i + 1] - ys[i])
+
+def interp2(xs, ys, zs, x: float, y: float) -> float:
+    """Reference bilinear interpolation on the breakpoint grid, clamped."""
+    col = [interp(ys, row, y) for row in zs]
+    return interp(xs, col, x)
+
+def _axis(points, step: float | None, what: str) -> tuple[float, float, int]:
+    """(start, step, intervals) of the dense axis over ``points``."""
+    if len(points) < 2 or any(b <= a for a, b in zip(points, points[1:])):
+        raise ValueError(f"{what}: need at least two strictly increasing breakpoints")
+    span = points[-1] - points[0]
+    if step is None:
+        step = min(b - a for a, b in zip(points, points[1:])) / DEFAULT_STEPS
+    if step <= 0:
+        raise ValueError(f"{what}: step must be positive")
+    n = max(1, math.ceil(span / step - 1e-9))
+    return float(points[0]), span / n, n
+
+class Map1D:
+    __slots__ = ('name', 'inputs', 'x0', 'inv', 'last', 'lut')
+
+    def __init__(self, xs, ys, step: float | None = None, name: str = '', inputs: tuple = ()):
+        if len(ys) != len(xs):
+            raise ValueError(f"{name}: {len(xs)} x breakpoints but {len(ys)} values")
+        x0, dx, n = _axis(xs, step, name)
+        if n + 1 > MAX_TABLE:
+            raise ValueError(f"{name}: table of {n + 1} points, step too small")
+        self.name = name
+        self.inputs = inputs
+        self.x0 = x0
+        self.inv = 1.0 / dx
+        self.last = n
+        self.lut = array('d', (interp(xs, ys, x0 + i * dx) for i in range(n + 1)))
+        self.lut[n] = ys[-1]
+
+    def __call__(self, x: float) -> float:
+        f = (x - self.x0) * self.inv
+        if f <= 0.0:
+            return self.lut[0]
+        if f >= self.last:
+            return self.lut[self.last]
+        i = int(f)
+        a = self.lut[i]
+        return a + (f - i) * (self.lut[i + 1] - a)
+
+    @property
+    def size(self) -> int:
+        return len(self.lut)
+
+class Map2D:
+    __slots__ = ('name', 'inputs', 'x0', 'y0', 'xinv', 'yinv', 'xlast', 'ylast', 'row', 'lut')
+
+    def __init__(self, xs, ys, zs, step=(None, None), name: str = '', inputs: tuple = ()):
+        if len(zs) != len(xs) or any(len(r) != len(ys) for r in zs):
+            raise ValueError(f"{name}: z must be {len(xs)} rows of {len(ys)} values")
+        x0, dx, nx = _axis(xs, step[0], name + ' x')
+        y0, dy, ny = _axis(ys, step[1], name + ' y')
+        if (nx + 1) * (ny + 1) > MAX_TABLE:
+            raise ValueError(f"{name}: table of {(nx + 1) * (ny + 1)} points, step too small")
+        self.name = name
+        self.inputs = inputs
+        self.x0, self.y0 = x0, y0
+        self.xinv, self.yinv = 1.0 / dx, 1.0 / dy
+        self.xlast, self.ylast = nx, ny
+        self.row = ny + 1
+        # resample each breakpoint row along y, then every dense column along x
+        rows = [[interp(ys, r, y0 + j * dy) for j in range(ny + 1)] for r in zs]
+        lut = array('d', bytes(8 * (nx + 1) * (ny + 1)))
+        for j in range(ny + 1):
+            col = [r[j] for r in rows]
+            for i in range(nx + 1):
+                lut[i * self.row + j] = interp(xs, col, x0 + i * dx)
+        self.lut = lut
+
+    def __call__(self, x: float, y: float) -> float:
+        f = (x - self.x0) * self.xinv
+        g = (y - self.y0) * self.yinv
+        f = 0.0 if f <= 0.0 else self.xlast if f >= self.xlast else f
+        g = 0.0 if g <= 0.0 else self.ylast if g >= self.ylast else g
+        i = min(int(f), self.xlast - 1)
+        j = min(int(g), self.ylast - 1)
+        f -= i
+        g -= j
+        lut = self.lut
+        k = i * self.row + j
+        a = lut[k] + g * (lut[k + 1] - lut[k])
+        b = lut[k + self.row] + g * (lut[k + self.row + 1] - lut[k + self.row])
+        return a + f * (b - a)
+
+    @property
+    def size(self) -> int:
+        return len(self.lut)
+
+def build(name: str, spec: dict) -> Map1D | Map2D:
+    inputs = spec.get('input', ())
+    inputs = (inputs,) if isinstance(inputs, str) else tuple(inputs)
+    if 'z' in spec:
+        step = spec.get('step', (None, None))
+        return Map2D(spec['x'], spec['y'], spec['z'], tuple(step), name, inputs)
+    return Map1D(spec['x'], spec['y'], spec.get('step'), name, inputs)
+
+_loaded: dict[str, dict] = {}
+
+def load(file: str | None = None) -> dict:
+    """``{name: map}`` of the enabled maps; empty (values pass through) if the file is missing or invalid.
+
+    Loaded once per file: the GUI (cold redline) and the serial reader share the tables, which are read-only.
+    """
+    file = config.path('CALIBRATION_PATH', 'CALIBRATION') if file is None else file
+    if file is None:
+        return {}
+    maps = _loaded.get(file)
+    if maps is None:
+        maps = _loaded[file] = _read(file)
+    return maps
+
+def _read(file: str) -> dict:
+    try:
+        with open(file) as f:
+            doc = json.load(f)
+        maps = {name: build(name, spec) for name, spec in doc.get('maps', {}).items() if spec.get('enabled', True)}
+    except FileNotFoundError:
+        print(f"[calibration] {file} not found; raw values")
+        return {}
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"[calibration] ignoring {file} ({e}); raw values")
+        return {}
+    print(f"[calibration] {len(maps)} maps from {os.path.basename(file)}: {', '.join(maps)}")
+    return maps
+
+if __name__ == '__main__':
+    maps = load(sys.argv[1] if len(sys.argv) > 1 else None)
+    for name, m in maps.items():
+        kind = '2D' if isinstance(m, Map2D) else '1D'
+        print(f"{name:<12} {kind}  input {', '.join(m.inputs) or '(own channel)':<20} {m.size} points, {m.size * 8 / 1024:.1f} KiB")
@@ -0,0 +1,207 @@
+"""Telemetry channel registry.
+
+Every live value shown by the UI is one row in ``CHANNELS``. The table
+drives the value store (one ``array('d')`` slot per channel), the emission
+policy and the generated Qt properties (``<name>``, ``<name>Changed``,
+``get<Name>``/``set<Name>``, and ``<name>Available``), so adding a protocol channel is one row here
+plus its id in ``frames.CHANNELS`` (or a slot in ``derived`` for values
+computed from other channels).
+
+Until a channel receives its first value it is not available
+(``<name>Available`` false, e.g. temperatures from v1 firmware, which never
+sends them): QML shows "no reading" instead of the ``default``. The first
+value is emitted regardless of deadband and rate limit.
+
+Emission policy per channel:
+- ``deadband``: a new value within ``deadband`` of the last emitted one is
+  dropped (0 = any change emits).
+- ``min_interval_s``: changes arriving sooner than this after the previous
+  emit are held and the newest one is emitted when the interval expires.
+
+Per channel the store counts emits, sets dropped as unchanged (within the
+deadband) and sets held by the rate limit; with ``SIGNAL_STATS`` on,
+``signal_stats.SignalStats`` also times every emit (see there).
+"""
+from __future__ import annotations
+import time
+from array import array
+from typing import NamedTuple
+from PySide6.QtCore import QObject, Signal, Property, Slot, QTimer, QMutex, QMutexLocker
+import config
+import frames
+import derived
+
+class Channel(NamedTuple):
+    name: str
+    type: type              # int, float or bool
+    default: float
+    lo: float
+    hi: float
+    deadband: float = 0.0
+    min_interval_s: float = 0.0
+    source: int | tuple[int, int] | None = None  # frame channel id, or (word id, bit mask)
+
+CHANNELS = (
+    Channel('rpm', int, 0, 0, 20000, source=frames.CH_RPM),
+    Channel('speed', float, 0.0, 0.0, 400.0, source=frames.CH_VSS),
+    Channel('leftBlink', bool, False, 0, 1, source=(frames.CH_FLAGS, 1 << 0)),
+    Channel('rightBlink', bool, False, 0, 1, source=(frames.CH_FLAGS, 1 << 1)),
+    Channel('highBeam', bool, False, 0, 1, source=(frames.CH_FLAGS, 1 << 2)),
+    Channel('park', bool, False, 0, 1, source=(frames.CH_FLAGS, 1 << 3)),
+    Channel('lowBeam', bool, False, 0, 1, source=(frames.CH_STATUS, frames.STATUS_LOW_BEAM)),
+    Channel('fogRear', bool, False, 0, 1, source=(frames.CH_STATUS, frames.STATUS_FOG_REAR)),
+    Channel('checkEngine', bool, False, 0, 1, source=(frames.CH_STATUS, frames.STATUS_CHECK_ENGINE)),
+    Channel('charging', bool, False, 0, 1, source=(frames.CH_STATUS, frames.STATUS_CHARGING)),
+    Channel('abs', bool, False, 0, 1, source=(frames.CH_STATUS, frames.STATUS_ABS)),
+    Channel('wheelPressure', bool, False, 0, 1, source=(frames.CH_STATUS, frames.STATUS_WHEEL_PRESSURE)),
+    Channel('underglow', bool, False, 0, 1, source=(frames.CH_STATUS, frames.STATUS_UNDERGLOW)),
+    # slow, noisy senders: hold fuel slosh and temperature jitter
+    # (calibrated on the serial thread, see derived.py / calibration.py)
+    Channel('fuel', int, 0, 0, 100, 0, 0.5, derived.FUEL_LEVEL),
+    Channel('waterTemp', int, 0, 0, 150, 0, 0.25, derived.WATER_TEMP),
+    Channel('oilTemp', int, 0, 0, 160, 0, 0.25, derived.OIL_TEMP),
+    # gauge still visualizes 10..18; text shows one decimal
+    Channel('afr', float, 14.7, 0.0, 25.0, 0.05, 0.05, frames.CH_AFR),
+    Channel('chargingVolt', float, 14.2, 0.0, 20.0, 0.02, 0.1, frames.CH_CHARGING_VOLT),
+    Channel('oilPressure', float, 0.0, 0.0, 10.0, 0.02, 0.05, frames.CH_OIL_PRESSURE),
+    Channel('fuelFlow', float, 0.0, 0.0, 200.0, 0.05, 0.1, frames.CH_FUEL_FLOW),
+    # derived on the serial thread (src/derived.py)
+    Channel('gear', int, 0, 0, 9, source=derived.GEAR),
+    Channel('fuelInst', float, 0.0, 0.0, 99.9, 0.1, 0.25, derived.FUEL_INST),
+    Channel('fuelAvg', float, 0.0, 0.0, 99.9, 0.05, 1.0, derived.FUEL_AVG),
+    Channel('afrAvg', float, 14.7, 0.0, 25.0, 0.05, 0.25, derived.AFR_AVG),
+    Channel('redlineTime', float, 0.0, 0.0, 1e6, 0.1, 1.0, derived.REDLINE_TIME),
+    Channel('dynamicRedline', int, config.REDLINE_RPM, 0, 20000, 0, 0.25, derived.DYN_REDLINE),
+)
+
+INDEX = {ch.name: i for i, ch in enumerate(CHANNELS)}
+
+class ChannelStore(QObject):
+    """Array-backed values plus the deadband / rate-limit emission policy."""
+    _flushScheduled = Signal(int)
+
+    def __init__(self):
+        super().__init__()
+        self._mtx = QMutex()
+        self._values = array('d', (float(ch.default) for ch in CHANNELS))
+        self._pending_values = array('d', self._values)
+        self._last_emit = array('d', (0.0 for _ in CHANNELS))
+        self._lo = array('d', (ch.lo for ch in CHANNELS))
+        self._hi = array('d', (ch.hi for ch in CHANNELS))
+        self._deadband = array('d', (ch.deadband for ch in CHANNELS))
+        self._interval = array('d', (ch.min_interval_s for ch in CHANNELS))
+        self._conv = [round if ch.type is int else ch.type for ch in CHANNELS]
+        self._signals = [getattr(self, ch.name + 'Changed') for ch in CHANNELS]
+        self._available_signals = [getattr(self, ch.name + 'AvailableChanged') for ch in CHANNELS]
+        self._available = 0  # bit i: channel i received a value
+        self._emitted = array('q', bytes(8 * len(CHANNELS)))
+        self._unchanged = array('q', bytes(8 * len(CHANNELS)))
+        self._held = array('q', bytes(8 * len(CHANNELS)))
+        self._profile = None  # SignalStats: times the handlers behind each emit
+        self._pending = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flushPending)
+        self._flushScheduled.connect(self._armFlush)
+
+    def _setChannel(self, i: int, v) -> None:
+        lo = self._lo[i]
+        hi = self._hi[i]
+        v = self._conv[i](lo if v < lo else hi if v > hi else v)
+        bit = 1 << i
+        if not self._available & bit:
+            self._available |= bit
+            self._pending &= ~bit
+            self._emit(i, v, time.monotonic())
+            self._available_signals[i].emit(True)
+            return
+        if abs(v - self._values[i]) <= self._deadband[i]:
+            self._pending &= ~bit  # back inside the deadband: nothing new to show
+            self._unchanged[i] += 1
+            return
+        now = 0.0
+        interval = self._interval[i]
+        if interval:
+            now = time.monotonic()
+            wait = self._last_emit[i] + interval - now
+            if wait > 0:
+                self._pending_values[i] = v
+                self._held[i] += 1
+                if not self._pending & bit:
+                    self._pending |= bit
+                    self._flushScheduled.emit(int(wait * 1000) + 1)
+                return
+            self._pending &= ~bit
+        self._emit(i, v, now)
+
+    def _emit(self, i: int, v, now: float) -> None:
+        self._values[i] = v
+        self._last_emit[i] = now
+        self._emitted[i] += 1
+        if self._profile is None:
+            self._signals[i].emit(v)
+        else:
+            self._profile.timed(i, self._signals[i], v)
+
+    @Slot(int)
+    def _armFlush(self, ms: int):
+        if not self._flush_timer.isActive() or self._flush_timer.remainingTime() > ms:
+            self._flush_timer.start(ms)
+
+    @Slot()
+    def _flushPending(self):
+        next_ms = 0
+        with QMutexLocker(self._mtx):
+            now = time.monotonic()
+            pending = self._pending
+            for i in range(len(CHANNELS)):
+                bit = 1 << i
+                if not pending & bit:
+                    continue
+                wait = self._last_emit[i] + self._interval[i] - now
+                if wait > 0:
+                    ms = int(wait * 1000) + 1
+                    next_ms = ms if not next_ms else min(next_ms, ms)
+                    continue
+                pending &= ~bit
+                self._emit(i, self._conv[i](self._pending_values[i]), now)
+            self._pending = pending
+        if next_ms:
+            self._flush_timer.start(next_ms)
+
+def _accessors(i: int, kind: type):
+    if kind is bool:
+        def getter(self) -> bool:
+            return self._values[i] != 0.0
+    elif kind is int:
+        def getter(self) -> int:
+            return int(self._values[i])
+    else:
+        def getter(self) -> float:
+            return self._values[i]
+    def setter(self, v):
+        self._setChannel(i, v)
+    def available(self) -> bool:
+        return bool(self._available >> i & 1)
+    return getter, setter, available
+
+def _build_base() -> type:
+    ns = {}
+    for i, ch in enumerate(CHANNELS):
+        cap = ch.name[0].upper() + ch.name[1:]
+        notify = Signal(ch.type)
+        available_notify = Signal(bool)
+        getter, setter, available = _accessors(i, ch.type)
+        ns[ch.name + 'Changed'] = notify
+        ns[ch.name + 'AvailableChanged'] = available_notify
+        ns['get' + cap] = getter
+        ns['set' + cap] = setter
+        ns[ch.name] = Property(ch.type, getter, setter, notify=notify)
+        ns[ch.name + 'Available'] = Property(bool, available, notify=available_notify)
+    return type(QObject)('ChannelObject', (ChannelStore,), ns)
+
+ChannelObject = _build_base()
+
+# frame vector -> channel routing, used by Telemetry._applyChannels
+VALUE_SOURCES = tuple((i, ch.source) for i, ch in enumerate(CHANNELS) if isinstance(ch.source, int))
+BIT_SOURCES = tuple((i, ch.source[0], ch.source[1]) for i, ch in enumerate(CHANNELS) if isinstance(ch.source, tuple))
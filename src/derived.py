@@ -0,0 +1,201 @@
+"""Derived channels computed from the decoded frame vector.
+
+``DerivedChannels.update`` runs on the serial thread right after every
+decoded frame and writes its results into slots appended after the frame
+channel ids (``GEAR`` ... ``REDLINE_TIME``, vector length ``VECTOR_LEN``),
+so the snapshot handoff, Telemetry's channel routing (``channels.CHANNELS``
+rows with these ids as ``source``) and the telemetry bus carry them like
+any received channel. Each step is O(1): running sums and an exponential
+average, no sample windows.
+
+- ``gear``: measured rpm per km/h against the overall ratio of every gear
+  (``GEARBOX_RATIOS`` x ``FINAL_DRIVE``, ``TYRE_CIRCUMFERENCE_M``); 0 when
+  no gear is within ``GEAR_TOLERANCE`` (clutch in, standing, wheelspin). A
+  new gear must hold for ``GEAR_CONFIRM_FRAMES`` frames.
+- ``fuelInst`` / ``fuelAvg``: l/100 km from the ECU fuel flow channel, now
+  and since start (0 below ``FUEL_MIN_KMH`` / before 0.1 km).
+- ``afrAvg``: AFR averaged with time constant ``AFR_AVG_TAU_S``.
+- ``redlineTime``: seconds spent at or above ``redline_rpm`` since start.
+- ``fuelLevel`` / ``waterTempCal`` / ``oilTempCal``: the fuel sender
+  (v2 fuel channel, or v1 FLAGS bits 4..11) and temperature readings through
+  the ``fuel`` / ``waterTemp`` / ``oilTemp`` calibration maps, or as
+  received without one. Telemetry shows these as ``fuel``, ``waterTemp``
+  and ``oilTemp``.
+- ``dynamicRedline``: the ``redline`` map (default input: calibrated oil
+  temperature); it also becomes ``redline_rpm``. Until its input arrives
+  (v1 firmware never sends oil temperature) it is the map's lowest value,
+  the cold-engine redline (``cold_redline``).
+
+Calibration maps (``src/calibration.py``) are dense lookup tables, so they
+are O(1) as well.
+
+Time-based values integrate over frame timestamps; intervals longer than
+``DISTANCE_MAX_GAP_S`` (link loss) are skipped.
+"""
+from __future__ import annotations
+import frames
+import config
+import calibration
+
+GEAR = frames.CHANNEL_COUNT
+FUEL_INST = GEAR + 1
+FUEL_AVG = GEAR + 2
+AFR_AVG = GEAR + 3
+REDLINE_TIME = GEAR + 4
+FUEL_LEVEL = GEAR + 5
+WATER_TEMP = GEAR + 6
+OIL_TEMP = GEAR + 7
+DYN_REDLINE = GEAR + 8
+VECTOR_LEN = GEAR + 9
+
+NAMES = {GEAR: 'gear', FUEL_INST: 'fuelInst', FUEL_AVG: 'fuelAvg', AFR_AVG: 'afrAvg', REDLINE_TIME: 'redlineTime',
+         FUEL_LEVEL: 'fuelLevel', WATER_TEMP: 'waterTempCal', OIL_TEMP: 'oilTempCal', DYN_REDLINE: 'dynamicRedline'}
+
+_RPM = 1 << frames.CH_RPM
+_VSS = 1 << frames.CH_VSS
+_AFR = 1 << frames.CH_AFR
+_FLOW = 1 << frames.CH_FUEL_FLOW
+_FLAGS = 1 << frames.CH_FLAGS
+_FUEL = 1 << frames.CH_FUEL
+_WATER = 1 << frames.CH_WATER_TEMP
+_OIL = 1 << frames.CH_OIL_TEMP
+
+# map input name -> (vector slot, frame channel bit); sensor channels read their calibrated slot
+_INPUTS = {name: (ch, 1 << ch) for ch, (name, _, _) in frames.CHANNELS.items()} | {
+    'fuel': (FUEL_LEVEL, _FUEL | _FLAGS), 'waterTemp': (WATER_TEMP, _WATER), 'oilTemp': (OIL_TEMP, _OIL)}
+_NS_PER_HOUR = 3600 * 10**9
+
+def gear_bands(ratios=config.GEARBOX_RATIOS, final_drive: float = config.FINAL_DRIVE,
+               circumference_m: float = config.TYRE_CIRCUMFERENCE_M,
+               tolerance: float = config.GEAR_TOLERANCE) -> tuple[tuple[float, float], ...]:
+    """(lo, hi) rpm per km/h accepted for each gear, first gear first."""
+    bands = []
+    for r in ratios:
+        k = r * final_drive * (1000.0 / 60.0) / circumference_m
+        bands.append((k * (1.0 - tolerance), k * (1.0 + tolerance)))
+    return tuple(bands)
+
+def cold_redline(m=None) -> int:
+    """Lowest rpm of redline map ``m`` (default: the calibration's ``redline``), or ``REDLINE_RPM`` without one."""
+    if m is None:
+        m = calibration.load().get('redline')
+    return config.REDLINE_RPM if m is None else round(min(m.lut))
+
+class DerivedChannels:
+    __slots__ = ('seen', 'redline_rpm', '_bands', '_confirm', '_gear_min', '_fuel_min', '_tau_ns', '_max_gap_ns',
+                 '_t', '_cand', '_cand_n', '_fuel_l', '_fuel_km', '_afr', '_redline_ns',
+                 '_fuel_map', '_water_map', '_oil_map', '_redline_map', '_redline_in', '_redline_bits')
+
+    def __init__(self, bands=None, maps: dict | None = None):
+        self.seen = 0  # bits of the derived slots that hold a value
+        self.redline_rpm = config.REDLINE_RPM
+        self._bands = gear_bands() if bands is None else bands
+        maps = calibration.load() if maps is None else maps
+        self._fuel_map = maps.get('fuel')
+        self._water_map = maps.get('waterTemp')
+        self._oil_map = maps.get('oilTemp')
+        self._redline_map = m = maps.get('redline')
+        self._redline_in = ()
+        self._redline_bits = 0
+        if m is not None:
+            names = m.inputs or ('oilTemp',)
+            unknown = [n for n in names if n not in _INPUTS]
+            if unknown or len(names) != (2 if isinstance(m, calibration.Map2D) else 1):
+                print(f"[calibration] redline: bad input {', '.join(names)}; fixed redline")
+                self._redline_map = None
+            else:
+                self._redline_in = tuple(_INPUTS[n][0] for n in names)
+                for n in names:
+                    self._redline_bits |= _INPUTS[n][1]
+                self.redline_rpm = cold_redline(m)
+        self._confirm = config.GEAR_CONFIRM_FRAMES
+        self._gear_min = config.GEAR_MIN_KMH
+        self._fuel_min = config.FUEL_MIN_KMH
+        self._tau_ns = config.AFR_AVG_TAU_S * 1e9
+        self._max_gap_ns = config.DISTANCE_MAX_GAP_S * 1e9
+        self._t = 0
+        self._cand = 0
+        self._cand_n = 0
+        self._fuel_l = 0.0
+        self._fuel_km = 0.0
+        self._afr = None
+        self._redline_ns = 0
+
+    def update(self, values: list, seen: int, t_ns: int) -> int:
+        """Fill the derived slots of ``values``; returns ``seen`` plus the derived bits."""
+        dt = t_ns - self._t if self._t else 0
+        if dt > 0 or not self._t:
+            self._t = t_ns
+        if dt > self._max_gap_ns:
+            dt = 0
+        rpm = values[frames.CH_RPM]
+        kmh = values[frames.CH_VSS]
+
+        if seen & (_FUEL | _FLAGS):
+            raw = values[frames.CH_FUEL] if seen & _FUEL else (int(values[frames.CH_FLAGS]) >> 4) & 0xFF
+            values[FUEL_LEVEL] = raw if self._fuel_map is None else self._fuel_map(raw)
+            self.seen |= 1 << FUEL_LEVEL
+        if seen & _WATER:
+            raw = values[frames.CH_WATER_TEMP]
+            values[WATER_TEMP] = raw if self._water_map is None else self._water_map(raw)
+            self.seen |= 1 << WATER_TEMP
+        if seen & _OIL:
+            raw = values[frames.CH_OIL_TEMP]
+            values[OIL_TEMP] = raw if self._oil_map is None else self._oil_map(raw)
+            self.seen |= 1 << OIL_TEMP
+        if seen & self._redline_bits:
+            ins = self._redline_in
+            if len(ins) == 1:
+                r = self._redline_map(values[ins[0]])
+            else:
+                r = self._redline_map(values[ins[0]], values[ins[1]])
+            values[DYN_REDLINE] = self.redline_rpm = r
+            self.seen |= 1 << DYN_REDLINE
+        elif not self.seen & 1 << DYN_REDLINE:
+            values[DYN_REDLINE] = self.redline_rpm
+            self.seen |= 1 << DYN_REDLINE
+
+        if seen & _RPM and seen & _VSS:
+            g = 0
+            if kmh >= self._gear_min and rpm > 0:
+                m = rpm / kmh
+                for i, (lo, hi) in enumerate(self._bands):
+                    if lo <= m <= hi:
+                        g = i + 1
+                        break
+            if g == self._cand:
+                self._cand_n += 1
+            else:
+                self._cand = g
+                self._cand_n = 1
+            if self._cand_n >= self._confirm:
+                values[GEAR] = g
+                self.seen |= 1 << GEAR
+
+        if seen & _RPM:
+            if dt > 0 and rpm >= self.redline_rpm:
+                self._redline_ns += dt
+            values[REDLINE_TIME] = self._redline_ns / 1e9
+            self.seen |= 1 << REDLINE_TIME
+
+        if seen & _FLOW and seen & _VSS:
+            flow = values[frames.CH_FUEL_FLOW]
+            if dt > 0:
+                self._fuel_l += flow * dt / _NS_PER_HOUR
+                self._fuel_km += kmh * dt / _NS_PER_HOUR
+            values[FUEL_INST] = flow * 100.0 / kmh if kmh >= self._fuel_min else 0.0
+            values[FUEL_AVG] = self._fuel_l * 100.0 / self._fuel_km if self._fuel_km >= 0.1 else 0.0
+            self.seen |= (1 << FUEL_INST) | (1 << FUEL_AVG)
+
+        if seen & _AFR:
+            afr = values[frames.CH_AFR]
+            avg = self._afr
+            if avg is None:
+                avg = afr
+            elif dt > 0:
+                avg += (afr - avg) * dt / (self._tau_ns + dt)
+            self._afr = avg
+            values[AFR_AVG] = avg
+            self.seen |= 1 << AFR_AVG
+
+        return seen | self.seen
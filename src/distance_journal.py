@@ -0,0 +1,147 @@
+"""Write-behind odometer/trip journal.
+
+Every displayed 0.1 km step appends one fixed-size record to
+the journal (``data/distance.journal`` next to ``data.json``) from a
+background thread. Every
+``JOURNAL_COMPACT_EVERY`` records (and on close) the values are folded into
+``data.json`` with an atomic rename and the journal is truncated. The
+snapshot stores ``journal_seq`` so records that survived a crash between
+the rename and the truncate are not applied twice.
+"""
+from __future__ import annotations
+import os, struct, threading, queue, time, zlib
+from typing import Callable
+import config
+
+# seq, odometer km, trip km, crc32 of the preceding 20 bytes
+_RECORD = struct.Struct('<Idd')
+_CRC = struct.Struct('<I')
+RECORD_LEN = _RECORD.size + _CRC.size
+
+_STOP = object()
+
+def pack_record(seq: int, odometer_km: float, trip_km: float) -> bytes:
+    body = _RECORD.pack(seq & 0xFFFFFFFF, odometer_km, trip_km)
+    return body + _CRC.pack(zlib.crc32(body))
+
+def recover(snapshot: dict, path: str) -> tuple[float, float, int]:
+    """Return (odometer_km, trip_km, seq) from snapshot plus newer journal records.
+
+    Reading stops at the first torn or corrupt record.
+    """
+    odo = snapshot.get('odometer')
+    trip = snapshot.get('trip')
+    odo = float(odo) if isinstance(odo, (int, float)) else 0.0
+    trip = float(trip) if isinstance(trip, (int, float)) else 0.0
+    seq = snapshot.get('journal_seq')
+    seq = int(seq) if isinstance(seq, int) else 0
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return odo, trip, seq
+    except Exception as e:
+        print(f"[journal] read error: {e}")
+        return odo, trip, seq
+    mv = memoryview(data)
+    for off in range(0, len(data) - RECORD_LEN + 1, RECORD_LEN):
+        body = mv[off:off + _RECORD.size]
+        (crc,) = _CRC.unpack_from(data, off + _RECORD.size)
+        if zlib.crc32(body) != crc:
+            print(f"[journal] corrupt record at {off}, ignoring tail")
+            break
+        rseq, rodo, rtrip = _RECORD.unpack(body)
+        if rseq > seq:
+            seq, odo, trip = rseq, rodo, rtrip
+    return odo, trip, seq
+
+class DistanceJournal(threading.Thread):
+    """Persists (odometer, trip) records off the GUI thread.
+
+    ``write_snapshot(odometer_km, trip_km, seq)`` is called on this thread to
+    compact; it must be durable when it returns.
+    """
+    def __init__(self, write_snapshot: Callable[[float, float, int], None], path: str, seq: int = 0):
+        super().__init__(daemon=True, name="distance-journal")
+        self.path = path
+        self._write_snapshot = write_snapshot
+        self._seq = seq
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.fsync_policy = config.JOURNAL_FSYNC
+        self.fsync_interval = config.JOURNAL_FSYNC_INTERVAL_S
+        self.compact_every = config.JOURNAL_COMPACT_EVERY
+        self.records = 0
+        self.fsyncs = 0
+        self.compactions = 0
+
+    # any thread
+    def record(self, odometer_km: float, trip_km: float):
+        self._queue.put((odometer_km, trip_km))
+
+    def close(self, timeout: float = 2.0):
+        self._queue.put(_STOP)
+        self.join(timeout)
+
+    def run(self):
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        except Exception as e:
+            print(f"[journal] open failed ({e}); distance will not be persisted")
+            return
+        last = None
+        pending = 0
+        dirty = False
+        last_sync = time.monotonic()
+        try:
+            while True:
+                timeout = self.fsync_interval if (dirty and self.fsync_policy == 'interval') else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                if item is _STOP:
+                    break
+                if item is not None:
+                    last = item
+                    self._seq += 1
+                    try:
+                        os.write(fd, pack_record(self._seq, item[0], item[1]))
+                    except Exception as e:
+                        print(f"[journal] write error: {e}")
+                    self.records += 1
+                    pending += 1
+                    dirty = True
+                    if self.fsync_policy == 'always':
+                        self._sync(fd)
+                        dirty = False
+                if dirty and self.fsync_policy == 'interval' and time.monotonic() - last_sync >= self.fsync_interval:
+                    self._sync(fd)
+                    dirty = False
+                    last_sync = time.monotonic()
+                if pending >= self.compact_every and last is not None:
+                    self._compact(fd, last)
+                    pending = 0
+                    dirty = False
+            if pending and last is not None:
+                self._compact(fd, last)
+        finally:
+            os.close(fd)
+
+    def _sync(self, fd: int):
+        try:
+            os.fdatasync(fd)
+            self.fsyncs += 1
+        except Exception as e:
+            print(f"[journal] fsync error: {e}")
+
+    def _compact(self, fd: int, last: tuple[float, float]):
+        try:
+            self._write_snapshot(last[0], last[1], self._seq)
+        except Exception as e:
+            print(f"[journal] snapshot error: {e}; keeping journal")
+            return
+        try:
+            os.ftruncate(fd, 0)
+            self.compactions += 1
+        except Exception as e:
+            print(f"[journal] truncate error: {e}")
@@ -0,0 +1,194 @@
+"""Fixed-size, memory-mapped ring file of validated raw frames.
+
+Layout: a 64-byte header, a table of the last ``RUNS`` runs, then
+``capacity`` slots of ``slot_size`` bytes. A slot holds
+``mono_ns(u64) run(u32) length(u8) frame[length]``. The file is fully
+allocated when created and never grows; the writer only stores into the
+mapping (no per-frame syscalls or allocations) and bumps the total frame
+counter in the header last, so a reader never sees a slot the counter does
+not cover yet.
+
+Every open of the recorder starts a new run and stores its wall-clock epoch
+(``time_ns() - monotonic_ns()`` at open) in the run table. ``(run, mono_ns)``
+is strictly increasing in write order whatever the wall clock does, so the
+reader bisects on that and shows ``epoch + mono_ns`` as the frame time. A
+wall-clock step (NTP, RTC-less boot) between runs only moves the times shown
+for the runs around it.
+"""
+from __future__ import annotations
+import os, sys, mmap, struct, time, bisect
+from typing import Iterator
+
+MAGIC = b'VCFR'
+VERSION = 2
+_HEADER = struct.Struct('<4sHHIQQI')  # magic, version, slot_size, capacity, count, created_ns, run
+_COUNT_OFF = 12
+_COUNT = struct.Struct('<Q')
+_RUN_OFF = 28
+_RUN = struct.Struct('<I')
+RUNS = 256
+_RUN_ENTRY = struct.Struct('<Iq')  # run, epoch_ns
+_RUNS_OFF = 64
+HEADER_SIZE = _RUNS_OFF + RUNS * _RUN_ENTRY.size
+_SLOT_HEAD = struct.Struct('<QIB')
+
+class FrameRecorder:
+    def __init__(self, path: str, capacity: int, slot_size: int = 32):
+        self.path = path
+        self.slot_size = slot_size
+        self.max_frame = slot_size - _SLOT_HEAD.size
+        self.dropped = 0
+        size = HEADER_SIZE + capacity * slot_size
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            reuse = False
+            if os.fstat(fd).st_size == size:
+                head = os.pread(fd, _HEADER.size, 0)
+                magic, ver, slot, cap, count, _, run = _HEADER.unpack(head)
+                reuse = magic == MAGIC and ver == VERSION and slot == slot_size and cap == capacity
+            if not reuse:
+                os.ftruncate(fd, 0)
+                try:
+                    os.posix_fallocate(fd, 0, size)
+                except (AttributeError, OSError):
+                    os.ftruncate(fd, size)
+                os.pwrite(fd, _HEADER.pack(MAGIC, VERSION, slot_size, capacity, 0, time.time_ns(), 0), 0)
+                count = run = 0
+            self._mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self.capacity = capacity
+        self.count = count
+        self.run = run + 1
+        # the table entry first: a reader that sees the new run number finds its epoch
+        _RUN_ENTRY.pack_into(self._mm, _RUNS_OFF + (self.run % RUNS) * _RUN_ENTRY.size,
+                             self.run, time.time_ns() - time.monotonic_ns())
+        _RUN.pack_into(self._mm, _RUN_OFF, self.run)
+        print(f"[recorder] {path}: {capacity} slots x {slot_size} B, {count} frames so far")
+
+    def record(self, mono_ns: int, frame) -> None:
+        n = len(frame)
+        if n > self.max_frame:
+            self.dropped += 1
+            return
+        off = HEADER_SIZE + (self.count % self.capacity) * self.slot_size
+        _SLOT_HEAD.pack_into(self._mm, off, mono_ns, self.run, n)
+        off += _SLOT_HEAD.size
+        self._mm[off:off + n] = frame
+        self.count += 1
+        _COUNT.pack_into(self._mm, _COUNT_OFF, self.count)
+
+    def flush(self):
+        self._mm.flush()
+
+    def close(self):
+        self._mm.flush()
+        self._mm.close()
+
+class FrameRing:
+    """Read-only view of a ring file (may be opened while the writer runs)."""
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, ver, self.slot_size, self.capacity, _, self.created_ns, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or ver != VERSION:
+            raise ValueError(f"{path}: not a frame ring file")
+
+    def close(self):
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return min(self._count(), self.capacity)
+
+    def _count(self) -> int:
+        return _COUNT.unpack_from(self._mm, _COUNT_OFF)[0]
+
+    def _slot(self, logical: int, count: int) -> int:
+        first = count - min(count, self.capacity)
+        return HEADER_SIZE + ((first + logical) % self.capacity) * self.slot_size
+
+    def _key(self, logical: int, count: int) -> tuple[int, int]:
+        mono, run, _ = _SLOT_HEAD.unpack_from(self._mm, self._slot(logical, count))
+        return run, mono
+
+    def epoch(self, run: int) -> int | None:
+        """Wall-clock epoch of ``run``, None once its table entry has been reused."""
+        r, epoch = _RUN_ENTRY.unpack_from(self._mm, _RUNS_OFF + (run % RUNS) * _RUN_ENTRY.size)
+        return epoch if r == run else None
+
+    def runs(self) -> list[tuple[int, int, int]]:
+        """``(run, first, end)`` logical slot ranges, oldest first."""
+        count = self._count()
+        n = min(count, self.capacity)
+        keys = _LogicalKeys(self, count, n)
+        out, i = [], 0
+        while i < n:
+            run = keys[i][0]
+            end = bisect.bisect_left(keys, (run + 1, 0), i, n)
+            out.append((run, i, end))
+            i = end
+        return out
+
+    def frames(self, t0_ns: int | None = None, t1_ns: int | None = None) -> Iterator[tuple[int, bytes]]:
+        """Yield ``(ts_ns, frame)`` in write order, limited to ``t0_ns <= ts < t1_ns``.
+
+        ``ts_ns`` is wall-clock time. Each run is searched on its own monotonic
+        timestamps; frames of a run whose epoch is no longer in the table are
+        skipped.
+        """
+        count = self._count()
+        n = min(count, self.capacity)
+        keys = _LogicalKeys(self, count, n)
+        for run, first, end in self.runs():
+            epoch = self.epoch(run)
+            if epoch is None:
+                continue
+            lo = first if t0_ns is None else bisect.bisect_left(keys, (run, t0_ns - epoch), first, end)
+            hi = end if t1_ns is None else bisect.bisect_left(keys, (run, t1_ns - epoch), first, end)
+            for i in range(lo, hi):
+                off = self._slot(i, count)
+                mono, _, ln = _SLOT_HEAD.unpack_from(self._mm, off)
+                yield epoch + mono, self._mm[off + _SLOT_HEAD.size:off + _SLOT_HEAD.size + ln]
+
+    def span(self) -> tuple[int, int] | None:
+        """Wall-clock times of the oldest and newest frame."""
+        count = self._count()
+        n = min(count, self.capacity)
+        if not n:
+            return None
+        (r0, m0), (r1, m1) = self._key(0, count), self._key(n - 1, count)
+        return (self.epoch(r0) or 0) + m0, (self.epoch(r1) or 0) + m1
+
+class _LogicalKeys:
+    # sequence adapter so bisect can search slot (run, mono_ns) keys in write order
+    def __init__(self, ring: FrameRing, count: int, n: int):
+        self._ring, self._count, self._n = ring, count, n
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, i: int) -> tuple[int, int]:
+        return self._ring._key(i, self._count)
+
+def from_config() -> FrameRecorder | None:
+    import config
+    path = config.path('FRAME_RECORD_PATH', 'FRAME_RECORD')
+    if path is None:
+        return None
+    capacity = int(config.FRAME_RECORD_HOURS * 3600 * config.FRAME_RECORD_RATE_HZ)
+    try:
+        return FrameRecorder(path, capacity, config.FRAME_RECORD_SLOT_BYTES)
+    except Exception as e:
+        print(f"[recorder] disabled ({e})")
+        return None
+
+if __name__ == '__main__':
+    # python src/frame_recorder.py RING [last_seconds]
+    ring = FrameRing(sys.argv[1])
+    span = ring.span()
+    print(f"{len(ring)} frames, capacity {ring.capacity}, slot {ring.slot_size} B")
+    if span:
+        print(f"span {(span[1] - span[0]) / 1e9:.1f} s ending {time.ctime(span[1] / 1e9)}")
+        last = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+        for t, frame in ring.frames(span[1] - int(last * 1e9)):
+            print(f"{t / 1e9:.6f} {frame.hex()}")
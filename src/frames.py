@@ -0,0 +1,224 @@
+"""Teensy frame codec.
+
+Frames are located with a bulk search for the magic bytes and decoded in
+place from a memoryview over the receive buffer; the buffer is compacted
+once per call instead of once per byte/frame.
+
+Two framings share the magic and CRC:
+
+v1 (fixed, 14 bytes): RPM, VSS and the FLAGS word.
+v2 (variable): ``COUNT`` records of ``channel id (u8), raw value (u16)``
+so slow channels (temperatures, pressures) can be sent less often than RPM.
+
+Both are decoded into one channel vector (see ``CHANNELS``) that keeps the
+latest value of every channel; ``seen`` has bit ``1 << id`` set for every
+channel received at least once.
+"""
+from __future__ import annotations
+import struct
+from typing import Callable
+import crcmod  # type: ignore
+import config
+
+crc16_x25 = crcmod.mkCrcFun(0x11021, rev=True, initCrc=0xFFFF, xorOut=0xFFFF)
+
+# MAGIC, VER, LEN, RPM, VSS_cm_s, FLAGS, reserved(u16), CRC16-X25 = 14 bytes
+FRAME_V1 = struct.Struct('<HBBHHH2xH')
+# MAGIC, VER=2, LEN (whole frame), COUNT, then COUNT x (ID u8, VALUE u16), CRC16-X25
+FRAME_V2_HEAD = struct.Struct('<HBBB')
+FRAME_V2_VERSION = 2
+FRAME_V2_OVERHEAD = FRAME_V2_HEAD.size + 2
+_CRC = struct.Struct('<H')
+MAGIC_BYTES = struct.pack('<H', config.FRAME_MAGIC)
+
+# CHANNEL TABLE
+CH_RPM = 1
+CH_VSS = 2
+CH_FLAGS = 3
+CH_STATUS = 4
+CH_FUEL = 5
+CH_WATER_TEMP = 6
+CH_OIL_TEMP = 7
+CH_AFR = 8
+CH_OIL_PRESSURE = 9
+CH_CHARGING_VOLT = 10
+CH_FUEL_FLOW = 11
+CHANNEL_COUNT = 12  # vector length (id 0 unused); derived.py appends its slots after these
+
+KMH_PER_CM_S = 0.036  # u16 VSS: up to 2359 km/h
+
+# id: (name, signed, scale) - physical value = raw * scale
+CHANNELS = {
+    CH_RPM: ('rpm', False, 1),
+    CH_VSS: ('speed', False, KMH_PER_CM_S),
+    CH_FLAGS: ('flags', False, 1),               # v1 FLAGS word
+    CH_STATUS: ('status', False, 1),             # STATUS_* bits
+    CH_FUEL: ('fuel', False, 1),                 # %
+    CH_WATER_TEMP: ('waterTemp', True, 0.1),     # 0.1 degC
+    CH_OIL_TEMP: ('oilTemp', True, 0.1),         # 0.1 degC
+    CH_AFR: ('afr', False, 0.01),
+    CH_OIL_PRESSURE: ('oilPressure', False, 0.01),   # 0.01 bar
+    CH_CHARGING_VOLT: ('chargingVolt', False, 0.01), # 0.01 V
+    CH_FUEL_FLOW: ('fuelFlow', False, 0.01),     # 0.01 l/h (injector flow from the ECU)
+}
+
+# STATUS bits (v2 only; v1 has no room for them)
+STATUS_LOW_BEAM = 1 << 0
+STATUS_FOG_REAR = 1 << 1
+STATUS_CHECK_ENGINE = 1 << 2
+STATUS_CHARGING = 1 << 3
+STATUS_ABS = 1 << 4
+STATUS_WHEEL_PRESSURE = 1 << 5
+STATUS_UNDERGLOW = 1 << 6
+
+_SCALE = [None] * 256
+_SIGNED = [False] * 256
+for _id, (_name, _signed, _scale) in CHANNELS.items():
+    _SCALE[_id] = _scale
+    _SIGNED[_id] = _signed
+V1_SEEN = (1 << CH_RPM) | (1 << CH_VSS) | (1 << CH_FLAGS)
+
+# record layouts precompiled for every COUNT a LEN byte can describe
+FRAME_V2_MAX_RECORDS = (255 - FRAME_V2_OVERHEAD) // 3
+_V2_RECORDS = [struct.Struct('<' + 'BH' * k) for k in range(FRAME_V2_MAX_RECORDS + 1)]
+
+def encode_v1(rpm: int, vss_cm_s: int, flags: int) -> bytes:
+    body = FRAME_V1.pack(config.FRAME_MAGIC, config.FRAME_VERSION, config.FRAME_LEN_BYTES,
+                         rpm & 0xFFFF, vss_cm_s & 0xFFFF, flags & 0xFFFF, 0)[:-2]
+    return body + _CRC.pack(crc16_x25(body))
+
+def encode_v2(records) -> bytes:
+    """``records``: iterable of ``(channel_id, raw)``; raw is u16 (or i16 for signed channels)."""
+    flat = []
+    for ch, raw in records:
+        flat += (ch, raw & 0xFFFF)
+    count = len(flat) // 2
+    if count > FRAME_V2_MAX_RECORDS:
+        raise ValueError(f"too many records for one frame ({count})")
+    body = FRAME_V2_HEAD.pack(config.FRAME_MAGIC, FRAME_V2_VERSION, FRAME_V2_OVERHEAD + 3 * count, count)
+    body += _V2_RECORDS[count].pack(*flat)
+    return body + _CRC.pack(crc16_x25(body))
+
+def vss_to_kmh(vss_cm_s: int) -> float:
+    return vss_cm_s * KMH_PER_CM_S
+
+class Decoder:
+    """Stateful decoder holding the latest value of every channel.
+
+    ``values`` is updated in place and handed to ``on_frame(values, seen)``
+    after every valid frame; callers must copy what they keep. ``size`` may
+    exceed ``CHANNEL_COUNT`` to leave room for channels computed downstream.
+
+    Link health counters (cumulative): ``frames`` accepted, ``crc_errors``
+    (a plausible header whose CRC did not match), ``bad_headers`` (magic
+    followed by an unknown version or impossible length) and
+    ``skipped_bytes`` (bytes dropped while resynchronising, i.e. not part of
+    an accepted frame).
+    """
+    __slots__ = ('values', 'seen', 'frames', 'crc_errors', 'bad_headers', 'skipped_bytes')
+
+    def __init__(self, size: int = CHANNEL_COUNT):
+        self.values = [0] * size
+        self.seen = 0
+        self.frames = 0
+        self.crc_errors = 0
+        self.bad_headers = 0
+        self.skipped_bytes = 0
+
+    def consume(self, buf: bytearray, on_frame: Callable[[list, int], None],
+                on_raw: Callable[[memoryview], None] | None = None) -> int:
+        """Decode every complete frame in ``buf`` and drop the consumed bytes.
+
+        Returns the number of valid frames. ``on_raw`` (optional) receives
+        each validated frame as a memoryview that is only valid during the
+        call. A trailing partial frame (or a lone first magic byte) is kept
+        for the next read.
+        """
+        v1_len = config.FRAME_LEN_BYTES
+        v1_version = config.FRAME_VERSION
+        v2_max = config.FRAME_V2_MAX_LEN
+        unpack_v1 = FRAME_V1.unpack_from
+        crc_from = _CRC.unpack_from
+        values = self.values
+        scale = _SCALE
+        signed = _SIGNED
+        seen = self.seen
+        n = len(buf)
+        pos = 0
+        count = 0
+        framed = 0  # bytes of accepted frames
+        crc_errors = bad_headers = 0
+        mv = memoryview(buf)
+        try:
+            while True:
+                i = buf.find(MAGIC_BYTES, pos)
+                if i < 0:
+                    # keep a trailing first magic byte, the second may be in the next chunk
+                    pos = max(pos, n - 1) if n and buf[-1] == MAGIC_BYTES[0] else n
+                    break
+                if n - i < FRAME_V2_HEAD.size:
+                    pos = i
+                    break
+                ver = buf[i + 2]
+                if ver == v1_version:
+                    if n - i < v1_len:
+                        pos = i
+                        break
+                    _, _, ln, rpm, vss_cm_s, flags, crc = unpack_v1(buf, i)
+                    if ln != v1_len:
+                        bad_headers += 1
+                        pos = i + 1
+                        continue
+                    if crc16_x25(mv[i:i + ln - 2]) != crc:
+                        crc_errors += 1
+                        pos = i + 1
+                        continue
+                    values[CH_RPM] = rpm
+                    values[CH_VSS] = vss_cm_s * KMH_PER_CM_S
+                    values[CH_FLAGS] = flags
+                    seen |= V1_SEEN
+                elif ver == FRAME_V2_VERSION:
+                    ln = buf[i + 3]
+                    if ln < FRAME_V2_OVERHEAD or ln > v2_max or ln != FRAME_V2_OVERHEAD + 3 * buf[i + 4]:
+                        bad_headers += 1
+                        pos = i + 1
+                        continue
+                    if n - i < ln:
+                        pos = i
+                        break
+                    if crc16_x25(mv[i:i + ln - 2]) != crc_from(buf, i + ln - 2)[0]:
+                        crc_errors += 1
+                        pos = i + 1
+                        continue
+                    k = buf[i + 4]
+                    rec = _V2_RECORDS[k].unpack_from(buf, i + FRAME_V2_HEAD.size)
+                    for j in range(0, 2 * k, 2):
+                        ch = rec[j]
+                        s = scale[ch]
+                        if s is None:
+                            continue  # unknown channel (newer firmware)
+                        raw = rec[j + 1]
+                        if signed[ch] and raw & 0x8000:
+                            raw -= 0x10000
+                        values[ch] = raw * s
+                        seen |= 1 << ch
+                else:
+                    bad_headers += 1
+                    pos = i + 1
+                    continue
+                if on_raw is not None:
+                    on_raw(mv[i:i + ln])
+                on_frame(values, seen)
+                count += 1
+                framed += ln
+                pos = i + ln
+        finally:
+            self.seen = seen
+            self.frames += count
+            self.crc_errors += crc_errors
+            self.bad_headers += bad_headers
+            self.skipped_bytes += pos - framed
+            mv.release()
+        if pos:
+            del buf[:pos]
+        return count
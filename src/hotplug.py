@@ -0,0 +1,103 @@
+"""Wait for a serial device node to (re)appear.
+
+``DeviceWatcher(path).wait(timeout)`` blocks until something is created,
+moved or has its attributes changed in the directory of ``path`` under the
+name of ``path`` (udev creates ``/dev/ttyACM0`` and then fixes its mode, a
+by-id symlink is created or replaced), or until ``timeout`` passes. It uses
+inotify through libc, so a re-enumerated Teensy is opened within
+milliseconds of its node showing up instead of on the next retry tick.
+Where inotify is unavailable (no libc symbol, the directory does not exist,
+watch limit reached) ``wait`` just sleeps for ``timeout`` and the reader's
+back-off does the work.
+
+The watch is on the path as configured, not its resolved target: a stable
+symlink moving to a new tty is the event we want.
+
+``DirectoryWatcher(directory)`` is the same for any name in ``directory``,
+removals included (the telemetry bus uses it to notice subscribers).
+"""
+from __future__ import annotations
+import os, sys, select, ctypes, ctypes.util, threading
+
+IN_ATTRIB = 0x004
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+_MASK = IN_CREATE | IN_ATTRIB | IN_MOVED_TO
+_HEADER = 16  # struct inotify_event: wd, mask, cookie, len
+
+def _libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch  # noqa: B018 - probe the symbols
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+class DeviceWatcher:
+    def __init__(self, path: str, stop_event: threading.Event | None = None):
+        self.path = path
+        self.name = os.fsencode(os.path.basename(path))
+        self.stop_event = stop_event
+        self.fd = -1
+        self._watch(os.path.dirname(os.path.abspath(path)), _MASK)
+
+    def _watch(self, directory: str, mask: int) -> None:
+        libc = _libc()
+        if libc is None:
+            return
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            os.close(fd)
+            return
+        self.fd = fd
+
+    @property
+    def active(self) -> bool:
+        return self.fd >= 0
+
+    def wait(self, timeout: float) -> bool:
+        """True when the device name was touched within ``timeout`` s."""
+        if self.fd < 0:
+            if self.stop_event is not None:
+                self.stop_event.wait(timeout)
+            else:
+                select.select([], [], [], timeout)
+            return False
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        return bool(ready) and self._drain()
+
+    def _drain(self) -> bool:
+        hit = False
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except BlockingIOError:
+                return hit
+            if not data:
+                return hit
+            pos = 0
+            while pos + _HEADER <= len(data):
+                length = int.from_bytes(data[pos + 12:pos + 16], sys.byteorder)
+                name = data[pos + _HEADER:pos + _HEADER + length].rstrip(b'\0')
+                hit |= self.name is None or name == self.name
+                pos += _HEADER + length
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+class DirectoryWatcher(DeviceWatcher):
+    """``wait`` returns True when any entry of ``directory`` was created, moved or removed."""
+    def __init__(self, directory: str, stop_event: threading.Event | None = None):
+        self.path = directory
+        self.name = None
+        self.stop_event = stop_event
+        self.fd = -1
+        self._watch(directory, IN_CREATE | IN_DELETE | IN_MOVED_TO | IN_MOVED_FROM)
@@ -0,0 +1,280 @@
+"""Indicator icons pre-scaled to the target resolution, packed into one atlas.
+
+The PNGs in ``assets/`` are drawn at design resolution; QML shows them
+through the uniform ``SCALE`` of the content root, so every render samples a
+large image down (``tein.png`` is 1782 px wide for a ~800 px logo). The QML
+loads them as ``image://icons/<name>`` instead; this provider serves each one
+from ``ICON_ATLAS_DIR/atlas.png``, rasterised once at exactly the physical
+size the layout shows it at (the largest, if it is used twice). The atlas is
+one PNG decode at startup; the icons are cut out of it once and the atlas is
+dropped, so what stays in memory are the pre-scaled icons. Each is still its
+own texture: the atlas saves decoding and pixels, not draw calls. An
+``Image`` takes its implicit size from the pixels it is served, so an item
+that relies on it (rather than an explicit size) asks for the original's
+with ``ICONS.sourceSize(name)``.
+
+The atlas is built from the live scene: once the cluster content is up and
+every icon image has loaded, ``measure`` walks the items, maps each icon's
+painted rect to window pixels, and ``build`` scales the originals to those
+sizes (smooth, never up), shelf-packs them and writes ``atlas.png`` with a
+manifest ``atlas.json`` (``{"icons": {name: [x, y, w, h]}, ...}``). The
+manifest records the target resolution/SCALE and digests of the QML and the
+assets; when any of them changes the atlas is ignored, the originals are
+served and the atlas is rebuilt in the background for the next start. So the
+first boot after an install or a resolution change builds it (only if the
+window really is ``WIDTH`` x ``HEIGHT``), or run
+``python tools/build_icon_atlas.py`` at install time.
+
+Env ``ICON_ATLAS=<dir>`` overrides the directory, ``0`` serves the originals.
+"""
+from __future__ import annotations
+import os, json, math, hashlib, threading
+from PySide6.QtCore import QObject, QRect, QRectF, QSize, QTimer, Qt, Slot
+from PySide6.QtGui import QImage, QImageReader, QPainter
+from PySide6.QtQuick import QQuickImageProvider
+import config
+import layer_cache
+
+ASSETS_DIR = os.path.join(config.PROJECT_ROOT, 'assets')
+SCHEME = 'image://icons/'
+PADDING = 1  # transparent gutter between icons
+MANIFEST = 'atlas.json'
+ATLAS = 'atlas.png'
+
+def asset_path(name: str) -> str:
+    return os.path.join(ASSETS_DIR, name + '.png')
+
+def assets_digest() -> str:
+    h = hashlib.sha1()
+    for name in sorted(os.listdir(ASSETS_DIR)):
+        if name.endswith('.png'):
+            with open(os.path.join(ASSETS_DIR, name), 'rb') as f:
+                h.update(name.encode())
+                h.update(f.read())
+    return h.hexdigest()[:12]
+
+def signature() -> dict:
+    return {'target': f"{config.WIDTH}x{config.HEIGHT}@{config.SCALE:.6g}",
+            'ui': layer_cache.ui_digest(), 'assets': assets_digest()}
+
+# MEASURE / BUILD
+
+def _items(item):
+    yield item
+    for child in item.childItems():
+        yield from _items(child)
+
+def measure(window) -> tuple[dict[str, tuple[int, int]], list[str]]:
+    """Physical size per icon shown in ``window`` (largest use) and the icons still loading."""
+    dpr = window.effectiveDevicePixelRatio()
+    sizes: dict[str, tuple[int, int]] = {}
+    pending = []
+    for item in _items(window.contentItem()):
+        source = item.property('source')
+        url = source.toString() if hasattr(source, 'toString') else str(source or '')
+        if not url.startswith(SCHEME):
+            continue
+        name = url[len(SCHEME):]
+        if item.property('progress') < 1.0:  # still loading (status is an enum PySide cannot read)
+            pending.append(name)
+            continue
+        r = item.mapRectToScene(QRectF(0, 0, item.property('paintedWidth'), item.property('paintedHeight')))
+        w, h = math.ceil(r.width() * dpr - 0.01), math.ceil(r.height() * dpr - 0.01)
+        if w <= 0 or h <= 0:
+            continue
+        old = sizes.get(name, (0, 0))
+        sizes[name] = (max(w, old[0]), max(h, old[1]))
+    return sizes, pending
+
+def _pack(sizes: dict[str, QSize]) -> tuple[int, int, dict[str, QRect]]:
+    """Shelf packing, tallest first, into the narrowest power-of-two width that keeps the atlas about square."""
+    area = sum((s.width() + PADDING) * (s.height() + PADDING) for s in sizes.values())
+    widest = max(s.width() for s in sizes.values()) + PADDING
+    width = 1 << max(widest, math.ceil(math.sqrt(area))).bit_length() - 1
+    if width < widest or width * width < area:
+        width <<= 1
+    rects = {}
+    x = y = shelf = 0
+    for name, s in sorted(sizes.items(), key=lambda kv: (-kv[1].height(), kv[0])):
+        if x + s.width() > width:
+            x, y, shelf = 0, y + shelf + PADDING, 0
+        rects[name] = QRect(x, y, s.width(), s.height())
+        x += s.width() + PADDING
+        shelf = max(shelf, s.height())
+    return width, y + shelf, rects
+
+def build(sizes: dict[str, tuple[int, int]], directory: str) -> dict:
+    """Rasterise ``{name: (w, h)}`` from ``assets/``, pack and write the atlas and manifest; returns the manifest."""
+    images = {}
+    for name, (w, h) in sizes.items():
+        src = QImage(asset_path(name))
+        if src.isNull():
+            print(f"[icons] cannot read {asset_path(name)}")
+            continue
+        if w < src.width() or h < src.height():
+            src = src.scaled(QSize(w, h), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        images[name] = src.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    if not images:
+        raise ValueError("no icons to pack")
+    width, height, rects = _pack({n: i.size() for n, i in images.items()})
+    atlas = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    atlas.fill(0)
+    p = QPainter(atlas)
+    p.setCompositionMode(QPainter.CompositionMode_Source)
+    for name, rect in rects.items():
+        p.drawImage(rect.topLeft(), images[name])
+    p.end()
+    os.makedirs(directory, exist_ok=True)
+    tmp = os.path.join(directory, ATLAS + '.tmp')
+    if not atlas.save(tmp, 'PNG'):
+        raise OSError(f"could not write {tmp}")
+    os.replace(tmp, os.path.join(directory, ATLAS))
+    manifest = dict(signature(), size=[width, height],
+                    icons={n: [r.x(), r.y(), r.width(), r.height()] for n, r in sorted(rects.items())})
+    tmp = os.path.join(directory, MANIFEST + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp, os.path.join(directory, MANIFEST))
+    return manifest
+
+# RUNTIME
+
+class IconAtlas(QObject):
+    def __init__(self, directory: str | None = None, parent: QObject | None = None):
+        super().__init__(parent)
+        self.dir = directory or config.path('ICON_ATLAS_DIR', 'ICON_ATLAS')
+        self.current = False
+        self.rects: dict[str, QRect] = {}
+        self._images: dict[tuple, QImage] = {}
+        self._sizes: dict[str, QSize] = {}  # original PNG sizes
+        self._lock = threading.Lock()  # the provider is also called from the async image loader thread
+        self.served_atlas = 0
+        self.served_original = 0
+        if self.dir is None:
+            return
+        try:
+            with open(os.path.join(self.dir, MANIFEST)) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            print(f"[icons] no atlas in {self.dir}; originals until it is built")
+            return
+        except (OSError, ValueError) as e:
+            print(f"[icons] ignoring atlas ({e})")
+            return
+        sig = signature()
+        stale = [k for k, v in sig.items() if manifest.get(k) != v]
+        if stale:
+            print(f"[icons] atlas out of date ({', '.join(stale)}); originals until it is rebuilt")
+            return
+        atlas = QImage(os.path.join(self.dir, ATLAS))
+        if atlas.isNull():
+            print(f"[icons] cannot read {os.path.join(self.dir, ATLAS)}")
+            return
+        self.rects = {n: QRect(*r) for n, r in manifest.get('icons', {}).items()}
+        atlas = atlas.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        self._images = {(n,): atlas.copy(r) for n, r in self.rects.items()}  # the atlas itself is not kept
+        self.current = True
+        print(f"[icons] atlas {atlas.width()}x{atlas.height()}, {len(self.rects)} icons for {sig['target']}")
+
+    @Slot(str, result=QSize)
+    def sourceSize(self, name: str) -> QSize:
+        """Size of the original PNG, whether the atlas or the original is served."""
+        size = self._sizes.get(name)  # GUI thread only
+        if size is None:
+            size = self._sizes[name] = QImageReader(asset_path(name)).size()  # header only
+        return size
+
+    def image(self, name: str, requested: QSize | None = None) -> QImage:
+        """The pre-scaled icon, or the original (scaled to ``requested`` if given) when it is not in the atlas."""
+        atlas = name in self.rects
+        key = (name,) if atlas or not requested else (name, requested.width(), requested.height())
+        with self._lock:
+            img = self._images.get(key)
+            if atlas:
+                self.served_atlas += 1
+                return img
+            if img is not None:
+                self.served_original += 1
+                return img
+        img = QImage(asset_path(name))  # outside the lock: decoding is the slow part
+        if img.isNull():
+            print(f"[icons] missing {name}")
+            img = QImage(1, 1, QImage.Format_ARGB32_Premultiplied)
+            img.fill(0)
+        elif requested is not None and requested.width() > 0 and requested.height() > 0:
+            img = img.scaled(requested, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        with self._lock:
+            self.served_original += 1
+            return self._images.setdefault(key, img)
+
+class IconImageProvider(QQuickImageProvider):
+    def __init__(self, atlas: IconAtlas):
+        super().__init__(QQuickImageProvider.ImageType.Image)
+        self._atlas = atlas
+
+    def requestImage(self, name: str, size: QSize, requested: QSize) -> QImage:
+        img = self._atlas.image(name, requested if requested.isValid() else None)
+        size.setWidth(img.width())
+        size.setHeight(img.height())
+        return img
+
+class AtlasBuilder(QObject):
+    """Measures ``window`` once its content is up and all icons have loaded, then builds the atlas.
+
+    ``on_done`` (e.g. ``app.quit``) is called on the GUI thread afterwards. The
+    build runs on a worker thread unless ``on_done`` is given.
+    """
+    def __init__(self, window, atlas: IconAtlas, on_done=None, retries: int = 20):
+        super().__init__(window)
+        self.window = window
+        self.atlas = atlas
+        self.on_done = on_done
+        self.retries = retries
+        self.thread = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(250)
+        self._timer.timeout.connect(self._try)
+        window.contentReadyChanged.connect(self._ready)
+        self._ready()
+
+    def _ready(self):
+        if self.window.property('contentReady'):
+            self.window.contentReadyChanged.disconnect(self._ready)
+            self._timer.start()
+
+    def _try(self):
+        w, h = self.window.width(), self.window.height()
+        if (w, h) != (config.WIDTH, config.HEIGHT):
+            # e.g. offscreen (800x800 screen) or a resized dev window: sizes would not be the target's
+            print(f"[icons] window is {w}x{h}, not {config.WIDTH}x{config.HEIGHT}; atlas not built")
+            if self.on_done is not None:
+                self.on_done()
+            return
+        sizes, pending = measure(self.window)
+        if pending and self.retries > 0:
+            self.retries -= 1
+            self._timer.start()
+            return
+        if pending:
+            print(f"[icons] not loaded, left out of the atlas: {', '.join(sorted(set(pending)))}")
+        if not sizes:
+            print("[icons] no icons on screen; atlas not built")
+            if self.on_done is not None:
+                self.on_done()
+            return
+        if self.on_done is not None:
+            self._build(sizes)
+            self.on_done()
+        else:
+            self.thread = threading.Thread(target=self._build, args=(sizes,), name='icon-atlas', daemon=True)
+            self.thread.start()
+
+    def _build(self, sizes):
+        try:
+            m = build(sizes, self.atlas.dir)
+        except (OSError, ValueError) as e:
+            print(f"[icons] atlas not built ({e})")
+            return
+        w, h = m['size']
+        print(f"[icons] atlas built: {len(m['icons'])} icons in {w}x{h} for {m['target']} -> {self.atlas.dir} (used from the next start)")
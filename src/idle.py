@@ -0,0 +1,144 @@
+"""Idle governor: drop to a low wakeup rate while the car sits still.
+
+Every ``IDLE_CHECK_S`` the governor compares the channel values with the
+ones it saw last; a channel counts as moving when it is more than its band
+away (``IDLE_BANDS[name]``, else the channel's own deadband). After
+``IDLE_AFTER_S`` without movement it goes idle:
+
+- the check timer stops and every channel's ``<name>Changed`` signal is
+  connected to a band check instead, so any real change wakes it in the
+  same event-loop pass that applied it (the next rendered frame is full rate
+  again);
+- registered timers (demo tick, ...) switch to their idle interval;
+- Telemetry applies snapshots straight away instead of forcing a window
+  update per frame, so the scene only renders when an item actually changed;
+- the serial reader keeps reading every frame as it arrives, but hands a
+  frame to Telemetry only when a channel moved beyond its band since the
+  last one it handed over, or ``IDLE_PUBLISH_S`` passed (``due``); the
+  first moving frame is delivered as soon as it is read;
+- ``TEL.idle`` turns true for QML (the clock then wakes once a minute).
+
+Blinkers are ignored by default, so hazards at a standstill still idle; they
+render like any other change, the governor just does not wake for them.
+"""
+from __future__ import annotations
+import time
+from array import array
+from functools import partial
+from PySide6.QtCore import QObject, Signal, Slot, QTimer
+import config
+
+class IdleGovernor(QObject):
+    changed = Signal(bool)
+
+    def __init__(self, store, channels, parent: QObject | None = None):
+        super().__init__(parent)
+        self.idle = False  # plain attribute: the serial thread reads it
+        self.entered = 0
+        self.idle_s = 0.0
+        self._store = store
+        self._signals = [getattr(store, ch.name + 'Changed') for ch in channels]
+        self._bands = array('d', (config.IDLE_BANDS.get(ch.name, ch.deadband) for ch in channels))
+        self._ref = array('d', store._values)
+        # serial thread, while idle: frame-vector slots / flag bits to watch, last vector handed over
+        slots: dict[int, float] = {}
+        words: dict[int, int] = {}
+        for ch, band in zip(channels, self._bands):
+            if isinstance(ch.source, int):
+                slots[ch.source] = min(band, slots.get(ch.source, band))
+            elif isinstance(ch.source, tuple) and band < 1:  # bools with band 1 (blinkers) never count
+                words[ch.source[0]] = words.get(ch.source[0], 0) | ch.source[1]
+        self._slot_bands = tuple(slots.items())
+        self._word_masks = tuple(words.items())
+        self._sent: list = []
+        self._sent_ns = 0
+        self._publish_ns = int(config.IDLE_PUBLISH_S * 1e9)
+        self._still_since = time.monotonic()
+        self._idle_at = 0.0
+        self._slots = [partial(self._changed, i) for i in range(len(channels))]
+        self._timers: list[tuple[QTimer, int, int]] = []
+        self._check = QTimer(self)
+        self._check.setInterval(int(config.IDLE_CHECK_S * 1000))
+        self._check.timeout.connect(self._poll)
+        self._check.start()
+
+    def addTimer(self, timer: QTimer, idle_ms: int) -> None:
+        """Run ``timer`` at ``idle_ms`` while idle, at its current interval otherwise."""
+        self._timers.append((timer, timer.interval(), idle_ms))
+        if self.idle:
+            timer.setInterval(idle_ms)
+
+    def due(self, values: list, now_ns: int) -> bool:
+        """Serial thread, while idle: hand this frame vector over?
+
+        Yes when a watched slot moved beyond its band (or a watched flag bit
+        flipped) since the last vector handed over, or ``IDLE_PUBLISH_S``
+        passed since then.
+        """
+        sent = self._sent
+        if sent and now_ns - self._sent_ns < self._publish_ns:
+            for slot, band in self._slot_bands:
+                if abs(values[slot] - sent[slot]) > band:
+                    break
+            else:
+                for word, mask in self._word_masks:
+                    if (int(values[word]) ^ int(sent[word])) & mask:
+                        break
+                else:
+                    return False
+        self._sent = list(values)
+        self._sent_ns = now_ns
+        return True
+
+    def _moved(self) -> bool:
+        values = self._store._values
+        ref = self._ref
+        bands = self._bands
+        for i in range(len(ref)):
+            if abs(values[i] - ref[i]) > bands[i]:
+                return True
+        return False
+
+    @Slot()
+    def _poll(self):
+        now = time.monotonic()
+        if self._moved():
+            self._ref = array('d', self._store._values)
+            self._still_since = now
+        elif now - self._still_since >= config.IDLE_AFTER_S:
+            self._enter(now)
+
+    def _enter(self, now: float):
+        self.idle = True
+        self.entered += 1
+        self._idle_at = now
+        self._sent = []  # the serial thread hands over the next frame and compares against it
+        self._check.stop()
+        for sig, slot in zip(self._signals, self._slots):
+            sig.connect(slot)
+        for timer, _, idle_ms in self._timers:
+            timer.setInterval(idle_ms)
+        print(f"[idle] idle after {now - self._still_since:.0f} s without movement")
+        self.changed.emit(True)
+
+    def _changed(self, i: int, *_):
+        if abs(self._store._values[i] - self._ref[i]) > self._bands[i]:
+            self.wake()
+
+    @Slot()
+    def wake(self):
+        """Back to full rate (no-op when not idle)."""
+        if not self.idle:
+            return
+        self.idle = False
+        now = time.monotonic()
+        self.idle_s += now - self._idle_at
+        for sig, slot in zip(self._signals, self._slots):
+            sig.disconnect(slot)
+        for timer, active_ms, _ in self._timers:
+            timer.setInterval(active_ms)
+        self._ref = array('d', self._store._values)
+        self._still_since = now
+        self._check.start()
+        print(f"[idle] awake after {now - self._idle_at:.1f} s idle")
+        self.changed.emit(False)
@@ -0,0 +1,186 @@
+"""Serial I/O in a child process (``SERIAL_PROCESS=1``).
+
+In the default threaded mode ``TeensyReader`` shares the GIL with the Qt
+process: a long slot, a settings save or a burst of binding callbacks on the
+GUI thread delays draining the port, and a burst of frames delays the GUI.
+With the split the child process (``src/serial_child.py``, no Qt)
+runs the stock ``TeensyReader``: it owns the port, decodes, derives,
+integrates distance and runs the frame recorder, public telemetry bus and
+session log. The Qt process only applies what it publishes:
+
+- values: after every read that decoded a frame the child writes the channel
+  vector into a private ``telemetry_bus`` segment
+  (``SERIAL_PROCESS_SHM.<pid>``); ``SerialProcess`` subscribes to it and a
+  ``QSocketNotifier`` on the notification socket reads the newest record
+  and hands it to ``Telemetry.publishChannels`` (or ``updateFromChannels``),
+  as the reader thread would. A slow GUI only ever sees the latest record.
+- link state and distance: small fixed records on a pipe
+  (connected, stale, integrated km), sent when the link state changes or the
+  distance grew by ``SERIAL_PROCESS_DISTANCE_KM``; distance is folded into
+  Telemetry's integrator with ``DistanceIntegrator.add``.
+
+The child exits when the Qt process goes away; if it dies it is started again
+after ``SERIAL_PROCESS_RESTART_S``. The idle governor's publish throttling
+does not apply to the child.
+
+CPU affinity (``SERIAL_CPUS`` / ``GUI_CPUS``, e.g. ``"1"``, ``"2,3"``,
+``serial_child.pin``) pins the child (or, threaded, the reader thread) and
+the Qt process to separate cores. ``python tools/bench_split.py`` compares frame handling jitter of both
+modes under GUI load.
+"""
+from __future__ import annotations
+import os, sys, time, subprocess
+from PySide6.QtCore import QObject, QSocketNotifier, QTimer, Slot
+import config
+import io_teensy
+import telemetry_bus
+from serial_child import STATE, STATE_READ
+
+CHILD = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'serial_child.py')
+
+class SerialProcess(QObject):
+    """Starts and watches the child; feeds its snapshots and link state into ``telemetry``."""
+    def __init__(self, telemetry, parent: QObject | None = None):
+        super().__init__(parent)
+        self.telemetry = telemetry
+        snapshot = io_teensy.handoff_mode() == "snapshot"
+        self._deliver = telemetry.publishChannels if snapshot else telemetry.updateFromChannels
+        self.snapshot = snapshot
+        self.latency = telemetry.getLatency()
+        self.distance = telemetry.getDistanceIntegrator()
+        self.path = f"{config.SERIAL_PROCESS_SHM}.{os.getpid()}"
+        self.proc = None
+        self.restarts = 0
+        self.received = 0
+        self._bus = None
+        self._state_fd = -1
+        self._state_notifier = None
+        self._bus_notifier = None
+        self._km = 0.0  # distance reported by the current child
+        self._stopping = False
+
+    def _sweep(self):
+        """Remove segments and socket directories left by Qt processes that were killed."""
+        base = os.path.basename(config.SERIAL_PROCESS_SHM) + '.'
+        d = os.path.dirname(config.SERIAL_PROCESS_SHM)
+        try:
+            names = os.listdir(d)
+        except OSError:
+            return
+        for name in names:
+            pid = name[len(base):].split('.')[0]
+            if not name.startswith(base) or not pid.isdigit() or os.path.exists(f'/proc/{pid}'):
+                continue
+            path = os.path.join(d, name)
+            try:
+                if os.path.isdir(path):
+                    for sock in os.listdir(path):
+                        os.unlink(os.path.join(path, sock))
+                    os.rmdir(path)
+                else:
+                    os.unlink(path)
+            except OSError:
+                pass
+
+    def start(self):
+        if not self.restarts:
+            self._sweep()
+        r, w = os.pipe()
+        env = dict(os.environ, PYTHONUNBUFFERED='1')
+        self.proc = subprocess.Popen([sys.executable, CHILD, '--child', self.path, str(w)],
+                                     env=env, pass_fds=(w,))
+        os.close(w)
+        self._state_fd = r
+        self._km = 0.0
+        self._state_notifier = QSocketNotifier(r, QSocketNotifier.Read, self)
+        self._state_notifier.activated.connect(self._onState)
+        print(f"[io_process] serial process {self.proc.pid} started")
+
+    def stop(self, timeout: float = config.SERIAL_STOP_TIMEOUT_S):
+        self._stopping = True
+        self._close_links()
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+    def _close_links(self):
+        for n in (self._state_notifier, self._bus_notifier):
+            if n is not None:
+                n.setEnabled(False)
+                n.deleteLater()
+        self._state_notifier = self._bus_notifier = None
+        if self._state_fd >= 0:
+            os.close(self._state_fd)
+            self._state_fd = -1
+        if self._bus is not None:
+            self._bus.close()
+            self._bus = None
+            try:
+                os.rmdir(self.path + '.d')  # notification sockets
+            except OSError:
+                pass
+
+    @Slot()
+    def _onState(self):
+        try:
+            data = os.read(self._state_fd, STATE_READ)
+        except BlockingIOError:
+            return
+        if not data:
+            self._childGone()
+            return
+        if self._bus is None:
+            self._bus = telemetry_bus.BusReader(self.path)
+            self._bus_notifier = QSocketNotifier(self._bus.subscribe(), QSocketNotifier.Read, self)
+            self._bus_notifier.activated.connect(self._onFrames)
+        connected, stale, km = STATE.unpack_from(data, len(data) - STATE.size)
+        if km > self._km:
+            self.distance.add(km - self._km)
+            self._km = km
+        self.telemetry.setLinkState(connected, stale)
+
+    @Slot()
+    def _onFrames(self):
+        bus = self._bus
+        bus.drain()
+        snap = bus.read_new()
+        if snap is None:
+            return
+        self.received += 1
+        received = time.monotonic_ns()
+        if self.snapshot:
+            self._deliver(snap.values, snap.seen, snap.ts_ns)
+        else:
+            self._deliver(snap.values, snap.seen)
+        if self.latency is not None:
+            # decode = serial read -> record received here (the child's decode plus the hop)
+            if not self.snapshot:
+                self.latency.post(snap.ts_ns)
+            self.latency.frame(snap.ts_ns, received, time.monotonic_ns())
+
+    def _childGone(self):
+        code = self.proc.wait() if self.proc is not None else None
+        self._close_links()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+        if self._stopping:
+            return
+        print(f"[io_process] serial process exited ({code}); restarting in {config.SERIAL_PROCESS_RESTART_S:g} s")
+        self.telemetry.setLinkState(False, True)
+        self.restarts += 1
+        QTimer.singleShot(int(config.SERIAL_PROCESS_RESTART_S * 1000), self._restart)
+
+    @Slot()
+    def _restart(self):
+        if not self._stopping:
+            self.start()
+
+def start_serial(telemetry) -> SerialProcess:
+    proc = SerialProcess(telemetry, telemetry)
+    proc.start()
+    return proc
@@ -1,76 +1,222 @@
 from __future__ import annotations
-import os, struct, threading, time, sys
-import crcmod, serial  # type: ignore
-from telemetry import Telemetry
+import os, threading, time, sys, selectors
+from typing import TYPE_CHECKING
+import serial  # type: ignore
 import config
+import frames
+import derived
+import frame_recorder
+import telemetry_bus
+import session_log
+import hotplug
+if TYPE_CHECKING:
+    from telemetry import Telemetry  # not at runtime: the serial process (serial_child.py) runs without Qt
 
-_crc_func = crcmod.mkCrcFun(0x11021, rev=True, initCrc=0xFFFF, xorOut=0xFFFF)
+_VSS_SEEN = 1 << frames.CH_VSS
+
+def handoff_mode() -> str:
+    return os.environ.get("FRAME_HANDOFF", config.FRAME_HANDOFF)
+
+def read_mode() -> str:
+    return os.environ.get("SERIAL_READ_MODE", config.SERIAL_READ_MODE)
 
 class TeensyReader(threading.Thread):
-    def __init__(self, telemetry: Telemetry):
+    def __init__(self, telemetry: Telemetry, record: bool = True, publish: bool = True):
         super().__init__(daemon=True)
         self.telemetry = telemetry
+        self.snapshot = handoff_mode() == "snapshot"
+        if self.snapshot:
+            self._deliver = telemetry.publishChannels
+        else:
+            self._deliver = telemetry.updateFromChannels
+        self.latency = telemetry.getLatency()
+        self._handoff = self._deliver
+        if self.latency is not None:
+            self._deliver = self._deliver_timed
+        self.distance = telemetry.getDistanceIntegrator()
+        self.governor = telemetry.getIdleGovernor()
+        self._link = telemetry.setLinkState
+        self.decoder = frames.Decoder(derived.VECTOR_LEN)
+        self.derived = derived.DerivedChannels()
+        self.frame_ns = 0
+        self._speeds: list[float] = []  # VSS of each frame of the current read, for the distance integrator
         self.stop_event = threading.Event()
         self.port = None
+        self.event_driven = read_mode() == "select"
+        self._selector = None
+        self.wakeups = 0
+        self.disconnects = 0
+        self.arrival_ns = 0
+        self.connected = False
+        self.stale = False
+        self.last_frame = 0.0  # monotonic s of the last decoded frame
+        self.reconnect_s: list[float] = []  # link lost -> port open again, per reconnect
+        self._watcher = None
+        self._retry_s = config.SERIAL_RETRY_MIN_S
+        self._lost_at = None  # monotonic s the link went away (None while open)
+        self._select_s = min(config.SERIAL_SELECT_TIMEOUT_S, config.STALE_AFTER_S / 2)
+        self.recorder = frame_recorder.from_config() if record else None
+        self.session = session_log.from_config() if record else None
+        self._on_raw = self._record if self.recorder is not None else None
+        self.bus = telemetry_bus.from_config() if publish else None
 
     def open_serial(self):
         dev = os.environ.get("TEENSY_DEV", config.SERIAL_DEV)
         try:
             self.port = serial.Serial(dev, config.BAUD, timeout=0.05)
-            print(f"[io_teensy] Opened serial {dev} @ {config.BAUD}")
         except Exception as e:
-            print(f"[io_teensy] Serial open failed ({e})")
+            if self._lost_at is None:
+                self._lost_at = time.monotonic()
+                print(f"[io_teensy] Serial open failed ({e}); waiting for {dev}")
             self.port = None
+            self._set_link(False, True)
+            return
+        if self._lost_at is None or not self.disconnects:
+            print(f"[io_teensy] Opened serial {dev} @ {config.BAUD}")
+        else:
+            took = time.monotonic() - self._lost_at
+            self.reconnect_s.append(took)
+            print(f"[io_teensy] Reopened serial {dev} {took * 1e3:.0f} ms after the link was lost")
+        self._lost_at = None
+        self._retry_s = config.SERIAL_RETRY_MIN_S
+        self.last_frame = time.monotonic()  # stale only after STALE_AFTER_S without frames
+        self._set_link(True, self.stale)
+        if self.event_driven:
+            self._close_selector()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.port.fileno(), selectors.EVENT_READ)
 
-    def run(self):
+    def _close_selector(self):
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    def _read_polled(self) -> bytes:
+        chunk = self.port.read(64)
+        self.wakeups += 1
+        self.arrival_ns = time.monotonic_ns()
+        if not chunk:
+            time.sleep(0.002)
+        return chunk
+
+    def _reconnect(self):
+        """Open the port, or wait for the device node (inotify) at most one back-off step."""
+        dev = os.environ.get("TEENSY_DEV", config.SERIAL_DEV)
+        if self._watcher is None or self._watcher.path != dev:
+            if self._watcher is not None:
+                self._watcher.close()
+            self._watcher = hotplug.DeviceWatcher(dev, self.stop_event)  # before open: no event slips by
         self.open_serial()
+        if self.port is None:
+            self._watcher.wait(self._retry_s)
+            self._retry_s = min(self._retry_s * 2, config.SERIAL_RETRY_MAX_S)
+
+    def _set_link(self, connected: bool, stale: bool):
+        if (connected, stale) != (self.connected, self.stale):
+            self.connected, self.stale = connected, stale
+            self._link(connected, stale)
+
+    def _read_event(self) -> bytes:
+        # block on the fd, then drain everything the driver has queued in one read
+        ready = self._selector.select(self._select_s)
+        self.wakeups += 1
+        if not ready:
+            return b''
+        self.arrival_ns = time.monotonic_ns()
+        try:
+            chunk = os.read(self.port.fileno(), config.SERIAL_READ_MAX)
+        except BlockingIOError:
+            return b''
+        if not chunk:
+            raise serial.SerialException("device readable but returned no data (disconnected?)")
+        return chunk
+
+    def run(self):
         buf = bytearray()
         while not self.stop_event.is_set():
             if self.port is None:
-                self.open_serial()
-                if self.port is None:
-                    time.sleep(1.0)
-                    continue
-            else:
+                self._reconnect()
+                continue
+            try:
+                chunk = self._read_event() if self.event_driven else self._read_polled()
+                if chunk:
+                    buf.extend(chunk)
+                    self._consume_buffer(buf)
+                if not self.stale and time.monotonic() - self.last_frame > config.STALE_AFTER_S:
+                    self._set_link(True, True)
+            except Exception as e:
+                print(f"[io_teensy] Serial error: {e}; disconnecting")
                 try:
-                    chunk = self.port.read(64)
-                    if chunk:
-                        buf.extend(chunk)
-                        self._consume_buffer(buf)
-                    else:
-                        time.sleep(0.002)
-                except Exception as e:
-                    print(f"[io_teensy] Serial error: {e}; disconnecting")
-                    self.port = None
+                    self.port.close()
+                except Exception:
+                    pass
+                self.port = None
+                self._lost_at = time.monotonic()
+                self.disconnects += 1
+                buf.clear()  # a partial frame from the old link must not prefix the new one
+                self.distance.reset()
+                self._close_selector()
+                self._set_link(False, True)
+        self._close_selector()
+        if self._watcher is not None:
+            self._watcher.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.bus is not None:
+            self.bus.close()
+        if self.session is not None:
+            self.session.close()
         if self.port:
             try:
                 self.port.close()
             except Exception:
                 pass
 
-    def _consume_buffer(self, buf: bytearray):
-        FRAME_LEN = config.FRAME_LEN_BYTES
-        while len(buf) >= FRAME_LEN:
-            if buf[0] != (config.FRAME_MAGIC & 0xFF) or (len(buf) >= 2 and buf[1] != (config.FRAME_MAGIC >> 8) & 0xFF):
-                buf.pop(0)
-                continue
-            if len(buf) < FRAME_LEN:
-                return
-            frame = bytes(buf[:FRAME_LEN])
-            del buf[:FRAME_LEN]
-            try:
-                magic, ver, ln, rpm, vss_cm_s, flags, crc = struct.unpack('<HBBHHHH', frame)
-            except struct.error:
-                continue
-            if magic != config.FRAME_MAGIC or ver != config.FRAME_VERSION:
-                continue
-            if ln != FRAME_LEN:
-                continue
-            calc_crc = _crc_func(frame[:-2])
-            if calc_crc != crc:
-                continue
-            speed_kmh = (vss_cm_s / 100.0) * 0.036
-            self.telemetry.updateFromFrame(int(rpm), float(speed_kmh), int(flags))
+    def stop(self, timeout: float = config.SERIAL_STOP_TIMEOUT_S):
+        """Stop reading and close the recorder, bus and session log (from another thread), waiting at most ``timeout``."""
+        self.stop_event.set()
+        self.join(timeout)
+
+    def _consume_buffer(self, buf: bytearray, ts_ns: int | None = None):
+        decoder = self.decoder
+        # once per read: frames decoded from the same read share its timestamp
+        ts = self.frame_ns = self.arrival_ns if ts_ns is None else ts_ns
+        speeds = self._speeds
+        speeds.clear()
+        n = decoder.consume(buf, self._derive, self._on_raw)
+        if not n:
+            return
+        self.last_frame = time.monotonic()
+        if self.stale:
+            self._set_link(True, False)
+        if speeds:
+            self.distance.sample_frames(ts, speeds)
+        if self.bus is not None:
+            self.bus.publish(decoder.values, decoder.seen | self.derived.seen, ts, n)
+
+    def _derive(self, values: list, seen: int):
+        if seen & _VSS_SEEN:
+            self._speeds.append(values[frames.CH_VSS])
+        seen = self.derived.update(values, seen, self.frame_ns)
+        if self.session is not None:
+            self.session.append(self.frame_ns, values, seen)  # every frame, so the pyramids see peaks inside a read
+        gov = self.governor
+        if gov is not None and gov.idle and not gov.due(values, self.frame_ns):
+            return  # idle and nothing moved: the values are still in the decoder for the next handover
+        self._deliver(values, seen)
+
+    def _deliver_timed(self, values: list, seen: int):
+        arrival = self.arrival_ns
+        decoded = time.monotonic_ns()
+        if self.snapshot:
+            self._handoff(values, seen, arrival)
+        else:
+            self._handoff(values, seen)
+            self.latency.post(arrival)
+        self.latency.frame(arrival, decoded, time.monotonic_ns())
+
+    def _record(self, frame: memoryview):
+        self.recorder.record(self.arrival_ns, frame)
 
 def start_serial(telemetry: Telemetry):
     reader = TeensyReader(telemetry)
@@ -78,7 +224,10 @@ def start_serial(telemetry: Telemetry):
     return reader
 
 if __name__ == '__main__':
-    tel = Telemetry()
+    import tempfile
+    from telemetry import Telemetry as _Telemetry
+    from settings_store import SettingsStore
+    tel = _Telemetry(SettingsStore(os.path.join(tempfile.mkdtemp(), 'data.json')))  # scratch odometer, not data/
     start_serial(tel)
     try:
         while True:
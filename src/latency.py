@@ -0,0 +1,133 @@
+"""End-to-end frame latency probe (exposed to QML as ``TEL.latency``).
+
+Every stage is measured from the arrival timestamp of the serial read that
+completed the frame (``TeensyReader.arrival_ns``):
+
+- ``decode``: frame validated, before it is handed to Telemetry
+- ``update``: ``updateFromChannels`` / ``publishChannels`` returned (serial thread)
+- ``gui``: values applied on the GUI thread (snapshot handoff) or a queued
+  marker delivered there (direct handoff, where the setters run on the
+  serial thread and their signals are queued the same way)
+- ``swap``: the next ``frameSwapped`` of the window after the ``gui`` stage;
+  frames superseded before a swap count from the oldest one
+
+Each stage keeps the last ``LATENCY_WINDOW`` samples in a preallocated
+``array('q')`` ring with a single writer thread, so recording is a few stores
+per frame. Percentiles are only computed when the stats are read (DevPanel
+refresh, ``SIGUSR1`` dump).
+"""
+from __future__ import annotations
+import os, json, time, signal, threading
+from array import array
+from PySide6.QtCore import QObject, Signal, Slot, Qt
+import config
+import unix_signals
+
+STAGES = ('decode', 'update', 'gui', 'swap')
+
+class _Window:
+    """Last ``size`` samples (ns) of one stage; written by one thread only."""
+    __slots__ = ('buf', 'count')
+
+    def __init__(self, size: int):
+        self.buf = array('q', bytes(8 * size))
+        self.count = 0
+
+    def add(self, ns: int) -> None:
+        buf = self.buf
+        buf[self.count % len(buf)] = ns
+        self.count += 1
+
+    def samples(self) -> list[int]:
+        n = min(self.count, len(self.buf))
+        return self.buf[:n].tolist()
+
+    def summary(self) -> dict:
+        s = sorted(self.samples())
+        if not s:
+            return {'count': self.count}
+        n = len(s)
+        at = lambda q: s[min(n - 1, int(q * n))] / 1e6
+        return {'count': self.count, 'p50': at(0.50), 'p95': at(0.95), 'p99': at(0.99), 'max': s[-1] / 1e6}
+
+class LatencyProbe(QObject):
+    _posted = Signal('qint64')
+
+    def __init__(self, window: int = config.LATENCY_WINDOW):
+        super().__init__()
+        self._stages = {name: _Window(window) for name in STAGES}
+        self._decode = self._stages['decode']
+        self._update = self._stages['update']
+        self._gui = self._stages['gui']
+        self._swap = self._stages['swap']
+        self._swap_arrival = 0  # GUI thread -> render thread, under _swap_lock
+        self._swap_lock = threading.Lock()
+        self._started = time.monotonic()
+        self._posted.connect(self.delivered)  # queued when emitted from the serial thread
+
+    # serial thread
+    def frame(self, arrival_ns: int, decoded_ns: int, updated_ns: int) -> None:
+        self._decode.add(decoded_ns - arrival_ns)
+        self._update.add(updated_ns - arrival_ns)
+
+    def post(self, arrival_ns: int) -> None:
+        """Direct handoff: mark the frame on the GUI thread via the event queue."""
+        self._posted.emit(arrival_ns)
+
+    # GUI thread
+    @Slot('qint64')
+    def delivered(self, arrival_ns: int) -> None:
+        self._gui.add(time.monotonic_ns() - arrival_ns)
+        with self._swap_lock:
+            if not self._swap_arrival:
+                self._swap_arrival = arrival_ns
+
+    def attachWindow(self, window) -> None:
+        # frameSwapped comes from the render thread with the threaded render loop
+        window.frameSwapped.connect(self._swapped, Qt.DirectConnection)
+
+    def _swapped(self) -> None:
+        with self._swap_lock:
+            arrival, self._swap_arrival = self._swap_arrival, 0
+        if arrival:
+            self._swap.add(time.monotonic_ns() - arrival)
+
+    # readers
+    @Slot(result='QVariantMap')
+    def stats(self) -> dict:
+        return {name: w.summary() for name, w in self._stages.items()}
+
+    @Slot(result=str)
+    def report(self) -> str:
+        lines = []
+        for name, s in self.stats().items():
+            if 'p50' not in s:
+                lines.append(f"{name:<7} -")
+                continue
+            lines.append(f"{name:<7} p50 {s['p50']:6.2f}  p95 {s['p95']:6.2f}  p99 {s['p99']:6.2f}  max {s['max']:6.2f} ms")
+        return "\n".join(lines)
+
+    def dump(self, path: str | None = None) -> str:
+        path = path or config.path('LATENCY_DUMP_PATH')
+        doc = {
+            'time': time.time(),
+            'uptime_s': round(time.monotonic() - self._started, 1),
+            'handoff': os.environ.get("FRAME_HANDOFF", config.FRAME_HANDOFF),
+            'stats_ms': self.stats(),
+            'samples_us': {name: [ns // 1000 for ns in w.samples()] for name, w in self._stages.items()},
+        }
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(doc, f)
+        os.replace(tmp, path)
+        return path
+
+def install_dump_signal(probe: LatencyProbe, path: str | None = None) -> None:
+    """Dump ``probe`` on SIGUSR1."""
+    def dump():
+        try:
+            print(f"[latency] dumped to {probe.dump(path)}")
+            print(probe.report())
+        except OSError as e:
+            print(f"[latency] dump failed ({e})")
+    unix_signals.handle(signal.SIGUSR1, dump)
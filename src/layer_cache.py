@@ -0,0 +1,120 @@
+"""Pre-rendered static UI layers (exposed to QML as LAYERS).
+
+``ui/components/CachedLayer.qml`` paints a static layer once with the Canvas
+API, grabs it and hands the image to ``store``; afterwards the layer is an
+``Image`` served from here by the ``image://layers/<key>`` provider.
+
+Keys are derived from the layer name, the target resolution/SCALE, the item
+size and a parameter string from QML. Images are kept in a small in-memory
+LRU and as PNGs under ``LAYER_CACHE_DIR/<ui digest>/`` so later boots skip
+the Canvas work entirely; any edit to the QML sources changes the digest and
+starts a fresh cache directory.
+"""
+from __future__ import annotations
+import os, hashlib, shutil, threading
+from collections import OrderedDict
+from PySide6.QtCore import QObject, Slot, QSize
+from PySide6.QtGui import QImage
+from PySide6.QtQuick import QQuickImageProvider
+import config
+
+UI_DIR = os.path.join(config.PROJECT_ROOT, 'ui')
+
+def ui_digest(root: str = UI_DIR) -> str:
+    h = hashlib.sha1()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.endswith('.qml'):
+                with open(os.path.join(dirpath, name), 'rb') as f:
+                    h.update(name.encode())
+                    h.update(f.read())
+    return h.hexdigest()[:12]
+
+class LayerCache(QObject):
+    def __init__(self, directory: str | None = None, mem_items: int = config.LAYER_CACHE_MEM_ITEMS):
+        super().__init__()
+        base = directory or config.path('LAYER_CACHE_DIR', 'LAYER_CACHE_DIR')
+        digest = ui_digest()
+        self.dir = os.path.join(base, digest)
+        self._mem: OrderedDict[str, QImage] = OrderedDict()
+        self._mem_items = mem_items
+        self._lock = threading.Lock()  # the provider may be called from the QML loader thread
+        self.hits = 0
+        self.misses = 0
+        try:
+            os.makedirs(self.dir, exist_ok=True)
+            for name in os.listdir(base):  # caches of older QML revisions
+                if name != digest and os.path.isdir(os.path.join(base, name)):
+                    shutil.rmtree(os.path.join(base, name), ignore_errors=True)
+        except OSError as e:
+            print(f"[layers] disk cache disabled ({e})")
+            self.dir = None
+
+    def _path(self, key: str) -> str | None:
+        return os.path.join(self.dir, key + '.png') if self.dir else None
+
+    @Slot(str, int, int, str, result=str)
+    def key(self, name: str, width: int, height: int, params: str) -> str:
+        src = f"{config.WIDTH}x{config.HEIGHT}@{config.SCALE}|{width}x{height}|{params}"
+        return f"{name}-{hashlib.sha1(src.encode()).hexdigest()[:16]}"
+
+    @Slot(str, result=bool)
+    def has(self, key: str) -> bool:
+        with self._lock:
+            if key in self._mem:
+                return True
+        path = self._path(key)
+        return path is not None and os.path.isfile(path)
+
+    @Slot(str, QImage)
+    def store(self, key: str, image: QImage):
+        self.misses += 1
+        self._remember(key, image)
+        path = self._path(key)
+        if path is None:
+            return
+        tmp = path + '.tmp'
+        if image.save(tmp, 'PNG'):
+            os.replace(tmp, path)
+        else:
+            print(f"[layers] could not write {path}")
+
+    def image(self, key: str) -> QImage | None:
+        with self._lock:
+            img = self._mem.get(key)
+            if img is not None:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return img
+        path = self._path(key)
+        if path is None or not os.path.isfile(path):
+            return None
+        img = QImage(path)
+        if img.isNull():
+            return None
+        self.hits += 1
+        self._remember(key, img)
+        return img
+
+    def _remember(self, key: str, image: QImage):
+        with self._lock:
+            self._mem[key] = image
+            self._mem.move_to_end(key)
+            while len(self._mem) > self._mem_items:
+                self._mem.popitem(last=False)
+
+class LayerImageProvider(QQuickImageProvider):
+    def __init__(self, cache: LayerCache):
+        super().__init__(QQuickImageProvider.ImageType.Image)
+        self._cache = cache
+
+    def requestImage(self, key: str, size: QSize, requested: QSize) -> QImage:
+        img = self._cache.image(key)
+        if img is None:
+            print(f"[layers] missing {key}")
+            img = QImage(1, 1, QImage.Format_ARGB32_Premultiplied)
+            img.fill(0)
+        size.setWidth(img.width())
+        size.setHeight(img.height())
+        return img
@@ -1,16 +1,29 @@
 from __future__ import annotations
-import os, sys, json, time
+import os, sys, time, signal, weakref
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 if PROJECT_ROOT not in sys.path: sys.path.insert(0, PROJECT_ROOT)
 
+import boot
+boot.mark('python')
+
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtCore import Qt, QUrl, qInstallMessageHandler, QtMsgType, QLibraryInfo, QTimer
 
 import config
 from telemetry import Telemetry
+from settings_store import SettingsStore
 import io_teensy
+import io_process
+import serial_child
+from layer_cache import LayerCache, LayerImageProvider
+from icon_atlas import IconAtlas, IconImageProvider, AtlasBuilder
+import ring_gauge
+import latency
+import storage
+import unix_signals
+boot.mark('imports')
 
 def _qt_msg_handler(mode, ctx, message):
     if mode in (QtMsgType.QtWarningMsg, QtMsgType.QtCriticalMsg, QtMsgType.QtFatalMsg):
@@ -71,60 +84,72 @@ def main():
 
     if dev_mode_int == 1:
         print("[MODE] DEVELOP_MODE=1 (desktop dev)")
-        os.environ.setdefault("QML_XHR_ALLOW_FILE_READ", "1")
         os.environ.setdefault("QT_QUICK_BACKEND", "software")
     elif dev_mode_int == 2:
         print("[MODE] DEVELOP_MODE=2 (demo mode – synthetic data, fullscreen)")
-        os.environ.setdefault("QML_XHR_ALLOW_FILE_READ", "1")
         _choose_platform_for_prod()
     else:
         print("[MODE] Production (wait for Teensy, no demo fallback)")
-        os.environ.setdefault("QML_XHR_ALLOW_FILE_READ", "1")
         _choose_platform_for_prod()
+    boot.mark('platform')
+    serial_child.pin('gui')  # before Qt starts its threads: they inherit it
+    fast_boot = config.flag('FAST_BOOT')
+    if fast_boot:
+        os.environ.setdefault("QML_DISK_CACHE_PATH", config.path('QML_CACHE_DIR'))
+        print(f"[BOOT] Fast boot (QML cache {os.environ['QML_DISK_CACHE_PATH']})")
     app = QGuiApplication(sys.argv)
     app.setApplicationName("VirtualCluster")
-
-    tel = Telemetry()
-
+    # systemd stop / Ctrl+C: quit through the event loop so aboutToQuit flushes distance, settings and the session log
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        unix_signals.handle(signum, app.quit)
+    boot.mark('app')
+
+    settings = SettingsStore(storage.DATA_PATH)
+    tel = Telemetry(settings)
+    app.aboutToQuit.connect(tel.shutdown)
+    stats = tel.getSignalStats()
+    if stats is not None:
+        def _dump_signal_stats():
+            try:
+                print(f"[signals] report written to {stats.dump()}")
+            except OSError as e:
+                print(f"[signals] report not written ({e})")
+        app.aboutToQuit.connect(_dump_signal_stats)
+    boot.mark('telemetry')
+
+    ring_gauge.register()
+    layers = LayerCache()
     engine = QQmlApplicationEngine()
+    engine.addImageProvider("layers", LayerImageProvider(layers))
+    icons = IconAtlas()
+    engine.addImageProvider("icons", IconImageProvider(icons))
+    engine.rootContext().setContextProperty("ICONS", icons)
     engine.rootContext().setContextProperty("WIDTH", config.WIDTH)
     engine.rootContext().setContextProperty("HEIGHT", config.HEIGHT)
     engine.rootContext().setContextProperty("DESIGN_WIDTH", getattr(config, 'DESIGN_WIDTH', config.WIDTH))
     engine.rootContext().setContextProperty("DESIGN_HEIGHT", getattr(config, 'DESIGN_HEIGHT', config.HEIGHT))
     engine.rootContext().setContextProperty("SCALE", getattr(config, 'SCALE', 1.0))
     engine.rootContext().setContextProperty("TEL", tel)
+    engine.rootContext().setContextProperty("COLD_REDLINE", tel.cold_redline)
+    engine.rootContext().setContextProperty("SETTINGS", settings)
+    engine.rootContext().setContextProperty("LAYERS", layers)
     engine.rootContext().setContextProperty("DEV_MODE", dev_mode_int == 1)
     engine.rootContext().setContextProperty("DEV_MODE_INT", dev_mode_int)
+    engine.rootContext().setContextProperty("FAST_BOOT", fast_boot)
 
     qml_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ui', 'Main.qml'))
     if not os.path.isfile(qml_path):
         print(f"QML not found: {qml_path}")
         return 1
+    boot.mark('engine')
     engine.load(QUrl.fromLocalFile(qml_path))
+    boot.mark('qml loaded')
 
     if not engine.rootObjects():
         print("Failed to load QML (no root objects)")
         return 1
 
     win = engine.rootObjects()[0]
-    data_path = os.path.join(PROJECT_ROOT, 'data', 'data.json')
-    if os.path.isfile(data_path):
-        try:
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data_obj = json.load(f)
-            key_map = [
-                ('FR','fr'), ('FL','fl'), ('RR','rr'), ('RL','rl'),
-                ('fr','fr'), ('fl','fl'), ('rr','rr'), ('rl','rl'),
-                ('odometer','odometerValue'), ('trip','tripValue')
-            ]
-            for key_json, key_qml in key_map:
-                if key_json in data_obj:
-                    try:
-                        win.setProperty(key_qml, data_obj[key_json])
-                    except Exception:
-                        pass
-        except Exception as e:
-            print(f"[data.json] Python load error: {e}")
     try:
         win.setWidth(config.WIDTH)
         win.setHeight(config.HEIGHT)
@@ -137,12 +162,24 @@ def main():
     else:
         win.setFlags(Qt.FramelessWindowHint | Qt.Window)
         win.showFullScreen()
+    boot.watch(win, app.quit if os.environ.get("STARTUP_TRACE_EXIT") else None)
+    if icons.dir is not None and (os.environ.get("ICON_ATLAS_EXIT") or not icons.current):
+        # first boot at this resolution (or tools/build_icon_atlas.py): measure the scene, build for the next start
+        AtlasBuilder(win, icons, app.quit if os.environ.get("ICON_ATLAS_EXIT") else None)  # parented to win
 
     if dev_mode_int == 1:
         dev_qml = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ui', 'DevPanel.qml'))
-        if os.path.isfile(dev_qml):
-            engine.load(QUrl.fromLocalFile(dev_qml))
+        engine_ref = weakref.ref(engine)  # the connection must not keep the engine alive past tel
+        def _load_dev_panel():
+            eng = engine_ref()
+            if eng is not None and os.path.isfile(dev_qml) and win.property('contentReady'):
+                win.contentReadyChanged.disconnect(_load_dev_panel)
+                eng.load(QUrl.fromLocalFile(dev_qml))
+        # second window: only once the cluster is up
+        win.contentReadyChanged.connect(_load_dev_panel)
+        _load_dev_panel()
     if dev_mode_int == 2:
+        tel.prepareDemo()
         start_t = time.time()
         demo_timer = QTimer()
         demo_timer.setInterval(16)
@@ -151,9 +188,24 @@ def main():
             tel.demoTick(t)
         demo_timer.timeout.connect(_demo_tick)
         demo_timer.start()
+        governor = tel.getIdleGovernor()
+        if governor is not None:
+            governor.addTimer(demo_timer, config.IDLE_DEMO_INTERVAL_MS)
         print("[DEMO] Running synthetic data (DEVELOP_MODE=2)")
     else:
-        io_teensy.start_serial(tel)
+        if io_teensy.handoff_mode() == "snapshot":
+            tel.attachWindow(win)
+        probe = tel.getLatency()
+        if probe is not None:
+            probe.attachWindow(win)
+            latency.install_dump_signal(probe)
+            print(f"[latency] probe on; kill -USR1 {os.getpid()} dumps to {config.path('LATENCY_DUMP_PATH')}")
+        if config.flag('SERIAL_PROCESS'):
+            reader = io_process.start_serial(tel)
+        else:
+            reader = io_teensy.start_serial(tel)
+            serial_child.pin('serial', reader.native_id)
+        app.aboutToQuit.connect(reader.stop)  # closes the session log; bounded by SERIAL_STOP_TIMEOUT_S
 
     return app.exec()
 
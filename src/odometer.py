@@ -0,0 +1,87 @@
+"""Per-frame distance integration for the odometer and trip.
+
+After every read that decoded frames the serial reader calls
+``DistanceIntegrator.sample_frames(t_ns, speeds)`` with the read timestamp
+and the speed of each of those frames. They were sent during the interval
+since the previous read, so it is split evenly between them and every frame
+is one ``sample``: speed is integrated with the trapezoidal rule per frame,
+so acceleration and braking between frames are accounted for, and a reader
+that stalled with frames waiting in the port buffer still gets their
+distance. Intervals between frames longer than ``DISTANCE_MAX_GAP_S`` (link
+loss, reconnect, a stalled replay) are not bridged: they are dropped and
+counted in ``gaps`` / ``gap_s`` instead of guessing a speed for them.
+
+``total_km`` only grows and is only written by the sampling thread. The
+consumer (Telemetry, GUI thread) remembers how much of it it has applied and
+sets ``notify_km`` to the total at which the next displayed tenth changes;
+``on_due`` fires once when that is reached and stays quiet until the
+consumer arms it again, so the GUI is only woken for a visible change.
+"""
+from __future__ import annotations
+import math
+from typing import Callable
+import config
+
+_NS_PER_HOUR = 3600 * 10**9
+
+class DistanceIntegrator:
+    __slots__ = ('total_km', 'notify_km', 'on_due', 'max_gap_ns', 'samples', 'gaps', 'gap_s', '_t', '_v')
+
+    def __init__(self, on_due: Callable[[], None] | None = None, max_gap_s: float = config.DISTANCE_MAX_GAP_S):
+        self.total_km = 0.0
+        self.notify_km = math.inf
+        self.on_due = on_due
+        self.max_gap_ns = int(max_gap_s * 1e9)
+        self.samples = 0
+        self.gaps = 0
+        self.gap_s = 0.0
+        self._t = None
+        self._v = 0.0
+
+    def sample(self, t_ns: int, speed_kmh: float) -> None:
+        t0, v0 = self._t, self._v
+        self._t, self._v = t_ns, speed_kmh
+        self.samples += 1
+        if t0 is None:
+            return
+        dt = t_ns - t0
+        if dt <= 0:
+            return  # several frames in one read
+        if dt > self.max_gap_ns:
+            self.gaps += 1
+            self.gap_s += dt / 1e9
+            return
+        if v0 > 0 or speed_kmh > 0:
+            self.total_km += (max(0.0, v0) + max(0.0, speed_kmh)) * 0.5 * dt / _NS_PER_HOUR
+            if self.total_km >= self.notify_km:
+                self.notify_km = math.inf
+                if self.on_due is not None:
+                    self.on_due()
+
+    def sample_frames(self, t_ns: int, speeds: list) -> None:
+        """The speeds of the frames decoded from one read, the last one received at ``t_ns``."""
+        t0 = self._t
+        n = len(speeds)
+        if t0 is None or n == 1 or t_ns <= t0:
+            for v in speeds:
+                self.sample(t_ns, v)
+            return
+        dt = t_ns - t0
+        for k in range(1, n + 1):
+            self.sample(t0 + dt * k // n, speeds[k - 1])
+
+    def add(self, km: float) -> None:
+        """Distance integrated elsewhere (the serial process); ``on_due`` as for ``sample``."""
+        self.total_km += km
+        if self.total_km >= self.notify_km:
+            self.notify_km = math.inf
+            if self.on_due is not None:
+                self.on_due()
+
+    def reset(self) -> None:
+        """Forget the last sample (link lost); the next one starts a new segment."""
+        self._t = None
+        self._v = 0.0
+
+    def stats(self) -> dict:
+        return {'total_km': self.total_km, 'samples': self.samples, 'gaps': self.gaps, 'gap_s': round(self.gap_s, 3)}
@@ -0,0 +1,68 @@
+"""Replay frames through the serial decode path without a serial port.
+
+``ReplayReader`` is a ``TeensyReader`` whose bytes come from an iterable of
+``(ts_ns, frame)`` pairs (a recorded ring file or generated frames) instead
+of the port; everything after the read - ``_consume_buffer``, the handoff
+mode and ``Telemetry`` - is the production code. Distance is integrated
+over the recorded timestamps, so it does not depend on the replay speed.
+
+speed: 1.0 = real time, N = N x faster, None = as fast as possible.
+"""
+from __future__ import annotations
+import time
+from typing import Iterable, Iterator
+from io_teensy import TeensyReader
+import frames
+import frame_recorder
+
+def ring_source(path: str, t0_ns: int | None = None, t1_ns: int | None = None) -> Iterator[tuple[int, bytes]]:
+    ring = frame_recorder.FrameRing(path)
+    try:
+        yield from ring.frames(t0_ns, t1_ns)
+    finally:
+        ring.close()
+
+def sweep_source(count: int, rate_hz: float = 100.0) -> Iterator[tuple[int, bytes]]:
+    """Deterministic rpm/speed sweep with blinkers and a draining tank."""
+    period_ns = int(1e9 / rate_hz)
+    for i in range(count):
+        t = i / rate_hz
+        ph = (t % 6.0) / 6.0
+        frac = ph * 2.0 if ph < 0.5 else 2.0 - ph * 2.0
+        flags = (int(t * 1.5) & 1) | ((int(t * 1.5) + 1) & 1) << 1
+        flags |= (max(0, 100 - int(t / 10)) & 0xFF) << 4
+        yield i * period_ns, frames.encode_v1(int(frac * 7000), round(frac * 230.0 / frames.KMH_PER_CM_S), flags)
+
+class ReplayReader(TeensyReader):
+    def __init__(self, telemetry, source: Iterable[tuple[int, bytes]], speed: float | None = 1.0):
+        super().__init__(telemetry, record=False, publish=False)
+        self.source = source
+        self.speed = speed
+        self.frames_fed = 0
+        self._buf = bytearray()
+
+    def run(self):
+        buf = self._buf
+        start_wall = time.monotonic_ns()
+        start_ts = None
+        for ts, frame in self.source:
+            if self.stop_event.is_set():
+                break
+            if self.speed:
+                if start_ts is None:
+                    start_ts = ts
+                due = start_wall + int((ts - start_ts) / self.speed)
+                delay = due - time.monotonic_ns()
+                if delay > 0:
+                    time.sleep(delay / 1e9)
+            self.arrival_ns = time.monotonic_ns()
+            buf.extend(frame)
+            self._consume_buffer(buf, ts)
+            self.frames_fed += 1
+
+    def feed(self, frame) -> None:
+        """Push one frame synchronously on the calling thread (benchmarks)."""
+        self._buf.extend(frame)
+        self.arrival_ns = time.monotonic_ns()
+        self._consume_buffer(self._buf)
+        self.frames_fed += 1
@@ -0,0 +1,361 @@
+"""Native RPM progress arc and marker for ``Gauge.qml`` (QML module ``Cluster 1.0``).
+
+``RingGauge`` builds the arc, its glow passes and the marker from scene-graph
+geometry nodes. The full-sweep vertex strips are computed once per geometry
+change; a value change only hands the leading slice of each strip (plus the
+exact end point) to the node, and the marker is a static triangle under a
+transform node, so nothing is rasterised on the CPU.
+
+The Qt Quick software adaptation does not draw custom geometry nodes, so
+``RingGaugePainted`` provides the same properties for that backend. It paints
+with QPainter and only invalidates the part of the ring between the old and
+new value plus the old and new marker, instead of a full Canvas repaint.
+
+Property names follow ``Gauge.qml``; ``markerValue`` is the (smoothed) marker
+position, which the gauge animates in QML.
+"""
+from __future__ import annotations
+import math
+from PySide6.QtCore import Property, Signal, QRectF, QPointF, Qt
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen, QPolygonF, QMatrix4x4
+from PySide6.QtQml import qmlRegisterType
+from PySide6.QtQuick import (QQuickItem, QQuickPaintedItem, QSGNode, QSGGeometryNode, QSGGeometry,
+                             QSGFlatColorMaterial, QSGTransformNode)
+
+ARC_SEGMENTS = 180   # over the full sweep
+CAP_SEGMENTS = 8     # per round cap
+
+# name: (type, default, affects) - "geometry" rebuilds the strips, "value" only re-slices them
+_PROPS = {
+    'value': (float, 0.0, 'value'),
+    'markerValue': (float, 0.0, 'value'),
+    'min': (float, 0.0, 'geometry'),
+    'max': (float, 100.0, 'geometry'),
+    'startAngle': (float, -130.0, 'geometry'),
+    'endAngle': (float, 130.0, 'geometry'),
+    'orientationOffset': (float, -90.0, 'geometry'),
+    'redFrom': (float, 80.0, 'value'),
+    'warnFrom': (float, -1.0, 'value'),
+    'warnTo': (float, -1.0, 'value'),
+    'redlineColor': (QColor, QColor('#ff3333'), 'value'),
+    'warnColor': (QColor, QColor('#e6c400'), 'value'),
+    'showInnerProgress': (bool, True, 'geometry'),
+    'innerProgressRadius': (float, 100.0, 'geometry'),
+    'innerProgressWidth': (float, 8.0, 'geometry'),
+    'innerProgressColor': (QColor, QColor('white'), 'value'),
+    'innerProgressRoundCap': (bool, True, 'geometry'),
+    'innerProgressGlow': (bool, True, 'geometry'),
+    'innerProgressGlowSpreadPx': (float, 4.0, 'geometry'),
+    'innerProgressGlowPasses': (int, 4, 'geometry'),
+    'innerProgressGlowMaxAlpha': (float, 0.21, 'geometry'),
+    'innerProgressGlowFalloffPower': (float, 1.4, 'geometry'),
+    'innerProgressWhiteGlow': (bool, True, 'geometry'),
+    'innerProgressWhiteGlowSpreadPx': (float, 6.0, 'geometry'),
+    'innerProgressWhiteGlowPasses': (int, 5, 'geometry'),
+    'innerProgressWhiteGlowMaxAlpha': (float, 0.38, 'geometry'),
+    'innerProgressWhiteGlowFalloffPower': (float, 1.05, 'geometry'),
+    'markerStartRadius': (float, 30.0, 'geometry'),
+    'markerEndRadius': (float, 90.0, 'geometry'),
+    'markerBaseWidth': (float, 6.0, 'geometry'),
+    'markerColor': (QColor, QColor('#ff3333'), 'value'),
+}
+
+def _base(qt_class: type, name: str) -> type:
+    # Signals/Properties must exist when the class is created for Qt to see them.
+    # Values live in a plain dict: attribute lookups on the Qt wrapper are slow.
+    defaults = {prop: default for prop, (_, default, _) in _PROPS.items()}
+    ns = {}
+
+    def __init__(self, parent=None):
+        qt_class.__init__(self, parent)
+        self._pv = dict(defaults)
+    ns['__init__'] = __init__
+
+    for prop, (kind, default, affects) in _PROPS.items():
+        notify = Signal()
+
+        def getter(self, prop=prop):
+            return self._pv[prop]
+
+        def setter(self, v, prop=prop, affects=affects, sig=prop + 'Changed'):
+            pv = self._pv
+            if pv[prop] == v:
+                return
+            pv[prop] = v
+            if affects == 'geometry':
+                self._geometry_dirty = True
+            self._propertyChanged(prop)
+            getattr(self, sig).emit()
+
+        ns[prop + 'Changed'] = notify
+        ns[prop] = Property(kind, getter, setter, notify=notify)
+    return type(qt_class)(name, (qt_class,), ns)
+
+class _RingMath:
+    """Angles, band list and colours shared by both implementations."""
+
+    def _angle(self, v: float) -> float:
+        lo, hi = self.min, self.max
+        frac = (v - lo) / (hi - lo) if hi != lo else 0.0
+        frac = 0.0 if frac < 0.0 else 1.0 if frac > 1.0 else frac
+        return math.radians(self.startAngle + frac * (self.endAngle - self.startAngle) + self.orientationOffset)
+
+    def _inWarn(self, v: float) -> bool:
+        return self.warnFrom >= 0 and self.warnFrom <= v <= self.warnTo
+
+    def _coreColor(self) -> QColor:
+        v = self.value
+        return self.redlineColor if v >= self.redFrom else self.warnColor if self._inWarn(v) else self.innerProgressColor
+
+    def _haloColor(self) -> QColor:
+        v = self.value
+        return self.redlineColor if v >= self.redFrom else self.warnColor if self._inWarn(v) else self.markerColor
+
+    def _markerFill(self) -> QColor:
+        return self.redlineColor if self.value >= self.redFrom else self.markerColor
+
+    def _bands(self) -> list[tuple[float, float, str]]:
+        """(line width, alpha, 'halo'|'white'|'core'), drawn in order."""
+        bands = []
+        w = self.innerProgressWidth
+        for enabled, passes, spread, max_alpha, power, kind in (
+                (self.innerProgressGlow, self.innerProgressGlowPasses, self.innerProgressGlowSpreadPx,
+                 self.innerProgressGlowMaxAlpha, self.innerProgressGlowFalloffPower, 'halo'),
+                (self.innerProgressWhiteGlow, self.innerProgressWhiteGlowPasses, self.innerProgressWhiteGlowSpreadPx,
+                 self.innerProgressWhiteGlowMaxAlpha, self.innerProgressWhiteGlowFalloffPower, 'white')):
+            if not enabled:
+                continue
+            passes = max(1, passes)
+            for gp in range(passes, 0, -1):
+                outer = gp / passes
+                alpha = max_alpha * (1.0 - outer) ** power
+                if alpha > 0:
+                    bands.append((w + 2 * spread * outer, alpha, kind))
+        bands.append((w, 1.0, 'core'))
+        return bands
+
+    def _bandColor(self, kind: str, alpha: float) -> QColor:
+        c = QColor(self._haloColor() if kind == 'halo' else self._coreColor())
+        c.setAlphaF(c.alphaF() * alpha)
+        return c
+
+class RingGauge(_RingMath, _base(QQuickItem, '_RingGaugeBase')):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFlag(QQuickItem.ItemHasContents, True)
+        self._geometry_dirty = True
+        self._strips = []   # per band: full-sweep [inner0, outer0, inner1, ...] Point2D
+        self._band_meta = []
+        self.widthChanged.connect(self._sizeChanged)
+        self.heightChanged.connect(self._sizeChanged)
+
+    def _sizeChanged(self):
+        self._geometry_dirty = True
+        self.update()
+
+    def _propertyChanged(self, name: str):
+        self.update()
+
+    def _point(self, x: float, y: float):
+        p = QSGGeometry.Point2D()
+        p.set(x, y)
+        return p
+
+    def _rebuild(self):
+        cx, cy = self.width() / 2, self.height() / 2
+        r = self.innerProgressRadius
+        a0, a1 = self._angle(self.min), self._angle(self.max)
+        self._band_meta = self._bands()
+        self._strips = []
+        for lw, _, _ in self._band_meta:
+            ri, ro = max(0.0, r - lw / 2), r + lw / 2
+            strip = []
+            for k in range(ARC_SEGMENTS + 1):
+                a = a0 + (a1 - a0) * k / ARC_SEGMENTS
+                c, s = math.cos(a), math.sin(a)
+                strip.append(self._point(cx + ri * c, cy + ri * s))
+                strip.append(self._point(cx + ro * c, cy + ro * s))
+            self._strips.append(strip)
+
+    @staticmethod
+    def _geometryNode(mode) -> QSGGeometryNode:
+        node = QSGGeometryNode()
+        geom = QSGGeometry(QSGGeometry.defaultAttributes_Point2D(), 0)
+        geom.setDrawingMode(mode)
+        node.setGeometry(geom)
+        node.setFlag(QSGNode.Flag.OwnsGeometry)
+        mat = QSGFlatColorMaterial()
+        node.setMaterial(mat)
+        node.setFlag(QSGNode.Flag.OwnsMaterial)
+        node.setFlag(QSGNode.Flag.OwnedByParent)
+        return node
+
+    @staticmethod
+    def _setColor(node: QSGGeometryNode, color: QColor):
+        mat = node.material()
+        if mat.color() != color:
+            mat.setColor(color)
+            node.markDirty(QSGNode.DirtyStateBit.DirtyMaterial)
+
+    @staticmethod
+    def _setVertices(node: QSGGeometryNode, points: list):
+        geom = node.geometry()
+        geom.allocate(len(points))
+        if points:
+            geom.setVertexDataAsPoint2D(points)
+        node.markDirty(QSGNode.DirtyStateBit.DirtyGeometry)
+
+    def updatePaintNode(self, root, data):
+        if self.width() <= 0 or self.height() <= 0:
+            return root
+        if root is None or self._geometry_dirty:
+            # tree: band strips..., cap triangles, marker transform -> triangle
+            self._rebuild()
+            root = QSGNode()
+            for _ in self._band_meta:
+                root.appendChildNode(self._geometryNode(QSGGeometry.DrawingMode.DrawTriangleStrip))
+            root.appendChildNode(self._geometryNode(QSGGeometry.DrawingMode.DrawTriangles))
+            marker = QSGTransformNode()
+            marker.setFlag(QSGNode.Flag.OwnedByParent)
+            tri = self._geometryNode(QSGGeometry.DrawingMode.DrawTriangles)
+            base, tip = sorted((self.markerStartRadius, self.markerEndRadius))
+            hw = self.markerBaseWidth / 2
+            self._setVertices(tri, [self._point(base, -hw), self._point(tip, 0), self._point(base, hw)])
+            marker.appendChildNode(tri)
+            root.appendChildNode(marker)
+            self._geometry_dirty = False
+        self._updateArc(root)
+        self._updateMarker(root.lastChild())
+        return root
+
+    def _updateArc(self, root: QSGNode):
+        cx, cy = self.width() / 2, self.height() / 2
+        r = self.innerProgressRadius
+        a0, amax = self._angle(self.min), self._angle(self.max)
+        a = self._angle(self.value)
+        frac = (a - a0) / (amax - a0) if amax != a0 else 0.0
+        k = int(frac * ARC_SEGMENTS)
+        show = self.showInnerProgress and r > 0 and frac > 0
+        c, s = math.cos(a), math.sin(a)
+        node = root.firstChild()
+        for (lw, alpha, kind), strip in zip(self._band_meta, self._strips):
+            if show:
+                ri, ro = max(0.0, r - lw / 2), r + lw / 2
+                pts = strip[:2 * (k + 1)]
+                pts.append(self._point(cx + ri * c, cy + ri * s))
+                pts.append(self._point(cx + ro * c, cy + ro * s))
+            else:
+                pts = []
+            self._setVertices(node, pts)
+            self._setColor(node, self._bandColor(kind, alpha))
+            node = node.nextSibling()
+        caps = []
+        if show and self.innerProgressRoundCap:
+            hw = self.innerProgressWidth / 2
+            for ang, facing in ((a0, -1.0), (a, 1.0)):
+                px, py = cx + r * math.cos(ang), cy + r * math.sin(ang)
+                # half disc pointing along the arc direction (facing) at this end
+                tangent = ang + facing * math.pi / 2
+                for j in range(CAP_SEGMENTS):
+                    t0 = tangent - math.pi / 2 + math.pi * j / CAP_SEGMENTS
+                    t1 = tangent - math.pi / 2 + math.pi * (j + 1) / CAP_SEGMENTS
+                    caps += (self._point(px, py),
+                             self._point(px + hw * math.cos(t0), py + hw * math.sin(t0)),
+                             self._point(px + hw * math.cos(t1), py + hw * math.sin(t1)))
+        self._setVertices(node, caps)
+        self._setColor(node, self._bandColor('core', 1.0))
+
+    def _updateMarker(self, marker: QSGTransformNode):
+        m = QMatrix4x4()
+        m.translate(self.width() / 2, self.height() / 2)
+        m.rotate(math.degrees(self._angle(self.markerValue)), 0, 0, 1)
+        marker.setMatrix(m)
+        marker.markDirty(QSGNode.DirtyStateBit.DirtyMatrix)
+        self._setColor(marker.firstChild(), self._markerFill())
+
+class RingGaugePainted(_RingMath, _base(QQuickPaintedItem, '_RingGaugePaintedBase')):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAntialiasing(True)
+        self._geometry_dirty = True
+        self._painted_value = 0.0
+        self._painted_marker = 0.0
+        self._painted_colors = None
+
+    def _propertyChanged(self, name: str):
+        if self._geometry_dirty or name not in ('value', 'markerValue'):
+            self.update()
+            return
+        colors = (self._coreColor().rgba(), self._haloColor().rgba(), self._markerFill().rgba())
+        if colors != self._painted_colors:
+            self.update()
+            return
+        if name == 'value':
+            rect = self._sectorRect(self._painted_value, self.value)
+        else:
+            rect = self._markerRect(self._painted_marker).united(self._markerRect(self.markerValue))
+        self.update(rect.toAlignedRect())
+
+    def _margin(self) -> float:
+        spread = 0.0
+        if self.innerProgressGlow:
+            spread = max(spread, self.innerProgressGlowSpreadPx)
+        if self.innerProgressWhiteGlow:
+            spread = max(spread, self.innerProgressWhiteGlowSpreadPx)
+        return self.innerProgressWidth / 2 + spread + 2
+
+    def _sectorRect(self, v0: float, v1: float) -> QRectF:
+        cx, cy = self.width() / 2, self.height() / 2
+        a0, a1 = sorted((self._angle(v0), self._angle(v1)))
+        r, m = self.innerProgressRadius, self._margin()
+        steps = max(1, int((a1 - a0) / math.radians(5)) + 1)
+        xs, ys = [], []
+        for i in range(steps + 1):
+            a = a0 + (a1 - a0) * i / steps
+            xs.append(cx + r * math.cos(a))
+            ys.append(cy + r * math.sin(a))
+        return QRectF(min(xs) - m, min(ys) - m, max(xs) - min(xs) + 2 * m, max(ys) - min(ys) + 2 * m)
+
+    def _markerRect(self, v: float) -> QRectF:
+        poly = self._markerPolygon(v)
+        return poly.boundingRect().adjusted(-2, -2, 2, 2)
+
+    def _markerPolygon(self, v: float) -> QPolygonF:
+        cx, cy = self.width() / 2, self.height() / 2
+        base, tip = sorted((self.markerStartRadius, self.markerEndRadius))
+        hw = self.markerBaseWidth / 2
+        a = self._angle(v)
+        c, s = math.cos(a), math.sin(a)
+        return QPolygonF([QPointF(cx + base * c + hw * s, cy + base * s - hw * c),
+                          QPointF(cx + tip * c, cy + tip * s),
+                          QPointF(cx + base * c - hw * s, cy + base * s + hw * c)])
+
+    def paint(self, painter: QPainter):
+        self._geometry_dirty = False
+        self._painted_value = self.value
+        self._painted_marker = self.markerValue
+        self._painted_colors = (self._coreColor().rgba(), self._haloColor().rgba(), self._markerFill().rgba())
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        cx, cy = self.width() / 2, self.height() / 2
+        r = self.innerProgressRadius
+        a0, a1 = self._angle(self.min), self._angle(self.value)
+        if self.showInnerProgress and r > 0 and a1 > a0:
+            rect = QRectF(cx - r, cy - r, 2 * r, 2 * r)
+            start = -math.degrees(a0)
+            span = -math.degrees(a1 - a0)
+            path = QPainterPath()
+            path.arcMoveTo(rect, start)
+            path.arcTo(rect, start, span)
+            painter.setBrush(Qt.NoBrush)
+            for lw, alpha, kind in self._bands():
+                pen = QPen(self._bandColor(kind, alpha), lw)
+                pen.setCapStyle(Qt.RoundCap if self.innerProgressRoundCap else Qt.FlatCap)
+                painter.setPen(pen)
+                painter.drawPath(path)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._markerFill())
+        painter.drawPolygon(self._markerPolygon(self.markerValue))
+
+def register():
+    qmlRegisterType(RingGauge, 'Cluster', 1, 0, 'RingGauge')
+    qmlRegisterType(RingGaugePainted, 'Cluster', 1, 0, 'RingGaugePainted')
@@ -0,0 +1,128 @@
+"""Serial I/O child process (``SERIAL_PROCESS=1``), no Qt.
+
+Started by ``io_process.SerialProcess`` as ``python src/serial_child.py
+--child SHM_PATH STATE_FD``. Runs the stock ``TeensyReader``: it owns the
+port, decodes, derives, integrates distance and runs the frame recorder,
+public telemetry bus and session log. After every read that decoded a frame
+the channel vector goes into the private ``telemetry_bus`` segment
+``SHM_PATH``; link state and integrated distance go to the pipe ``STATE_FD``
+as ``STATE`` records. The child stops on SIGTERM or when its parent goes
+away.
+
+Also holds the CPU affinity helpers (``SERIAL_CPUS`` / ``GUI_CPUS``), which
+both processes and the threaded mode use.
+"""
+from __future__ import annotations
+import os, sys, struct, signal, threading
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))  # config
+import config
+import odometer
+import io_teensy
+import telemetry_bus
+
+STATE = struct.Struct('<??d')  # connected, stale, km integrated by this child
+STATE_READ = STATE.size * 64  # whole records only (each write is atomic)
+
+def cpus(name: str) -> set[int] | None:
+    """CPU set for ``name`` ('serial' or 'gui') from env / config, None for any."""
+    key = name.upper() + "_CPUS"
+    raw = os.environ.get(key, getattr(config, key))
+    out = set()
+    for part in str(raw).replace(' ', '').split(','):
+        if '-' in part:
+            a, b = part.split('-')
+            out.update(range(int(a), int(b) + 1))
+        elif part:
+            out.add(int(part))
+    return out or None
+
+def pin(name: str, tid: int = 0) -> None:
+    """Pin the calling process (``tid`` 0) or thread ``tid`` to the CPUs configured for ``name``."""
+    want = cpus(name)
+    if want is None:
+        return
+    try:
+        os.sched_setaffinity(tid, want)
+        print(f"[serial_child] {name} pinned to CPU {','.join(map(str, sorted(want)))}")
+    except (OSError, ValueError) as e:
+        print(f"[serial_child] {name} affinity {sorted(want)} not applied ({e})")
+
+class _ChildSink:
+    """What ``TeensyReader`` needs from Telemetry, in the child: link state and distance go to the pipe."""
+    def __init__(self, fd: int):
+        self.fd = fd
+        self.connected = False
+        self.stale = False
+        self.distance = odometer.DistanceIntegrator(self._distance_due)
+        self.distance.notify_km = config.SERIAL_PROCESS_DISTANCE_KM
+
+    def publishChannels(self, values, seen, arrival_ns=0):
+        pass  # the reader publishes once per read to the private bus (_ChildReader)
+
+    updateFromChannels = publishChannels
+
+    def getLatency(self):
+        return None
+
+    def getDistanceIntegrator(self):
+        return self.distance
+
+    def getIdleGovernor(self):
+        return None
+
+    def setLinkState(self, connected, stale):
+        self.connected, self.stale = connected, stale
+        self.send()
+
+    def _distance_due(self):
+        self.distance.notify_km = self.distance.total_km + config.SERIAL_PROCESS_DISTANCE_KM
+        self.send()
+
+    def send(self):
+        try:
+            os.write(self.fd, STATE.pack(self.connected, self.stale, self.distance.total_km))
+        except BrokenPipeError:
+            pass  # parent gone; the watchdog stops the reader
+
+class _ChildReader(io_teensy.TeensyReader):
+    """The stock reader (recorder, public bus and session log as configured) that also publishes each read to the private bus."""
+    def __init__(self, sink: _ChildSink, path: str):
+        super().__init__(sink)
+        self.link = telemetry_bus.BusWriter(path, rescan_s=0.05)  # the parent subscribes after start; polled this often only without inotify
+
+    def _consume_buffer(self, buf, ts_ns=None):
+        before = self.decoder.frames
+        super()._consume_buffer(buf, ts_ns)
+        n = self.decoder.frames - before
+        if n:
+            self.link.publish(self.decoder.values, self.decoder.seen | self.derived.seen, self.frame_ns, n)
+
+def child_main(path: str, fd: int) -> int:
+    pin('serial')
+    sink = _ChildSink(fd)
+    reader = _ChildReader(sink, path)
+    signal.signal(signal.SIGTERM, lambda *_: reader.stop_event.set())
+    ppid = os.getppid()
+    def watchdog():
+        while not reader.stop_event.wait(0.5):
+            if os.getppid() != ppid:
+                reader.stop_event.set()
+    threading.Thread(target=watchdog, daemon=True).start()
+    sink.send()  # ready: the bus segment exists
+    try:
+        reader.run()  # on this thread; returns after stop_event, recorder/bus/session closed
+    except KeyboardInterrupt:
+        pass
+    reader.link.close()
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    # python src/serial_child.py --child SHM_PATH STATE_FD (started by SerialProcess)
+    if len(sys.argv) != 4 or sys.argv[1] != '--child':
+        sys.exit("usage: serial_child.py --child SHM_PATH STATE_FD")
+    sys.exit(child_main(sys.argv[2], int(sys.argv[3])))
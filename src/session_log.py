@@ -0,0 +1,495 @@
+"""Per-drive session log: typed column chunks plus min/max/mean pyramids.
+
+The serial reader appends the channel vector after every decoded frame,
+derived and calibrated channels included (``SessionLogger.append``, a few
+``array.append`` calls; frames decoded from one read share its timestamp),
+so the pyramids keep the peaks between reads. Every
+``SESSION_CHUNK_ROWS`` rows, and at the latest every ``SESSION_FLUSH_S``
+(the logger thread's timer takes the partial chunk, so a power cut loses at
+most that much), the column arrays are handed to the logger thread, which
+appends each column to its own file in one write, folds the chunk into the
+pyramids and rewrites ``meta.json``. If the thread falls
+``SESSION_QUEUE_CHUNKS`` chunks behind, chunks are dropped (and counted)
+rather than blocking the reader, so memory stays bounded however long the
+session runs. No data for ``SESSION_SPLIT_S`` (ignition off) closes the
+session on the same timer; the next sample starts a new one.
+
+A session closed at exit is left uncompressed so quitting only waits for
+the last chunk; the logger compresses it (and sessions a crash left open,
+cut to their last complete chunk) when it starts next time.
+
+The SD card is not allowed to fill up: when the logger starts and whenever
+a session begins, the oldest sessions are deleted until at most
+``SESSION_MAX_SESSIONS`` remain and together they take at most
+``SESSION_MAX_MB`` (``prune``).
+
+Session directory ``<SESSION_LOG_DIR>/<YYYYmmdd-HHMMSS>/``:
+
+- ``t.col`` (int64 ns, monotonic), ``seen.col`` (u32 channel mask) and one
+  ``<channel>.col`` per channel in ``frames.CHANNELS`` and ``derived.NAMES``
+  (u16 for integer channels and the gear, float32 otherwise); raw
+  little-endian arrays while the session runs, zlib-compressed to
+  ``.col.z`` when it ends
+- ``pyr<L>.bin`` for L = 1, 10, 60 s: one ``PYRAMID_ROW`` per bucket
+  (bucket start ns, row count, then min/max/mean per channel, NaN where the
+  channel was not received), never compressed so a summary or a plot of an
+  hour reads a few hundred kB at most
+- ``meta.json``: columns, row count, chunk index, wall clock offset
+
+``Session`` reads them back; ``python src/session_log.py [DIR]`` lists the
+sessions or summarises one.
+"""
+from __future__ import annotations
+import os, sys, json, math, time, zlib, queue, struct, bisect, shutil, threading
+from array import array
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))  # config
+import frames
+import derived
+import config
+
+VERSION = 2  # 1: frame channels only, u16 seen mask (still readable, columns are described in meta.json)
+LEVELS = (1, 10, 60)
+CHANNELS = [(ch, name, 'H' if scale == 1 else 'f') for ch, (name, _, scale) in sorted(frames.CHANNELS.items())] + \
+           [(ch, name, 'H' if ch == derived.GEAR else 'f') for ch, name in sorted(derived.NAMES.items())]
+NAMES = [name for _, name, _ in CHANNELS]
+PYRAMID_ROW = struct.Struct('<qI' + 'fff' * len(CHANNELS))
+_NAN = float('nan')
+_STOP = object()
+
+def _new_columns():
+    return array('q'), array('I'), [array(code) for _, _, code in CHANNELS]
+
+class _Level:
+    """Running min/max/sum/count of the current bucket of one pyramid level."""
+    def __init__(self, seconds: int, t0_ns: int, f, parent: _Level | None):
+        self.span = seconds * 10**9
+        self.t0 = t0_ns
+        self.f = f
+        self.parent = parent
+        self.bucket = None
+        self.rows = 0
+        self.stats = [None] * len(CHANNELS)
+        self.emitted = 0
+
+    def add(self, bucket_start: int, rows: int, stats: list) -> None:
+        b = (bucket_start - self.t0) // self.span
+        if b != self.bucket:
+            self.emit()
+            self.bucket = b
+        self.rows += rows
+        acc = self.stats
+        for c, s in enumerate(stats):
+            if s is None:
+                continue
+            a = acc[c]
+            if a is None:
+                acc[c] = list(s)
+            else:
+                if s[0] < a[0]: a[0] = s[0]
+                if s[1] > a[1]: a[1] = s[1]
+                a[2] += s[2]
+                a[3] += s[3]
+
+    def emit(self) -> None:
+        if self.bucket is None:
+            return
+        start = self.t0 + self.bucket * self.span
+        row = [start, self.rows]
+        for a in self.stats:
+            row += (a[0], a[1], a[2] / a[3]) if a else (_NAN, _NAN, _NAN)
+        self.f.write(PYRAMID_ROW.pack(*row))
+        self.emitted += 1
+        if self.parent is not None:
+            self.parent.add(start, self.rows, self.stats)
+        self.bucket = None
+        self.rows = 0
+        self.stats = [None] * len(CHANNELS)
+
+class _SessionWriter:
+    """Files of one session; used by the logger thread only."""
+    def __init__(self, root: str, t0_ns: int, wall_offset_ns: int):
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime((t0_ns + wall_offset_ns) / 1e9))
+        self.path = os.path.join(root, stamp)
+        n = 1
+        while os.path.exists(self.path):
+            n += 1
+            self.path = os.path.join(root, f"{stamp}-{n}")
+        os.makedirs(self.path)
+        self.meta = {
+            'version': VERSION,
+            'start_ns': t0_ns,
+            'wall_offset_ns': wall_offset_ns,
+            'columns': [{'name': 't', 'type': 'q'}, {'name': 'seen', 'type': 'I'}] +
+                       [{'name': name, 'type': code, 'channel': ch} for ch, name, code in CHANNELS],
+            'levels': list(LEVELS),
+            'pyramid_row': PYRAMID_ROW.format,
+            'rows': 0,
+            'chunks': [],
+            'dropped_rows': 0,
+            'compressed': False,
+        }
+        self._files = [open(os.path.join(self.path, c['name'] + '.col'), 'ab') for c in self.meta['columns']]
+        self._pyr_files = [open(os.path.join(self.path, f"pyr{s}.bin"), 'ab') for s in LEVELS]
+        parent = None
+        levels = []
+        for seconds, f in reversed(list(zip(LEVELS, self._pyr_files))):
+            parent = _Level(seconds, t0_ns, f, parent)
+            levels.append(parent)
+        self._base = levels[-1]
+        self._levels = levels[::-1]
+        self.last_ts = t0_ns
+        print(f"[session] logging to {self.path}")
+
+    def write(self, t: array, seen: array, cols: list, dropped: int) -> None:
+        for f, col in zip(self._files, [t, seen] + cols):
+            col.tofile(f)
+        for f in self._files:
+            f.flush()
+        self._pyramid(t, seen, cols)
+        meta = self.meta
+        meta['chunks'].append([meta['rows'], t[0], t[-1]])
+        meta['rows'] += len(t)
+        meta['dropped_rows'] += dropped
+        self.last_ts = t[-1]
+        self._write_meta()
+
+    def _pyramid(self, t: array, seen: array, cols: list) -> None:
+        base = self._base
+        span = base.span
+        t0 = base.t0
+        n = len(t)
+        i = 0
+        while i < n:
+            start = t0 + (t[i] - t0) // span * span
+            end = bisect.bisect_left(t, start + span, i)
+            stats = []
+            for c, col in enumerate(cols):
+                bit = 1 << CHANNELS[c][0]
+                lo = i
+                if not seen[end - 1] & bit:
+                    stats.append(None)
+                    continue
+                while not seen[lo] & bit:  # received for the first time inside this bucket
+                    lo += 1
+                s = col[lo:end]
+                stats.append((min(s), max(s), float(sum(s)), end - lo))
+            base.add(start, end - i, stats)
+            i = end
+
+    def _write_meta(self) -> None:
+        tmp = os.path.join(self.path, 'meta.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.meta, f)
+        os.replace(tmp, os.path.join(self.path, 'meta.json'))
+
+    def finish(self, compress: bool = True) -> None:
+        for level in self._levels:
+            level.emit()  # open buckets, finest first so they reach the coarser levels
+        for f in self._files + self._pyr_files:
+            f.close()
+        self._write_meta()
+        if compress:
+            compress_session(self.path, self.meta)
+        print(f"[session] closed {self.path} ({self.meta['rows']} rows{'' if compress else ', compressed at next start'})")
+
+def compress_session(path: str, meta: dict | None = None) -> bool:
+    """Compress the raw columns of a closed session, cut to ``meta['rows']``; False if left raw."""
+    if meta is None:
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+    rows = meta['rows']
+    for c in meta['columns']:
+        raw = os.path.join(path, c['name'] + '.col')
+        if not os.path.exists(raw):
+            continue  # compressed before an earlier attempt stopped
+        try:
+            _compress(raw, raw + '.z', rows * array(c['type']).itemsize)
+            os.remove(raw)
+        except OSError as e:
+            print(f"[session] compress {raw} failed ({e}); keeping it raw")
+            return False
+    meta['compressed'] = True
+    tmp = os.path.join(path, 'meta.json.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(path, 'meta.json'))
+    return True
+
+def _compress(src: str, dst: str, size: int, block: int = 1 << 20) -> None:
+    z = zlib.compressobj(6)
+    with open(src, 'rb') as fi, open(dst + '.tmp', 'wb') as fo:
+        while size > 0:
+            data = fi.read(min(block, size))
+            if not data:
+                break
+            size -= len(data)
+            fo.write(z.compress(data))
+        fo.write(z.flush())
+    os.replace(dst + '.tmp', dst)
+
+def _disk_bytes(path: str) -> int:
+    total = 0
+    for name in os.listdir(path):
+        try:
+            total += os.path.getsize(os.path.join(path, name))
+        except OSError:
+            pass
+    return total
+
+def prune(root: str, max_sessions: int = config.SESSION_MAX_SESSIONS, max_mb: float = config.SESSION_MAX_MB,
+          reserve: int = 0) -> list[str]:
+    """Delete the oldest sessions beyond ``max_sessions`` (less ``reserve`` about to start) or ``max_mb`` in total
+    (0 = no limit); returns the deleted paths."""
+    paths = sessions(root)
+    keep = max(0, max_sessions - reserve)
+    sizes = [_disk_bytes(p) for p in paths]
+    total = sum(sizes)
+    limit = max_mb * 2**20
+    removed = []
+    for path, size in zip(paths, sizes):
+        if not (max_sessions and len(paths) - len(removed) > keep) and not (max_mb and total > limit):
+            break
+        try:
+            shutil.rmtree(path)
+        except OSError as e:
+            print(f"[session] cannot delete {path} ({e})")
+            continue
+        removed.append(path)
+        total -= size
+    if removed:
+        print(f"[session] deleted {len(removed)} old session(s), {len(paths) - len(removed)} kept ({total / 2**20:.0f} MB)")
+    return removed
+
+class SessionLogger(threading.Thread):
+    """Column buffers filled by the serial thread, written by this thread."""
+    def __init__(self, root: str, chunk_rows: int = config.SESSION_CHUNK_ROWS,
+                 split_s: float = config.SESSION_SPLIT_S, max_queued: int = config.SESSION_QUEUE_CHUNKS,
+                 flush_s: float = config.SESSION_FLUSH_S, max_sessions: int = config.SESSION_MAX_SESSIONS,
+                 max_mb: float = config.SESSION_MAX_MB):
+        super().__init__(daemon=True, name="session-log")
+        self.root = root
+        self.chunk_rows = chunk_rows
+        self.split_ns = int(split_s * 1e9)
+        self.flush_s = flush_s
+        self.max_sessions = max_sessions
+        self.max_mb = max_mb
+        self._queue: queue.Queue = queue.Queue(max_queued)
+        self._lock = threading.Lock()  # the column buffers: appended by the serial thread, taken by the timer
+        self._appended = time.monotonic()  # when the last row came in
+        self._t, self._seen, self._cols = _new_columns()
+        self._pairs = list(zip(self._cols, [ch for ch, _, _ in CHANNELS]))
+        self._last_ts = None
+        self._dropped = 0
+        self.rows = 0
+        self.dropped_rows = 0
+        self.chunks = 0
+        self.sessions = 0
+        self._wall_offset = time.time_ns() - time.monotonic_ns()
+        self._session: _SessionWriter | None = None
+        os.makedirs(root, exist_ok=True)
+
+    # serial thread
+    def append(self, ts_ns: int, values: list, seen: int) -> None:
+        with self._lock:
+            last = self._last_ts
+            if last is not None and ts_ns - last > self.split_ns and self._t:
+                self._flush()  # the logger thread starts a new session at the gap
+            self._last_ts = ts_ns
+            self._t.append(ts_ns)
+            self._seen.append(seen)
+            for col, ch in self._pairs:
+                col.append(values[ch])
+            self.rows += 1
+            self._appended = time.monotonic()
+            if len(self._t) >= self.chunk_rows:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Queue the buffered rows as a chunk (lock held)."""
+        item = (self._t, self._seen, self._cols, self._dropped)
+        self._t, self._seen, self._cols = _new_columns()
+        self._pairs = list(zip(self._cols, [ch for ch, _, _ in CHANNELS]))
+        try:
+            self._queue.put_nowait(item)
+            self._dropped = 0
+        except queue.Full:
+            self._dropped += len(item[0])
+            self.dropped_rows += len(item[0])
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Hand over the partial chunk and wait for it to be written (the session is compressed at next start)."""
+        with self._lock:
+            if self._t:
+                self._flush()
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            print("[session] logger thread stuck, last chunks not written")
+            return
+        self.join(timeout)
+
+    # logger thread
+    def run(self):
+        self._compress_leftovers()
+        self._prune()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_s)
+            except queue.Empty:
+                self._tick()
+                continue
+            if item is _STOP:
+                break
+            t, seen, cols, dropped = item
+            try:
+                s = self._session
+                if s is None or t[0] - s.last_ts > self.split_ns:
+                    if s is not None:
+                        s.finish()
+                    self._prune(1)  # room for the one about to start
+                    self._session = s = _SessionWriter(self.root, t[0], self._wall_offset)
+                    self.sessions += 1
+                s.write(t, seen, cols, dropped)
+                self.chunks += 1
+            except Exception as e:
+                print(f"[session] write error: {e}")
+        if self._session is not None:
+            try:
+                self._session.finish(compress=False)
+            except Exception as e:
+                print(f"[session] close error: {e}")
+
+    def _tick(self) -> None:
+        """Nothing queued for ``flush_s``: take the partial chunk, or close the session after ``SESSION_SPLIT_S`` without data."""
+        with self._lock:
+            if self._t:
+                self._flush()  # back through the queue, after any full chunk the reader queued meanwhile
+                return
+            quiet = time.monotonic() - self._appended
+        s = self._session
+        if s is not None and quiet * 1e9 > self.split_ns:
+            self._session = None
+            try:
+                s.finish()
+            except Exception as e:
+                print(f"[session] close error: {e}")
+
+    def _prune(self, reserve: int = 0) -> None:
+        try:
+            prune(self.root, self.max_sessions, self.max_mb, reserve)
+        except OSError as e:
+            print(f"[session] prune failed ({e})")
+
+    def _compress_leftovers(self) -> None:
+        for path in sessions(self.root):
+            try:
+                with open(os.path.join(path, 'meta.json')) as f:
+                    meta = json.load(f)
+                if not meta.get('compressed') and compress_session(path, meta):
+                    print(f"[session] compressed {path} ({meta['rows']} rows)")
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[session] cannot compress {path} ({e})")
+
+class Session:
+    """Read-only view of a session directory."""
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, 'meta.json')) as f:
+            self.meta = json.load(f)
+        if self.meta.get('version') not in (1, VERSION):
+            raise ValueError(f"{path}: session format {self.meta.get('version')}")
+        self.channels = [c['name'] for c in self.meta['columns'][2:]]
+        self._row = struct.Struct(self.meta['pyramid_row'])
+
+    @property
+    def rows(self) -> int:
+        return self.meta['rows']
+
+    def duration_s(self) -> float:
+        chunks = self.meta['chunks']
+        return (chunks[-1][2] - self.meta['start_ns']) / 1e9 if chunks else 0.0
+
+    def column(self, name: str) -> array:
+        """All samples of one column (``t``, ``seen`` or a channel)."""
+        code = next(c['type'] for c in self.meta['columns'] if c['name'] == name)
+        base = os.path.join(self.path, name + '.col')
+        col = array(code)
+        if os.path.exists(base + '.z'):
+            with open(base + '.z', 'rb') as f:
+                col.frombytes(zlib.decompress(f.read()))
+        else:
+            with open(base, 'rb') as f:
+                data = f.read(self.rows * col.itemsize)  # a crash may leave a partial chunk behind
+            col.frombytes(data[:len(data) - len(data) % col.itemsize])
+        return col
+
+    def pyramid(self, level: int) -> dict:
+        """``{'t': [...], 'n': [...], channel: {'min': [...], 'max': [...], 'mean': [...]}}`` for one level (s)."""
+        with open(os.path.join(self.path, f"pyr{level}.bin"), 'rb') as f:
+            data = f.read()
+        data = data[:len(data) - len(data) % self._row.size]
+        out = {'t': [], 'n': []}
+        per = [{'min': [], 'max': [], 'mean': []} for _ in self.channels]
+        for row in self._row.iter_unpack(data):
+            out['t'].append(row[0])
+            out['n'].append(row[1])
+            for c, d in enumerate(per):
+                d['min'].append(row[2 + 3 * c])
+                d['max'].append(row[3 + 3 * c])
+                d['mean'].append(row[4 + 3 * c])
+        out.update(zip(self.channels, per))
+        return out
+
+    def summary(self, level: int = LEVELS[-1]) -> dict:
+        """Per-channel min/max/mean of the whole session from the coarsest pyramid."""
+        p = self.pyramid(level)
+        out = {}
+        for name in self.channels:
+            d = p[name]
+            rows = [(lo, hi, mean, n) for lo, hi, mean, n in zip(d['min'], d['max'], d['mean'], p['n']) if not math.isnan(mean)]
+            if not rows:
+                continue
+            total = sum(r[3] for r in rows)
+            out[name] = {'min': min(r[0] for r in rows), 'max': max(r[1] for r in rows),
+                         'mean': sum(r[2] * r[3] for r in rows) / total}
+        return out
+
+def sessions(root: str | None = None) -> list[str]:
+    root = root or config.path('SESSION_LOG_DIR', 'SESSION_LOG')
+    if not root or not os.path.isdir(root):
+        return []
+    return sorted(os.path.join(root, d) for d in os.listdir(root) if os.path.isfile(os.path.join(root, d, 'meta.json')))
+
+def from_config() -> SessionLogger | None:
+    root = config.path('SESSION_LOG_DIR', 'SESSION_LOG')
+    if root is None:
+        return None
+    try:
+        logger = SessionLogger(root)
+    except Exception as e:
+        print(f"[session] disabled ({e})")
+        return None
+    logger.start()
+    return logger
+
+if __name__ == '__main__':
+    # python src/session_log.py            - list sessions
+    # python src/session_log.py DIR [LEVEL] - summary, or every bucket of pyramid LEVEL (s)
+    if len(sys.argv) < 2:
+        for path in sessions():
+            s = Session(path)
+            print(f"{os.path.basename(path)}  {s.duration_s() / 60:6.1f} min  {s.rows} rows"
+                  f"{'' if s.meta['compressed'] else '  (open or not closed cleanly)'}")
+        sys.exit(0)
+    s = Session(sys.argv[1])
+    if len(sys.argv) > 2:
+        p = s.pyramid(int(sys.argv[2]))
+        for i, t in enumerate(p['t']):
+            cells = ' '.join(f"{name}={p[name]['min'][i]:g}/{p[name]['mean'][i]:.4g}/{p[name]['max'][i]:g}"
+                             for name in s.channels if not math.isnan(p[name]['mean'][i]))
+            print(f"{(t - s.meta['start_ns']) / 1e9:8.0f}s n={p['n'][i]} {cells}")
+    else:
+        print(f"{s.duration_s() / 60:.1f} min, {s.rows} rows, {s.meta['dropped_rows']} dropped")
+        for name, d in s.summary().items():
+            print(f"{name:<14} min {d['min']:10.2f}  mean {d['mean']:10.2f}  max {d['max']:10.2f}")
@@ -0,0 +1,177 @@
+"""Single in-memory copy of data/data.json exposed to QML as SETTINGS.
+
+The file is parsed once at startup. QML reads and writes notifying
+properties; changes are written back by one coalescing writer thread, and
+the distance journal commits its snapshots through the same document so no
+writer can drop another writer's keys.
+"""
+from __future__ import annotations
+import threading, time
+from PySide6.QtCore import QObject, Signal, Property, Slot
+import config
+import storage
+
+_WHEEL_MIN = 1
+_WHEEL_MAX = 32
+
+class _CoalescingWriter(threading.Thread):
+    def __init__(self, store: 'SettingsStore'):
+        super().__init__(daemon=True, name="settings-writer")
+        self._store = store
+        self._wake = threading.Event()
+        self._stopping = False
+
+    def kick(self):
+        self._wake.set()
+
+    def stop(self):
+        self._stopping = True
+        self._wake.set()
+        self.join(2.0)
+
+    def run(self):
+        while not self._stopping:
+            self._wake.wait()
+            if self._stopping:
+                break
+            time.sleep(config.SETTINGS_WRITE_DELAY_S)  # let bursts of edits collapse into one write
+            self._wake.clear()
+            self._store._write()
+        self._store._write()
+
+class SettingsStore(QObject):
+    frChanged = Signal(int)
+    flChanged = Signal(int)
+    rrChanged = Signal(int)
+    rlChanged = Signal(int)
+    exhaustChanged = Signal(bool)
+    odometerChanged = Signal(int)
+    tripChanged = Signal(float)
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._dirty = False
+        doc = storage.load_data(path)
+        for upper in ('FR', 'FL', 'RR', 'RL'):
+            if upper in doc:
+                doc.setdefault(upper.lower(), doc.pop(upper))
+        for key in ('fr', 'fl', 'rr', 'rl'):
+            doc[key] = self._clampWheel(doc.get(key, _WHEEL_MIN))
+        doc['exhaust'] = bool(doc.get('exhaust', False))
+        self._doc = doc
+        self._odometer = int(doc.get('odometer', 0) or 0)
+        self._trip = float(doc.get('trip', 0.0) or 0.0)
+        self._writer = _CoalescingWriter(self)
+        self._writer.start()
+
+    @staticmethod
+    def _clampWheel(v) -> int:
+        try:
+            v = int(v)
+        except (TypeError, ValueError):
+            v = _WHEEL_MIN
+        return max(_WHEEL_MIN, min(_WHEEL_MAX, v))
+
+    def document(self) -> dict:
+        with self._lock:
+            return dict(self._doc)
+
+    def _set(self, key: str, value, signal) -> None:
+        with self._lock:
+            if self._doc.get(key) == value:
+                return
+            self._doc[key] = value
+            self._dirty = True
+        signal.emit(value)
+        self._writer.kick()
+
+    def _write(self):
+        with self._io_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                doc = dict(self._doc)
+                self._dirty = False
+            try:
+                storage.atomic_write_json(self.path, doc)
+            except Exception as e:
+                print(f"[settings] write error: {e}")
+                with self._lock:
+                    self._dirty = True
+
+    def commit(self, updates: dict):
+        """Merge ``updates`` and write synchronously (durable on return)."""
+        with self._lock:
+            self._doc.update(updates)
+            self._dirty = True
+        self._write()
+
+    def close(self):
+        self._writer.stop()
+
+    # SUSPENSION (damper clicks per corner)
+    def getFr(self) -> int:
+        return self._doc['fr']
+
+    def setFr(self, v: int):
+        self._set('fr', self._clampWheel(v), self.frChanged)
+
+    fr = Property(int, getFr, setFr, notify=frChanged)
+
+    def getFl(self) -> int:
+        return self._doc['fl']
+
+    def setFl(self, v: int):
+        self._set('fl', self._clampWheel(v), self.flChanged)
+
+    fl = Property(int, getFl, setFl, notify=flChanged)
+
+    def getRr(self) -> int:
+        return self._doc['rr']
+
+    def setRr(self, v: int):
+        self._set('rr', self._clampWheel(v), self.rrChanged)
+
+    rr = Property(int, getRr, setRr, notify=rrChanged)
+
+    def getRl(self) -> int:
+        return self._doc['rl']
+
+    def setRl(self, v: int):
+        self._set('rl', self._clampWheel(v), self.rlChanged)
+
+    rl = Property(int, getRl, setRl, notify=rlChanged)
+
+    @Slot(int, int, int, int)
+    def setSuspension(self, fr: int, fl: int, rr: int, rl: int):
+        self.setFr(fr); self.setFl(fl); self.setRr(rr); self.setRl(rl)
+
+    # EXHAUST FLAPS
+    def getExhaust(self) -> bool:
+        return self._doc['exhaust']
+
+    def setExhaust(self, v: bool):
+        self._set('exhaust', bool(v), self.exhaustChanged)
+
+    exhaust = Property(bool, getExhaust, setExhaust, notify=exhaustChanged)
+
+    # DISTANCE (live display values; persisted by the distance journal)
+    def getOdometer(self) -> int:
+        return self._odometer
+
+    def getTrip(self) -> float:
+        return self._trip
+
+    odometer = Property(int, getOdometer, notify=odometerChanged)
+    trip = Property(float, getTrip, notify=tripChanged)
+
+    def setDistance(self, odometer_km: int, trip_km: float):
+        if odometer_km != self._odometer:
+            self._odometer = odometer_km
+            self.odometerChanged.emit(odometer_km)
+        if trip_km != self._trip:
+            self._trip = trip_km
+            self.tripChanged.emit(trip_km)
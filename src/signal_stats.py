@@ -0,0 +1,130 @@
+"""Per-channel signal statistics (exposed to QML as ``TEL.signalStats``).
+
+``ChannelStore`` always counts, per channel, the ``<name>Changed`` emits,
+the sets dropped as unchanged (within the deadband) and the sets held by the
+rate limit. With ``SIGNAL_STATS`` on, every emit also goes through
+``timed``: the emit runs the directly connected QML bindings and handlers
+before it returns, so its duration is what that channel costs in QML per
+change. Canvas repaints they request happen later in the render and are not
+included. With ``FRAME_HANDOFF=direct`` the setters run on the serial
+thread and the QML side is queued, so there the time covers only the emit.
+
+A 1 s timer turns the counters into rates (last second and peak). The
+DevPanel shows ``report()``; ``dump()`` (on exit, and the DevPanel button
+through ``writeReport()``) writes everything to ``SIGNAL_STATS_DUMP_PATH`` as
+JSON, channels sorted by total handler time, the first candidates to
+quantise or throttle.
+"""
+from __future__ import annotations
+import os, json, time
+from array import array
+from PySide6.QtCore import QObject, QTimer, Slot
+import config
+from channels import CHANNELS
+
+class SignalStats(QObject):
+    def __init__(self, store, parent: QObject | None = None):
+        super().__init__(parent)
+        n = len(CHANNELS)
+        self._store = store
+        self._ns = array('q', bytes(8 * n))  # handler time, written by the emitting thread only
+        self._max_ns = array('q', bytes(8 * n))
+        self._started = time.monotonic()
+        self._prev = self._counters()
+        self._prev_ns = array('q', self._ns)
+        self._prev_t = self._started
+        self._rate = [(0.0, 0.0, 0.0, 0.0)] * n  # last second: emits, unchanged, held per s; handler ms per s
+        self._peak = [0.0] * n  # emits/s
+        self._timer = QTimer(self)
+        self._timer.setInterval(1000)
+        self._timer.timeout.connect(self._sample)
+        self._timer.start()
+        store._profile = self
+
+    def timed(self, i: int, signal, v) -> None:
+        t = time.perf_counter_ns()
+        signal.emit(v)
+        dt = time.perf_counter_ns() - t
+        self._ns[i] += dt
+        if dt > self._max_ns[i]:
+            self._max_ns[i] = dt
+
+    def _counters(self) -> tuple[array, array, array]:
+        s = self._store
+        return array('q', s._emitted), array('q', s._unchanged), array('q', s._held)
+
+    @Slot()
+    def _sample(self):
+        now = time.monotonic()
+        dt = now - self._prev_t
+        if dt <= 0:
+            return
+        cur = self._counters()
+        rates = []
+        for i in range(len(CHANNELS)):
+            r = tuple((c[i] - p[i]) / dt for c, p in zip(cur, self._prev))
+            ms = (self._ns[i] - self._prev_ns[i]) / 1e6 / dt
+            rates.append(r + (ms,))
+            if r[0] > self._peak[i]:
+                self._peak[i] = r[0]
+        self._rate = rates
+        self._prev, self._prev_ns, self._prev_t = cur, array('q', self._ns), now
+
+    # readers
+    def channels(self) -> list[dict]:
+        """One row per channel, most handler time first."""
+        uptime = max(1e-9, time.monotonic() - self._started)
+        emitted, unchanged, held = self._counters()
+        rows = []
+        for i, ch in enumerate(CHANNELS):
+            e = emitted[i]
+            rows.append({
+                'name': ch.name,
+                'emitted': e,
+                'unchanged': unchanged[i],
+                'held': held[i],
+                'emits_per_s': round(e / uptime, 2),
+                'peak_emits_per_s': round(self._peak[i], 1),
+                'handler_ms': round(self._ns[i] / 1e6, 3),
+                'handler_mean_us': round(self._ns[i] / e / 1e3, 1) if e else 0.0,
+                'handler_max_us': round(self._max_ns[i] / 1e3, 1),
+                'handler_ms_per_s': round(self._ns[i] / 1e6 / uptime, 3),
+                'deadband': ch.deadband,
+                'min_interval_s': ch.min_interval_s,
+            })
+        rows.sort(key=lambda r: (-r['handler_ms'], -r['emitted']))
+        return rows
+
+    @Slot(result=str)
+    def report(self, rows: int = 12) -> str:
+        """Last second, busiest channels first."""
+        order = sorted(range(len(CHANNELS)), key=lambda i: (-self._rate[i][3], -self._rate[i][0]))
+        lines = [f"{'channel':<14}{'emit/s':>7}{'same/s':>8}{'held/s':>7}{'ms/s':>7}{'max us':>8}"]
+        for i in order[:rows]:
+            e, u, h, ms = self._rate[i]
+            lines.append(f"{CHANNELS[i].name:<14}{e:>7.0f}{u:>8.0f}{h:>7.0f}{ms:>7.2f}{self._max_ns[i] / 1e3:>8.0f}")
+        return "\n".join(lines)
+
+    @Slot(result=str)
+    def writeReport(self) -> str:
+        """DevPanel button: ``dump()``, with the outcome as text (errors must not reach QML as exceptions)."""
+        try:
+            return f"Written: {self.dump()}"
+        except OSError as e:
+            return f"Not written: {e.strerror or e}"
+
+    def dump(self, path: str | None = None) -> str:
+        path = path or config.path('SIGNAL_STATS_DUMP_PATH')
+        rows = self.channels()
+        doc = {
+            'time': time.time(),
+            'uptime_s': round(time.monotonic() - self._started, 1),
+            'handoff': os.environ.get("FRAME_HANDOFF", config.FRAME_HANDOFF),
+            'handler_ms_total': round(sum(r['handler_ms'] for r in rows), 3),
+            'channels': rows,
+        }
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(doc, f, indent=1)
+        os.replace(tmp, path)
+        return path
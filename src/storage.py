@@ -0,0 +1,45 @@
+"""data/data.json access shared by every writer.
+
+Writes merge into the current document under one lock and land on disk via
+write-to-temp + fsync + rename, so a power cut leaves either the old or the
+new file, never a truncated one.
+"""
+from __future__ import annotations
+import os, json, threading
+
+DATA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'data.json'))
+
+_lock = threading.Lock()
+
+def load_data(path: str) -> dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            obj = json.load(f)
+        return obj if isinstance(obj, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"[storage] load error ({path}): {e}")
+        return {}
+
+def atomic_write_json(path: str, obj: dict):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    try:
+        dfd = os.open(os.path.dirname(path) or '.', os.O_RDONLY)
+        try:
+            os.fsync(dfd)
+        finally:
+            os.close(dfd)
+    except OSError:
+        pass
+
+def update_data(updates: dict, path: str):
+    with _lock:
+        obj = load_data(path)
+        obj.update(updates)
+        atomic_write_json(path, obj)
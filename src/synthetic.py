@@ -0,0 +1,311 @@
+"""Synthetic drive: a deterministic drive cycle precomputed into arrays.
+
+``SyntheticDrive(seed, rate_hz, profile=...)`` computes one cycle up front.
+Every row is a frame channel vector (``frames`` ids and units) in one flat
+``array('d')``.
+
+- ``drive``: cold start and idle, a gentle pull away, a left turn, a hard
+  run through the gears to the shift light, a motorway cruise, an off-ramp,
+  a spirited section, braking to a stop, with a small driver/gearbox model:
+  speed follows the segment targets, gears follow rpm with
+  ``config.GEARBOX_RATIOS`` (so ``TEL.gear`` detects them), rpm, AFR and
+  fuel flow follow throttle, water and oil warm up, the tank drains by the
+  integrated fuel flow (``SYNTH_TANK_L``). The warning lamps do what they
+  would on the road: a bulb check at key-on, ABS on hard braking, rear fog,
+  check engine, wheel pressure and underglow in the segments that set them.
+  The seed only drives the sensor noise and idle hunting.
+- ``sweep``: every gauge and lamp through its full range on independent
+  triangle waves (rpm 0-7000, speed 0-230 km/h, 40-140 degC water, ...),
+  the demo mode's look for checking the layout.
+
+Demo mode plays ``SYNTH_PROFILE`` (env ``DEMO_PROFILE``).
+
+Playback costs a slice copy per tick: ``fill(i, values)`` for Telemetry
+(demo mode), ``v1_frames()`` / ``v2_frames()`` for the encoded frames
+(built once, cached), ``source()`` for ``replay.ReplayReader`` and
+``stream()`` to pace them into a serial device or pty at any rate.
+
+    python src/synthetic.py --pty --rate 2000    # prints a TEENSY_DEV for main.py
+    python src/synthetic.py /dev/ttyUSB1 --v2
+"""
+from __future__ import annotations
+import os, sys, time, math, random
+from array import array
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))  # config
+import config
+import frames
+import derived
+
+_FOG = frames.STATUS_FOG_REAR
+_CEL = frames.STATUS_CHECK_ENGINE
+_TPMS = frames.STATUS_WHEEL_PRESSURE
+_GLOW = frames.STATUS_UNDERGLOW
+
+# (seconds, target km/h, aggression 0..1, blinker 0 / 1 left / 2 right, STATUS bits besides low beam)
+SEGMENTS = (
+    (8.0, 0.0, 0.0, 0, _GLOW),           # cold start, idle
+    (14.0, 55.0, 0.35, 0, 0),            # pull away
+    (10.0, 55.0, 0.2, 0, 0),
+    (6.0, 25.0, 0.3, 1, 0),              # slow down for a left turn
+    (18.0, 105.0, 1.0, 0, 0),            # full throttle through the gears
+    (35.0, 110.0, 0.2, 0, _FOG),         # motorway cruise in fog
+    (10.0, 50.0, 0.5, 2, 0),             # off-ramp
+    (16.0, 90.0, 0.9, 0, _CEL),          # spirited section, misfire
+    (12.0, 0.0, 0.6, 2, _TPMS),          # brake to a stop, slow puncture
+    (8.0, 0.0, 0.0, 0, _TPMS | _GLOW),
+)
+BULB_CHECK_S = 2.0  # key-on: every warning lamp lit
+_BULB_CHECK = _CEL | frames.STATUS_CHARGING | frames.STATUS_ABS | _TPMS
+SWEEP_S = 132.0  # sweep profile length: whole periods of the rpm (6 s) and fuel (22 s) waves
+
+PROFILES = ('drive', 'sweep')
+W = frames.CHANNEL_COUNT
+SEEN = sum(1 << ch for ch in frames.CHANNELS)
+IDLE_RPM = 850.0
+_SLOW_EVERY_S = 0.1  # v2: temperatures, pressures, fuel ride along this often
+
+def profile() -> str:
+    return os.environ.get("DEMO_PROFILE", config.SYNTH_PROFILE)
+
+def _tri(t: float, period: float) -> float:
+    ph = (t % period) / period
+    return ph * 2.0 if ph < 0.5 else 2.0 - ph * 2.0
+
+class SyntheticDrive:
+    def __init__(self, seed: int = 1, rate_hz: float = config.SYNTH_RATE_HZ, tank_l: float = config.SYNTH_TANK_L,
+                 profile: str = 'drive'):
+        if profile not in PROFILES:
+            raise ValueError(f"unknown profile {profile!r} (one of {', '.join(PROFILES)})")
+        self.seed = seed
+        self.rate_hz = rate_hz
+        self.profile = profile
+        self.seen = SEEN
+        self._v1 = None
+        self._v2 = None
+        t = time.perf_counter()
+        if profile == 'sweep':
+            self.data = self._sweep(1.0 / rate_hz)
+        else:
+            self.data = self._simulate(random.Random(seed), 1.0 / rate_hz, tank_l)
+        self.rows = len(self.data) // W
+        self.duration_s = self.rows / rate_hz
+        self.build_s = time.perf_counter() - t
+
+    def _simulate(self, rnd: random.Random, dt: float, tank_l: float) -> array:
+        k = [k for k, _ in derived.gear_bands(tolerance=0.0)]  # rpm per km/h, 1st..top
+        top = len(k)
+        noise = rnd.random  # uniform noise: gauss() would double the build time
+        out = array('d')
+        row = [0.0] * W
+        v = 0.0            # km/h
+        g = 0              # 0 = neutral / clutch in
+        rpm = IDLE_RPM
+        shift_left = 0.0   # s left of a running upshift
+        shift_from = 0.0
+        water, oil = 35.0, 30.0
+        afr = 14.7
+        fuel_l = tank_l * 0.9
+        t = 0.0
+        for seconds, target, aggr, blinker, lamps in SEGMENTS:
+            for _ in range(int(seconds / dt)):
+                err = target - v
+                braking = False
+                if err > 0.5:
+                    a = (3.0 + 11.0 * aggr) / (1.0 + 0.35 * max(0, g - 1))
+                    v = min(target, v + a * dt)
+                    throttle = max(0.15, aggr)
+                elif err < -0.5:
+                    v = max(target, v - (4.0 + 10.0 * aggr) * dt)
+                    throttle = 0.0
+                    braking = True
+                else:
+                    v = target
+                    throttle = 0.08 + v / 700.0 if v else 0.0
+
+                # gearbox
+                if v < 3.0 and target == 0.0:
+                    g = 0
+                elif g == 0:
+                    g = 1
+                elif shift_left <= 0.0:
+                    if not braking and throttle > 0.1 and g < top and v * k[g - 1] > 2800.0 + 3300.0 * aggr:
+                        shift_from = v * k[g - 1]
+                        g += 1
+                        shift_left = 0.25
+                    elif g > 1 and v * k[g - 1] < 1400.0:
+                        g -= 1
+                if g == 0:
+                    want = IDLE_RPM + 25.0 * math.sin(t * 2.1)
+                elif shift_left > 0.0:
+                    shift_left -= dt
+                    p = 1.0 - max(0.0, shift_left) / 0.25
+                    want = shift_from + (v * k[g - 1] - shift_from) * p
+                    throttle = 0.0
+                elif g == 1 and throttle and v * k[0] < 1100.0 + 2000.0 * aggr:
+                    want = 1100.0 + 2000.0 * aggr  # clutch slipping on launch
+                else:
+                    want = max(v * k[g - 1], IDLE_RPM)
+                rpm = want + (noise() - 0.5) * 20.0
+
+                # engine
+                overrun = g and not throttle and v > 10.0
+                target_afr = 12.6 if throttle > 0.7 else 19.5 if overrun else 14.7
+                afr += (target_afr - afr) * min(1.0, dt / 0.2)
+                flow = 0.2 if overrun else 0.8 + rpm / 1000.0 * (0.6 + 5.0 * throttle)
+                fuel_l = max(0.0, fuel_l - flow * dt / 3600.0)
+                water += (88.0 + 8.0 * throttle - water) * dt * (0.02 + 0.03 * throttle)
+                oil += (92.0 + 10.0 * throttle - oil) * dt * (0.011 + 0.01 * throttle)
+
+                blink = blinker and int(t * 1.5) & 1
+                flags = (1 << (blinker - 1) if blink else 0) | (1 << 2 if v > 95.0 else 0) | (1 << 3 if braking else 0)
+                status = frames.STATUS_LOW_BEAM | lamps
+                if t < BULB_CHECK_S:
+                    status |= _BULB_CHECK
+                if braking and aggr >= 0.5 and v > 20.0:
+                    status |= frames.STATUS_ABS
+                fuel_pct = fuel_l * 100.0 / tank_l
+                row[frames.CH_RPM] = round(rpm)
+                row[frames.CH_VSS] = v
+                row[frames.CH_FLAGS] = flags | (int(fuel_pct) & 0xFF) << 4
+                row[frames.CH_STATUS] = status
+                row[frames.CH_FUEL] = round(fuel_pct)
+                row[frames.CH_WATER_TEMP] = water
+                row[frames.CH_OIL_TEMP] = oil
+                row[frames.CH_AFR] = afr + (noise() - 0.5) * 0.16
+                row[frames.CH_OIL_PRESSURE] = min(7.5, 0.8 + rpm / 1300.0 * (1.2 - (oil - 30.0) / 300.0))
+                row[frames.CH_CHARGING_VOLT] = (14.0 if g == 0 else 14.3) + (noise() - 0.5) * 0.06
+                row[frames.CH_FUEL_FLOW] = flow
+                out.extend(row)
+                t += dt
+        return out
+
+    def _sweep(self, dt: float) -> array:
+        out = array('d')
+        row = [0.0] * W
+        for i in range(int(SWEEP_S / dt)):
+            t = i * dt
+            frac = _tri(t, 6.0)
+            rpm = frac * 7000.0
+            v = frac * 230.0
+            fuel = int(_tri(t, 22.0) * 100)
+            flags = 1 if int(t * 1.5) % 2 == 0 else 2  # blinkers alternate
+            flags |= (1 << 2 if rpm > 6000 else 0) | (1 << 3 if int(t / 10) % 2 == 0 else 0)
+            status = frames.STATUS_LOW_BEAM
+            if int(t / 5) % 2 == 0:
+                status |= _FOG
+            if int(t / 15) % 30 == 0:
+                status |= _CEL
+            if int(t * 0.5) % 2 == 0:
+                status |= _GLOW
+            if int(t / 7) % 2 == 0 and rpm > 2500:
+                status |= frames.STATUS_CHARGING
+            if int(t / 11) % 3 == 0 and v > 80:
+                status |= frames.STATUS_ABS
+            if int(t / 9) % 2 == 0 and fuel < 30:
+                status |= _TPMS
+            row[frames.CH_RPM] = round(rpm)
+            row[frames.CH_VSS] = v
+            row[frames.CH_FLAGS] = flags | fuel << 4
+            row[frames.CH_STATUS] = status
+            row[frames.CH_FUEL] = fuel
+            row[frames.CH_WATER_TEMP] = 40.0 + _tri(t * 0.85, 14.0) * 100.0
+            row[frames.CH_OIL_TEMP] = 29.0 + _tri(t * 0.80 + 1.3, 15.0) * 61.0
+            row[frames.CH_AFR] = 10.0 + _tri(t * 0.75 + 0.4, 13.0) * 8.0
+            row[frames.CH_OIL_PRESSURE] = _tri(t * 1.10, 7.5) * 8.0
+            row[frames.CH_CHARGING_VOLT] = 11.0 + _tri(t * 0.95, 11.0) * 5.0
+            row[frames.CH_FUEL_FLOW] = 0.8 + frac * 24.0
+            out.extend(row)
+        return out
+
+    def fill(self, i: int, values: list) -> None:
+        """Copy row ``i`` (wrapped) into ``values[:CHANNEL_COUNT]``."""
+        i = (i % self.rows) * W
+        values[:W] = self.data[i:i + W]
+
+    def row_at(self, t: float) -> int:
+        return int(t * self.rate_hz) % self.rows
+
+    def _raw(self, i: int, ch: int) -> int:
+        scale = frames.CHANNELS[ch][2]
+        raw = round(self.data[i * W + ch] / scale)
+        return min(raw, 0xFFFF) if not frames.CHANNELS[ch][1] else raw
+
+    def v1_frames(self) -> list[bytes]:
+        """Every row as a v1 frame (rpm, VSS, FLAGS with fuel bits)."""
+        if self._v1 is None:
+            raw = self._raw
+            self._v1 = [frames.encode_v1(raw(i, frames.CH_RPM), raw(i, frames.CH_VSS), raw(i, frames.CH_FLAGS))
+                        for i in range(self.rows)]
+        return self._v1
+
+    def v2_frames(self) -> list[bytes]:
+        """Every row as a v2 frame: rpm, VSS, FLAGS, fuel flow each row, the slow channels every 0.1 s."""
+        if self._v2 is None:
+            fast = (frames.CH_RPM, frames.CH_VSS, frames.CH_FLAGS, frames.CH_FUEL_FLOW)
+            every = max(1, round(_SLOW_EVERY_S * self.rate_hz))
+            raw = self._raw
+            out = []
+            for i in range(self.rows):
+                chans = frames.CHANNELS if i % every == 0 else fast
+                out.append(frames.encode_v2([(ch, raw(i, ch)) for ch in chans]))
+            self._v2 = out
+        return self._v2
+
+    def source(self, version: int = 1, loops: int = 1):
+        """``(ts_ns, frame)`` pairs for ``replay.ReplayReader``."""
+        encoded = self.v2_frames() if version == 2 else self.v1_frames()
+        period_ns = 1e9 / self.rate_hz
+        n = 0
+        for _ in range(loops):
+            for frame in encoded:
+                yield int(n * period_ns), frame
+                n += 1
+
+    def stream(self, fd: int, version: int = 1, seconds: float | None = None) -> int:
+        """Write the cycle to ``fd`` in real time (looping) until ``seconds`` pass; returns frames written.
+
+        Each wakeup writes every frame that is due, so rates of several kHz
+        do not need a sleep per frame."""
+        encoded = self.v2_frames() if version == 2 else self.v1_frames()
+        t0 = time.monotonic()
+        n = 0
+        while seconds is None or time.monotonic() - t0 < seconds:
+            due = int((time.monotonic() - t0) * self.rate_hz)
+            if due > n:
+                chunk = b''.join(encoded[i % self.rows] for i in range(n, due))
+                try:
+                    os.write(fd, chunk)
+                except BlockingIOError:
+                    pass  # reader behind: drop, like a real UART would
+                n = due
+            time.sleep(0.001)
+        return n
+
+if __name__ == '__main__':
+    import argparse, tty
+    ap = argparse.ArgumentParser(description="stream the synthetic drive as frames")
+    ap.add_argument('device', nargs='?', help='serial device to write to')
+    ap.add_argument('--pty', action='store_true', help='create a pseudo-terminal and print its path')
+    ap.add_argument('--rate', type=float, default=config.SYNTH_RATE_HZ, help='frames per second')
+    ap.add_argument('--v2', action='store_true', help='v2 frames (all channels) instead of v1')
+    ap.add_argument('--seed', type=int, default=1)
+    ap.add_argument('--profile', choices=PROFILES, default='drive')
+    ap.add_argument('--seconds', type=float)
+    args = ap.parse_args()
+    drive = SyntheticDrive(args.seed, args.rate, profile=args.profile)
+    print(f"[synthetic] {drive.rows} rows ({drive.duration_s:.0f} s @ {args.rate:g} Hz) built in {drive.build_s * 1e3:.0f} ms")
+    if args.pty:
+        fd, slave = os.openpty()
+        tty.setraw(fd); tty.setraw(slave)
+        print(f"[synthetic] TEENSY_DEV={os.ttyname(slave)}", flush=True)
+    elif args.device:
+        fd = os.open(args.device, os.O_WRONLY | os.O_NOCTTY)
+    else:
+        ap.error("give a device or --pty")
+    os.set_blocking(fd, False)
+    try:
+        n = drive.stream(fd, 2 if args.v2 else 1, args.seconds)
+        print(f"[synthetic] {n} frames written")
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,302 @@
+"""Shared-memory telemetry bus: live channel values for other local processes.
+
+The serial reader publishes the decoded channel vector (see
+``frames.CHANNELS``) after every read into a small file under ``/dev/shm``
+so a logger or a second display can follow the car without opening the
+port or talking to the Qt process.
+
+Layout: a 16-byte header (magic, version, channel count, writer pid), the
+sequence word at offset 16, then one record ``seq(u64) ts_ns(i64)
+frames(u64) seen(u64) values(f64 x WIDTH) crc32``, ``WIDTH`` being the frame
+channels plus the derived ones (``derived.VECTOR_LEN``). The writer is a
+seqlock writer: it makes the sequence odd, stores the record, makes it even
+again, and never waits for anybody. A reader copies the record and accepts
+it only if the sequence was even and unchanged around the copy and the CRC
+matches. Python gives no guarantee that a multi-byte store or load is
+atomic (torn reads of the sequence word do happen), so the CRC, which also
+covers the record's own copy of the sequence, is what decides; the header
+word only tells readers cheaply whether anything changed. Readers never
+write to the segment.
+
+Readers either poll ``read()`` or ``subscribe()``: the writer then sends the
+new sequence number as a datagram to every socket in ``<path>.d/`` with
+``MSG_DONTWAIT``, so a reader can ``select``/``poll`` on ``fileno()``; a
+full socket buffer just means that reader is behind and gets the latest
+record on its next read. The writer learns about sockets from a small
+thread that waits on inotify for ``<path>.d/`` (polling it every
+``rescan_s`` without inotify), so ``publish`` itself makes no directory
+calls.
+
+The bus is off unless ``TELEMETRY_BUS_PATH`` (env ``TELEMETRY_BUS``) names
+a segment.
+"""
+from __future__ import annotations
+import os, sys, mmap, time, socket, struct, zlib, select, threading
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))  # config
+import frames
+import derived
+import hotplug
+
+MAGIC = b'VCTB'
+VERSION = 1
+_HEADER = struct.Struct('<4sHHI4x')  # magic, version, channels, writer pid
+_SEQ_OFF = 16
+_SEQ = struct.Struct('<Q')
+_RECORD_OFF = 24
+WIDTH = derived.VECTOR_LEN
+NAMES = {ch: name for ch, (name, _, _) in frames.CHANNELS.items()} | derived.NAMES
+_RECORD = struct.Struct('<QqQQ' + 'd' * WIDTH)
+_CRC = struct.Struct('<I')
+SIZE = _RECORD_OFF + _RECORD.size + _CRC.size
+_RESCAN_S = 1.0
+
+def _notify_dir(path: str) -> str:
+    return path + '.d'
+
+class BusWriter:
+    def __init__(self, path: str, rescan_s: float = _RESCAN_S):
+        self.path = path
+        self.rescan_s = rescan_s
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # keep an existing segment (readers stay mapped across restarts), just take it over
+            if os.fstat(fd).st_size != SIZE:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, SIZE)
+            self._mm = mmap.mmap(fd, SIZE)
+        finally:
+            os.close(fd)
+        body = self._mm[_RECORD_OFF:_RECORD_OFF + _RECORD.size]
+        if zlib.crc32(body) == _CRC.unpack_from(self._mm, _RECORD_OFF + _RECORD.size)[0]:
+            seq, _, self.frames, _ = _RECORD.unpack(body)[:4]  # keep counting where the last writer stopped
+        else:
+            seq, self.frames = 0, 0
+        self._seq = seq
+        _SEQ.pack_into(self._mm, _SEQ_OFF, seq)  # even again if the last writer died mid-record
+        _HEADER.pack_into(self._mm, 0, MAGIC, VERSION, WIDTH, os.getpid())
+        self.published = 0
+        self.notified = 0
+        self.notify_dropped = 0
+        os.makedirs(_notify_dir(path), exist_ok=True)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._subscribers: list[str] = []  # replaced whole by the scanner thread, never mutated in place
+        self._stop = threading.Event()
+        self._scanned = threading.Event()
+        self._scanner = threading.Thread(target=self._scan_loop, name='bus-subscribers', daemon=True)
+        self._scanner.start()
+        self._scanned.wait(1.0)  # subscribers that were already there get the first publish
+        print(f"[bus] publishing {WIDTH} channels to {path}")
+
+    # serial thread
+    def publish(self, values: list, seen: int, ts_ns: int, frame_count: int = 1) -> None:
+        self.frames += frame_count
+        seq = self._seq + 2
+        body = _RECORD.pack(seq, ts_ns, self.frames, seen, *values)
+        mm = self._mm
+        _SEQ.pack_into(mm, _SEQ_OFF, seq - 1)
+        mm[_RECORD_OFF:SIZE] = body + _CRC.pack(zlib.crc32(body))
+        _SEQ.pack_into(mm, _SEQ_OFF, seq)
+        self._seq = seq
+        self.published += 1
+        subscribers = self._subscribers
+        if subscribers:
+            self._notify(seq, subscribers)
+
+    # scanner thread
+    def _scan_loop(self) -> None:
+        d = _notify_dir(self.path)
+        watcher = hotplug.DirectoryWatcher(d, self._stop)  # before the first scan: nothing slips in between
+        try:
+            while not self._stop.is_set():
+                self._rescan()
+                self._scanned.set()
+                # with inotify the timeout only bounds how long close() waits to be noticed
+                watcher.wait(1.0 if watcher.active else self.rescan_s)
+        finally:
+            watcher.close()
+
+    def _rescan(self) -> None:
+        d = _notify_dir(self.path)
+        try:
+            self._subscribers = [os.path.join(d, n) for n in os.listdir(d) if n.endswith('.sock')]
+        except OSError:
+            self._subscribers = []
+
+    def _notify(self, seq: int, subscribers: list[str]) -> None:
+        msg = _SEQ.pack(seq)
+        stale = None
+        for addr in subscribers:
+            try:
+                self._sock.sendto(msg, socket.MSG_DONTWAIT, addr)
+                self.notified += 1
+            except BlockingIOError:
+                self.notify_dropped += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                stale = stale or []
+                stale.append(addr)
+            except OSError:
+                self.notify_dropped += 1
+        if stale:
+            self._subscribers = [a for a in subscribers if a not in stale]  # the scanner drops them too once unlinked
+            for addr in stale:
+                try:
+                    os.unlink(addr)  # reader died without unsubscribing
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        self._stop.set()
+        self._scanner.join(2.0)
+        self._sock.close()
+        self._mm.close()
+
+class Snapshot:
+    __slots__ = ('seq', 'ts_ns', 'frames', 'seen', 'values')
+
+    def __init__(self, seq: int, ts_ns: int, frame_count: int, seen: int, values: tuple):
+        self.seq = seq
+        self.ts_ns = ts_ns
+        self.frames = frame_count
+        self.seen = seen
+        self.values = values
+
+    def channels(self) -> dict:
+        """``{name: value}`` for every channel received so far."""
+        return {name: self.values[ch] for ch, name in NAMES.items() if self.seen & (1 << ch)}
+
+class BusReader:
+    """Read-only client. ``read()`` never blocks; ``wait()`` needs ``subscribe()``."""
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) != SIZE:
+            raise ValueError(f"{path}: not a telemetry bus segment")
+        magic, ver, channels, self.writer_pid = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or ver != VERSION or channels != WIDTH:
+            raise ValueError(f"{path}: bus {magic!r} v{ver} with {channels} channels, expected v{VERSION} with {WIDTH}")
+        self.last_seq = 0
+        self.retries = 0
+        self._sock = None
+        self._sock_path = None
+
+    def read(self, spins: int = 1000) -> Snapshot | None:
+        """Latest record, or None if nothing was published yet (or the writer kept it busy ``spins`` times)."""
+        mm = self._mm
+        unpack_seq = _SEQ.unpack_from
+        for i in range(spins):
+            s1 = unpack_seq(mm, _SEQ_OFF)[0]
+            if s1 & 1:
+                self.retries += 1
+                if i & 15 == 15:
+                    os.sched_yield()  # the writer may be preempted mid-record
+                continue
+            data = mm[_RECORD_OFF:SIZE]
+            if unpack_seq(mm, _SEQ_OFF)[0] != s1:
+                self.retries += 1
+                continue
+            body = data[:_RECORD.size]
+            if zlib.crc32(body) != _CRC.unpack_from(data, _RECORD.size)[0]:
+                if not any(data):
+                    return None  # never written
+                self.retries += 1
+                continue
+            rec = _RECORD.unpack(body)
+            self.last_seq = rec[0]
+            return Snapshot(rec[0], rec[1], rec[2], rec[3], rec[4:])
+        return None
+
+    def read_new(self) -> Snapshot | None:
+        """Like ``read()`` but None when nothing was published since the last read."""
+        last = self.last_seq
+        if _SEQ.unpack_from(self._mm, _SEQ_OFF)[0] == last:
+            return None
+        snap = self.read()
+        return snap if snap is not None and snap.seq != last else None
+
+    # notification
+    def subscribe(self) -> int:
+        """Ask the writer for a datagram per publish; returns the fd to wait on."""
+        if self._sock is None:
+            d = _notify_dir(self.path)
+            os.makedirs(d, exist_ok=True)
+            self._sock_path = os.path.join(d, f"{os.getpid()}-{id(self):x}.sock")
+            try:
+                os.unlink(self._sock_path)
+            except FileNotFoundError:
+                pass
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self._sock.bind(self._sock_path)
+            self._sock.setblocking(False)
+        return self._sock.fileno()
+
+    def fileno(self) -> int:
+        return self.subscribe()
+
+    def drain(self) -> int:
+        """Discard queued notifications; returns how many there were."""
+        n = 0
+        while True:
+            try:
+                self._sock.recv(64)
+                n += 1
+            except (BlockingIOError, InterruptedError):
+                return n
+
+    def wait(self, timeout: float | None = None) -> Snapshot | None:
+        """Block until something newer than the last read is published (or ``timeout``)."""
+        fd = self.subscribe()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snap = self.read_new()
+            if snap is not None:
+                self.drain()
+                return snap
+            left = None if deadline is None else deadline - time.monotonic()
+            if left is not None and left <= 0:
+                return None
+            select.select([fd], [], [], left)
+            self.drain()
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            try:
+                os.unlink(self._sock_path)
+            except OSError:
+                pass
+            self._sock = None
+        self._mm.close()
+
+def from_config() -> BusWriter | None:
+    import config
+    path = config.path('TELEMETRY_BUS_PATH', 'TELEMETRY_BUS')
+    if path is None:
+        return None
+    try:
+        return BusWriter(path)
+    except Exception as e:
+        print(f"[bus] disabled ({e})")
+        return None
+
+if __name__ == '__main__':
+    # python src/telemetry_bus.py [PATH]   - print live values as they are published
+    import config
+    path = sys.argv[1] if len(sys.argv) > 1 else config.path('TELEMETRY_BUS_PATH', 'TELEMETRY_BUS')
+    if path is None:
+        sys.exit("usage: telemetry_bus.py PATH (or set TELEMETRY_BUS)")
+    reader = BusReader(path)
+    try:
+        while True:
+            snap = reader.wait(1.0)
+            if snap is None:
+                print("(no data)")
+                continue
+            vals = ' '.join(f"{k}={v:g}" for k, v in snap.channels().items())
+            print(f"#{snap.frames} {vals}")
+            time.sleep(0.2)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
@@ -0,0 +1,48 @@
+"""Unix signals handled inside the Qt event loop.
+
+Python signal handlers only run when the interpreter gets control, which
+can take a while inside the Qt event loop, and then in the middle of
+whatever Python code Qt was calling. Instead the signal number goes to a
+wakeup fd; a socket notifier reads it and calls the handler from the event
+loop, where quitting or dumping is safe. A process has one wakeup fd, so
+every handler goes through ``handle``.
+"""
+from __future__ import annotations
+import signal, socket
+from typing import Callable
+from PySide6.QtCore import QSocketNotifier
+
+_handlers: dict[int, Callable[[], None]] = {}
+_notifier: QSocketNotifier | None = None
+
+def _install() -> None:
+    global _notifier
+    if _notifier is not None:
+        return
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
+    signal.set_wakeup_fd(wsock.fileno())  # Python writes each signal number here
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Read)
+
+    def dispatch():
+        try:
+            data = rsock.recv(64)
+        except OSError:
+            return
+        for signum in data:
+            fn = _handlers.get(signum)
+            if fn is not None:
+                fn()
+    notifier.activated.connect(dispatch)
+    notifier._socks = (rsock, wsock)
+    _notifier = notifier
+
+def _ignore(signum, frame):
+    pass  # replaces the default action; the work happens in dispatch()
+
+def handle(signum: int, fn: Callable[[], None]) -> None:
+    """Call ``fn()`` from the event loop when ``signum`` arrives (needs the QCoreApplication)."""
+    _install()
+    _handlers[signum] = fn
+    signal.signal(signum, _ignore)
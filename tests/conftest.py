@@ -0,0 +1,29 @@
+import os, sys, time
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+def _wait_for(cond, timeout: float = 5.0) -> bool:
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if cond():
+            return True
+        time.sleep(0.01)
+    return False
+
+@pytest.fixture
+def wait_for():
+    """``wait_for(cond, timeout=5.0)``: poll ``cond`` until true (True) or the timeout (False)."""
+    return _wait_for
+
+@pytest.fixture
+def sink():
+    """The serial child's stand-in for Telemetry (what ``TeensyReader`` needs), its state pipe read by nobody."""
+    import serial_child
+    r, w = os.pipe()
+    yield serial_child._ChildSink(w)
+    os.close(r)
+    os.close(w)
@@ -0,0 +1,47 @@
+import os, json, random
+
+import pytest
+
+import config
+import calibration
+
+with open(os.path.join(config.PROJECT_ROOT, config.CALIBRATION_PATH)) as f:
+    SHIPPED = json.load(f)['maps']  # disabled ones too
+
+def sweep(lo: float, hi: float, n: int = 4001) -> list:
+    """``n`` inputs from 10 % below ``lo`` to 10 % above ``hi``, mostly off the dense grid, plus the ends themselves."""
+    pad = (hi - lo) * 0.1
+    a, b = lo - pad, hi + pad
+    return [a + (b - a) * k / (n - 1) for k in range(n)] + [lo, hi]
+
+@pytest.mark.parametrize('name', sorted(SHIPPED))
+def test_1d_table_matches_the_breakpoints(name):
+    spec = SHIPPED[name]
+    m = calibration.build(name, spec)
+    xs, ys = spec['x'], spec['y']
+    tol = 1e-9 * (max(ys) - min(ys))
+    for x in sweep(xs[0], xs[-1]):
+        assert m(x) == pytest.approx(calibration.interp(xs, ys, x), abs=tol), x
+    assert m(xs[0] - 1e6) == ys[0] and m(xs[-1] + 1e6) == ys[-1]  # clamped
+    for x, y in zip(xs, ys):
+        assert m(x) == pytest.approx(y, abs=tol)
+
+@pytest.mark.parametrize('step', [(0.5, 0.5), (None, None)])
+def test_2d_table_matches_bilinear(step):
+    rnd = random.Random(7)
+    xs, ys = [20, 40, 60, 80, 100], [40, 70, 90, 110]
+    zs = [[rnd.randrange(2000, 7000) for _ in ys] for _ in xs]
+    m = calibration.Map2D(xs, ys, zs, step, 'redline2d')
+    tol = 1e-9 * 5000
+    for x in sweep(xs[0], xs[-1], 181):
+        for y in sweep(ys[0], ys[-1], 121):
+            assert m(x, y) == pytest.approx(calibration.interp2(xs, ys, zs, x, y), abs=tol), (x, y)
+    for x, row in ((-1e6, zs[0]), (1e6, zs[-1])):  # clamped corners and edges
+        assert m(x, -1e6) == pytest.approx(row[0]) and m(x, 1e6) == pytest.approx(row[-1])
+        assert m(x, 80) == pytest.approx(calibration.interp(ys, row, 80))
+
+def test_bad_breakpoints_are_rejected():
+    with pytest.raises(ValueError):
+        calibration.Map1D([0, 0, 1], [1, 2, 3])
+    with pytest.raises(ValueError):
+        calibration.Map1D([0, 1], [1, 2, 3])
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+import channels
+
+@pytest.fixture(scope='module')
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])  # the flush timer needs one
+
+@pytest.fixture
+def store(app):
+    s = channels.ChannelObject()
+    yield s
+    s.deleteLater()
+
+def record(store, name: str) -> list:
+    got = []
+    getattr(store, name + 'Changed').connect(got.append)
+    return got
+
+def spin(seconds: float) -> None:
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+def test_changes_within_the_deadband_are_not_emitted(store):
+    got = record(store, 'afr')  # deadband 0.05
+    store.setAfr(13.0)
+    spin(0.1)
+    store.setAfr(13.04)
+    store.setAfr(12.96)
+    spin(0.1)
+    assert got == [13.0]
+    i = channels.INDEX['afr']
+    assert store._unchanged[i] == 2 and store.afr == 13.0
+
+def test_rate_limit_emits_the_latest_value_once_the_interval_passes(store):
+    got = record(store, 'oilPressure')  # 50 ms
+    store.setOilPressure(1.0)
+    store.setOilPressure(1.5)
+    store.setOilPressure(2.0)
+    assert got == [1.0]  # the others are held
+    spin(0.2)
+    assert got == [1.0, 2.0]
+    assert store._held[channels.INDEX['oilPressure']] == 2
+
+def test_held_value_back_inside_the_deadband_is_dropped(store):
+    got = record(store, 'oilPressure')
+    store.setOilPressure(1.0)
+    store.setOilPressure(1.5)
+    store.setOilPressure(1.01)  # back where it was
+    spin(0.2)
+    assert got == [1.0]
+
+def test_status_bits_are_never_suppressed(store):
+    got = record(store, 'checkEngine')
+    for _ in range(5):
+        store.setCheckEngine(True)
+        store.setCheckEngine(False)
+    assert got == [True, False] * 5
+    lamps = [ch for ch in channels.CHANNELS if ch.type is bool]
+    assert lamps and all(ch.deadband == 0 and ch.min_interval_s == 0 for ch in lamps)
+
+def test_first_value_makes_a_channel_available(store):
+    got = record(store, 'waterTemp')
+    flips = record(store, 'waterTempAvailable')
+    assert not store.waterTempAvailable and store.waterTemp == 0
+    store.setWaterTemp(0)  # a real 0 degC, equal to the default and inside any deadband
+    assert store.waterTempAvailable and flips == [True] and got == [0]
+    store.setWaterTemp(85)  # rate limited as usual from now on
+    assert got == [0] and not store.oilTempAvailable
+
+def test_v1_frames_leave_the_temperatures_unavailable(app, tmp_path):
+    import derived, frames
+    from settings_store import SettingsStore
+    from telemetry import Telemetry
+    tel = Telemetry(SettingsStore(str(tmp_path / 'data.json')))
+    try:
+        tel.updateFromFrame(2000, 50.0, 0)
+        assert tel.rpmAvailable and tel.speedAvailable
+        assert not tel.waterTempAvailable and not tel.oilTempAvailable
+        values = [0] * derived.VECTOR_LEN
+        values[frames.CH_OIL_TEMP] = 92.0
+        tel.updateFromChannels(values, derived.DerivedChannels(maps={}).update(values, 1 << frames.CH_OIL_TEMP, 10**9))
+        assert tel.oilTempAvailable and tel.oilTemp == 92 and not tel.waterTempAvailable
+    finally:
+        tel.shutdown()
@@ -0,0 +1,24 @@
+import os
+
+import config
+
+def test_flag_env_overrides(monkeypatch):
+    monkeypatch.setattr(config, 'SIGNAL_STATS', False)
+    monkeypatch.delenv('SIGNAL_STATS', raising=False)
+    assert config.flag('SIGNAL_STATS') is False
+    for raw, want in (('1', True), (' Yes ', True), ('on', True), ('0', False), ('off', False), ('', False)):
+        monkeypatch.setenv('SIGNAL_STATS', raw)
+        assert config.flag('SIGNAL_STATS') is want
+
+def test_path_relative_absolute_and_off(monkeypatch):
+    monkeypatch.setattr(config, 'SESSION_LOG_DIR', 'data/sessions')
+    monkeypatch.delenv('SESSION_LOG', raising=False)
+    assert config.path('SESSION_LOG_DIR', 'SESSION_LOG') == os.path.join(config.PROJECT_ROOT, 'data', 'sessions')
+    monkeypatch.setenv('SESSION_LOG', '/tmp/s')
+    assert config.path('SESSION_LOG_DIR', 'SESSION_LOG') == '/tmp/s'
+    for off in ('', '0'):
+        monkeypatch.setenv('SESSION_LOG', off)
+        assert config.path('SESSION_LOG_DIR', 'SESSION_LOG') is None
+    monkeypatch.setattr(config, 'SESSION_LOG_DIR', None)
+    monkeypatch.delenv('SESSION_LOG')
+    assert config.path('SESSION_LOG_DIR', 'SESSION_LOG') is None
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+import config
+import calibration
+import derived
+import frames
+
+REDLINE = calibration.Map1D([30, 60, 90], [2498, 3994, 5994], 0.5, 'redline', ('oilTemp',))
+
+def test_redline_is_cold_until_oil_temperature_arrives():
+    d = derived.DerivedChannels(maps={'redline': REDLINE})
+    assert d.redline_rpm == derived.cold_redline(REDLINE) == 2498
+    v = [0] * derived.VECTOR_LEN
+    v[frames.CH_RPM] = 850
+    seen = d.update(v, 1 << frames.CH_RPM, 10**9)  # v1 firmware: no oil temperature channel
+    assert seen & 1 << derived.DYN_REDLINE and v[derived.DYN_REDLINE] == 2498
+
+    v[frames.CH_OIL_TEMP] = 90
+    d.update(v, 1 << frames.CH_OIL_TEMP, 2 * 10**9)
+    assert v[derived.DYN_REDLINE] == 5994 and d.redline_rpm == 5994
+
+def test_fixed_redline_without_a_map():
+    d = derived.DerivedChannels(maps={})
+    assert d.redline_rpm == config.REDLINE_RPM
+
+# a pull through every gear at 50 Hz, as tools/replay_derived.py drives it: each gear 4 s of
+# 2000 -> 6500 rpm at that gear's wheel speed, then 0.4 s of clutch (1200 rpm, speed held)
+RATE = 50
+FRAME_NS = 10**9 // RATE
+FLOW_LPH = 18.0
+AFR = 13.2
+SEEN = (1 << frames.CH_RPM) | (1 << frames.CH_VSS) | (1 << frames.CH_AFR) | (1 << frames.CH_FUEL_FLOW)
+
+def drive(noise: float = 0.0, seed: int = 1):
+    """Yields (rpm, kmh, gear the rpm/speed ratio belongs to, 0 with the clutch in)."""
+    rnd = random.Random(seed)
+    for g, (k, _) in enumerate(derived.gear_bands(tolerance=0.0), 1):
+        for i in range(4 * RATE):
+            rpm = 2000 + 4500 * i / (4 * RATE)
+            yield rpm * (1 + rnd.uniform(-noise, noise)), rpm / k, g
+        for _ in range(RATE * 2 // 5):
+            yield 1200.0, 6500 / k, 0
+
+def replay(trace, d=None):
+    d = d or derived.DerivedChannels(maps={})
+    v = [0.0] * derived.VECTOR_LEN
+    v[frames.CH_AFR] = AFR
+    v[frames.CH_FUEL_FLOW] = FLOW_LPH
+    shown = []
+    for n, (rpm, kmh, _) in enumerate(trace):
+        v[frames.CH_RPM] = rpm
+        v[frames.CH_VSS] = kmh
+        d.update(v, SEEN, 10**12 + n * FRAME_NS)
+        shown.append(v[derived.GEAR])
+    return v, shown
+
+def settled(trace, shown):
+    """(shown, expected) gear pairs, without the frames before a change is confirmed."""
+    return [(s, g) for i, ((_, _, g), s) in enumerate(zip(trace, shown)) if i % 220 not in (0, 1, 200, 201)]
+
+def test_gear_follows_the_pull_after_confirm_frames():
+    trace = list(drive())
+    _, shown = replay(trace)
+    assert len(trace) == 1100
+    assert shown[:4] == [0, 0, 1, 1]  # GEAR_CONFIRM_FRAMES = 3
+    assert shown[198:204] == [1, 1, 1, 1, 0, 0]  # clutch in at frame 200, shown from 202
+    assert shown[220:224] == [0, 0, 2, 2]
+    assert sum(s != g for s, g in settled(trace, shown)) == 0
+    assert shown[-1] == 0
+
+def test_gear_holds_under_rpm_noise():
+    trace = list(drive(noise=0.02))
+    _, shown = replay(trace)
+    assert sum(s != g for s, g in settled(trace, shown)) == 0
+
+def test_fuel_and_averages_for_the_pull():
+    v, _ = replay(drive())
+    # 1099 intervals of 20 ms = 21.98 s at 18 l/h = 0.1099 l over 0.56291 km
+    assert v[derived.FUEL_AVG] == pytest.approx(19.5234, rel=1e-4)
+    assert v[derived.FUEL_INST] == pytest.approx(FLOW_LPH * 100 / (6500 / 30.0702), rel=1e-4)  # clutch, top gear speed
+    assert v[derived.AFR_AVG] == pytest.approx(AFR)
+    assert v[derived.REDLINE_TIME] == pytest.approx(2.2)  # 22 frames >= 5994 rpm per gear, 5 gears
+
+def test_link_gap_is_not_integrated():
+    d = derived.DerivedChannels(maps={})
+    v, _ = replay(drive(), d)
+    before = (v[derived.FUEL_AVG], v[derived.REDLINE_TIME])
+    v[frames.CH_RPM] = 6500.0
+    d.update(v, SEEN, 10**12 + 1100 * FRAME_NS + 10 * 10**9)  # 10 s without frames
+    assert (v[derived.FUEL_AVG], v[derived.REDLINE_TIME]) == before
+
+def test_standing_shows_neutral_and_no_instant_consumption():
+    d = derived.DerivedChannels(maps={})
+    v = [0.0] * derived.VECTOR_LEN
+    v[frames.CH_RPM] = 850
+    v[frames.CH_FUEL_FLOW] = 0.9
+    for n in range(5):
+        d.update(v, SEEN, 10**12 + n * FRAME_NS)
+    assert v[derived.GEAR] == 0 and v[derived.FUEL_INST] == 0.0 and v[derived.FUEL_AVG] == 0.0
@@ -0,0 +1,40 @@
+import frames
+import frame_recorder
+
+S = 10**9
+
+def frame(rpm: int) -> bytes:
+    return frames.encode_v1(rpm, 0, 0)
+
+def record_run(path, epoch_ns, monos, monkeypatch):
+    monkeypatch.setattr(frame_recorder.time, 'time_ns', lambda: epoch_ns + monos[0])
+    monkeypatch.setattr(frame_recorder.time, 'monotonic_ns', lambda: monos[0])
+    rec = frame_recorder.FrameRecorder(str(path), capacity=64, slot_size=56)
+    for m in monos:
+        rec.record(m, frame(m // S))
+    rec.close()
+
+def rpms(ring, *span):
+    return [frames.FRAME_V1.unpack_from(f)[3] for _, f in ring.frames(*span)]
+
+def test_wall_clock_step_back_between_runs(tmp_path, monkeypatch):
+    path = tmp_path / 'frames.ring'
+    record_run(path, 2000 * S, [10 * S, 11 * S, 12 * S], monkeypatch)
+    # next boot: monotonic restarts and the clock is an hour behind until NTP
+    record_run(path, (2000 - 3600) * S, [1 * S, 2 * S, 3 * S], monkeypatch)
+    ring = frame_recorder.FrameRing(str(path))
+    assert [r for r, _, _ in ring.runs()] == [1, 2]
+    assert rpms(ring) == [10, 11, 12, 1, 2, 3]  # write order
+    assert rpms(ring, 2011 * S, 2013 * S) == [11, 12]
+    assert rpms(ring, (2000 - 3600 + 2) * S, None) == [10, 11, 12, 2, 3]
+    assert ring.span() == (2010 * S, (2000 - 3600 + 3) * S)
+    ring.close()
+
+def test_wrapped_ring_keeps_the_newest(tmp_path, monkeypatch):
+    path = tmp_path / 'frames.ring'
+    record_run(path, 0, [i * S for i in range(1, 101)], monkeypatch)
+    ring = frame_recorder.FrameRing(str(path))
+    assert len(ring) == 64
+    assert rpms(ring) == list(range(37, 101))
+    assert rpms(ring, 98 * S, None) == [98, 99, 100]
+    ring.close()
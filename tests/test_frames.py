@@ -0,0 +1,90 @@
+import struct
+
+import pytest
+
+import frames
+
+def v1(rpm: int, kmh: float = 0.0, flags: int = 0) -> bytes:
+    return frames.encode_v1(rpm, round(kmh / frames.KMH_PER_CM_S), flags)
+
+def decode(dec: frames.Decoder, buf: bytearray) -> list:
+    """Copies of (rpm, values, seen) handed to ``on_frame``."""
+    out = []
+    dec.consume(buf, lambda values, seen: out.append((values[frames.CH_RPM], list(values), seen)))
+    return out
+
+def test_resync_after_leading_garbage():
+    dec = frames.Decoder()
+    garbage = b'\x00\xff' + frames.MAGIC_BYTES + b'\x07\x10' + b'\x5a' + b'noise'  # a magic with a bad version, a lone magic byte
+    buf = bytearray(garbage + v1(2500, 36.0))
+    got = decode(dec, buf)
+    assert [g[0] for g in got] == [2500]
+    assert got[0][1][frames.CH_VSS] == 36.0
+    assert (dec.frames, dec.bad_headers, dec.crc_errors, dec.skipped_bytes) == (1, 1, 0, len(garbage))
+    assert not buf
+
+def test_crc_failure_in_the_middle():
+    dec = frames.Decoder()
+    bad = bytearray(v1(9999))
+    bad[5] ^= 0x01  # rpm high byte
+    buf = bytearray(v1(1000) + bad + v1(3000))
+    assert [g[0] for g in decode(dec, buf)] == [1000, 3000]
+    assert (dec.frames, dec.crc_errors, dec.skipped_bytes) == (2, 1, len(bad))
+
+def test_frame_split_across_reads():
+    dec = frames.Decoder()
+    frame = v1(4200)
+    buf = bytearray(v1(4100) + frame[:9])
+    assert [g[0] for g in decode(dec, buf)] == [4100]
+    assert buf == frame[:9]  # the partial tail waits for the next read
+    buf.extend(frame[9:])
+    assert [g[0] for g in decode(dec, buf)] == [4200]
+    assert not buf and dec.skipped_bytes == 0
+
+def test_magic_split_across_reads():
+    dec = frames.Decoder()
+    frame = frames.encode_v2([(frames.CH_RPM, 1500)])
+    buf = bytearray(frame[:1])
+    assert decode(dec, buf) == [] and buf == frame[:1]
+    buf.extend(frame[1:])
+    assert [g[0] for g in decode(dec, buf)] == [1500]
+
+def test_v1_and_v2_in_one_buffer():
+    dec = frames.Decoder()
+    buf = bytearray(v1(900, 0.0, 0x0F0) + frames.encode_v2([(frames.CH_WATER_TEMP, 905), (frames.CH_OIL_TEMP, -25),
+                                                             (frames.CH_RPM, 950)]) + v1(1000, 18.0))
+    got = decode(dec, buf)
+    assert [g[0] for g in got] == [900, 950, 1000]
+    _, values, seen = got[1]
+    assert (values[frames.CH_WATER_TEMP], values[frames.CH_OIL_TEMP]) == pytest.approx((90.5, -2.5))  # signed, 0.1 degC
+    assert seen == frames.V1_SEEN | 1 << frames.CH_WATER_TEMP | 1 << frames.CH_OIL_TEMP
+    _, values, seen = got[2]
+    assert (values[frames.CH_WATER_TEMP], values[frames.CH_VSS]) == pytest.approx((90.5, 18.0))  # latest value of every channel kept
+    assert dec.frames == 3 and dec.skipped_bytes == 0
+
+def test_v2_unknown_channel_is_skipped():
+    dec = frames.Decoder()
+    buf = bytearray(frames.encode_v2([(200, 1234), (frames.CH_AFR, 1470), (0, 77)]))
+    got = decode(dec, buf)
+    assert len(got) == 1
+    _, values, seen = got[0]
+    assert values[frames.CH_AFR] == pytest.approx(14.7)
+    assert seen == 1 << frames.CH_AFR  # neither 200 nor the unused id 0
+    assert dec.bad_headers == 0
+
+def test_v2_bad_length_is_a_bad_header():
+    dec = frames.Decoder()
+    good = frames.encode_v2([(frames.CH_RPM, 2000)])
+    wrong_count = bytearray(good)
+    wrong_count[3] += 3  # LEN says two records, COUNT one
+    too_long = frames.FRAME_V2_HEAD.pack(0xA55A, frames.FRAME_V2_VERSION, 255, 83)
+    buf = bytearray(bytes(wrong_count) + too_long + good)
+    assert [g[0] for g in decode(dec, buf)] == [2000]
+    assert dec.bad_headers == 2 and dec.crc_errors == 0
+    assert not buf
+
+def test_v2_record_layout():
+    frame = frames.encode_v2([(frames.CH_RPM, 3000), (frames.CH_FUEL_FLOW, 250)])
+    magic, ver, ln, count = frames.FRAME_V2_HEAD.unpack_from(frame)
+    assert (magic, ver, ln, count) == (0xA55A, 2, len(frame), 2)
+    assert struct.unpack_from('<BHBH', frame, frames.FRAME_V2_HEAD.size) == (frames.CH_RPM, 3000, frames.CH_FUEL_FLOW, 250)
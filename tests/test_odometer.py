@@ -0,0 +1,71 @@
+import pytest
+
+import frames
+import odometer
+from io_teensy import TeensyReader
+
+MS = 10**6
+S = 10**9
+
+def frame(kmh: float) -> bytes:
+    return frames.encode_v1(1000, round(kmh / frames.KMH_PER_CM_S), 0)
+
+@pytest.fixture
+def reader(monkeypatch, sink):
+    monkeypatch.setenv('FRAME_HANDOFF', 'snapshot')
+    return TeensyReader(sink, record=False, publish=False)
+
+def km(kmh: float, seconds: float) -> float:
+    return kmh * seconds / 3600.0
+
+def test_trapezoid_over_acceleration():
+    d = odometer.DistanceIntegrator(max_gap_s=1.0)
+    for i in range(501):  # 0 -> 20 km/h in 10 s at 50 Hz
+        d.sample(i * 20 * MS, 20.0 * i / 500)
+    assert d.total_km == pytest.approx(km(10.0, 10.0), rel=1e-9)
+    assert d.gaps == 0
+
+def test_link_loss_is_not_bridged():
+    d = odometer.DistanceIntegrator(max_gap_s=1.0)
+    d.sample(0, 20.0)
+    d.sample(1 * S, 20.0)
+    d.sample(4 * S, 20.0)  # nothing for 3 s
+    assert d.total_km == pytest.approx(km(20.0, 1.0))
+    assert (d.gaps, d.gap_s) == (1, 3.0)
+
+def test_frames_of_one_read_share_its_interval():
+    d = odometer.DistanceIntegrator(max_gap_s=1.0)
+    d.sample_frames(0, [10.0])
+    d.sample_frames(3 * S, [10.0] * 150)  # reader stalled 3 s, 50 Hz of frames waiting
+    assert d.total_km == pytest.approx(km(10.0, 3.0))
+    assert d.gaps == 0 and d.samples == 151
+
+def test_reader_stall_keeps_the_buffered_distance(reader):
+    buf = bytearray(frame(18.0))
+    reader._consume_buffer(buf, 0)
+    for i in range(1, 51):  # 1 s of reads, one frame each
+        buf.extend(frame(18.0))
+        reader._consume_buffer(buf, i * 20 * MS)
+    buf.extend(b''.join(frame(18.0) for _ in range(100)))  # then 2 s of frames in one read
+    reader._consume_buffer(buf, 3 * S)
+    d = reader.distance
+    assert d.total_km == pytest.approx(km(18.0, 3.0), rel=1e-3)  # VSS is quantised to cm/s
+    assert d.gaps == 0
+
+def test_reader_reset_after_disconnect(reader):
+    buf = bytearray(frame(18.0))
+    reader._consume_buffer(buf, 0)
+    buf.extend(frame(18.0))
+    reader._consume_buffer(buf, 500 * MS)
+    reader.distance.reset()  # link lost
+    buf.extend(frame(18.0) * 2)
+    reader._consume_buffer(buf, 10 * S)
+    assert reader.distance.total_km == pytest.approx(km(18.0, 0.5), rel=1e-3)
+
+def test_due_fires_once_until_rearmed():
+    calls = []
+    d = odometer.DistanceIntegrator(lambda: calls.append(d.total_km), max_gap_s=1.0)
+    d.notify_km = 0.1
+    for i in range(1, 401):  # 36 km/h for 40 s = 0.4 km
+        d.sample(i * 100 * MS, 36.0)
+    assert len(calls) == 1 and calls[0] >= 0.1
@@ -0,0 +1,131 @@
+import os, json, time
+
+import pytest
+
+import derived
+import frames
+import session_log
+from io_teensy import TeensyReader
+
+S = 10**9
+SEEN = (1 << frames.CH_RPM) | (1 << frames.CH_VSS)
+
+def row(rpm: int, kmh: float) -> list:
+    values = [0] * derived.VECTOR_LEN
+    values[frames.CH_RPM] = rpm
+    values[frames.CH_VSS] = kmh
+    return values
+
+def meta(path: str) -> dict:
+    with open(os.path.join(path, 'meta.json')) as f:
+        return json.load(f)
+
+@pytest.fixture
+def logger(tmp_path):
+    loggers = []
+    def make(**kw):
+        kw.setdefault('chunk_rows', 64)
+        kw.setdefault('max_queued', 64)  # tests append faster than any serial link
+        lg = session_log.SessionLogger(str(tmp_path), **kw)
+        lg.start()
+        loggers.append(lg)
+        return lg
+    yield make
+    for lg in loggers:
+        if lg.is_alive():
+            lg.close()
+
+def test_gap_splits_and_summaries(logger, tmp_path):
+    lg = logger(split_s=60)
+    t0 = 1000 * S
+    for i in range(300):  # 3 s at 100 Hz, rpm 1000..3990
+        lg.append(t0 + i * S // 100, row(1000 + 10 * i, 50.0), SEEN)
+    t1 = t0 + 120 * S  # ignition off for 2 min
+    for i in range(200):
+        lg.append(t1 + i * S // 100, row(800, 0.0), SEEN)
+    lg.close()
+
+    paths = session_log.sessions(str(tmp_path))
+    assert len(paths) == 2
+    first, second = (session_log.Session(p) for p in paths)
+    assert (first.rows, second.rows) == (300, 200)
+    assert first.duration_s() == pytest.approx(2.99)
+    s = first.summary()
+    assert (s['rpm']['min'], s['rpm']['max']) == (1000, 3990)
+    assert s['rpm']['mean'] == pytest.approx(2495.0)
+    assert s['speed']['mean'] == pytest.approx(50.0)
+    assert 'waterTemp' not in s  # never received
+    assert second.summary()['rpm'] == {'min': 800, 'max': 800, 'mean': 800.0}
+    assert list(first.column('rpm'))[:3] == [1000, 1010, 1020]
+    assert first.meta['compressed'] and not second.meta['compressed']  # the last one is compressed at next start
+
+def test_next_start_compresses_what_exit_left_raw(logger, tmp_path, wait_for):
+    lg = logger()
+    for i in range(100):
+        lg.append(i * S // 100, row(900, 0.0), SEEN)
+    lg.close()
+    path = session_log.sessions(str(tmp_path))[0]
+    with open(os.path.join(path, 'rpm.col'), 'ab') as f:
+        f.write(b'\x01\x02\x03')  # a chunk cut short by a crash
+    logger()  # next start
+    assert wait_for(lambda: meta(path)['compressed'])
+    assert len(session_log.Session(path).column('rpm')) == 100
+
+def test_partial_chunk_is_written_on_the_timer(logger, tmp_path, wait_for):
+    lg = logger(chunk_rows=8192, flush_s=0.05)
+    for i in range(10):
+        lg.append(time.monotonic_ns() + i, row(900, 0.0), SEEN)
+    assert wait_for(lambda: session_log.sessions(str(tmp_path)) and meta(session_log.sessions(str(tmp_path))[0])['rows'] == 10)
+
+def test_quiet_link_closes_the_session_without_new_data(logger, tmp_path, wait_for):
+    lg = logger(flush_s=0.05, split_s=0.3)
+    for i in range(10):
+        lg.append(time.monotonic_ns() + i, row(900, 0.0), SEEN)
+    assert wait_for(lambda: session_log.sessions(str(tmp_path)) and meta(session_log.sessions(str(tmp_path))[0])['compressed'])
+    assert lg._session is None
+
+def fake_session(root, name: str, size: int = 0) -> str:
+    path = os.path.join(str(root), name)
+    os.makedirs(path)
+    with open(os.path.join(path, 'meta.json'), 'w') as f:
+        json.dump({'version': session_log.VERSION, 'rows': 0, 'compressed': True}, f)
+    with open(os.path.join(path, 'rpm.col.z'), 'wb') as f:
+        f.write(bytes(size))
+    return path
+
+def test_start_deletes_the_oldest_sessions(logger, tmp_path, wait_for):
+    paths = [fake_session(tmp_path, f"2026010{d}-120000") for d in range(1, 6)]
+    logger(max_sessions=3)
+    assert wait_for(lambda: len(session_log.sessions(str(tmp_path))) == 3)
+    assert session_log.sessions(str(tmp_path)) == paths[2:]
+
+def test_a_new_session_makes_room_for_itself(logger, tmp_path):
+    fake_session(tmp_path, "20260101-120000")
+    newer = fake_session(tmp_path, "20260102-120000")
+    lg = logger(max_sessions=2)
+    for i in range(10):
+        lg.append(i * S // 100, row(900, 0.0), SEEN)
+    lg.close()
+    paths = session_log.sessions(str(tmp_path))
+    assert len(paths) == 2 and paths[0] == newer
+
+def test_prune_by_size(tmp_path):
+    paths = [fake_session(tmp_path, f"2026010{d}-120000", 2**20) for d in range(1, 5)]
+    assert session_log.prune(str(tmp_path), max_sessions=0, max_mb=2.5) == paths[:2]
+    assert session_log.sessions(str(tmp_path)) == paths[2:]
+    assert session_log.prune(str(tmp_path), max_sessions=0, max_mb=0) == []  # no limit
+
+def test_reader_logs_every_frame_of_a_read(logger, tmp_path, monkeypatch, sink):
+    monkeypatch.setenv('FRAME_HANDOFF', 'snapshot')
+    reader = TeensyReader(sink, record=False, publish=False)
+    reader.session = lg = logger()
+    kmh = round(60 / frames.KMH_PER_CM_S)
+    buf = bytearray(b''.join(frames.encode_v1(rpm, kmh, 0) for rpm in (3000, 7000, 3000)))
+    reader._consume_buffer(buf, 10 * S)  # one read, a spike in the middle
+    lg.close()
+    s = session_log.Session(session_log.sessions(str(tmp_path))[0])
+    assert list(s.column('rpm')) == [3000, 7000, 3000]
+    assert list(s.column('t')) == [10 * S] * 3
+    assert s.summary()['rpm']['max'] == 7000
+    assert s.column('seen')[-1] & 1 << derived.REDLINE_TIME
+    assert 'gear' in s.channels and 'fuelLevel' in s.channels
@@ -0,0 +1,45 @@
+import pytest
+
+import derived
+import frames
+import synthetic
+
+ALL_STATUS = (frames.STATUS_LOW_BEAM | frames.STATUS_FOG_REAR | frames.STATUS_CHECK_ENGINE | frames.STATUS_CHARGING
+              | frames.STATUS_ABS | frames.STATUS_WHEEL_PRESSURE | frames.STATUS_UNDERGLOW)
+
+def decode(drive, version):
+    """Every frame of the cycle through the decoder and the derived stage; OR of the lamp bits, gears, top speed."""
+    dec = frames.Decoder(derived.VECTOR_LEN)
+    der = derived.DerivedChannels(maps={})
+    out = {'status': 0, 'flags': 0, 'gears': set(), 'kmh': 0.0}
+    buf = bytearray()
+    for ts, frame in drive.source(version):
+        buf.extend(frame)
+        def on_frame(v, seen):
+            der.update(v, seen, ts)
+            out['status'] |= int(v[frames.CH_STATUS])
+            out['flags'] |= int(v[frames.CH_FLAGS]) & 0xF
+            out['gears'].add(v[derived.GEAR])
+            out['kmh'] = max(out['kmh'], v[frames.CH_VSS])
+        dec.consume(buf, on_frame)
+    return out
+
+@pytest.mark.parametrize('profile', synthetic.PROFILES)
+def test_every_lamp_is_exercised(profile):
+    got = decode(synthetic.SyntheticDrive(profile=profile), 2)
+    assert got['status'] == ALL_STATUS
+    assert got['flags'] == 0xF  # blinkers, high beam, park
+
+def test_drive_shifts_through_every_gear_in_encoded_frames():
+    drive = synthetic.SyntheticDrive()
+    for version in (1, 2):
+        got = decode(drive, version)
+        assert got['gears'] == set(range(len(derived.gear_bands()) + 1))
+        assert got['kmh'] == pytest.approx(110.0, abs=frames.KMH_PER_CM_S)
+
+def test_sweep_covers_the_full_speed_range():
+    assert decode(synthetic.SyntheticDrive(profile='sweep'), 1)['kmh'] == pytest.approx(230.0, abs=frames.KMH_PER_CM_S)
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        synthetic.SyntheticDrive(profile='track')
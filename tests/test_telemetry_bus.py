@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+import config
+import telemetry_bus
+
+SEEN = (1 << telemetry_bus.WIDTH) - 2
+
+def vector(k: int) -> list:
+    return [k * 1000 + ch for ch in range(telemetry_bus.WIDTH)]
+
+@pytest.fixture
+def bus(tmp_path):
+    path = str(tmp_path / 'bus')
+    writer = telemetry_bus.BusWriter(path, rescan_s=0.05)
+    reader = telemetry_bus.BusReader(path)
+    yield writer, reader
+    reader.close()
+    writer.close()
+
+def test_off_unless_configured(monkeypatch):
+    monkeypatch.setattr(config, 'TELEMETRY_BUS_PATH', None)
+    monkeypatch.delenv('TELEMETRY_BUS', raising=False)
+    assert telemetry_bus.from_config() is None
+
+def test_round_trip(bus):
+    writer, reader = bus
+    assert reader.read() is None  # nothing published yet
+    writer.publish(vector(1), SEEN, 123, 3)
+    snap = reader.read()
+    assert (snap.seq, snap.ts_ns, snap.frames, snap.seen) == (2, 123, 3, SEEN)
+    assert list(snap.values) == vector(1)
+    assert set(snap.channels()) == {name for ch, name in telemetry_bus.NAMES.items() if ch}
+    assert reader.read_new() is None
+    writer.publish(vector(2), SEEN, 456)
+    assert reader.read_new().frames == 4
+
+def test_subscriber_is_notified(bus, wait_for):
+    writer, reader = bus
+    reader.subscribe()
+    assert wait_for(lambda: writer._subscribers)  # picked up by the scanner thread, not by publish
+    writer.publish(vector(1), SEEN, 1)
+    snap = reader.wait(2.0)
+    assert snap is not None and snap.seq == 2
+    assert writer.notified == 1
+
+def test_torn_record_is_not_returned(bus):
+    writer, reader = bus
+    writer.publish(vector(1), SEEN, 1)
+    mm = writer._mm
+    telemetry_bus._SEQ.pack_into(mm, telemetry_bus._SEQ_OFF, 3)  # writer stopped mid-record
+    assert reader.read(spins=50) is None
+    assert reader.retries == 50
+    telemetry_bus._SEQ.pack_into(mm, telemetry_bus._SEQ_OFF, 4)
+    mm[telemetry_bus._RECORD_OFF + 40] ^= 0xff  # even sequence, half-written values
+    assert reader.read(spins=50) is None
+    assert reader.retries == 100
+    writer.publish(vector(2), SEEN, 2)
+    assert list(reader.read().values) == vector(2)
+
+def test_concurrent_reads_are_whole_records(bus):
+    writer, reader = bus
+    stop = threading.Event()
+    def publish():
+        k = 0
+        while not stop.is_set():
+            k += 1
+            writer.publish(vector(k), SEEN, k)
+    t = threading.Thread(target=publish)
+    t.start()
+    try:
+        reads = 0
+        while reads < 2000:
+            snap = reader.read()
+            if snap is None:
+                continue
+            k = snap.ts_ns
+            assert list(snap.values) == vector(k)
+            reads += 1
+    finally:
+        stop.set()
+        t.join()
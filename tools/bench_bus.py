@@ -0,0 +1,125 @@
+"""One bus writer, several reader processes: throughput, torn reads, notify latency.
+
+    python tools/bench_bus.py                       # 1 kHz for 5 s, 2 waiting + 2 polling readers
+    python tools/bench_bus.py --rate 0 --seconds 3  # writer flat out
+    python tools/bench_bus.py --waiters 4 --pollers 0
+
+The writer publishes records whose channel values are all derived from the
+frame counter (``values[ch] = frames * 1000 + ch``), so a reader can tell a
+torn record from a consistent one. Every reader runs in its own process on
+its own mapping of the segment; waiting readers use ``wait()`` on the
+notification socket, polling readers spin on ``read_new()``. A torn record
+accepted by a reader makes the run fail.
+"""
+from __future__ import annotations
+import os, sys, json, time, argparse, tempfile, subprocess
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import telemetry_bus
+
+SEEN = (1 << telemetry_bus.WIDTH) - 2
+
+def pct(values: list, q: float) -> float:
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float('nan')
+
+def writer(path: str, rate: float, seconds: float) -> dict:
+    bus = telemetry_bus.BusWriter(path)
+    base = bus.frames
+    period = 1.0 / rate if rate else 0.0
+    cost: list[int] = []
+    t0 = time.monotonic()
+    n = 0
+    while True:
+        now = time.monotonic()
+        if now - t0 >= seconds:
+            break
+        if period:
+            due = t0 + n * period
+            if due > now:
+                time.sleep(due - now)
+        k = base + n + 1
+        values = [k * 1000 + ch for ch in range(telemetry_bus.WIDTH)]
+        a = time.perf_counter_ns()
+        bus.publish(values, SEEN, time.monotonic_ns())
+        cost.append(time.perf_counter_ns() - a)
+        n += 1
+    bus.close()
+    cost.sort()
+    return {'published': n, 'rate': n / seconds, 'p50_us': pct(cost, 0.5) / 1e3, 'p99_us': pct(cost, 0.99) / 1e3,
+            'max_us': cost[-1] / 1e3 if cost else 0.0, 'notify_dropped': bus.notify_dropped}
+
+def reader(path: str, mode: str, seconds: float) -> dict:
+    bus = telemetry_bus.BusReader(path)
+    if mode == 'wait':
+        bus.subscribe()
+    print('ready', flush=True)
+    reads = torn = backwards = 0
+    first = last = None
+    lat: list[int] = []
+    t_end = time.monotonic() + seconds
+    while time.monotonic() < t_end:
+        snap = bus.wait(0.2) if mode == 'wait' else bus.read_new()
+        if snap is None:
+            continue
+        now = time.monotonic_ns()
+        k = snap.frames
+        if any(v != k * 1000 + ch for ch, v in enumerate(snap.values)) or snap.seen != SEEN:
+            torn += 1
+        if last is not None and k <= last:
+            backwards += 1
+        if first is None:
+            first = k
+        last = k
+        reads += 1
+        lat.append(now - snap.ts_ns)
+    bus.close()
+    lat.sort()
+    covered = (last - first + 1) if first is not None else 0
+    return {'mode': mode, 'reads': reads, 'torn': torn, 'backwards': backwards, 'retries': bus.retries,
+            'seen_pct': 100.0 * reads / covered if covered else 0.0,
+            'lat_p50_us': pct(lat, 0.5) / 1e3, 'lat_p99_us': pct(lat, 0.99) / 1e3}
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rate', type=float, default=1000.0, help='publishes per second (0 = flat out)')
+    ap.add_argument('--seconds', type=float, default=5.0)
+    ap.add_argument('--waiters', type=int, default=2)
+    ap.add_argument('--pollers', type=int, default=2)
+    ap.add_argument('--path', help='segment path (default: a temporary file in /dev/shm)')
+    ap.add_argument('--child', choices=('writer', 'wait', 'poll'), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        r = writer(args.path, args.rate, args.seconds) if args.child == 'writer' else reader(args.path, args.child, args.seconds)
+        print(json.dumps(r))
+        return 0
+
+    tmp = tempfile.TemporaryDirectory(dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+    path = args.path or os.path.join(tmp.name, 'bench.bus')
+    telemetry_bus.BusWriter(path).close()  # create the segment so readers can map it first
+    cmd = [sys.executable, __file__, '--path', path, '--rate', str(args.rate)]
+    readers = []
+    for mode in ['wait'] * args.waiters + ['poll'] * args.pollers:
+        p = subprocess.Popen(cmd + ['--child', mode, '--seconds', str(args.seconds + 1.0)], stdout=subprocess.PIPE, text=True)
+        p.stdout.readline()  # ready
+        readers.append(p)
+    w = subprocess.run(cmd + ['--child', 'writer', '--seconds', str(args.seconds)], capture_output=True, text=True)
+    wr = json.loads(w.stdout.strip().splitlines()[-1])
+    print(f"writer  {wr['published']} records ({wr['rate']:.0f}/s), publish p50 {wr['p50_us']:.1f} us  "
+          f"p99 {wr['p99_us']:.1f} us  max {wr['max_us']:.1f} us, notifications dropped {wr['notify_dropped']}")
+    print(f"{'reader':<8} {'reads':>7} {'seen %':>7} {'torn':>5} {'back':>5} {'retries':>8} {'lat p50 us':>11} {'lat p99 us':>11}")
+    bad = 0
+    for i, p in enumerate(readers):
+        out, _ = p.communicate()
+        r = json.loads(out.strip().splitlines()[-1])
+        bad += r['torn'] + r['backwards']
+        print(f"{r['mode'] + str(i):<8} {r['reads']:>7} {r['seen_pct']:>7.1f} {r['torn']:>5} {r['backwards']:>5} "
+              f"{r['retries']:>8} {r['lat_p50_us']:>11.1f} {r['lat_p99_us']:>11.1f}")
+    print("OK" if not bad else "FAIL: torn or out-of-order records")
+    return 1 if bad else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Calibration lookup tables: accuracy against the breakpoints and cost per sample.
+
+    python tools/bench_calibration.py                 # data/calibration.json
+    python tools/bench_calibration.py --file my.json --samples 200000
+
+Every map in the file (disabled ones too) plus a random 2D grid is
+evaluated through its dense table at ``--samples`` random inputs (10 %
+outside the breakpoints) and compared with plain interpolation on the
+breakpoints (``calibration.interp`` / ``interp2``). Then the redline curve
+is timed per sample four ways: the dense table, bisect on the breakpoints,
+the linear scan ``Cluster.qml`` used to run (ported to Python), and that
+JavaScript function itself in a ``QJSEngine``. Exits 1 if a table is off by
+more than ``--tolerance`` of its output range.
+"""
+from __future__ import annotations
+import os, sys, json, time, random, argparse
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import config
+import calibration
+
+# redlineForOilTemp as it was in ui/Cluster.qml
+QML_REDLINE = """
+function redlineForOilTemp(oilTemp) {
+    var table = [
+        [30,2498], [35,2750], [40,2994], [45,3250], [50,3498], [55,3700], [60,3994],
+        [65,4250], [70,4498], [75,4750], [80,4994], [85,5498], [90,5994]
+    ];
+    if (oilTemp <= table[0][0]) return table[0][1];
+    if (oilTemp >= table[table.length-1][0]) return table[table.length-1][1];
+    for (var i=0;i<table.length-1;i++) {
+        var a = table[i]; var b = table[i+1];
+        if (oilTemp >= a[0] && oilTemp <= b[0]) {
+            var t = (oilTemp - a[0])/(b[0]-a[0]);
+            return a[1] + t*(b[1]-a[1]);
+        }
+    }
+    return 5994;
+}
+"""
+
+def scan(table, x):
+    """The QML linear scan, table rebuilt per call like the JS literal."""
+    table = [list(r) for r in table]
+    if x <= table[0][0]: return table[0][1]
+    if x >= table[-1][0]: return table[-1][1]
+    for i in range(len(table) - 1):
+        a, b = table[i], table[i + 1]
+        if a[0] <= x <= b[0]:
+            return a[1] + (x - a[0]) / (b[0] - a[0]) * (b[1] - a[1])
+    return table[-1][1]
+
+def inputs(lo, hi, n, rnd):
+    pad = (hi - lo) * 0.05
+    return [rnd.uniform(lo - pad, hi + pad) for _ in range(n)]
+
+def per_call_ns(fn, xs) -> float:
+    t = time.perf_counter_ns()
+    for x in xs:
+        fn(x)
+    return (time.perf_counter_ns() - t) / len(xs)
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--file', default=config.path('CALIBRATION_PATH', 'CALIBRATION'))
+    ap.add_argument('--samples', type=int, default=50000)
+    ap.add_argument('--tolerance', type=float, default=1e-9, help='max error as a fraction of the output range')
+    ap.add_argument('--seed', type=int, default=1)
+    args = ap.parse_args()
+    rnd = random.Random(args.seed)
+
+    with open(args.file) as f:
+        specs = json.load(f)['maps']
+    # a 2D map on integer breakpoints, like a redline over oil and water temperature
+    xs2, ys2 = [20, 40, 60, 80, 100], [40, 70, 90, 110]
+    specs = dict(specs, random2d={'x': xs2, 'y': ys2, 'z': [[rnd.randrange(2000, 7000) for _ in ys2] for _ in xs2],
+                                  'step': [0.5, 0.5]})
+    bad = False
+    print(f"{'map':<12} {'kind':<4} {'points':>8} {'build ms':>9} {'max error':>10}")
+    for name, spec in specs.items():
+        t = time.perf_counter()
+        m = calibration.build(name, spec)
+        build_ms = (time.perf_counter() - t) * 1e3
+        if 'z' in spec:
+            ax = inputs(spec['x'][0], spec['x'][-1], args.samples, rnd)
+            ay = inputs(spec['y'][0], spec['y'][-1], args.samples, rnd)
+            err = max(abs(m(x, y) - calibration.interp2(spec['x'], spec['y'], spec['z'], x, y)) for x, y in zip(ax, ay))
+            span = max(map(max, spec['z'])) - min(map(min, spec['z']))
+        else:
+            ax = inputs(spec['x'][0], spec['x'][-1], args.samples, rnd)
+            err = max(abs(m(x) - calibration.interp(spec['x'], spec['y'], x)) for x in ax)
+            span = max(spec['y']) - min(spec['y'])
+        off = err > args.tolerance * max(span, 1e-12)
+        bad |= off
+        print(f"{name:<12} {'2D' if 'z' in spec else '1D':<4} {m.size:>8} {build_ms:>9.2f} {err:>10.2e}{'  FAIL' if off else ''}")
+
+    red = specs.get('redline')
+    if red is not None and 'z' not in red:
+        table = list(zip(red['x'], red['y']))
+        m = calibration.build('redline', red)
+        xs = inputs(20.0, 100.0, args.samples, rnd)
+        rows = [('dense table', per_call_ns(m, xs)),
+                ('bisect', per_call_ns(lambda x: calibration.interp(red['x'], red['y'], x), xs)),
+                ('linear scan (py)', per_call_ns(lambda x: scan(table, x), xs))]
+        try:
+            from PySide6.QtCore import QCoreApplication
+            from PySide6.QtQml import QJSEngine
+            app = QCoreApplication.instance() or QCoreApplication([])  # noqa: F841 - QJSEngine needs it alive
+            js = QJSEngine()
+            js.evaluate(QML_REDLINE)
+            n = args.samples
+            loop = js.evaluate(f"(function() {{ var s = 0; var t0 = Date.now(); for (var i = 0; i < {n}; i++)"
+                               f" s += redlineForOilTemp(20 + (i % 800) / 10); return Date.now() - t0; }})")
+            rows.append(('QML function (js)', loop.call().toNumber() * 1e6 / n))
+        except ImportError:
+            pass
+        print(f"\nredline per sample ({args.samples} samples)")
+        for label, ns in rows:
+            print(f"{label:<18} {ns:>8.0f} ns")
+    print("OK" if not bad else "FAIL")
+    return 1 if bad else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
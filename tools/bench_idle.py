@@ -0,0 +1,152 @@
+"""CPU and wakeups of the whole app with the car idling, governor off vs on.
+
+    python tools/bench_idle.py                  # 50 Hz frames, 10 s measured per mode
+    python tools/bench_idle.py --rate 100 --seconds 20 --platform eglfs   # on the Pi
+
+Runs ``src/main.py`` in production mode against a pseudo-terminal that
+sends what an idling car sends: v2 frames with rpm hunting around 850,
+speed 0 and steady temperatures. After a warm-up longer than
+``IDLE_AFTER_S`` it samples the process from ``/proc`` for ``--seconds``:
+CPU % (user + system) and wakeups/s (voluntary + involuntary context
+switches summed over all threads). With the governor on it then sends a
+blip to 3000 rpm and reports how long after writing the first blip frame
+the app printed that it woke up. The bus, session log and recorder are off; data/data.json and the
+distance journal are put back afterwards.
+"""
+from __future__ import annotations
+import os, sys, time, glob, tty, random, argparse, threading, subprocess
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import config
+import frames
+
+CLK_TCK = os.sysconf('SC_CLK_TCK')
+
+def cpu_s(pid: int) -> float:
+    with open(f'/proc/{pid}/stat') as f:
+        fields = f.read().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLK_TCK  # utime, stime
+
+def switches(pid: int) -> int:
+    n = 0
+    for status in glob.glob(f'/proc/{pid}/task/*/status'):
+        try:
+            with open(status) as f:
+                for line in f:
+                    if 'ctxt_switches' in line:
+                        n += int(line.split()[1])
+        except OSError:
+            pass  # thread exited
+    return n
+
+class Car(threading.Thread):
+    """Writes idle frames to the pty master at ``rate``; ``rpm`` can be changed."""
+    def __init__(self, master: int, rate: float):
+        super().__init__(daemon=True)
+        self.master = master
+        self.period = 1.0 / rate
+        self.rpm = 850
+        self.changed_at = None  # monotonic s the first frame with a new ``rpm`` was written
+        self.stop = threading.Event()
+
+    def run(self):
+        rnd = random.Random(1)
+        temps = [(frames.CH_WATER_TEMP, 880), (frames.CH_OIL_TEMP, 910), (frames.CH_AFR, 1470),
+                 (frames.CH_OIL_PRESSURE, 150), (frames.CH_CHARGING_VOLT, 1420), (frames.CH_FUEL, 64)]
+        t = time.monotonic()
+        i = 0
+        while not self.stop.is_set():
+            rpm = self.rpm
+            records = [(frames.CH_RPM, rpm + rnd.randrange(-40, 41)), (frames.CH_VSS, 0)]
+            if i % 10 == 0:
+                records += temps
+            try:
+                os.write(self.master, frames.encode_v2(records))
+                if rpm != 850 and self.changed_at is None:
+                    self.changed_at = time.monotonic()
+            except (BlockingIOError, OSError):
+                pass  # port not open yet
+            i += 1
+            t += self.period
+            self.stop.wait(max(0.0, t - time.monotonic()))
+
+def run(governor: bool, args) -> dict:
+    master, slave = os.openpty()
+    tty.setraw(master); tty.setraw(slave)
+    os.set_blocking(master, False)
+    env = dict(os.environ, TEENSY_DEV=os.ttyname(slave), IDLE_GOVERNOR='1' if governor else '0',
+               QT_QPA_PLATFORM=args.platform, PYTHONUNBUFFERED='1', LATENCY_PROBE='0',
+               TELEMETRY_BUS='0', SESSION_LOG='0', FRAME_RECORD='')
+    env.pop('DEVELOP_MODE', None)
+    car = Car(master, args.rate)
+    car.start()
+    proc = subprocess.Popen([sys.executable, os.path.join(PROJECT_ROOT, 'src', 'main.py')], env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    lines: list[tuple[float, str]] = []
+    def pump():
+        for line in proc.stdout:
+            lines.append((time.monotonic(), line.rstrip()))
+    threading.Thread(target=pump, daemon=True).start()
+    r = {'governor': 'on' if governor else 'off'}
+    try:
+        time.sleep(config.IDLE_AFTER_S + config.IDLE_CHECK_S + args.warmup)
+        c0, s0, t0 = cpu_s(proc.pid), switches(proc.pid), time.monotonic()
+        time.sleep(args.seconds)
+        c1, s1, t1 = cpu_s(proc.pid), switches(proc.pid), time.monotonic()
+        r['cpu_pct'] = 100.0 * (c1 - c0) / (t1 - t0)
+        r['wakeups_s'] = (s1 - s0) / (t1 - t0)
+        r['idle'] = any('[idle] idle after' in l for _, l in lines)
+        if governor:
+            car.rpm = 3000
+            deadline = time.monotonic() + 2.0
+            woke = None
+            while woke is None and time.monotonic() < deadline:
+                woke = next((t for t, l in lines if '[idle] awake' in l), None)
+                time.sleep(0.001)
+            sent = car.changed_at
+            r['wake_ms'] = (woke - sent) * 1e3 if woke is not None and sent is not None else float('nan')
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        car.stop.set()
+        car.join(1.0)
+        os.close(master); os.close(slave)
+    return r
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rate', type=float, default=50.0, help='frames per second from the car')
+    ap.add_argument('--seconds', type=float, default=10.0, help='measured seconds per mode')
+    ap.add_argument('--warmup', type=float, default=3.0, help='extra seconds after IDLE_AFTER_S before measuring')
+    ap.add_argument('--platform', default=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    args = ap.parse_args()
+
+    saved = {}
+    for name in ('data.json', 'distance.journal'):
+        path = os.path.join(PROJECT_ROOT, 'data', name)
+        saved[path] = open(path, 'rb').read() if os.path.exists(path) else None
+    try:
+        results = [run(False, args), run(True, args)]
+    finally:
+        for path, content in saved.items():
+            if content is None:
+                if os.path.exists(path):
+                    os.remove(path)
+            else:
+                with open(path, 'wb') as f:
+                    f.write(content)
+
+    print(f"idle car, {args.rate:g} Hz frames, {args.seconds:g} s measured ({args.platform})")
+    print(f"{'governor':<9} {'CPU %':>7} {'wakeups/s':>10} {'went idle':>10} {'wake ms':>8}")
+    for r in results:
+        wake = f"{r['wake_ms']:.1f}" if 'wake_ms' in r else '-'
+        print(f"{r['governor']:<9} {r['cpu_pct']:>7.1f} {r['wakeups_s']:>10.0f} {'yes' if r['idle'] else 'no':>10} {wake:>8}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Write amplification per 100 km: per-0.1 km data.json rewrites vs the journal.
+
+    python tools/bench_journal.py [--km 100] [--fsync interval]
+
+Bytes are taken from /proc/self/io (wchar: bytes handed to write()), so they
+include the JSON snapshot rewrites done by compaction. Payload is 16 bytes
+(odometer + trip as doubles) per 0.1 km step.
+"""
+from __future__ import annotations
+import os, sys, json, time, tempfile, argparse
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import config
+import storage
+import distance_journal
+
+SEED_DOC = {"odometer": 2142.7, "trip": 142.7, "fr": 14, "fl": 14, "rr": 15, "rl": 15, "exhaust": True}
+
+def wchar() -> int:
+    with open('/proc/self/io') as f:
+        for line in f:
+            if line.startswith('wchar:'):
+                return int(line.split()[1])
+    return 0
+
+def legacy(path: str, steps: int) -> dict:
+    # old saveTrip + saveOdometer: read, modify, truncate-and-dump, twice per step
+    def save(key, value):
+        with open(path, 'r', encoding='utf-8') as f:
+            obj = json.load(f) or {}
+        obj[key] = float(value)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+    odo, trip = SEED_DOC['odometer'], SEED_DOC['trip']
+    w0 = wchar(); t0 = time.perf_counter()
+    for _ in range(steps):
+        odo += 0.1; trip += 0.1
+        save('trip', round(trip, 1))
+        save('odometer', round(odo, 1))
+    return {'bytes': wchar() - w0, 'rewrites': steps * 2, 'fsyncs': 0, 'seconds': time.perf_counter() - t0}
+
+def journal(path: str, steps: int) -> dict:
+    jpath = path + '.journal'
+    j = distance_journal.DistanceJournal(
+        lambda o, t, s: storage.update_data({'odometer': round(o, 3), 'trip': round(t, 3), 'journal_seq': s}, path),
+        path=jpath)
+    odo, trip = SEED_DOC['odometer'], SEED_DOC['trip']
+    w0 = wchar(); t0 = time.perf_counter()
+    j.start()
+    for _ in range(steps):
+        odo += 0.1; trip += 0.1
+        j.record(odo, trip)
+    j.close(10.0)
+    res = {'bytes': wchar() - w0, 'rewrites': j.compactions, 'fsyncs': j.fsyncs, 'seconds': time.perf_counter() - t0}
+    rodo, rtrip, _ = distance_journal.recover(storage.load_data(path), jpath)
+    res['recovered_ok'] = abs(rodo - odo) < 1e-6 and abs(rtrip - trip) < 1e-6
+    return res
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--km', type=float, default=100.0)
+    ap.add_argument('--fsync', choices=('always', 'interval', 'never'), default=config.JOURNAL_FSYNC)
+    args = ap.parse_args()
+    config.JOURNAL_FSYNC = args.fsync
+    steps = int(round(args.km * 10))
+    payload = steps * 16
+    with tempfile.TemporaryDirectory() as d:
+        results = {}
+        for name, fn in (('json rewrite', legacy), ('journal', journal)):
+            path = os.path.join(d, name.replace(' ', '_') + '.json')
+            storage.atomic_write_json(path, SEED_DOC)
+            results[name] = fn(path, steps)
+    print(f"{args.km:g} km, {steps} steps of 0.1 km, fsync={args.fsync}")
+    print(f"{'method':<13} {'bytes':>10} {'WA':>8} {'file rewrites':>14} {'fsyncs':>7} {'time s':>7}")
+    for name, r in results.items():
+        print(f"{name:<13} {r['bytes']:>10} {r['bytes'] / payload:>8.1f} {r['rewrites']:>14} {r['fsyncs']:>7} {r['seconds']:>7.3f}")
+    print(f"journal recovery matches final value: {results['journal']['recovered_ok']}")
+
+if __name__ == '__main__':
+    main()
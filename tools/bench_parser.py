@@ -0,0 +1,94 @@
+"""Microbenchmark: legacy byte-popping scanner vs frames.Decoder.consume.
+
+    python tools/bench_parser.py [--frames 20000] [--chunk 64]
+
+Captures: clean (back-to-back frames), noisy (garbage bursts and bit flips
+between frames), misaligned (starts mid-frame behind a 4 KiB noise block)
+and v2 (RPM/VSS every frame, FLAGS every 5th, slow channels every 10th;
+new decoder only).
+"""
+from __future__ import annotations
+import os, sys, time, random, argparse, struct
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import config
+import frames
+
+def legacy_consume(buf: bytearray, on_frame):
+    # Pre-rewrite TeensyReader._consume_buffer (with the 14-byte layout)
+    FRAME_LEN = config.FRAME_LEN_BYTES
+    while len(buf) >= FRAME_LEN:
+        if buf[0] != (config.FRAME_MAGIC & 0xFF) or (len(buf) >= 2 and buf[1] != (config.FRAME_MAGIC >> 8) & 0xFF):
+            buf.pop(0)
+            continue
+        frame = bytes(buf[:FRAME_LEN])
+        del buf[:FRAME_LEN]
+        try:
+            magic, ver, ln, rpm, vss_cm_s, flags, crc = frames.FRAME_V1.unpack(frame)
+        except struct.error:
+            continue
+        if magic != config.FRAME_MAGIC or ver != config.FRAME_VERSION or ln != FRAME_LEN:
+            continue
+        if frames.crc16_x25(frame[:-2]) != crc:
+            continue
+        on_frame(int(rpm), float(vss_cm_s * 0.036), int(flags))
+
+def make_captures(n: int, seed: int = 1) -> dict[str, bytes]:
+    rnd = random.Random(seed)
+    good = [frames.encode_v1(rnd.randrange(7000), rnd.randrange(9000), rnd.randrange(1 << 12)) for _ in range(n)]
+    clean = b''.join(good)
+    noisy = bytearray()
+    for f in good:
+        if rnd.random() < 0.05:
+            noisy += bytes(rnd.randrange(256) for _ in range(rnd.randrange(1, 48)))
+        if rnd.random() < 0.01:
+            f = bytearray(f); f[rnd.randrange(len(f))] ^= 1 << rnd.randrange(8); f = bytes(f)
+        noisy += f
+    noise = bytes(rnd.randrange(256) for _ in range(4096))
+    misaligned = noise + clean[7:]
+    v2 = bytearray()
+    for k in range(n):
+        rec = [(frames.CH_RPM, rnd.randrange(7000)), (frames.CH_VSS, rnd.randrange(9000))]
+        if k % 5 == 0:
+            rec.append((frames.CH_FLAGS, rnd.randrange(1 << 12)))
+        if k % 10 == 0:
+            rec += [(frames.CH_WATER_TEMP, rnd.randrange(1500)), (frames.CH_OIL_TEMP, rnd.randrange(1500)),
+                    (frames.CH_AFR, rnd.randrange(1000, 1800)), (frames.CH_OIL_PRESSURE, rnd.randrange(800)),
+                    (frames.CH_CHARGING_VOLT, rnd.randrange(1100, 1600)), (frames.CH_FUEL, rnd.randrange(101)),
+                    (frames.CH_STATUS, rnd.randrange(1 << 7))]
+        v2 += frames.encode_v2(rec)
+    return {'clean': clean, 'noisy': bytes(noisy), 'misaligned': misaligned, 'v2': bytes(v2)}
+
+def run(consume, data: bytes, chunk: int) -> tuple[int, float]:
+    count = 0
+    def on_frame(*_):
+        nonlocal count
+        count += 1
+    buf = bytearray()
+    t0 = time.perf_counter()
+    for off in range(0, len(data), chunk):
+        buf.extend(data[off:off + chunk])
+        consume(buf, on_frame)
+    return count, time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--frames', type=int, default=20000)
+    ap.add_argument('--chunk', type=int, default=64, help='bytes appended per read')
+    args = ap.parse_args()
+    caps = make_captures(args.frames)
+    print(f"{'capture':<11} {'impl':<7} {'frames':>7} {'frames/s':>12} {'MB/s':>8}")
+    for name, data in caps.items():
+        impls = [('after', frames.Decoder().consume)]
+        if name != 'v2':
+            impls.insert(0, ('before', legacy_consume))
+        for impl, fn in impls:
+            count, dt = run(fn, data, args.chunk)
+            print(f"{name:<11} {impl:<7} {count:>7} {count / dt:>12,.0f} {len(data) / dt / 1e6:>8.2f}")
+        print(f"{'':<11} {len(data) / max(count, 1):.1f} bytes/frame on the wire")
+
+if __name__ == '__main__':
+    main()
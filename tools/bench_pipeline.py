@@ -0,0 +1,107 @@
+"""Headless regression benchmark for the frame parser + Telemetry path.
+
+    python tools/bench_pipeline.py                       # 20k generated frames, as fast as possible
+    python tools/bench_pipeline.py --ring frames.ring    # replay a recording
+    python tools/bench_pipeline.py --speed 1 --frames 1000   # real time, threaded, with event loop
+    python tools/bench_pipeline.py --drive 2 --rate 5000     # synthetic drive as v2 frames at 5 kHz
+    FRAME_HANDOFF=direct python tools/bench_pipeline.py  # legacy per-frame setters
+
+Runs under QCoreApplication (no window). Fast mode feeds frames one at a
+time on the main thread and times each _consume_buffer -> Telemetry step.
+"""
+from __future__ import annotations
+import os, sys, time, argparse, tempfile, json, itertools
+from collections import Counter
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+from PySide6.QtCore import QCoreApplication, QTimer, Signal
+
+from telemetry import Telemetry
+from settings_store import SettingsStore
+import io_teensy
+import replay
+import synthetic
+
+def count_emissions(tel: Telemetry) -> Counter:
+    counts: Counter = Counter()
+    for name in dir(Telemetry):
+        if name.endswith('Changed') and isinstance(getattr(Telemetry, name, None), Signal):
+            getattr(tel, name).connect(lambda *_, n=name: counts.update((n,)))
+    return counts
+
+def pct(sorted_ns: list[int], q: float) -> float:
+    return sorted_ns[min(len(sorted_ns) - 1, int(q * len(sorted_ns)))] / 1e3
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--ring', help='frame ring file to replay (default: generated sweep)')
+    ap.add_argument('--frames', type=int, default=20000, help='generated frame count')
+    ap.add_argument('--rate', type=float, default=100.0, help='generated frame rate (Hz)')
+    ap.add_argument('--drive', type=int, choices=(1, 2), help='synthetic drive cycle (src/synthetic.py) as v1/v2 frames at --rate')
+    ap.add_argument('--speed', type=float, default=0.0, help='0 = as fast as possible, 1 = real time, N = N x')
+    ap.add_argument('--json', help='write results to this file')
+    args = ap.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    tmp = tempfile.TemporaryDirectory()
+    settings = SettingsStore(os.path.join(tmp.name, 'data.json'))
+    tel = Telemetry(settings)
+    counts = count_emissions(tel)
+    if args.ring:
+        source = replay.ring_source(args.ring)
+    elif args.drive:
+        drive = synthetic.SyntheticDrive(rate_hz=args.rate)
+        print(f"drive: {drive.duration_s:.0f} s cycle @ {args.rate:g} Hz built in {drive.build_s:.2f} s")
+        source = itertools.islice(drive.source(args.drive, loops=args.frames // drive.rows + 1), args.frames)
+    else:
+        source = replay.sweep_source(args.frames, args.rate)
+    reader = replay.ReplayReader(tel, source, speed=args.speed or None)
+
+    t0 = time.perf_counter()
+    if args.speed:
+        reader.start()
+        def poll():
+            if not reader.is_alive():
+                app.quit()
+        timer = QTimer(); timer.timeout.connect(poll); timer.start(50)
+        app.exec()
+        per_frame = []
+    else:
+        per_frame = []
+        clock = time.perf_counter_ns
+        for _, frame in source:
+            s = clock()
+            reader.feed(frame)
+            per_frame.append(clock() - s)
+    elapsed = time.perf_counter() - t0
+    app.processEvents()
+    tel.shutdown()
+
+    n = reader.frames_fed
+    emissions = sum(counts.values())
+    res = {
+        'handoff': io_teensy.handoff_mode(), 'frames': n, 'seconds': elapsed,
+        'frames_per_s': n / elapsed if elapsed else 0.0,
+        'emissions': emissions, 'emissions_per_frame': emissions / n if n else 0.0,
+        'per_signal': dict(counts.most_common()),
+    }
+    if per_frame:
+        per_frame.sort()
+        res.update({f'p{int(q * 100)}_us': pct(per_frame, q) for q in (0.5, 0.95, 0.99)})
+        res['max_us'] = per_frame[-1] / 1e3
+    print(f"handoff={res['handoff']} frames={n} time={elapsed:.3f}s -> {res['frames_per_s']:,.0f} frames/s")
+    if per_frame:
+        print(f"per frame: p50 {res['p50_us']:.1f} us  p95 {res['p95_us']:.1f} us  p99 {res['p99_us']:.1f} us  max {res['max_us']:.1f} us")
+    print(f"signal emissions: {emissions} ({res['emissions_per_frame']:.2f}/frame)")
+    for name, c in counts.most_common():
+        print(f"  {name:<22} {c:>8}  {c / n if n else 0:.3f}/frame")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(res, f, indent=2)
+    tmp.cleanup()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""Frame-time comparison: Canvas progress arc/marker vs the native RingGauge.
+
+    python tools/bench_ring_gauge.py                          # software backend, both implementations
+    python tools/bench_ring_gauge.py --backend software --backend rhi --platform eglfs   # on the Pi
+    python tools/bench_ring_gauge.py --impl native --shot ring.png
+
+Each (backend, implementation) pair runs in its own process with a window
+holding one Gauge configured like Main.qml's rpmRing. The value sweeps by
+one step per rendered frame, so every frame repaints the arc and marker.
+Reported: frame interval percentiles and process CPU time per frame
+(vsync is off on offscreen/linuxfb, so the interval is the frame cost).
+"""
+from __future__ import annotations
+import os, sys, time, json, argparse, subprocess
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+SCENE = b"""
+import QtQuick 2.15
+import QtQuick.Window 2.15
+import "components"
+Window {
+    width: 720; height: 720; color: 'black'; visible: true
+    Gauge {
+        objectName: 'gauge'
+        anchors.fill: parent
+        useNativeRing: %(native)s
+        max: 7000; min: 0
+        showInnerProgress: true
+        innerProgressWidth: width * 0.012
+        innerProgressRadius: radius - ringWidth * 1.55
+        innerProgressGlow: %(glow)s
+        innerProgressWhiteGlow: %(glow)s
+        innerProgressRoundCap: false
+        markerStartRadius: radius * 0.42
+        markerEndRadius: radius - ringWidth - width * 0.004
+        markerBaseWidth: width * 0.045
+        redFrom: 5994; redTo: 7000
+        majorStep: 1000; minorStep: 500
+        abbreviateThousands: true
+        showCenterValue: false; showCenterLabel: false
+        useTextLabels: true; drawCanvasLabels: false
+        ringWidth: width * 0.04
+        tickMajorLen: width * 0.075; tickMinorLen: width * 0.045
+        warnFrom: 5300; warnTo: 6000
+        smoothMarker: false
+    }
+}
+"""
+
+BACKENDS = {
+    'software': {'QT_QUICK_BACKEND': 'software'},
+    'rhi': {},
+}
+
+def pct(values: list[float], q: float) -> float:
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def child(args) -> dict:
+    from PySide6.QtGui import QGuiApplication
+    from PySide6.QtQml import QQmlApplicationEngine
+    from PySide6.QtCore import QUrl, QTimer
+    from PySide6.QtQuick import QQuickItem
+    import ring_gauge
+
+    app = QGuiApplication(sys.argv[:1])
+    ring_gauge.register()
+    engine = QQmlApplicationEngine()
+    qml = SCENE % {b'native': b'true' if args.impl == 'native' else b'false',
+                   b'glow': b'true' if args.glow else b'false'}
+    engine.loadData(qml, QUrl.fromLocalFile(os.path.join(PROJECT_ROOT, 'ui', 'bench.qml')))
+    win = engine.rootObjects()[0]
+    gauge = win.findChild(QQuickItem, 'gauge')
+    stamps: list[int] = []
+    cpu: list[float] = []
+    state = {'v': 0.0, 'n': 0}
+
+    def swapped():
+        stamps.append(time.perf_counter_ns())
+        cpu.append(time.process_time())
+        state['n'] += 1
+        if state['n'] >= args.frames + args.warmup:
+            app.quit()
+            return
+        QTimer.singleShot(0, step)
+
+    def step():
+        state['v'] = (state['v'] + 37.0) % 7000.0
+        gauge.setProperty('value', state['v'])
+        win.update()
+
+    win.frameSwapped.connect(swapped)
+    QTimer.singleShot(200, step)
+    app.exec()
+    if args.shot:
+        win.grabWindow().save(args.shot)
+    stamps, cpu = stamps[args.warmup:], cpu[args.warmup:]
+    intervals = sorted((b - a) / 1e6 for a, b in zip(stamps, stamps[1:]))
+    api = win.rendererInterface().graphicsApi()
+    return {
+        'api': getattr(api, 'name', str(api)),
+        'native': bool(gauge.property('nativeRing')),
+        'frames': len(intervals),
+        'p50_ms': pct(intervals, 0.50), 'p95_ms': pct(intervals, 0.95), 'p99_ms': pct(intervals, 0.99),
+        'cpu_ms_per_frame': (cpu[-1] - cpu[0]) * 1e3 / max(1, len(cpu) - 1),
+    }
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--backend', action='append', choices=sorted(BACKENDS), help='repeatable (default: software)')
+    ap.add_argument('--impl', choices=('canvas', 'native', 'both'), default='both')
+    ap.add_argument('--platform', default=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    ap.add_argument('--frames', type=int, default=300)
+    ap.add_argument('--warmup', type=int, default=30)
+    ap.add_argument('--glow', action='store_true', help='enable both glow passes (Gauge defaults)')
+    ap.add_argument('--shot', help='save a screenshot of the last frame')
+    ap.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(child(args)))
+        return
+
+    impls = ('canvas', 'native') if args.impl == 'both' else (args.impl,)
+    print(f"{'backend':<9} {'impl':<7} {'api':<10} {'frames':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'cpu ms/f':>9}")
+    for backend in args.backend or ['software']:
+        for impl in impls:
+            env = dict(os.environ, QT_QPA_PLATFORM=args.platform, **BACKENDS[backend])
+            if backend == 'rhi':
+                env.pop('QT_QUICK_BACKEND', None)
+                env.pop('QSG_RHI_BACKEND', None)
+            cmd = [sys.executable, __file__, '--child', '--impl', impl,
+                   '--frames', str(args.frames), '--warmup', str(args.warmup)]
+            if args.glow:
+                cmd.append('--glow')
+            if args.shot:
+                root, ext = os.path.splitext(args.shot)
+                cmd += ['--shot', f"{root}-{backend}-{impl}{ext or '.png'}"]
+            out = subprocess.run(cmd, env=env, capture_output=True, text=True)
+            line = out.stdout.strip().splitlines()[-1:] or ['']
+            try:
+                r = json.loads(line[0])
+            except ValueError:
+                print(f"{backend:<9} {impl:<7} failed: {out.stderr.strip()[-300:]}")
+                continue
+            label = impl if impl == 'canvas' or r['native'] else 'native?'  # native? = Cluster module missing
+            print(f"{backend:<9} {label:<7} {r['api']:<10} {r['frames']:>6} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+                  f"{r['p99_ms']:>8.2f} {r['cpu_ms_per_frame']:>9.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Wakeups/s and latency of the serial read loop, poll vs select mode.
+
+    python tools/bench_serial_read.py [--rate 500] [--seconds 3] [--idle 3]
+
+Runs TeensyReader against a pseudo-terminal fed by a writer thread. Each
+frame carries its sequence number in the RPM field so the decode callback
+can compute send->decode latency; arrival->decode uses the reader's own
+per-read arrival stamp.
+"""
+from __future__ import annotations
+import os, sys, time, tty, argparse
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import frames
+import io_teensy
+import odometer
+
+class _Sink:
+    """Stands in for Telemetry; records decode timestamps."""
+    def __init__(self, sent_ns):
+        self.sent_ns = sent_ns
+        self.reader = None
+        self.send_lat = []
+        self.arrival_lat = []
+
+    def updateFromChannels(self, values, seen):
+        now = time.monotonic_ns()
+        self.send_lat.append(now - self.sent_ns[values[frames.CH_RPM]])
+        self.arrival_lat.append(now - self.reader.arrival_ns)
+
+    publishChannels = updateFromChannels
+
+    def getLatency(self):
+        return None  # this tool does its own timing
+
+    def getDistanceIntegrator(self):
+        return odometer.DistanceIntegrator()
+
+    def getIdleGovernor(self):
+        return None
+
+    def setLinkState(self, connected, stale):
+        pass
+
+def pct(values, q):
+    if not values: return float('nan')
+    v = sorted(values)
+    return v[min(len(v) - 1, int(q * len(v)))] / 1e3
+
+def measure(mode: str, rate: float, seconds: float, idle: float) -> dict:
+    os.environ['SERIAL_READ_MODE'] = mode
+    master, slave = os.openpty()
+    tty.setraw(master); tty.setraw(slave)
+    os.environ['TEENSY_DEV'] = os.ttyname(slave)
+    n = int(rate * seconds)
+    sent_ns = [0] * 65536
+    sink = _Sink(sent_ns)
+    reader = io_teensy.TeensyReader(sink)
+    sink.reader = reader
+    reader.start()
+    time.sleep(0.2)
+
+    w0 = reader.wakeups; t0 = time.monotonic()
+    time.sleep(idle)
+    idle_rate = (reader.wakeups - w0) / (time.monotonic() - t0)
+
+    w0 = reader.wakeups; t0 = time.monotonic()
+    period = 1.0 / rate
+    for i in range(n):
+        target = t0 + i * period
+        delay = target - time.monotonic()
+        if delay > 0: time.sleep(delay)
+        seq = i & 0xFFFF
+        sent_ns[seq] = time.monotonic_ns()
+        os.write(master, frames.encode_v1(seq, 0, 0))
+    time.sleep(0.2)
+    busy_rate = (reader.wakeups - w0) / (time.monotonic() - t0)
+    reader.stop_event.set()
+    reader.join(2.0)
+    os.close(master)
+    return {
+        'mode': mode, 'decoded': len(sink.send_lat), 'sent': n,
+        'idle_wakeups_s': idle_rate, 'busy_wakeups_s': busy_rate,
+        'send_p50': pct(sink.send_lat, 0.50), 'send_p99': pct(sink.send_lat, 0.99),
+        'arr_p50': pct(sink.arrival_lat, 0.50), 'arr_p99': pct(sink.arrival_lat, 0.99),
+    }
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rate', type=float, default=500.0, help='frames per second')
+    ap.add_argument('--seconds', type=float, default=3.0)
+    ap.add_argument('--idle', type=float, default=3.0, help='seconds with no traffic')
+    args = ap.parse_args()
+    print(f"{'mode':<7} {'frames':>11} {'idle wk/s':>10} {'busy wk/s':>10} "
+          f"{'send->dec p50/p99 us':>22} {'arrival->dec p50/p99 us':>25}")
+    for mode in ('poll', 'select'):
+        r = measure(mode, args.rate, args.seconds, args.idle)
+        print(f"{r['mode']:<7} {r['decoded']:>5}/{r['sent']:<5} {r['idle_wakeups_s']:>10.1f} {r['busy_wakeups_s']:>10.1f} "
+              f"{r['send_p50']:>10.0f} / {r['send_p99']:<9.0f} {r['arr_p50']:>12.0f} / {r['arr_p99']:<10.0f}")
+
+if __name__ == '__main__':
+    main()
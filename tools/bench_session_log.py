@@ -0,0 +1,103 @@
+"""Session logger cost and what reading a session back costs.
+
+    python tools/bench_session_log.py                 # 1 h of 100 Hz rows
+    python tools/bench_session_log.py --hours 0.25 --rate 200 --keep /tmp/sess
+
+Feeds generated channel vectors (track-like rpm/speed sweeps, slow
+temperatures, through ``derived.DerivedChannels``) with synthetic
+timestamps straight into ``SessionLogger`` on this thread, one row per
+frame the way the serial reader does, and reports: append cost per
+row on the calling thread, peak RSS growth while logging, how long close
+takes, files on disk raw vs compressed (compression runs at the next start), and the time to summarise the session from the 60 s
+pyramid, to load the 1 s pyramid for a plot, and to load every rpm sample.
+"""
+from __future__ import annotations
+import os, sys, math, time, argparse, tempfile, resource
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import frames
+import derived
+import session_log
+
+def rows(hours: float, rate: float):
+    values = [0] * derived.VECTOR_LEN
+    received = sum(1 << ch for ch in frames.CHANNELS)
+    d = derived.DerivedChannels(maps={})
+    period_ns = int(1e9 / rate)
+    t0 = time.monotonic_ns()
+    for i in range(int(hours * 3600 * rate)):
+        t = i / rate
+        lap = (t % 95.0) / 95.0
+        values[frames.CH_RPM] = int(3000 + 4000 * abs(math.sin(lap * 9.4)))
+        values[frames.CH_VSS] = 60 + 140 * abs(math.sin(lap * 4.7))
+        values[frames.CH_FLAGS] = int(t) & 0x3
+        values[frames.CH_STATUS] = 0
+        values[frames.CH_FUEL] = max(0, 100 - int(t / 60))
+        values[frames.CH_WATER_TEMP] = min(105.0, 40 + t / 20)
+        values[frames.CH_OIL_TEMP] = min(120.0, 30 + t / 15)
+        values[frames.CH_AFR] = 12.5 + math.sin(t * 3.1) * 0.8
+        values[frames.CH_OIL_PRESSURE] = 1.0 + values[frames.CH_RPM] / 1400.0
+        values[frames.CH_CHARGING_VOLT] = 14.1 + math.sin(t * 0.2) * 0.1
+        values[frames.CH_FUEL_FLOW] = 2.0 + values[frames.CH_RPM] / 300.0
+        ts = t0 + i * period_ns
+        yield ts, values, d.update(values, received, ts)
+
+def du(path: str) -> dict:
+    out = {}
+    for name in os.listdir(path):
+        ext = 'compressed columns' if name.endswith('.col.z') else 'raw columns' if name.endswith('.col') else \
+              'pyramids' if name.startswith('pyr') else 'meta'
+        out[ext] = out.get(ext, 0) + os.path.getsize(os.path.join(path, name))
+    return out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--hours', type=float, default=1.0)
+    ap.add_argument('--rate', type=float, default=100.0)
+    ap.add_argument('--keep', help='log into this directory instead of a temporary one')
+    args = ap.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    root = args.keep or tmp.name
+    logger = session_log.SessionLogger(root)
+    logger.start()
+    rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    cost = 0
+    n = 0
+    for ts, values, seen in rows(args.hours, args.rate):
+        a = time.perf_counter_ns()
+        logger.append(ts, values, seen)
+        cost += time.perf_counter_ns() - a
+        n += 1
+    peak = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss0) * 1024
+    before_close = du(session_log.sessions(root)[-1])
+    t = time.perf_counter()
+    logger.close(timeout=120)
+    close_s = time.perf_counter() - t
+    path = session_log.sessions(root)[-1]
+    t = time.perf_counter()
+    session_log.compress_session(path)  # what the next start does
+    compress_s = time.perf_counter() - t
+    after = du(path)
+
+    print(f"rows             {n} ({args.hours:g} h @ {args.rate:g} Hz), dropped {logger.dropped_rows}")
+    print(f"append           {cost / n / 1e3:.2f} us/row on the reader thread")
+    print(f"peak RSS growth  {peak / 1e6:.1f} MB while logging")
+    print(f"close            {close_s * 1e3:.0f} ms (last chunk, no compression)")
+    print(f"raw columns      {before_close.get('raw columns', 0) / 1e6:.1f} MB -> compressed {after.get('compressed columns', 0) / 1e6:.1f} MB "
+          f"at next start ({compress_s:.2f} s), pyramids {after.get('pyramids', 0) / 1e3:.0f} kB")
+
+    s = session_log.Session(path)
+    t = time.perf_counter(); summary = s.summary(); t_sum = time.perf_counter() - t
+    t = time.perf_counter(); p1 = s.pyramid(1); t_p1 = time.perf_counter() - t
+    t = time.perf_counter(); rpm = s.column('rpm'); t_col = time.perf_counter() - t
+    print(f"summary (60 s)   {t_sum * 1e3:8.1f} ms   rpm {summary['rpm']['min']:.0f}..{summary['rpm']['max']:.0f}, "
+          f"mean {summary['rpm']['mean']:.0f} (all samples: {sum(rpm) / len(rpm):.0f})")
+    print(f"plot (1 s)       {t_p1 * 1e3:8.1f} ms   {len(p1['t'])} buckets")
+    print(f"all rpm samples  {t_col * 1e3:8.1f} ms   {len(rpm)} samples")
+
+if __name__ == '__main__':
+    main()
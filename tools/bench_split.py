@@ -0,0 +1,169 @@
+"""Frame handling jitter: serial reader thread vs serial process, under GUI load.
+
+    python tools/bench_split.py                      # 1 kHz frames, 10 s per mode, 8 ms of Python every 50 ms
+    python tools/bench_split.py --load-ms 20 --serial-cpus 1 --gui-cpus 0    # on the Pi
+
+A separate writer process sends sequence-numbered v1 frames into a
+pseudo-terminal at ``--rate`` and notes when each one was written. The Qt
+side is a real ``Telemetry`` (temporary data.json) whose GUI thread gets
+a ``json.dumps`` taking ``--load-ms`` every ``--load-every-ms`` (one C
+call that holds the GIL throughout, standing in for settings saves, slots
+and binding callbacks). The latency probe is on so
+both modes hand the read timestamp over with the values. Each mode runs against it:
+
+- ``thread``: the stock ``TeensyReader`` thread in the Qt process
+- ``process``: ``io_process.SerialProcess`` (reader in a child process)
+
+For every snapshot applied on the GUI thread the newest frame in it gives
+two delays from the moment the frame was written: ``read`` (the serial read
+that returned it, i.e. how late the port was drained) and ``applied``
+(values set on the GUI thread). Reports p50 / p99 / max of both; the
+difference between p99 and p50 is the jitter. ``--serial-cpus`` /
+``--gui-cpus`` set ``SERIAL_CPUS`` / ``GUI_CPUS`` (with one CPU both share it).
+"""
+from __future__ import annotations
+import os, sys, time, tty, array, argparse, tempfile, subprocess, json
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import frames
+
+def car(fd: int, rate: float, seconds: float, out: str) -> int:
+    """Writer process: frames into ``fd`` at ``rate``; write times (ns) go to ``out``."""
+    sent = array.array('q')
+    period = 1.0 / rate
+    t0 = time.monotonic()
+    seq = 0
+    while time.monotonic() - t0 < seconds:
+        due = int((time.monotonic() - t0) / period)
+        if due > seq:
+            chunk = b''.join(frames.encode_v1(s & 0xFFFF, s >> 16, 0) for s in range(seq, due))
+            now = time.monotonic_ns()
+            try:
+                os.write(fd, chunk)
+            except (BlockingIOError, OSError):
+                pass
+            sent.extend([now] * (due - seq))
+            seq = due
+        time.sleep(0.0005)
+    with open(out, 'wb') as f:
+        sent.tofile(f)
+    return 0
+
+def load_doc(ms: float) -> list:
+    """A document ``json.dumps`` needs about ``ms`` for."""
+    doc = [{'odometer': 12345.6, 'trip': 12.3, 'suspension': [1, 2, 3, 4]}] * 1000
+    t = time.perf_counter()
+    json.dumps(doc)
+    per = (time.perf_counter() - t) / len(doc)
+    return doc * max(1, round(ms / 1000.0 / per / len(doc)))
+
+def seq_of(values) -> int:
+    return int(values[frames.CH_RPM]) | round(values[frames.CH_VSS] / frames.KMH_PER_CM_S) << 16
+
+def run(mode: str, args, app, tmp: str) -> dict:
+    from telemetry import Telemetry
+    from settings_store import SettingsStore
+    from PySide6.QtCore import QTimer
+    import io_teensy
+    import io_process
+    import serial_child
+
+    applied: list[tuple[int, int, int]] = []  # (applied ns, seq, read ns)
+
+    class _Tel(Telemetry):
+        def _applyChannels(self, values, seen):
+            applied.append((time.monotonic_ns(), seq_of(values), values[-1]))
+            super()._applyChannels(values, seen)
+
+    master, slave = os.openpty()
+    tty.setraw(master); tty.setraw(slave)
+    os.set_blocking(master, False)
+    os.environ['TEENSY_DEV'] = os.ttyname(slave)
+    data = os.path.join(tmp, mode)
+    os.makedirs(data)
+    tel = _Tel(SettingsStore(os.path.join(data, 'data.json')))
+    if mode == 'thread':
+        reader = io_teensy.TeensyReader(tel, record=False, publish=False)
+        reader.start()
+        serial_child.pin('serial', reader.native_id)
+    else:
+        reader = io_process.start_serial(tel)
+
+    busy = {'n': 0}
+    doc = load_doc(args.load_ms)
+    def load():
+        json.dumps(doc)  # one C call: holds the GIL throughout, like a settings save
+        busy['n'] += 1
+    load_timer = QTimer()
+    load_timer.setInterval(args.load_every_ms)
+    load_timer.timeout.connect(load)
+
+    sent_path = os.path.join(data, 'sent.bin')
+    writer = None
+    def start_car():
+        nonlocal writer
+        writer = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--car', str(master), str(args.rate),
+                                   str(args.seconds), sent_path], pass_fds=(master,))
+        load_timer.start()
+    QTimer.singleShot(int(args.settle * 1000), start_car)  # port open / child up
+    QTimer.singleShot(int((args.settle + args.seconds + 0.3) * 1000), app.quit)
+    app.exec()
+    load_timer.stop()
+    writer.wait()
+    reader.stop()
+    tel.shutdown()
+    os.close(master); os.close(slave)
+
+    sent = array.array('q')
+    with open(sent_path, 'rb') as f:
+        sent.frombytes(f.read())
+    read_ms, applied_ms = [], []
+    for t, seq, read_ns in applied:
+        if seq < len(sent):
+            read_ms.append((read_ns - sent[seq]) / 1e6)
+            applied_ms.append((t - sent[seq]) / 1e6)
+    return {'mode': mode, 'frames': len(sent), 'snapshots': len(applied), 'loads': busy['n'],
+            'read': sorted(read_ms), 'applied': sorted(applied_ms)}
+
+def pct(values: list, q: float) -> float:
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float('nan')
+
+def main() -> int:
+    if len(sys.argv) == 6 and sys.argv[1] == '--car':
+        return car(int(sys.argv[2]), float(sys.argv[3]), float(sys.argv[4]), sys.argv[5])
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rate', type=float, default=1000.0, help='frames per second')
+    ap.add_argument('--seconds', type=float, default=10.0, help='measured seconds per mode')
+    ap.add_argument('--load-ms', type=float, default=8.0, help='GIL held by the GUI thread per load tick')
+    ap.add_argument('--load-every-ms', type=int, default=50)
+    ap.add_argument('--settle', type=float, default=1.0, help='seconds before the writer starts')
+    ap.add_argument('--serial-cpus', default='')
+    ap.add_argument('--gui-cpus', default='')
+    ap.add_argument('--modes', default='thread,process')
+    args = ap.parse_args()
+
+    os.environ.update(SERIAL_CPUS=args.serial_cpus, GUI_CPUS=args.gui_cpus, LATENCY_PROBE='1', IDLE_GOVERNOR='0',
+                      TELEMETRY_BUS='0', SESSION_LOG='0', FRAME_RECORD='', PYTHONUNBUFFERED='1')
+    from PySide6.QtCore import QCoreApplication
+    import serial_child
+    serial_child.pin('gui')
+    app = QCoreApplication([])
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes.split(','):
+            results.append(run(mode, args, app, tmp))
+
+    print(f"\n{args.rate:g} Hz frames, {args.seconds:g} s per mode, GUI load {args.load_ms:g} ms every "
+          f"{args.load_every_ms} ms, {os.cpu_count()} CPU(s)")
+    print(f"{'mode':<8} {'snapshots':>9}  {'read p50':>8} {'p99':>7} {'max':>7}  {'applied p50':>11} {'p99':>7} {'max':>7}  (ms)")
+    for r in results:
+        rd, ap_ = r['read'], r['applied']
+        print(f"{r['mode']:<8} {r['snapshots']:>9}  {pct(rd, 0.5):>8.2f} {pct(rd, 0.99):>7.2f} {rd[-1] if rd else float('nan'):>7.2f}"
+              f"  {pct(ap_, 0.5):>11.2f} {pct(ap_, 0.99):>7.2f} {ap_[-1] if ap_ else float('nan'):>7.2f}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Startup time to the first frame with the gauges, fast boot vs plain.
+
+    python tools/bench_startup.py                 # 5 runs per mode, warm QML cache
+    python tools/bench_startup.py --cold --runs 9 # drop the compiled QML before every run
+    python tools/bench_startup.py --cold --precompiled  # fast boot re-warmed by tools/precompile_qml.py (deploy)
+    python tools/bench_startup.py --platform eglfs  # on the Pi
+
+Runs ``src/main.py`` in demo mode (DEVELOP_MODE=2, no serial port) with
+STARTUP_TRACE_EXIT=1, which quits after the first frame with the cluster
+content on screen, and prints the median time of every traced phase in ms
+since process start (see ``src/boot.py``).
+"""
+from __future__ import annotations
+import os, sys, json, shutil, argparse, statistics, subprocess
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import config
+
+def run_once(fast: bool, platform: str, cache_home: str) -> dict | None:
+    env = dict(os.environ, DEVELOP_MODE='2', STARTUP_TRACE_EXIT='1', STARTUP_TRACE_JSON='1',
+               FAST_BOOT='1' if fast else '0', QT_QPA_PLATFORM=platform, XDG_CACHE_HOME=cache_home,
+               LATENCY_PROBE='0')
+    env.pop('QML_DISK_CACHE_PATH', None)
+    out = subprocess.run([sys.executable, os.path.join(PROJECT_ROOT, 'src', 'main.py')],
+                         env=env, capture_output=True, text=True, timeout=60)
+    for line in out.stdout.splitlines():
+        if line.startswith('[startup] json '):
+            return json.loads(line[len('[startup] json '):])
+    print(out.stdout[-500:], out.stderr[-500:])
+    return None
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--runs', type=int, default=5)
+    ap.add_argument('--cold', action='store_true', help='remove compiled QML before each run')
+    ap.add_argument('--precompiled', action='store_true', help='with --cold: run tools/precompile_qml.py before fast-boot runs')
+    ap.add_argument('--platform', default=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    args = ap.parse_args()
+
+    # demo mode drives the odometer: put data.json and the journal back afterwards
+    saved = {}
+    for name in ('data.json', 'distance.journal'):
+        path = os.path.join(PROJECT_ROOT, 'data', name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                saved[path] = f.read()
+        else:
+            saved[path] = None
+    cache_home = os.path.join(PROJECT_ROOT, 'data', '.bench_cache')  # Qt's default qmlcache (plain mode)
+    results: dict[str, list[dict]] = {'plain': [], 'fast': []}
+    try:
+        for _ in range(args.runs):
+            for mode in ('plain', 'fast'):  # interleaved, so drift hits both
+                if args.cold:
+                    shutil.rmtree(cache_home, ignore_errors=True)
+                    shutil.rmtree(config.path('QML_CACHE_DIR'), ignore_errors=True)
+                    if args.precompiled and mode == 'fast':
+                        subprocess.run([sys.executable, os.path.join(PROJECT_ROOT, 'tools', 'precompile_qml.py')],
+                                       capture_output=True, timeout=60)
+                r = run_once(mode == 'fast', args.platform, cache_home)
+                if r:
+                    results[mode].append(r)
+    finally:
+        shutil.rmtree(cache_home, ignore_errors=True)
+        for path, content in saved.items():
+            if content is None:
+                if os.path.exists(path):
+                    os.remove(path)
+            else:
+                with open(path, 'wb') as f:
+                    f.write(content)
+
+    phases: list[str] = []
+    for runs in results.values():
+        for r in runs:
+            phases += [k for k in r if k not in phases]
+    print(f"{'phase':<16} {'plain ms':>9} {'fast ms':>9}   (median of {args.runs}, {'cold' if args.cold else 'warm'} QML cache)")
+    for name in phases:
+        cells = []
+        for mode in ('plain', 'fast'):
+            vals = [r[name] for r in results[mode] if name in r]
+            cells.append(f"{statistics.median(vals):9.1f}" if vals else f"{'-':>9}")
+        print(f"{name:<16} {cells[0]} {cells[1]}")
+
+if __name__ == '__main__':
+    main()
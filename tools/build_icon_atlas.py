@@ -0,0 +1,121 @@
+"""Build the icon atlas for the configured resolution, then compare it with the originals.
+
+    python tools/build_icon_atlas.py              # after install / a WIDTH, HEIGHT or asset change
+    python tools/build_icon_atlas.py --compare-only --frames 500
+
+Runs ``src/main.py`` in demo mode on an offscreen screen of exactly
+``WIDTH`` x ``HEIGHT`` with ICON_ATLAS_EXIT=1, which measures every icon on
+screen once the cluster is up, writes ``ICON_ATLAS_DIR/atlas.png`` and
+``atlas.json`` and quits (see ``src/icon_atlas.py``). Then, for the icons in
+the manifest, reports decoded pixel memory, decode time (each original PNG
+vs the one atlas plus cutting the icons out) and the cost of drawing all of
+them once with ``QPainter`` into a ``WIDTH`` x ``HEIGHT`` raster image, the
+way the software scene graph draws a smooth ``Image``: originals scaled
+down to their physical size vs pre-scaled icons copied 1:1.
+"""
+from __future__ import annotations
+import os, sys, json, time, argparse, tempfile, statistics, subprocess
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import config
+import icon_atlas
+
+def build(timeout: float) -> bool:
+    # demo mode drives the odometer: put data.json and the journal back afterwards
+    saved = {}
+    for name in ('data.json', 'distance.journal'):
+        path = os.path.join(PROJECT_ROOT, 'data', name)
+        saved[path] = open(path, 'rb').read() if os.path.exists(path) else None
+    with tempfile.TemporaryDirectory() as tmp:
+        screen = os.path.join(tmp, 'screen.json')
+        with open(screen, 'w') as f:
+            json.dump({'screens': [{'name': 'target', 'x': 0, 'y': 0, 'width': config.WIDTH, 'height': config.HEIGHT,
+                                    'logicalDpi': 96, 'logicalBaseDpi': 96, 'dpr': 1}]}, f)
+        env = dict(os.environ, DEVELOP_MODE='2', ICON_ATLAS_EXIT='1', QT_QPA_PLATFORM=f'offscreen:configfile={screen}',
+                   LATENCY_PROBE='0', SESSION_LOG='0', TELEMETRY_BUS='0', PYTHONUNBUFFERED='1')
+        try:
+            out = subprocess.run([sys.executable, os.path.join(PROJECT_ROOT, 'src', 'main.py')],
+                                 env=env, capture_output=True, text=True, timeout=timeout)
+        finally:
+            for path, content in saved.items():
+                if content is None:
+                    if os.path.exists(path):
+                        os.remove(path)
+                else:
+                    with open(path, 'wb') as f:
+                        f.write(content)
+    lines = [l for l in out.stdout.splitlines() if l.startswith(('[icons]', '[QML]'))]
+    print('\n'.join(lines))
+    return any('atlas built' in l for l in lines)
+
+def median_ms(fn, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        t = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t) * 1e3)
+    return statistics.median(times)
+
+def compare(directory: str, runs: int, frames: int) -> int:
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PySide6.QtGui import QGuiApplication, QImage, QPainter
+    from PySide6.QtCore import QRect
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])  # noqa: F841 - QPainter on images needs it
+    with open(os.path.join(directory, icon_atlas.MANIFEST)) as f:
+        manifest = json.load(f)
+    rects = {n: QRect(*r) for n, r in manifest['icons'].items()}
+    atlas_path = os.path.join(directory, icon_atlas.ATLAS)
+
+    originals = {n: QImage(icon_atlas.asset_path(n)) for n in rects}
+    orig_bytes = sum(i.width() * i.height() * 4 for i in originals.values())
+    aw, ah = manifest['size']
+    icon_bytes = sum(r.width() * r.height() * 4 for r in rects.values())
+    t_orig = median_ms(lambda: [QImage(icon_atlas.asset_path(n)) for n in rects], runs)
+    def load_atlas():
+        a = QImage(atlas_path)
+        return [a.copy(r) for r in rects.values()]
+    t_atlas = median_ms(load_atlas, runs)
+
+    pre = {n: QImage(atlas_path).copy(r) for n, r in rects.items()}
+    targets = [QRect(0, 0, r.width(), r.height()) for r in rects.values()]
+    frame = QImage(config.WIDTH, config.HEIGHT, QImage.Format_ARGB32_Premultiplied)
+    def draw(images):
+        def once():
+            p = QPainter(frame)
+            p.setRenderHint(QPainter.SmoothPixmapTransform, True)
+            for img, target in zip(images, targets):
+                p.drawImage(target, img)
+            p.end()
+        return once
+    orig_list = [originals[n].convertToFormat(QImage.Format_ARGB32_Premultiplied) for n in rects]
+    pre_list = [pre[n] for n in rects]
+    d_orig = median_ms(draw(orig_list), frames)
+    d_pre = median_ms(draw(pre_list), frames)
+
+    print(f"\n{len(rects)} icons for {manifest['target']}, atlas {aw}x{ah}")
+    print(f"{'':<20} {'originals':>10} {'atlas':>10}")
+    print(f"{'decoded KiB':<20} {orig_bytes / 1024:>10.0f} {aw * ah * 4 / 1024:>10.0f}   ({icon_bytes / 1024:.0f} KiB in icons)")
+    print(f"{'decode ms':<20} {t_orig:>10.2f} {t_atlas:>10.2f}   (median of {runs})")
+    print(f"{'draw all ms':<20} {d_orig:>10.3f} {d_pre:>10.3f}   (median of {frames}, smooth, {config.WIDTH}x{config.HEIGHT} raster)")
+    return 0
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--compare-only', action='store_true', help='keep the existing atlas')
+    ap.add_argument('--runs', type=int, default=20, help='decode repetitions')
+    ap.add_argument('--frames', type=int, default=200, help='draw repetitions')
+    ap.add_argument('--timeout', type=float, default=60.0)
+    args = ap.parse_args()
+    directory = config.path('ICON_ATLAS_DIR', 'ICON_ATLAS')
+    if directory is None:
+        print("[icons] ICON_ATLAS=0: nothing to build")
+        return 1
+    if not args.compare_only and not build(args.timeout):
+        return 1
+    return compare(directory, args.runs, args.frames)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""Teensy stand-in on a pseudo-terminal: valid frames plus injected link faults.
+
+    python tools/fake_teensy.py                          # 2 kHz for 10 s, default fault mix
+    python tools/fake_teensy.py --rate 10000 --faults 20 --hangup-every 3
+    python tools/fake_teensy.py --faults 0 --hangup-every 2 --gone 0.5   # unplug/replug recovery
+    python tools/fake_teensy.py --serve --seconds 0      # only serve the pty (run main.py against it)
+
+Creates a pty behind a symlink, points ``TEENSY_DEV`` at the symlink and
+writes 14-byte v1 frames at ``--rate``. Each frame carries its sequence
+number (RPM = low 16 bits, VSS = high bits), so lost frames are exact.
+About ``--faults`` times per second one fault is injected instead of a
+plain frame:
+
+- ``flip``: the frame with 1-3 random bits flipped
+- ``trunc``: only the first 2-13 bytes of the frame
+- ``garbage``: a burst of 16-512 random bytes (may contain the magic)
+
+and every ``--hangup-every`` seconds the pty is closed (the reader sees the
+hang-up), a new one is created and the symlink moved to it, like a USB
+re-enumeration. With ``--gone S`` the symlink is removed on hang-up and
+only comes back S seconds later, like a cable pulled and plugged back in;
+the reader then waits for the node (inotify, see ``src/hotplug.py``) and
+the report adds how long after the node reappeared the port was open again
+and the link stopped being stale. ``--retry S`` turns inotify off and
+retries every S seconds (``--retry 1`` is the old fixed 1 s sleep), for
+comparison. The stock ``TeensyReader`` (select mode unless
+``SERIAL_READ_MODE`` says otherwise) reads the pty in this process.
+
+Reports frames accepted, rejected on CRC, bad headers and bytes skipped
+while resynchronising (``frames.Decoder`` counters), valid frames lost, the
+largest receive backlog, and per fault kind how long it took to accept the
+next intact frame after the fault was written (lock reacquired; for
+hang-ups: after the new node appeared).
+"""
+from __future__ import annotations
+import os, sys, time, tty, bisect, random, argparse, tempfile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import config
+import frames
+import hotplug
+import io_teensy
+import odometer
+
+KINDS = ('flip', 'trunc', 'garbage')
+
+class _Sink:
+    """Stands in for Telemetry; records (accept time, sequence number)."""
+    def __init__(self):
+        self.accepted: list[tuple[int, int]] = []
+        self.link: list[tuple[int, bool, bool]] = []  # (time, connected, stale)
+
+    def updateFromChannels(self, values, seen):
+        seq = int(values[frames.CH_RPM]) | round(values[frames.CH_VSS] / frames.KMH_PER_CM_S) << 16
+        self.accepted.append((time.monotonic_ns(), seq))
+
+    publishChannels = updateFromChannels
+
+    def getLatency(self):
+        return None
+
+    def getDistanceIntegrator(self):
+        return odometer.DistanceIntegrator()
+
+    def getIdleGovernor(self):
+        return None
+
+    def setLinkState(self, connected, stale):
+        self.link.append((time.monotonic_ns(), connected, stale))
+
+class _Reader(io_teensy.TeensyReader):
+    """Stock reader that also tracks the largest buffer handed to the decoder."""
+    def __init__(self, sink):
+        super().__init__(sink, record=False, publish=False)
+        self.max_backlog = 0
+        self.opened: list[int] = []
+
+    def open_serial(self):
+        super().open_serial()
+        if self.port is not None:
+            self.opened.append(time.monotonic_ns())
+
+    def _consume_buffer(self, buf, ts_ns=None):
+        if len(buf) > self.max_backlog:
+            self.max_backlog = len(buf)
+        super()._consume_buffer(buf, ts_ns)
+
+class Link:
+    """A pty behind a stable symlink; ``hangup()`` replaces the pty."""
+    def __init__(self, path: str):
+        self.path = path
+        self.master = -1
+        self.dropped = 0
+        self.open()
+
+    def open(self):
+        master, slave = os.openpty()
+        tty.setraw(master); tty.setraw(slave)
+        os.set_blocking(master, False)
+        tmp = self.path + '.new'
+        os.symlink(os.ttyname(slave), tmp)
+        os.replace(tmp, self.path)
+        os.close(slave)  # the reader opens its own
+        self.master = master
+
+    def hangup(self):
+        os.close(self.master)
+        self.open()
+
+    def remove(self):
+        """Unplugged: close the pty and remove the node until ``open()``."""
+        os.close(self.master)
+        self.master = -1
+        os.remove(self.path)
+
+    def write(self, data: bytes) -> bool:
+        try:
+            os.write(self.master, data)
+            return True
+        except (BlockingIOError, OSError):
+            self.dropped += 1  # nobody reading (reconnecting) or reader far behind
+            return False
+
+    def close(self):
+        if self.master >= 0:
+            os.close(self.master)
+
+def frame(seq: int) -> bytes:
+    return frames.encode_v1(seq & 0xFFFF, (seq >> 16) & 0xFFFF, 0)
+
+def fault(kind: str, seq: int, rnd: random.Random) -> bytes:
+    f = frame(seq)
+    if kind == 'flip':
+        b = bytearray(f)
+        for _ in range(rnd.randint(1, 3)):
+            bit = rnd.randrange(len(b) * 8)
+            b[bit >> 3] ^= 1 << (bit & 7)
+        return bytes(b)
+    if kind == 'trunc':
+        return f[:rnd.randint(2, len(f) - 1)]
+    return rnd.randbytes(rnd.randint(16, 512))
+
+def pct(values: list, q: float) -> float:
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float('nan')
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rate', type=float, default=2000.0, help='frames per second')
+    ap.add_argument('--seconds', type=float, default=10.0, help='run time (0 with --serve: until Ctrl-C)')
+    ap.add_argument('--faults', type=float, default=10.0, help='faults per second')
+    ap.add_argument('--mix', default='flip,trunc,garbage', help='fault kinds to draw from')
+    ap.add_argument('--hangup-every', type=float, default=4.0, help='seconds between hang-ups (0 = none)')
+    ap.add_argument('--gone', type=float, default=0.0, help='seconds the device node is missing per hang-up')
+    ap.add_argument('--retry', type=float, help='no inotify, fixed retry interval in seconds (1 = old behaviour)')
+    ap.add_argument('--seed', type=int, default=1)
+    ap.add_argument('--serve', action='store_true', help='no in-process reader; print TEENSY_DEV and serve')
+    args = ap.parse_args()
+
+    if args.retry:
+        hotplug._libc = lambda: None
+        config.SERIAL_RETRY_MIN_S = config.SERIAL_RETRY_MAX_S = args.retry
+    rnd = random.Random(args.seed)
+    kinds = [k for k in args.mix.split(',') if k in KINDS]
+    tmp = tempfile.TemporaryDirectory()
+    link = Link(os.path.join(tmp.name, 'ttyTEENSY'))
+    os.environ['TEENSY_DEV'] = link.path
+    sink = reader = None
+    if args.serve:
+        print(f"[fake_teensy] TEENSY_DEV={link.path}", flush=True)
+    else:
+        sink = _Sink()
+        reader = _Reader(sink)
+        reader.start()
+        time.sleep(0.3)
+
+    period = 1.0 / args.rate
+    p_fault = args.faults / args.rate
+    valid: set[int] = set()   # sequence numbers written intact
+    faults: list[tuple[str, int, int]] = []  # (kind, write time, last seq before the fault)
+    t0 = time.monotonic()
+    next_hangup = t0 + args.hangup_every if args.hangup_every else float('inf')
+    back_at = 0.0
+    appeared: list[int] = []  # new node in place
+    seq = 0
+    try:
+        while not args.seconds or time.monotonic() - t0 < args.seconds:
+            now = time.monotonic()
+            if now >= next_hangup:
+                if args.gone:
+                    link.remove()
+                    back_at = now + args.gone
+                else:
+                    link.hangup()
+                    appeared.append(time.monotonic_ns())
+                    faults.append(('hangup', appeared[-1], seq - 1))
+                next_hangup = now + args.hangup_every
+            if back_at and now >= back_at:
+                link.open()
+                appeared.append(time.monotonic_ns())
+                faults.append(('hangup', appeared[-1], seq - 1))
+                back_at = 0.0
+            due = int((now - t0) / period)
+            chunk = []
+            while seq < due:
+                if kinds and rnd.random() < p_fault:
+                    kind = rnd.choice(kinds)
+                    chunk.append(fault(kind, seq, rnd))
+                    faults.append((kind, time.monotonic_ns(), seq))
+                else:
+                    chunk.append(frame(seq))
+                    valid.add(seq)
+                seq += 1
+            if chunk and not link.write(b''.join(chunk)):
+                valid.difference_update(range(seq - len(chunk), seq))  # never reached the pty
+            time.sleep(0.0005)
+        time.sleep(0.3)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if reader is not None:
+            reader.stop(2.0)
+        link.close()
+    if reader is None:
+        return 0
+
+    dec = reader.decoder
+    got = {s for _, s in sink.accepted}
+    lost = len(valid - got)
+    elapsed = time.monotonic() - t0
+    print(f"sent        {seq} frames in {elapsed:.1f} s ({seq / elapsed:,.0f}/s, {seq * 14 * 10 / elapsed / 1e6:.2f} Mbaud "
+          f"equivalent), {len(valid)} intact, {len(faults)} faults, {link.dropped} writes dropped by the pty")
+    print(f"decoder     accepted {dec.frames}  crc errors {dec.crc_errors}  bad headers {dec.bad_headers}  "
+          f"skipped {dec.skipped_bytes} bytes")
+    print(f"reader      {reader.wakeups} reads, largest backlog {reader.max_backlog} bytes, {reader.disconnects} disconnects")
+    print(f"lost        {lost} intact frames ({100.0 * lost / max(1, len(valid)):.3f} %)")
+
+    # lock reacquired: first accepted intact frame written after the fault
+    accepted = sorted(sink.accepted, key=lambda a: a[1])
+    seqs = [s for _, s in accepted]
+    relock: dict[str, list[float]] = {}
+    for kind, t_ns, last in faults:
+        j = bisect.bisect_right(seqs, last)
+        if j < len(seqs):
+            relock.setdefault(kind, []).append((accepted[j][0] - t_ns) / 1e6)
+    print(f"{'fault':<9} {'count':>6} {'relock p50 ms':>14} {'p99 ms':>8} {'max ms':>8}")
+    for kind in KINDS + ('hangup',):
+        r = sorted(relock.get(kind, []))
+        n = sum(1 for f in faults if f[0] == kind)
+        if n:
+            print(f"{kind:<9} {n:>6} {pct(r, 0.5):>14.2f} {pct(r, 0.99):>8.2f} {r[-1] if r else float('nan'):>8.2f}")
+
+    if appeared:
+        # node back -> port open, and -> TEL.stale cleared
+        reopen, fresh = [], []
+        for t in appeared:
+            o = next((o for o in reader.opened if o >= t), None)
+            f = next((l for l, c, st in sink.link if l >= t and c and not st), None)
+            if o is not None:
+                reopen.append((o - t) / 1e6)
+            if f is not None:
+                fresh.append((f - t) / 1e6)
+        mode = f"fixed {args.retry:g} s retry" if args.retry else "inotify" if hotplug.DeviceWatcher(link.path).active else "back-off"
+        print(f"reconnect   {len(appeared)} times ({mode}, node gone {args.gone:g} s): node back -> port open "
+              f"p50 {pct(sorted(reopen), 0.5):.1f} ms max {max(reopen, default=float('nan')):.1f} ms, "
+              f"-> not stale p50 {pct(sorted(fresh), 0.5):.1f} ms max {max(fresh, default=float('nan')):.1f} ms")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Compile every QML file into the fast-boot cache (``config.QML_CACHE_DIR``).
+
+    python tools/precompile_qml.py          # after a deploy / git pull, before the next boot
+
+Compiles (without instantiating) each ``ui/**/*.qml`` with the same
+``QML_DISK_CACHE_PATH`` main.py uses in fast-boot mode, so the first boot
+after an update does not pay for parsing and compiling the QML. Qt keys the
+cache entries by file contents and the Qt version; stale ones are ignored.
+"""
+from __future__ import annotations
+import os, sys, time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import config
+
+def main() -> int:
+    cache = config.path('QML_CACHE_DIR')
+    os.environ['QML_DISK_CACHE_PATH'] = cache
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PySide6.QtGui import QGuiApplication
+    from PySide6.QtQml import QQmlEngine, QQmlComponent
+    from PySide6.QtCore import QUrl
+    import ring_gauge
+
+    app = QGuiApplication(sys.argv[:1])  # noqa: F841 - the QML engine needs it alive
+    ring_gauge.register()
+    engine = QQmlEngine()
+    ui = os.path.join(PROJECT_ROOT, 'ui')
+    failed = 0
+    t0 = time.perf_counter()
+    for dirpath, dirnames, filenames in os.walk(ui):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if not name.endswith('.qml'):
+                continue
+            path = os.path.join(dirpath, name)
+            comp = QQmlComponent(engine, QUrl.fromLocalFile(path))
+            if comp.isError():
+                failed += 1
+                print(f"[precompile] {os.path.relpath(path, PROJECT_ROOT)}: {comp.errorString().strip()}")
+    n = len([f for f in os.listdir(cache) if f.endswith('.qmlc')]) if os.path.isdir(cache) else 0
+    print(f"[precompile] {n} cache files in {cache} ({(time.perf_counter() - t0) * 1e3:.0f} ms)")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Drive a synthetic pull through every gear and check the derived channels.
+
+    python tools/replay_derived.py               # 50 Hz
+    python tools/replay_derived.py --rate 100 --noise 0.03
+
+Each gear is held for a few seconds while rpm sweeps 2000 -> 6500 with the
+wheel speed that gear's ratio gives (plus ``--noise`` relative rpm noise),
+then the clutch is pressed for 0.4 s (rpm drops, speed holds). Fuel flow
+and AFR are constant, so the expected average consumption, AFR average and
+time at redline are known. Vectors go straight into
+``derived.DerivedChannels.update`` with synthetic timestamps, as the serial
+reader does after each decoded frame. Reports the share of frames showing
+the right gear (clutch frames excluded), the other values against their
+expected ones and the cost per update; exits 1 on a gear mismatch rate
+above 2 % or a value more than 1 % off.
+"""
+from __future__ import annotations
+import os, sys, time, random, argparse
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+import config
+import frames
+import derived
+
+FLOW_LPH = 18.0
+AFR = 13.2
+
+def drive(rate: float, noise: float, seed: int = 1):
+    """Yields (rpm, kmh, expected gear or None); None while the clutch is in or
+    during the first ``GEAR_CONFIRM_FRAMES`` of a gear, before it can show."""
+    rnd = random.Random(seed)
+    bands = derived.gear_bands(tolerance=0.0)
+    for g, (k, _) in enumerate(bands, 1):
+        for i in range(int(4.0 * rate)):
+            rpm = 2000 + 4500 * i / (4.0 * rate)
+            yield rpm * (1 + rnd.uniform(-noise, noise)), rpm / k, g if i >= config.GEAR_CONFIRM_FRAMES else None
+        for _ in range(int(0.4 * rate)):
+            yield 1200.0, 6500 / k, None
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rate', type=float, default=50.0)
+    ap.add_argument('--noise', type=float, default=0.02, help='relative rpm noise')
+    args = ap.parse_args()
+
+    d = derived.DerivedChannels()
+    values = [0.0] * derived.VECTOR_LEN
+    seen = (1 << frames.CH_RPM) | (1 << frames.CH_VSS) | (1 << frames.CH_AFR) | (1 << frames.CH_FUEL_FLOW)
+    values[frames.CH_AFR] = AFR
+    values[frames.CH_FUEL_FLOW] = FLOW_LPH
+    period_ns = int(1e9 / args.rate)
+    t0 = 10**12
+    n = wrong = counted = 0
+    km = redline_s = 0.0
+    cost = 0
+    prev = None
+    for rpm, kmh, gear in drive(args.rate, args.noise):
+        if prev is not None:
+            km += prev[1] * (1.0 / args.rate) / 3600.0
+            if prev[0] >= d.redline_rpm:
+                redline_s += 1.0 / args.rate
+        prev = (rpm, kmh)
+        values[frames.CH_RPM] = rpm
+        values[frames.CH_VSS] = kmh
+        a = time.perf_counter_ns()
+        d.update(values, seen, t0 + n * period_ns)
+        cost += time.perf_counter_ns() - a
+        n += 1
+        if gear is not None:
+            counted += 1
+            wrong += values[derived.GEAR] != gear
+
+    hours = (n - 1) / args.rate / 3600.0
+    expect_avg = FLOW_LPH * hours * 100.0 / km
+    checks = [('fuel avg l/100km', values[derived.FUEL_AVG], expect_avg),
+              ('afr avg', values[derived.AFR_AVG], AFR),
+              ('redline s', values[derived.REDLINE_TIME], redline_s)]
+    bad = wrong / max(1, counted) > 0.02
+    print(f"frames           {n} ({args.rate:g} Hz, {len(config.GEARBOX_RATIOS)} gears, rpm noise {args.noise * 100:g} %)")
+    print(f"gear             {counted - wrong}/{counted} frames right ({100.0 * wrong / max(1, counted):.2f} % wrong)")
+    for name, got, want in checks:
+        off = abs(got - want) / want if want else abs(got)
+        bad |= off > 0.01
+        print(f"{name:<16} {got:8.3f}   expected {want:8.3f}   ({off * 100:.2f} % off)")
+    print(f"update           {cost / n / 1e3:.2f} us/frame")
+    print("OK" if not bad else "FAIL")
+    return 1 if bad else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Replay a known drive profile and compare the integrated distance with the exact one.
+
+    python tools/replay_distance.py              # 50 Hz frames
+    python tools/replay_distance.py --rate 20 --jitter 0.3
+
+The profile (hard acceleration, cruise, hard braking, a stop, a link
+dropout) is made of constant-acceleration segments, so its distance is
+known exactly. Frames are generated with ``frames.encode_v1`` and fed
+through ``ReplayReader`` into a Telemetry instance (temporary data.json),
+i.e. the production decode path and ``odometer.DistanceIntegrator``. The
+old 500 ms timer (last speed sample x elapsed time) is emulated on the same
+samples for comparison. Exits 1 when the integrator is off by more than
+``--tolerance`` metres (default: 0.2 m plus one frame period at the top
+speed, the interval lost at each edge of the dropout).
+"""
+from __future__ import annotations
+import os, sys, random, argparse, tempfile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'src')):
+    if p not in sys.path: sys.path.insert(0, p)
+
+from PySide6.QtCore import QCoreApplication
+
+from telemetry import Telemetry
+from settings_store import SettingsStore
+import frames
+import replay
+
+# (duration s, speed at start km/h, speed at end km/h, link up)
+PROFILE = [
+    (5.0, 0.0, 0.0, True),
+    (3.0, 0.0, 22.0, True),      # ~0.2 g
+    (20.0, 22.0, 22.0, True),
+    (1.0, 22.0, 2.0, True),      # ~0.57 g braking
+    (4.0, 2.0, 18.0, True),
+    (3.0, 18.0, 18.0, False),    # dropout: no frames, not counted
+    (10.0, 18.0, 18.0, True),
+    (2.0, 18.0, 0.0, True),
+    (4.0, 0.0, 0.0, True),
+]
+
+def exact_km(include_dropouts: bool = False) -> float:
+    return sum((v0 + v1) / 2 * dur / 3600.0 for dur, v0, v1, up in PROFILE if up or include_dropouts)
+
+def profile_source(rate_hz: float, jitter: float, rng: random.Random):
+    """Frames at ``rate_hz`` (+- ``jitter`` of a period) with the speed the profile has at their timestamp."""
+    period = 1.0 / rate_hz
+    t0 = 0.0
+    t = 0.0
+    for dur, v0, v1, up in PROFILE:
+        while t < t0 + dur:
+            if up:
+                kmh = v0 + (v1 - v0) * (t - t0) / dur
+                yield int(t * 1e9), kmh, frames.encode_v1(int(kmh * 100), round(kmh / frames.KMH_PER_CM_S), 0)
+            t += period * (1.0 + rng.uniform(-jitter, jitter))
+        t0 += dur
+    end = t0
+    kmh = PROFILE[-1][2]
+    yield int(end * 1e9), kmh, frames.encode_v1(0, round(kmh / frames.KMH_PER_CM_S), 0)
+
+def legacy_km(samples: list[tuple[int, float]]) -> float:
+    """The removed 500 ms GUI timer: last speed x elapsed, gaps over 5 s clamped to 1 s."""
+    dist = 0.0
+    tick = 0.5e9
+    last = samples[0][0]
+    i = 0
+    now = last + tick
+    while now <= samples[-1][0]:
+        while i + 1 < len(samples) and samples[i + 1][0] <= now:
+            i += 1
+        dt = (now - last) / 1e9
+        dist += samples[i][1] * (min(dt, 1.0) if dt > 5.0 else dt) / 3600.0
+        last = now
+        now += tick
+    return dist
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rate', type=float, default=50.0, help='frame rate (Hz)')
+    ap.add_argument('--jitter', type=float, default=0.1, help='frame interval jitter (fraction of a period)')
+    ap.add_argument('--seed', type=int, default=1)
+    ap.add_argument('--tolerance', type=float, help='allowed error (m)')
+    args = ap.parse_args()
+
+    app = QCoreApplication(sys.argv[:1])
+    tmp = tempfile.TemporaryDirectory()
+    tel = Telemetry(SettingsStore(os.path.join(tmp.name, 'data.json')))
+    samples = list(profile_source(args.rate, args.jitter, random.Random(args.seed)))
+    reader = replay.ReplayReader(tel, ((ts, frame) for ts, _, frame in samples), speed=None)
+    reader.run()  # synchronously, on this thread
+    app.processEvents()
+
+    integ = reader.distance
+    tolerance = args.tolerance if args.tolerance is not None else 0.2 + 25.0 / 3.6 / args.rate
+    expected = exact_km()
+    got = integ.total_km
+    legacy = legacy_km([(ts, kmh) for ts, kmh, _ in samples])
+    print(f"frames          {reader.frames_fed} @ {args.rate:g} Hz (jitter {args.jitter:g})")
+    print(f"exact           {expected * 1000:9.2f} m   (dropout {(exact_km(True) - expected) * 1000:.2f} m not counted)")
+    print(f"integrator      {got * 1000:9.2f} m   error {(got - expected) * 1000:+.2f} m, gaps {integ.gaps} ({integ.gap_s:.2f} s)")
+    print(f"500 ms timer    {legacy * 1000:9.2f} m   error {(legacy - expected) * 1000:+.2f} m")
+    print(f"trip shown      {tel.getTrip():.1f} km")
+    tel.shutdown()
+    ok = abs(got - expected) * 1000 <= tolerance and integ.gaps == 1
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
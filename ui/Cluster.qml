@@ -0,0 +1,543 @@
+import QtQuick 2.15
+import "components"
+
+// Cluster content shown behind the splash (loaded by Main.qml's contentLoader).
+Item {
+    id: content
+    property int odometerValue: SETTINGS.odometer
+    property real tripValue: SETTINGS.trip
+    property real fr: SETTINGS.fr
+    property real fl: SETTINGS.fl
+    property real rr: SETTINGS.rr
+    property real rl: SETTINGS.rl
+    // live values grey out while the serial link is down or silent (TEL.stale)
+    property real liveOpacity: (TEL && TEL.stale) ? 0.35 : 1.0
+    Behavior on liveOpacity { NumberAnimation { duration: 150 } }
+
+    Item {
+        id: leftIndicatorsCluster
+        anchors.bottom: odometerText.top
+        anchors.bottomMargin: 10
+        anchors.left: parent.left
+        anchors.leftMargin: 340
+    width: content.width * 0.095
+        property int topRowOffset: 30
+        height: width + topRowOffset
+        visible: true
+        z: 600
+    property real cell: width * 0.50
+        Grid {
+            id: licGrid
+            anchors.horizontalCenter: parent.horizontalCenter
+            anchors.bottom: parent.bottom
+        rows: 2; columns: 2;
+        rowSpacing: leftIndicatorsCluster.cell * 0.09
+        columnSpacing: leftIndicatorsCluster.width * 0.04
+            Repeater {
+                model: [
+                    { key: 'lowBeam', src: 'image://icons/low_beam', color: '#009a1e' },
+                    { key: 'highBeam', src: 'image://icons/high_beam', color: '#0040ff' },
+                    { key: 'fogRear', src: 'image://icons/fog_rear', color: '#e6cc00' },
+                    { key: 'underglow', src: 'image://icons/underglow', color: '#ff2020' }
+                ]
+                delegate: Item {
+                    width: leftIndicatorsCluster.cell
+                    height: width
+                    property bool active: TEL && TEL[modelData.key]
+                    transform: Translate { y: index < 2 ? leftIndicatorsCluster.topRowOffset : 0 }
+                    opacity: 1
+                    Image {
+                        id: indicatorImg
+                        anchors.centerIn: parent
+                        source: modelData.src
+                        fillMode: Image.PreserveAspectFit
+                        smooth: true
+                        cache: true
+                        opacity: (active || bgRect.opacity > 0.05) ? 1 : 0
+                        width: parent.width
+                        height: parent.height
+                    }
+                    Rectangle {
+                        id: bgRect
+                        anchors.centerIn: indicatorImg
+                        width: Math.max(0, indicatorImg.paintedWidth - (index < 2 ? 3 : 5))
+                        height: Math.max(0, indicatorImg.paintedHeight - (index < 2 ? 3 : 5))
+                        radius: width * 0.18
+                        color: modelData.color
+                        opacity: active ? 0.95 : 0.0
+                        z: -1
+                        Behavior on opacity { NumberAnimation { duration: 180; easing.type: Easing.InOutQuad } }
+                    }
+                }
+            }
+        }
+    }
+
+    Item { // RIGHT INDICATORS CLUSTER
+        id: rightIndicatorsCluster
+        anchors.bottom: tripText.top
+        anchors.bottomMargin: 10
+        anchors.right: parent.right
+        anchors.rightMargin: 370
+        width: content.width * 0.09
+        property int topRowOffset: 20
+        height: width + topRowOffset
+        visible: true
+        z: 600
+        property real cell: width * 0.48
+        Grid {
+            id: ricGrid
+            anchors.horizontalCenter: parent.horizontalCenter
+            anchors.bottom: parent.bottom
+            rows: 2; columns: 2;
+            rowSpacing: rightIndicatorsCluster.cell * 0.14
+            columnSpacing: rightIndicatorsCluster.width * 0.04
+            Repeater {
+                model: [
+                    { key: 'charging', src: 'image://icons/charging', color: '#ff2020' },
+                    { key: 'park',     src: 'image://icons/parking',  color: '#ff2020' },
+                    { key: 'abs',      src: 'image://icons/abs',      color: '#e6cc00' },
+                    { key: 'wheelPressure', src: 'image://icons/wheel_pressure', color: '#e6cc00' }
+                ]
+                delegate: Item {
+                    width: rightIndicatorsCluster.cell
+                    height: width
+                    property bool active: TEL && TEL[modelData.key]
+                    transform: Translate { y: index < 2 ? rightIndicatorsCluster.topRowOffset : 0 }
+                    opacity: 1
+                    Image {
+                        id: ricIndicatorImg
+                        anchors.centerIn: parent
+                        source: modelData.src
+                        fillMode: Image.PreserveAspectFit
+                        smooth: true
+                        cache: true
+                        opacity: (active || ricBgRect.opacity > 0.05) ? 1 : 0
+                        width: parent.width
+                        height: parent.height
+                    }
+                    Rectangle {
+                        id: ricBgRect
+                        anchors.centerIn: ricIndicatorImg
+                        width: Math.max(0, ricIndicatorImg.paintedWidth - (index < 2 ? 3 : 5))
+                        height: Math.max(0, ricIndicatorImg.paintedHeight - (index < 2 ? 3 : 5))
+                        radius: width * 0.18
+                        color: modelData.color
+                        opacity: active ? 0.95 : 0.0
+                        z: -1
+                        Behavior on opacity { NumberAnimation { duration: 180; easing.type: Easing.InOutQuad } }
+                    }
+                }
+            }
+        }
+    }
+
+Item {
+        id: checkEngineIcon
+        property bool active: TEL && TEL.checkEngine
+        property bool fadingOut: false
+        visible: active || fadingOut
+        anchors.horizontalCenter: parent.horizontalCenter
+        anchors.verticalCenter: parent.verticalCenter
+        anchors.verticalCenterOffset: -230
+        property real baseHeight: parent.width * 0.04
+        height: baseHeight
+        width: engineImage.width
+        z: -1
+        Image {
+            id: engineImage
+            height: parent.height
+            width: height * (sourceSize.width > 0 && sourceSize.height > 0 ? sourceSize.width / sourceSize.height : 1)
+            source: 'image://icons/check_engine'
+            fillMode: Image.PreserveAspectFit
+            smooth: true
+            cache: true
+        }
+        Rectangle {
+            id: checkEngineBg
+            width: engineImage.width - 10
+            height: engineImage.height
+            anchors.centerIn: engineImage
+            radius: height * 0.18
+            color: '#ff9900'
+            property real pulseLevel: 1.0
+            property real fadeFactor: 0.0
+            opacity: fadeFactor * (checkEngineIcon.active ? pulseLevel : 1)
+            SequentialAnimation {
+                id: pulse
+                running: checkEngineIcon.active
+                loops: Animation.Infinite
+                PropertyAnimation { target: checkEngineBg; property: 'pulseLevel'; to: 0.55; duration: 540; easing.type: Easing.InOutQuad }
+                PropertyAnimation { target: checkEngineBg; property: 'pulseLevel'; to: 1.0;  duration: 620; easing.type: Easing.InOutQuad }
+            }
+            NumberAnimation { id: ceFadeIn;  target: checkEngineBg; property: 'fadeFactor'; to: 1.0; duration: 180; easing.type: Easing.InOutQuad }
+            NumberAnimation { id: ceFadeOut; target: checkEngineBg; property: 'fadeFactor'; to: 0.0; duration: 180; easing.type: Easing.InOutQuad; onFinished: { if (!checkEngineIcon.active) checkEngineIcon.fadingOut = false } }
+            Component.onCompleted: { if (checkEngineIcon.active) { fadeFactor = 0; ceFadeIn.restart(); pulse.start(); } }
+            z: -1
+        }
+        onActiveChanged: {
+            if (active) {
+                fadingOut = false
+                ceFadeOut.stop()
+                checkEngineBg.fadeFactor = 0
+                ceFadeIn.restart()
+                if (!pulse.running) pulse.start()
+            } else {
+                if (checkEngineBg.fadeFactor > 0) {
+                    fadingOut = true
+                    ceFadeIn.stop()
+                    ceFadeOut.restart()
+                } else {
+                    fadingOut = false
+                }
+            }
+        }
+    }
+
+    Item {
+        id: clusterCenter
+        anchors.horizontalCenter: parent.horizontalCenter
+        anchors.verticalCenter: parent.verticalCenter
+        anchors.verticalCenterOffset: content.height * 0.10
+        width: content.height * 1.20 // size of the center gauge
+        height: width
+        opacity: content.liveOpacity
+
+        Gauge {
+            id: rpmRing
+            anchors.fill: parent
+            value: TEL.rpm
+            max: 7000
+            min: 0
+            showInnerProgress: true
+            innerProgressColor: 'white'
+            innerProgressWidth: width * 0.012
+            innerProgressRadius: radius - ringWidth * 1.55
+            innerProgressGlow: false
+            innerProgressWhiteGlow: false
+            innerProgressRoundCap: false
+            markerStartRadius: radius * 0.42
+            markerEndRadius: radius - ringWidth - width * 0.004
+            markerBaseWidth: width * 0.045
+            markerColor: '#ff3333'
+            redFrom: COLD_REDLINE
+            redTo: 7000
+            label: ""
+            majorStep: 1000
+            minorStep: 500
+            abbreviateThousands: true
+            showValueInThousands: true
+            showCenterValue: false
+            showCenterLabel: false
+            useTextLabels: true
+            drawCanvasLabels: false
+            fontSizeLabels: width * 0.07
+            labelDistance: width * 0.05
+            ringWidth: width * 0.04
+            tickMajorLen: width * 0.075
+            tickMinorLen: width * 0.045
+            backgroundArcColor: "#1d1d1d"
+            tickColorMajor: "#e6e6e6"
+            tickColorMinor: "#5f5f5f"
+            redlineColor: "#d62828"
+            warnFrom: 5300
+            warnTo: 6000
+            warnColor: '#ffcc33'
+                // oil temperature redline: data/calibration.json "redline" map, evaluated in Python
+                property int dynRedline: TEL ? TEL.dynamicRedline : COLD_REDLINE
+                onDynRedlineChanged: {
+                    if (redFrom !== dynRedline) {
+                        redFrom = dynRedline
+                        redTo = 7000
+                    }
+                }
+        }
+        
+        Item {
+            id: speedInner
+            anchors.centerIn: parent
+            width: parent.width * 0.58
+            height: width
+            layer.enabled: true
+            layer.smooth: true
+
+            CachedLayer {
+                id: speedInnerBase
+                anchors.fill: parent
+                layerName: 'speed-base'
+                paintFn: function(ctx, w, h) {
+                    var r = w/2; ctx.translate(r,r)
+                    ctx.fillStyle = '#0d0d0d' // neutral dark fill
+                    ctx.beginPath(); ctx.arc(0,0,r,0,Math.PI*2); ctx.fill()
+                }
+            }
+
+            property int rpmState: (TEL.rpm >= rpmRing.redFrom ? 2 : (TEL.rpm >= rpmRing.warnFrom && TEL.rpm <= rpmRing.warnTo ? 1 : 0))
+
+            function paintStateBg(ctx, w, h, fill, ring, gradient) {
+                var cx = w/2, cy = h/2, r = w/2; ctx.translate(cx, cy)
+                if (gradient) {
+                    var grad = ctx.createRadialGradient(0,0,r*0.10,0,0,r)
+                    grad.addColorStop(0, fill[0]); grad.addColorStop(1, fill[1])
+                    ctx.fillStyle = grad
+                } else {
+                    ctx.fillStyle = fill
+                }
+                ctx.beginPath(); ctx.arc(0,0,r,0,Math.PI*2); ctx.fill()
+                ctx.lineWidth = r*0.018; ctx.strokeStyle = ring
+                ctx.beginPath(); ctx.arc(0,0,r*0.965,0,Math.PI*2); ctx.stroke()
+            }
+
+            Item { anchors.fill: parent; id: gradientStack }
+            CachedLayer { // neutral (gray)
+                id: neutralBg
+                anchors.fill: parent
+                layerName: 'speed-neutral'
+                opacity: speedInner.rpmState === 0 ? 1 : 0
+                Behavior on opacity { NumberAnimation { duration: 260; easing.type: Easing.InOutQuad } }
+                paintFn: function(ctx, w, h) { speedInner.paintStateBg(ctx, w, h, ['#141414', '#070707'], '#2f2f2f', true) }
+            }
+            CachedLayer { // warn (yellow tint)
+                id: warnBg
+                anchors.fill: parent
+                layerName: 'speed-warn'
+                opacity: speedInner.rpmState === 1 ? 1 : 0
+                Behavior on opacity { NumberAnimation { duration: 260; easing.type: Easing.InOutQuad } }
+                paintFn: function(ctx, w, h) { speedInner.paintStateBg(ctx, w, h, '#221b00', '#b89000', false) }
+            }
+            CachedLayer { // red (hot)
+                id: redBg
+                anchors.fill: parent
+                layerName: 'speed-red'
+                opacity: speedInner.rpmState === 2 ? 1 : 0
+                Behavior on opacity { NumberAnimation { duration: 260; easing.type: Easing.InOutQuad } }
+                paintFn: function(ctx, w, h) { speedInner.paintStateBg(ctx, w, h, '#240000', '#b00000', false) }
+            }
+
+            Column {
+                id: speedStack
+                anchors.centerIn: parent
+                anchors.verticalCenterOffset: -speedInner.width * 0.0375
+                spacing: 4
+                property real logoScale: 1.5
+                Image {
+                    id: mazdaspeedLogo
+                    source: 'image://icons/mazdaspeed'
+                    fillMode: Image.PreserveAspectFit
+                    smooth: true
+                    cache: true
+                    width: speedInner.width * 0.6 * speedStack.logoScale
+                    height: width * 0.25
+                    anchors.horizontalCenter: parent.horizontalCenter
+                }
+                Text {
+                    id: speedValue
+                    text: Math.round(TEL.speed)
+                    color: 'white'
+                    font.pixelSize: speedInner.width * 0.40
+                    font.bold: true
+                    anchors.horizontalCenter: parent.horizontalCenter
+                }
+                Text {
+                    text: 'km/h'
+                    color: '#888'
+                    font.pixelSize: speedInner.width * 0.12
+                    anchors.horizontalCenter: parent.horizontalCenter
+                }
+            }
+        }
+    }
+
+Item {
+        id: leftTurnIndicator
+        width: clusterCenter.width * 0.11
+        height: width
+        anchors.top: clusterCenter.top
+        anchors.topMargin: 58
+        anchors.right: clusterCenter.left
+        anchors.rightMargin: -130
+        z: 500
+        property bool active: TEL ? TEL.leftBlink : false
+        property bool fadingOut: false
+        visible: active || fadingOut
+        opacity: 1
+        onActiveChanged: {
+            if (active) {
+                fadingOut = false
+                leftTurnFadeOut.stop()
+                leftTurnBg.opacity = 0
+                leftTurnFadeIn.restart()
+            } else {
+                if (leftTurnBg.opacity > 0) {
+                    fadingOut = true
+                    leftTurnFadeIn.stop()
+                    leftTurnFadeOut.restart()
+                } else {
+                    fadingOut = false
+                }
+            }
+        }
+        Rectangle {
+            id: leftTurnBg
+            anchors.centerIn: parent
+            width: parent.width * 0.96
+            height: parent.height * 0.72
+            radius: width * 0.20
+            color: '#00c040'
+            opacity: 0
+            NumberAnimation { id: leftTurnFadeIn; target: leftTurnBg; property: 'opacity'; to: 0.95; duration: 180; easing.type: Easing.InOutQuad }
+            NumberAnimation { id: leftTurnFadeOut; target: leftTurnBg; property: 'opacity'; to: 0.0; duration: 180; easing.type: Easing.InOutQuad; onFinished: { if (!leftTurnIndicator.active) leftTurnIndicator.fadingOut = false } }
+        }
+        Image {
+            anchors.fill: parent
+            source: 'image://icons/left_turn'
+            fillMode: Image.PreserveAspectFit
+            smooth: true
+            cache: true
+            opacity: 1
+        }
+        Connections { target: TEL; function onLeftBlinkChanged(v) { leftTurnIndicator.active = v } }
+    }
+
+Item {
+        id: rightTurnIndicator
+        width: clusterCenter.width * 0.11
+        height: width
+        anchors.top: clusterCenter.top
+        anchors.topMargin: 58
+        anchors.left: clusterCenter.right
+        anchors.leftMargin: -130
+        z: 500
+        property bool active: TEL ? TEL.rightBlink : false
+        property bool fadingOut: false
+        visible: active || fadingOut
+        opacity: 1
+        onActiveChanged: {
+            if (active) {
+                fadingOut = false
+                rightTurnFadeOut.stop()
+                rightTurnBg.opacity = 0
+                rightTurnFadeIn.restart()
+            } else {
+                if (rightTurnBg.opacity > 0) {
+                    fadingOut = true
+                    rightTurnFadeIn.stop()
+                    rightTurnFadeOut.restart()
+                } else {
+                    fadingOut = false
+                }
+            }
+        }
+        Rectangle {
+            id: rightTurnBg
+            anchors.centerIn: parent
+            width: parent.width * 0.98
+            height: parent.height * 0.7
+            radius: width * 0.20
+            color: '#00c040'
+            opacity: 0
+            NumberAnimation { id: rightTurnFadeIn; target: rightTurnBg; property: 'opacity'; to: 0.95; duration: 180; easing.type: Easing.InOutQuad }
+            NumberAnimation { id: rightTurnFadeOut; target: rightTurnBg; property: 'opacity'; to: 0.0; duration: 180; easing.type: Easing.InOutQuad; onFinished: { if (!rightTurnIndicator.active) rightTurnIndicator.fadingOut = false } }
+        }
+        Image {
+            anchors.fill: parent
+            source: 'image://icons/right_turn'
+            fillMode: Image.PreserveAspectFit
+            smooth: true
+            cache: true
+            opacity: 1
+        }
+        Connections { target: TEL; function onRightBlinkChanged(v) { rightTurnIndicator.active = v } }
+    }
+
+FuelGauge {
+        id: fuelGauge
+        anchors.left: content.left
+        anchors.bottom: content.bottom
+        anchors.leftMargin: width * 0.02 + 25
+        anchors.bottomMargin: height * 0.02 + 20
+        width: content.width * 0.22
+        height: content.height * 0.32
+        opacity: content.liveOpacity
+    }
+LeftCluster {
+        id: leftCluster
+        base: clusterCenter.width * 0.15
+        heightOverride: base * 0.3
+        width: base * ratioW + 50
+        anchors.verticalCenter: clusterCenter.verticalCenter
+        anchors.verticalCenterOffset: -30
+        anchors.right: clusterCenter.left
+        anchors.rightMargin: 20
+        fl: content.fl
+        fr: content.fr
+        rr: content.rr
+        rl: content.rl
+        windowRoot: content
+    }
+WaterTempGauge {
+        id: waterTempGauge
+        anchors.right: content.right
+        anchors.bottom: content.bottom
+        anchors.rightMargin: width * 0.02 + 25
+        anchors.bottomMargin: height * 0.02 + 20
+        width: content.width * 0.22
+        height: content.height * 0.32
+        tempC: TEL ? TEL.waterTemp : 0
+        available: TEL ? TEL.waterTempAvailable : false
+        opacity: content.liveOpacity
+    }
+    RightCluster {
+        id: rightCluster
+        anchors.bottom: waterTempGauge.top
+        anchors.bottomMargin: 24
+        anchors.right: waterTempGauge.left
+        anchors.rightMargin: -280
+        width: content.width * 0.18
+        opacity: content.liveOpacity
+    }
+
+Text {
+        id: odometerText
+        text: 'ODO: ' + content.odometerValue
+        color: 'white'
+        font.pixelSize: 28
+        font.bold: true
+        anchors.left: content.left
+        anchors.bottom: content.bottom
+        anchors.leftMargin: 340
+        anchors.bottomMargin: 35
+        z: 600
+    }
+Text {
+        id: tripText
+        text: 'TRIP: ' + tripValue.toFixed(1)
+        color: 'white'
+        font.pixelSize: 28
+        font.bold: true
+        anchors.right: content.right
+        anchors.bottom: content.bottom
+        anchors.rightMargin: 360
+        anchors.bottomMargin: 35
+        z: 600
+        property color baseColor: 'white'
+        property bool flash: false
+        SequentialAnimation {
+            id: tripPulse
+            running: false
+            PropertyAnimation { target: tripText; property: 'scale'; to: 1.22; duration: 120; easing.type: Easing.OutCubic }
+            PropertyAnimation { target: tripText; property: 'scale'; to: 1.0; duration: 180; easing.type: Easing.InOutCubic }
+        }
+        SequentialAnimation {
+            id: tripFlash
+            running: false
+            ColorAnimation { target: tripText; property: 'color'; to: '#ff5050'; duration: 160 }
+            ColorAnimation { target: tripText; property: 'color'; to: tripText.baseColor; duration: 300 }
+        }
+    }
+
+    function animateTripReset() {
+        tripPulse.start();
+        tripFlash.start();
+    }
+}
@@ -300,7 +300,7 @@ Window {
             CheckBox {
                 id: exhaustBox
                 text: 'Exhaust'
-                checked: false
+                checked: SETTINGS.exhaust
                 font.pixelSize: 12
                 palette { button: '#333'; buttonText: 'white' }
                 contentItem: Text {
@@ -313,23 +313,48 @@ Window {
                     anchors.leftMargin: 6
                 }
                 implicitWidth: indicator.width + 6 + contentItem.implicitWidth
-                onToggled: if (TEL.saveExhaust) TEL.saveExhaust(checked)
-                Component.onCompleted: {
-                    try {
-                        var xhr = new XMLHttpRequest();
-                        xhr.open('GET', Qt.resolvedUrl('../data/data.json'));
-                        xhr.onreadystatechange = function() {
-                            if (xhr.readyState === XMLHttpRequest.DONE) {
-                                try { var obj = JSON.parse(xhr.responseText); exhaustBox.checked = !!obj.exhaust; } catch(e) {}
-                            }
-                        }
-                        xhr.send();
-                    } catch(e) {}
-                }
+                onToggled: SETTINGS.exhaust = checked
             }
             Item { Layout.fillWidth: true }
         }
         Rectangle { Layout.fillWidth: true; height: 1; color: '#444' }
+        Text { text: "Frame Latency (serial byte \u2192 ms)"; color: '#bbb'; font.pixelSize: 14; Layout.topMargin: -4; visible: TEL.latency !== null }
+        Text {
+            id: latencyText
+            visible: TEL.latency !== null
+            color: 'white'
+            font.family: 'monospace'
+            font.pixelSize: 11
+            Layout.fillWidth: true
+            Timer {
+                interval: 1000; repeat: true; triggeredOnStart: true
+                running: TEL.latency !== null
+                onTriggered: latencyText.text = TEL.latency.report()
+            }
+        }
+        Rectangle { Layout.fillWidth: true; height: 1; color: '#444'; visible: TEL.latency !== null }
+        Text { text: "Signals (last second, most QML time first)"; color: '#bbb'; font.pixelSize: 14; Layout.topMargin: -4; visible: TEL.signalStats !== null }
+        Text {
+            id: signalText
+            visible: TEL.signalStats !== null
+            color: 'white'
+            font.family: 'monospace'
+            font.pixelSize: 11
+            Layout.fillWidth: true
+            Timer {
+                interval: 1000; repeat: true; triggeredOnStart: true
+                running: TEL.signalStats !== null
+                onTriggered: signalText.text = TEL.signalStats.report()
+            }
+        }
+        Button {
+            id: signalExport
+            visible: TEL.signalStats !== null
+            text: "Export Signal Report"
+            Layout.fillWidth: true
+            onClicked: signalExport.text = TEL.signalStats.writeReport()
+        }
+        Rectangle { Layout.fillWidth: true; height: 1; color: '#444'; visible: TEL.signalStats !== null }
         Button { text: "Center All"; Layout.fillWidth: true; onClicked: {
                 TEL.rpm = 3500;
                 TEL.speed = 150;
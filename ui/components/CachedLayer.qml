@@ -0,0 +1,94 @@
+import QtQuick 2.15
+
+// Static layer painted once with the Canvas API and afterwards shown as a
+// cached texture (LAYERS, src/layer_cache.py). The cache key covers the
+// resolution, the item size and `params`, so `params` must name everything
+// paintFn reads. Changing it switches to another cached variant (rendering
+// it once if missing) and cross-fades over `fadeDuration`.
+Item {
+    id: cached
+    property string layerName: 'layer'
+    property var paintFn: null          // function(ctx, width, height)
+    property string params: ''
+    property int fadeDuration: 0
+    // grab at physical pixels: the scene is scaled by SCALE afterwards
+    property real textureScale: (typeof SCALE !== 'undefined' && SCALE > 0) ? SCALE : 1.0
+
+    readonly property bool cacheAvailable: typeof LAYERS !== 'undefined' && LAYERS !== null
+    readonly property int pw: Math.round(width)
+    readonly property int ph: Math.round(height)
+    readonly property string key: (cacheAvailable && paintFn && pw > 0 && ph > 0)
+                                  ? LAYERS.key(layerName, pw, ph, params) : ''
+    property string shownKey: ''
+    property bool painting: false
+
+    onKeyChanged: refresh()
+    Component.onCompleted: refresh()
+
+    function refresh() {
+        if (!cacheAvailable) { painting = paintFn !== null; return }
+        if (key === '' || key === shownKey) return
+        if (LAYERS.has(key)) {
+            show(key)
+        } else {
+            painting = false   // recreate the canvas for the new variant
+            painting = true
+        }
+    }
+
+    function show(k) {
+        var fade = fadeDuration > 0 && current.source.toString() !== ''
+        previous.source = fade ? current.source : ''
+        current.source = 'image://layers/' + k
+        shownKey = k
+        painting = false
+        if (fade) {
+            fadeIn.restart()
+        } else {
+            current.opacity = 1
+        }
+    }
+
+    Image {
+        id: previous
+        anchors.fill: parent
+        smooth: true
+        visible: source.toString() !== ''
+    }
+    Image {
+        id: current
+        anchors.fill: parent
+        smooth: true
+        NumberAnimation on opacity {
+            id: fadeIn
+            running: false
+            from: 0; to: 1
+            duration: cached.fadeDuration
+            easing.type: Easing.InOutQuad
+            onFinished: previous.source = ''
+        }
+    }
+
+    Loader {
+        anchors.fill: parent
+        active: cached.painting
+        sourceComponent: Canvas {
+            property string paintedKey: ''
+            onPaint: {
+                var ctx = getContext('2d')
+                ctx.reset()
+                cached.paintFn(ctx, width, height)
+                paintedKey = cached.key
+            }
+            onPainted: {
+                if (!cached.cacheAvailable || paintedKey === '') return
+                var k = paintedKey
+                grabToImage(function(result) {
+                    LAYERS.store(k, result.image)
+                    if (k === cached.key) cached.show(k)
+                }, Qt.size(Math.max(1, Math.round(width * cached.textureScale)),
+                           Math.max(1, Math.round(height * cached.textureScale))))
+            }
+        }
+    }
+}
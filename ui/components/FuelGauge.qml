@@ -14,7 +14,7 @@ Item {
     property int fuelIconSize: 60
     property int fuelIconGap: 10
     property int fuelIconGapRight: 8
-    property url fuelIconSource: "../../assets/fuel.png"
+    property url fuelIconSource: 'image://icons/fuel'
     property int fuelIconBackingSideTrim: 6
     property real fuelIconVerticalLift: (fuelIconSize - fullLabelSize)/2
     property int fuelIconExtraLift: 0
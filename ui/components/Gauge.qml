@@ -70,6 +70,10 @@ Item {
     property color innerProgressCoreEffectiveColor: (value >= redFrom ? redlineColor : (warnFrom >= 0 && value >= warnFrom && value <= warnTo ? warnColor : innerProgressColor))
     property color innerProgressWhiteGlowEffectiveColor: innerProgressCoreEffectiveColor
 
+    // draw progress arc + marker with the native RingGauge item (falls back to Canvas)
+    property bool useNativeRing: true
+    readonly property bool nativeRing: useNativeRing && nativeRingLoader.status === Loader.Ready
+
     property bool smoothMarker: true
     property real markerSmoothedValue: value
     property real markerSmoothVelocity: (max - min) / 0.25
@@ -79,93 +83,102 @@ Item {
 
     width: 600; height: 600
 
-    onFontSizeLabelsChanged: { scaleCanvas.requestPaint(); labelsRepeater.model = labelsRepeater.model }
-    onLabelOffsetFactorChanged: scaleCanvas.requestPaint()
-    onLabelDistanceChanged: scaleCanvas.requestPaint()
-    onTickMajorLenChanged: scaleCanvas.requestPaint()
-    onTickMinorLenChanged: scaleCanvas.requestPaint()
-    onRingWidthChanged: scaleCanvas.requestPaint()
-    onRedFromChanged: { scaleCanvas.requestPaint(); markerCanvas.requestPaint() }
-    onRedToChanged: { scaleCanvas.requestPaint(); markerCanvas.requestPaint() }
-    onWarnFromChanged: scaleCanvas.requestPaint()
-    onWarnToChanged: scaleCanvas.requestPaint()
+    onFontSizeLabelsChanged: labelsRepeater.model = labelsRepeater.model
+    onRedFromChanged: markerCanvas.requestPaint()
+    onRedToChanged: markerCanvas.requestPaint()
 
-    Canvas {
-        id: scaleCanvas
-        anchors.fill: parent
-        onPaint: {
-            var ctx = getContext('2d')
-            ctx.reset()
-            var cx = width/2
-            var cy = height/2
-            ctx.translate(cx, cy)
+    // red band / tick colours use the redline rounded to this step, so a moving
+    // redline switches (cross-fading over scaleFadeDuration ms) between a few
+    // cached scale textures
+    property real redlineQuantum: 50
+    readonly property real scaleRedFrom: Math.round(redFrom / redlineQuantum) * redlineQuantum
+    property int scaleFadeDuration: 300
 
-            function angleFor(v) {
-                var frac = (v - root.min)/(root.max - root.min)
-                return (root.startAngle + frac*(root.endAngle-root.startAngle) + root.orientationOffset) * Math.PI/180.0
-            }
-            var arcRadius = root.radius - root.ringWidth/2
-            ctx.lineWidth = root.ringWidth
-            ctx.strokeStyle = root.backgroundArcColor
-            ctx.beginPath()
-            ctx.arc(0,0, arcRadius, angleFor(root.min), angleFor(root.max), false)
-            ctx.stroke()
-            if (root.warnTo > root.warnFrom && root.warnFrom >= root.min) {
-                ctx.strokeStyle = root.warnColor
-                ctx.beginPath()
-                ctx.arc(0,0, arcRadius, angleFor(root.warnFrom), angleFor(root.warnTo), false)
-                ctx.stroke()
-            }
-            // red zone
-            ctx.strokeStyle = root.redlineColor
+    function paintScale(ctx, w, h) {
+        var redFrom = root.scaleRedFrom
+        var cx = w/2
+        var cy = h/2
+        ctx.translate(cx, cy)
+
+        function angleFor(v) {
+            var frac = (v - root.min)/(root.max - root.min)
+            return (root.startAngle + frac*(root.endAngle-root.startAngle) + root.orientationOffset) * Math.PI/180.0
+        }
+        var arcRadius = root.radius - root.ringWidth/2
+        ctx.lineWidth = root.ringWidth
+        ctx.strokeStyle = root.backgroundArcColor
+        ctx.beginPath()
+        ctx.arc(0,0, arcRadius, angleFor(root.min), angleFor(root.max), false)
+        ctx.stroke()
+        if (root.warnTo > root.warnFrom && root.warnFrom >= root.min) {
+            ctx.strokeStyle = root.warnColor
             ctx.beginPath()
-            ctx.arc(0,0, arcRadius, angleFor(root.redFrom), angleFor(root.redTo), false)
+            ctx.arc(0,0, arcRadius, angleFor(root.warnFrom), angleFor(root.warnTo), false)
             ctx.stroke()
-            // ticks
-            ctx.lineWidth = 4
-            for (var v = root.min; v <= root.max + 0.001; v += root.majorStep) {
-                var a = angleFor(v)
-                var isRed = v >= root.redFrom
+        }
+        // red zone
+        ctx.strokeStyle = root.redlineColor
+        ctx.beginPath()
+        ctx.arc(0,0, arcRadius, angleFor(redFrom), angleFor(root.redTo), false)
+        ctx.stroke()
+        // ticks
+        ctx.lineWidth = 4
+        for (var v = root.min; v <= root.max + 0.001; v += root.majorStep) {
+            var a = angleFor(v)
+            var isRed = v >= redFrom
+            ctx.save(); ctx.rotate(a)
+            ctx.beginPath(); ctx.moveTo(root.radius-10,0); ctx.lineTo(root.radius-10 - root.tickMajorLen,0)
+            ctx.strokeStyle = isRed ? root.redlineColor : root.tickColorMajor; ctx.stroke(); ctx.restore()
+            if (root.drawCanvasLabels && !root.useTextLabels) {
                 ctx.save(); ctx.rotate(a)
-                ctx.beginPath(); ctx.moveTo(root.radius-10,0); ctx.lineTo(root.radius-10 - root.tickMajorLen,0)
-                ctx.strokeStyle = isRed ? root.redlineColor : root.tickColorMajor; ctx.stroke(); ctx.restore()
-                if (root.drawCanvasLabels && !root.useTextLabels) {
-                    ctx.save(); ctx.rotate(a)
-                    ctx.translate(root.radius-10 - root.tickMajorLen - root.labelDistance,0)
-                    ctx.rotate(-a)
-                    ctx.fillStyle = isRed ? root.redlineColor : root.tickColorMajor
-                    ctx.font = root.fontSizeLabels + 'px DejaVu Sans'
-                    ctx.textAlign = 'center'; ctx.textBaseline = 'middle'
-                    var display = root.abbreviateThousands ? String(Math.round(v/1000)) : String(Math.round(v))
-                    ctx.fillText(display,0,0)
-                    ctx.restore()
-                }
+                ctx.translate(root.radius-10 - root.tickMajorLen - root.labelDistance,0)
+                ctx.rotate(-a)
+                ctx.fillStyle = isRed ? root.redlineColor : root.tickColorMajor
+                ctx.font = root.fontSizeLabels + 'px DejaVu Sans'
+                ctx.textAlign = 'center'; ctx.textBaseline = 'middle'
+                var display = root.abbreviateThousands ? String(Math.round(v/1000)) : String(Math.round(v))
+                ctx.fillText(display,0,0)
+                ctx.restore()
             }
-            // minor ticks
-            ctx.lineWidth = 2
-            for (var mv = root.min; mv <= root.max + 0.001; mv += root.minorStep) {
-                if (Math.abs(mv % root.majorStep) < 0.001) continue
-                var ma = angleFor(mv)
-                ctx.save(); ctx.rotate(ma)
-                ctx.beginPath(); ctx.moveTo(root.radius-10,0); ctx.lineTo(root.radius-10 - root.tickMinorLen,0)
-                if (mv >= root.redFrom) {
-                    ctx.strokeStyle = root.redlineColor
-                } else if (mv >= root.warnFrom && mv <= root.warnTo) {
-                    ctx.strokeStyle = root.warnColor
-                } else {
-                    ctx.strokeStyle = root.tickColorMinor
-                }
-                ctx.stroke(); ctx.restore()
+        }
+        // minor ticks
+        ctx.lineWidth = 2
+        for (var mv = root.min; mv <= root.max + 0.001; mv += root.minorStep) {
+            if (Math.abs(mv % root.majorStep) < 0.001) continue
+            var ma = angleFor(mv)
+            ctx.save(); ctx.rotate(ma)
+            ctx.beginPath(); ctx.moveTo(root.radius-10,0); ctx.lineTo(root.radius-10 - root.tickMinorLen,0)
+            if (mv >= redFrom) {
+                ctx.strokeStyle = root.redlineColor
+            } else if (mv >= root.warnFrom && mv <= root.warnTo) {
+                ctx.strokeStyle = root.warnColor
+            } else {
+                ctx.strokeStyle = root.tickColorMinor
             }
+            ctx.stroke(); ctx.restore()
         }
     }
 
+    CachedLayer {
+        id: scaleCanvas
+        anchors.fill: parent
+        layerName: 'gauge-scale'
+        paintFn: root.paintScale
+        fadeDuration: root.scaleFadeDuration
+        params: [root.min, root.max, root.majorStep, root.minorStep, root.startAngle, root.endAngle,
+                 root.orientationOffset, root.scaleRedFrom, root.redTo, root.warnFrom, root.warnTo,
+                 root.warnColor, root.backgroundArcColor, root.redlineColor, root.tickColorMajor,
+                 root.tickColorMinor, root.ringWidth, root.tickMajorLen, root.tickMinorLen, root.radius,
+                 root.fontSizeLabels, root.labelDistance, root.abbreviateThousands,
+                 root.drawCanvasLabels, root.useTextLabels].join('|')
+    }
+
     Canvas {
         id: innerProgressCanvas
         anchors.fill: parent
-        visible: root.showInnerProgress
+        visible: root.showInnerProgress && !root.nativeRing
         onPaint: {
-            if (!root.showInnerProgress) return
+            if (!root.showInnerProgress || root.nativeRing) return
             var ctx = getContext('2d'); ctx.reset();
             var cx = width/2, cy = height/2; ctx.translate(cx, cy)
             function angleFor(v) {
@@ -266,11 +279,20 @@ Item {
         renderType: Text.NativeRendering
     }
 
+    Loader {
+        id: nativeRingLoader
+        anchors.fill: parent
+        active: root.useNativeRing
+        source: 'NativeRing.qml'
+        onLoaded: item.gauge = root
+    }
+
     Canvas {
         id: markerCanvas
         anchors.fill: parent
-        visible: true
+        visible: !root.nativeRing
         onPaint: {
+            if (root.nativeRing) return
             var ctx = getContext('2d'); ctx.reset();
             var cx = width/2, cy = height/2; ctx.translate(cx, cy)
             var useVal = (root.smoothMarker ? root.markerSmoothedValue : root.value)
@@ -295,14 +317,15 @@ Item {
     }
 
     onValueChanged: {
-        if (showInnerProgress) innerProgressCanvas.requestPaint()
+        if (showInnerProgress && !nativeRing) innerProgressCanvas.requestPaint()
         if (smoothMarker) {
             markerSmoothedValue = value
-        } else {
+        } else if (!nativeRing) {
             markerCanvas.requestPaint()
         }
     }
-    onMarkerSmoothedValueChanged: if (smoothMarker) { markerCanvas.requestPaint(); if (showInnerProgress) innerProgressCanvas.requestPaint() }
+    onMarkerSmoothedValueChanged: if (smoothMarker && !nativeRing) { markerCanvas.requestPaint(); if (showInnerProgress) innerProgressCanvas.requestPaint() }
+    onNativeRingChanged: if (!nativeRing) { markerCanvas.requestPaint(); innerProgressCanvas.requestPaint() }
     onStartAngleChanged: { markerCanvas.requestPaint(); if (showInnerProgress) innerProgressCanvas.requestPaint() }
     onEndAngleChanged: { markerCanvas.requestPaint(); if (showInnerProgress) innerProgressCanvas.requestPaint() }
     onInnerProgressRadiusChanged: if (showInnerProgress) innerProgressCanvas.requestPaint()
@@ -29,7 +29,7 @@ Item {
     property int wheelMin: 1
     property int wheelMax: 32
     property real selectedTextWidth: 0
-    property bool exhaustState: false
+    property bool exhaustState: SETTINGS.exhaust
     
     property bool settingsHeaderVisible: false
     property bool settingsTransitionActive: false
@@ -56,7 +56,6 @@ Item {
             selectedTextWidth = menuFontMetrics.advanceWidth(menuItems[0]);
             frame.targetWidth = (selectedTextWidth > 0 ? selectedTextWidth : base) + base * 0.36;
         }
-    refreshExhaustState();
     }
     onSelectedFontChanged: if (menuItems.length > 0) { selectedTextWidth = menuFontMetrics.advanceWidth(menuItems[menuIndex]); frame.targetWidth = (selectedTextWidth>0?selectedTextWidth:base)+base*0.36 }
     onMenuIndexChanged: if (menuItems.length > 0) { selectedTextWidth = menuFontMetrics.advanceWidth(menuItems[menuIndex]); frame.targetWidth = (selectedTextWidth>0?selectedTextWidth:base)+base*0.36 }
@@ -77,7 +76,11 @@ Item {
 
     
     property date now: new Date()
-    Timer { interval: 1000; running: true; repeat: true; onTriggered: root.now = new Date() }
+    // idle (TEL.idle): wake once per minute, just after the shown minute changes
+    Timer {
+        interval: (typeof TEL !== 'undefined' && TEL.idle) ? 60050 - (root.now.getSeconds() * 1000 + root.now.getMilliseconds()) : 1000
+        running: true; repeat: true; onTriggered: root.now = new Date()
+    }
     Timer {
         id: inactivityTimer
         interval: root.inactivityMs
@@ -164,11 +167,14 @@ Item {
 
     Image {
         id: teinLogo
-        source: Qt.resolvedUrl('../../assets/tein.png')
+        source: 'image://icons/tein'
+        asynchronous: true
         anchors.horizontalCenter: parent.horizontalCenter
         anchors.bottom: parent.bottom
     anchors.bottomMargin: 180
         width: parent.width * 0.65
+        readonly property size originalSize: ICONS.sourceSize('tein')
+        height: width * originalSize.height / originalSize.width  // as with the original PNG; the atlas serves it smaller
         fillMode: Image.PreserveAspectFit
         smooth: true
     FontMetrics { id: settingsMetrics; font.pixelSize: settingsContainer.settingsFontSelected }
@@ -187,184 +193,206 @@ Item {
     readonly property real valRL: rl
     readonly property real valRR: rr
 
-    Item {
-            id: suspensionContainer
-            anchors.horizontalCenter: parent.horizontalCenter
-            anchors.verticalCenter: parent.verticalCenter
-            anchors.verticalCenterOffset: -base * 0.3
-            width: parent.width * 0.7
-            height: width 
-            opacity: root.currentSubmenu === 'suspension' ? 1 : 0
-            scale: 1
-            visible: root.currentSubmenu === 'suspension'
-
-            Image {
-                id: suspensionImage
+    // submenus are created on first entry (see _enterSubmenuCommon)
+    Loader {
+        id: suspensionLoader
+        anchors.horizontalCenter: parent.horizontalCenter
+        anchors.verticalCenter: parent.verticalCenter
+        anchors.verticalCenterOffset: -base * 0.3
+        width: parent.width * 0.7
+        height: width
+        active: false
+        sourceComponent: Component {
+            Item {
+                id: suspensionContainer
                 anchors.fill: parent
-                fillMode: Image.PreserveAspectFit
-                source: Qt.resolvedUrl('../../assets/suspension.png')
-                smooth: true
-            }
-            
-            property real wheelFont: base * 0.32
+                opacity: root.currentSubmenu === 'suspension' ? 1 : 0
+                scale: 1
+                visible: root.currentSubmenu === 'suspension'
 
+                Image {
+                    id: suspensionImage
+                    anchors.fill: parent
+                    fillMode: Image.PreserveAspectFit
+                    source: 'image://icons/suspension'
+                    asynchronous: true
+                    smooth: true
+                }
 
-            Text {
-                id: txtFL
-                text: submenuLayer.valFL
-                anchors.left: parent.left; anchors.top: parent.top
-                anchors.leftMargin: base * -0.25; anchors.topMargin: base * 0.10
-                font.pixelSize: suspensionContainer.wheelFont; font.bold: true
-                color: root.wheelEditIndex===0 ? '#00c060' : 'white'
-                transformOrigin: Item.Center
-                scale: 1
-                Behavior on color { ColorAnimation { duration: 140 } }
-                onTextChanged: if (root.wheelEditIndex===0) { pulseFL.restart(); flashFL.restart(); }
-                SequentialAnimation {
-                    id: pulseFL
-                    running: false
-                    loops: 1
-                    PropertyAnimation { target: txtFL; property: 'scale'; from: 1; to: 1.28; duration: 90; easing.type: Easing.OutCubic }
-                    PropertyAnimation { target: txtFL; property: 'scale'; from: 1.28; to: 1.0; duration: 180; easing.type: Easing.OutBack }
+                property real wheelFont: base * 0.32
+
+
+                Text {
+                    id: txtFL
+                    text: submenuLayer.valFL
+                    anchors.left: parent.left; anchors.top: parent.top
+                    anchors.leftMargin: base * -0.25; anchors.topMargin: base * 0.10
+                    font.pixelSize: suspensionContainer.wheelFont; font.bold: true
+                    color: root.wheelEditIndex===0 ? '#00c060' : 'white'
+                    transformOrigin: Item.Center
+                    scale: 1
+                    Behavior on color { ColorAnimation { duration: 140 } }
+                    onTextChanged: if (root.wheelEditIndex===0) { pulseFL.restart(); flashFL.restart(); }
+                    SequentialAnimation {
+                        id: pulseFL
+                        running: false
+                        loops: 1
+                        PropertyAnimation { target: txtFL; property: 'scale'; from: 1; to: 1.28; duration: 90; easing.type: Easing.OutCubic }
+                        PropertyAnimation { target: txtFL; property: 'scale'; from: 1.28; to: 1.0; duration: 180; easing.type: Easing.OutBack }
+                    }
+                    SequentialAnimation {
+                        id: flashFL
+                        running: false
+                        loops: 1
+                        ColorAnimation { target: txtFL; property: 'color'; from: '#ffffff'; to: '#00ff90'; duration: 60 }
+                        ColorAnimation { target: txtFL; property: 'color'; from: '#00ff90'; to: (root.wheelEditIndex===0 ? '#00c060' : 'white'); duration: 200 }
+                    }
                 }
-                SequentialAnimation {
-                    id: flashFL
-                    running: false
-                    loops: 1
-                    ColorAnimation { target: txtFL; property: 'color'; from: '#ffffff'; to: '#00ff90'; duration: 60 }
-                    ColorAnimation { target: txtFL; property: 'color'; from: '#00ff90'; to: (root.wheelEditIndex===0 ? '#00c060' : 'white'); duration: 200 }
+                Text {
+                    id: txtFR
+                    text: submenuLayer.valFR
+                    anchors.right: parent.right; anchors.top: parent.top
+                    anchors.rightMargin: base * -0.25; anchors.topMargin: base * 0.10
+                    font.pixelSize: suspensionContainer.wheelFont; font.bold: true
+                    color: root.wheelEditIndex===1 ? '#00c060' : 'white'
+                    transformOrigin: Item.Center
+                    scale: 1
+                    Behavior on color { ColorAnimation { duration: 140 } }
+                    onTextChanged: if (root.wheelEditIndex===1) { pulseFR.restart(); flashFR.restart(); }
+                    SequentialAnimation {
+                        id: pulseFR
+                        running: false
+                        loops: 1
+                        PropertyAnimation { target: txtFR; property: 'scale'; from: 1; to: 1.28; duration: 90; easing.type: Easing.OutCubic }
+                        PropertyAnimation { target: txtFR; property: 'scale'; from: 1.28; to: 1.0; duration: 180; easing.type: Easing.OutBack }
+                    }
+                    SequentialAnimation {
+                        id: flashFR
+                        running: false
+                        loops: 1
+                        ColorAnimation { target: txtFR; property: 'color'; from: '#ffffff'; to: '#00ff90'; duration: 60 }
+                        ColorAnimation { target: txtFR; property: 'color'; from: '#00ff90'; to: (root.wheelEditIndex===1 ? '#00c060' : 'white'); duration: 200 }
+                    }
                 }
-            }
-            Text {
-                id: txtFR
-                text: submenuLayer.valFR
-                anchors.right: parent.right; anchors.top: parent.top
-                anchors.rightMargin: base * -0.25; anchors.topMargin: base * 0.10
-                font.pixelSize: suspensionContainer.wheelFont; font.bold: true
-                color: root.wheelEditIndex===1 ? '#00c060' : 'white'
-                transformOrigin: Item.Center
-                scale: 1
-                Behavior on color { ColorAnimation { duration: 140 } }
-                onTextChanged: if (root.wheelEditIndex===1) { pulseFR.restart(); flashFR.restart(); }
-                SequentialAnimation {
-                    id: pulseFR
-                    running: false
-                    loops: 1
-                    PropertyAnimation { target: txtFR; property: 'scale'; from: 1; to: 1.28; duration: 90; easing.type: Easing.OutCubic }
-                    PropertyAnimation { target: txtFR; property: 'scale'; from: 1.28; to: 1.0; duration: 180; easing.type: Easing.OutBack }
+                Text {
+                    id: txtRL
+                    text: submenuLayer.valRL
+                    anchors.left: parent.left; anchors.bottom: parent.bottom
+                    anchors.leftMargin: base * -0.25; anchors.bottomMargin: base * 0.05
+                    font.pixelSize: suspensionContainer.wheelFont; font.bold: true
+                    color: root.wheelEditIndex===2 ? '#00c060' : 'white'
+                    transformOrigin: Item.Center
+                    scale: 1
+                    Behavior on color { ColorAnimation { duration: 140 } }
+                    onTextChanged: if (root.wheelEditIndex===2) { pulseRL.restart(); flashRL.restart(); }
+                    SequentialAnimation {
+                        id: pulseRL
+                        running: false
+                        loops: 1
+                        PropertyAnimation { target: txtRL; property: 'scale'; from: 1; to: 1.28; duration: 90; easing.type: Easing.OutCubic }
+                        PropertyAnimation { target: txtRL; property: 'scale'; from: 1.28; to: 1.0; duration: 180; easing.type: Easing.OutBack }
+                    }
+                    SequentialAnimation {
+                        id: flashRL
+                        running: false
+                        loops: 1
+                        ColorAnimation { target: txtRL; property: 'color'; from: '#ffffff'; to: '#00ff90'; duration: 60 }
+                        ColorAnimation { target: txtRL; property: 'color'; from: '#00ff90'; to: (root.wheelEditIndex===2 ? '#00c060' : 'white'); duration: 200 }
+                    }
                 }
-                SequentialAnimation {
-                    id: flashFR
-                    running: false
-                    loops: 1
-                    ColorAnimation { target: txtFR; property: 'color'; from: '#ffffff'; to: '#00ff90'; duration: 60 }
-                    ColorAnimation { target: txtFR; property: 'color'; from: '#00ff90'; to: (root.wheelEditIndex===1 ? '#00c060' : 'white'); duration: 200 }
+                Text {
+                    id: txtRR
+                    text: submenuLayer.valRR
+                    anchors.right: parent.right; anchors.bottom: parent.bottom
+                    anchors.rightMargin: base * -0.25; anchors.bottomMargin: base * 0.05
+                    font.pixelSize: suspensionContainer.wheelFont; font.bold: true
+                    color: root.wheelEditIndex===3 ? '#00c060' : 'white'
+                    transformOrigin: Item.Center
+                    scale: 1
+                    Behavior on color { ColorAnimation { duration: 140 } }
+                    onTextChanged: if (root.wheelEditIndex===3) { pulseRR.restart(); flashRR.restart(); }
+                    SequentialAnimation {
+                        id: pulseRR
+                        running: false
+                        loops: 1
+                        PropertyAnimation { target: txtRR; property: 'scale'; from: 1; to: 1.28; duration: 90; easing.type: Easing.OutCubic }
+                        PropertyAnimation { target: txtRR; property: 'scale'; from: 1.28; to: 1.0; duration: 180; easing.type: Easing.OutBack }
+                    }
+                    SequentialAnimation {
+                        id: flashRR
+                        running: false
+                        loops: 1
+                        ColorAnimation { target: txtRR; property: 'color'; from: '#ffffff'; to: '#00ff90'; duration: 60 }
+                        ColorAnimation { target: txtRR; property: 'color'; from: '#00ff90'; to: (root.wheelEditIndex===3 ? '#00c060' : 'white'); duration: 200 }
+                    }
                 }
             }
-            Text {
-                id: txtRL
-                text: submenuLayer.valRL
-                anchors.left: parent.left; anchors.bottom: parent.bottom
-                anchors.leftMargin: base * -0.25; anchors.bottomMargin: base * 0.05
-                font.pixelSize: suspensionContainer.wheelFont; font.bold: true
-                color: root.wheelEditIndex===2 ? '#00c060' : 'white'
-                transformOrigin: Item.Center
-                scale: 1
-                Behavior on color { ColorAnimation { duration: 140 } }
-                onTextChanged: if (root.wheelEditIndex===2) { pulseRL.restart(); flashRL.restart(); }
-                SequentialAnimation {
-                    id: pulseRL
-                    running: false
-                    loops: 1
-                    PropertyAnimation { target: txtRL; property: 'scale'; from: 1; to: 1.28; duration: 90; easing.type: Easing.OutCubic }
-                    PropertyAnimation { target: txtRL; property: 'scale'; from: 1.28; to: 1.0; duration: 180; easing.type: Easing.OutBack }
-                }
-                SequentialAnimation {
-                    id: flashRL
-                    running: false
-                    loops: 1
-                    ColorAnimation { target: txtRL; property: 'color'; from: '#ffffff'; to: '#00ff90'; duration: 60 }
-                    ColorAnimation { target: txtRL; property: 'color'; from: '#00ff90'; to: (root.wheelEditIndex===2 ? '#00c060' : 'white'); duration: 200 }
+        }
+    }
+
+    Loader {
+        id: exhaustLoader
+        anchors.horizontalCenter: parent.horizontalCenter
+        anchors.verticalCenter: parent.verticalCenter
+        anchors.verticalCenterOffset: -base * 0.15 - 60
+        width: parent.width * 0.9
+        height: width * 0.55
+        active: false
+        sourceComponent: Component {
+            Item {
+                function pulse() {
+                    if (exhaustContainer.visible) exhaustPulse.restart();
                 }
-            }
-            Text {
-                id: txtRR
-                text: submenuLayer.valRR
-                anchors.right: parent.right; anchors.bottom: parent.bottom
-                anchors.rightMargin: base * -0.25; anchors.bottomMargin: base * 0.05
-                font.pixelSize: suspensionContainer.wheelFont; font.bold: true
-                color: root.wheelEditIndex===3 ? '#00c060' : 'white'
-                transformOrigin: Item.Center
-                scale: 1
-                Behavior on color { ColorAnimation { duration: 140 } }
-                onTextChanged: if (root.wheelEditIndex===3) { pulseRR.restart(); flashRR.restart(); }
-                SequentialAnimation {
-                    id: pulseRR
-                    running: false
-                    loops: 1
-                    PropertyAnimation { target: txtRR; property: 'scale'; from: 1; to: 1.28; duration: 90; easing.type: Easing.OutCubic }
-                    PropertyAnimation { target: txtRR; property: 'scale'; from: 1.28; to: 1.0; duration: 180; easing.type: Easing.OutBack }
+                Rectangle {
+                    id: exhaustContainer
+                    anchors.fill: parent
+                    radius: 14
+                    property color onColor: Qt.rgba(0, 0.55, 0, 0.35)
+                    property color offColor: Qt.rgba(0.65, 0, 0, 0.40)
+                    color: root.exhaustState ? onColor : offColor
+                    Behavior on color { ColorAnimation { duration: 420; easing.type: Easing.InOutCubic } }
+                    opacity: root.currentSubmenu === 'exhaust' ? 1 : 0
+                    scale: 1
+                    visible: root.currentSubmenu === 'exhaust'
+                    transformOrigin: Item.Center
+                    SequentialAnimation {
+                        id: exhaustPulse
+                        PropertyAnimation { target: exhaustContainer; property: 'scale'; to: 1.08; duration: 140; easing.type: Easing.OutCubic }
+                        PropertyAnimation { target: exhaustContainer; property: 'scale'; to: 1.0; duration: 240; easing.type: Easing.InOutQuad }
+                    }
+                    onColorChanged: {/* no-op to keep Behavior alive */}
+                    Image {
+                        id: exhaustImage
+                        anchors.centerIn: parent
+                        width: parent.width * 1.1
+                        height: width
+                        source: 'image://icons/exhaust'
+                        asynchronous: true
+                        fillMode: Image.PreserveAspectFit
+                        smooth: true
+                        opacity: exhaustContainer.opacity
+                        scale: 1
+                    }
                 }
-                SequentialAnimation {
-                    id: flashRR
-                    running: false
-                    loops: 1
-                    ColorAnimation { target: txtRR; property: 'color'; from: '#ffffff'; to: '#00ff90'; duration: 60 }
-                    ColorAnimation { target: txtRR; property: 'color'; from: '#00ff90'; to: (root.wheelEditIndex===3 ? '#00c060' : 'white'); duration: 200 }
+                Text {
+                    id: exhaustLabel
+                    text: root.exhaustState ? 'flaps open' : 'flaps closed'
+                    anchors.top: exhaustContainer.bottom
+                    anchors.topMargin: base * 0.06
+                    anchors.horizontalCenter: exhaustContainer.horizontalCenter
+                    font.pixelSize: base * 0.22
+                    font.bold: true
+                    property color onColor: '#00ff40'
+                    property color offColor: '#ff4040'
+                    color: root.exhaustState ? onColor : offColor
+                    Behavior on color { ColorAnimation { duration: 400; easing.type: Easing.InOutCubic } }
+                    opacity: exhaustContainer.opacity
+                    visible: exhaustContainer.visible
+                    scale: 1
                 }
             }
         }
-    
-    Rectangle {
-            id: exhaustContainer
-            anchors.horizontalCenter: parent.horizontalCenter
-            anchors.verticalCenter: parent.verticalCenter
-            anchors.verticalCenterOffset: -base * 0.15 - 60
-            width: parent.width * 0.9
-            height: width * 0.55
-            radius: 14
-            property color onColor: Qt.rgba(0, 0.55, 0, 0.35)
-            property color offColor: Qt.rgba(0.65, 0, 0, 0.40)
-            color: root.exhaustState ? onColor : offColor
-            Behavior on color { ColorAnimation { duration: 420; easing.type: Easing.InOutCubic } }
-            opacity: root.currentSubmenu === 'exhaust' ? 1 : 0
-            scale: 1
-            visible: root.currentSubmenu === 'exhaust'
-            transformOrigin: Item.Center
-            SequentialAnimation {
-                id: exhaustPulse
-                PropertyAnimation { target: exhaustContainer; property: 'scale'; to: 1.08; duration: 140; easing.type: Easing.OutCubic }
-                PropertyAnimation { target: exhaustContainer; property: 'scale'; to: 1.0; duration: 240; easing.type: Easing.InOutQuad }
-            }
-            onColorChanged: {/* no-op to keep Behavior alive */}
-            Image {
-                id: exhaustImage
-                anchors.centerIn: parent
-                width: parent.width * 1.1
-                height: width
-                source: Qt.resolvedUrl('../../assets/exhaust.png')
-                fillMode: Image.PreserveAspectFit
-                smooth: true
-                opacity: exhaustContainer.opacity
-                scale: 1
-            }
-        }
-    Text {
-            id: exhaustLabel
-            text: root.exhaustState ? 'flaps open' : 'flaps closed'
-            anchors.top: exhaustContainer.bottom
-            anchors.topMargin: base * 0.06
-            anchors.horizontalCenter: exhaustContainer.horizontalCenter
-            font.pixelSize: base * 0.22
-            font.bold: true
-            property color onColor: '#00ff40'
-            property color offColor: '#ff4040'
-            color: root.exhaustState ? onColor : offColor
-            Behavior on color { ColorAnimation { duration: 400; easing.type: Easing.InOutCubic } }
-            opacity: exhaustContainer.opacity
-            visible: exhaustContainer.visible
-            scale: 1
-        }
+    }
     }
 
     
@@ -389,6 +417,8 @@ Item {
     }
 
     function _enterSubmenuCommon(name) {
+        if (name === 'suspension') suspensionLoader.active = true;
+        else if (name === 'exhaust') exhaustLoader.active = true;
         root.currentSubmenu = name;
         root.menuActive = true;
         inactivityTimer.stop();
@@ -400,10 +430,6 @@ Item {
         submenuInactivityTimer.restart();
     }
     function enterSuspension() {
-        if (fl < wheelMin) { fl = wheelMin; if (windowRoot) windowRoot.fl = fl }
-        if (fr < wheelMin) { fr = wheelMin; if (windowRoot) windowRoot.fr = fr }
-        if (rl < wheelMin) { rl = wheelMin; if (windowRoot) windowRoot.rl = rl }
-        if (rr < wheelMin) { rr = wheelMin; if (windowRoot) windowRoot.rr = rr }
     console.log('[suspension] enter FR='+root.fr+' FL='+root.fl+' RR='+root.rr+' RL='+root.rl)
         _enterSubmenuCommon('suspension');
     }
@@ -416,7 +442,6 @@ Item {
         submenuFadeOut.from = submenuFade; submenuFadeOut.to = 0; submenuFadeOut.start();
     }
     function enterExhaust() {
-        refreshExhaustState();
         _exhaustAutoExit = false;
         _enterSubmenuCommon('exhaust');
     }
@@ -489,54 +514,15 @@ Item {
             
             settingsOptionsExitAnim.start();
         }
-    function refreshExhaustState() {
-        try {
-            var xhr = new XMLHttpRequest();
-            xhr.open('GET', Qt.resolvedUrl('../../data/data.json'));
-            xhr.onreadystatechange = function() {
-                if (xhr.readyState === XMLHttpRequest.DONE) {
-                    try {
-                        var obj = JSON.parse(xhr.responseText);
-                        if (obj && obj.hasOwnProperty('exhaust')) root.exhaustState = obj.exhaust ? true : false;
-                    } catch(e) {}
-                }
-            }
-            xhr.send();
-        } catch(e) {}
-    }
     function toggleExhaust() {
-        exhaustState = !exhaustState;
+        SETTINGS.exhaust = !SETTINGS.exhaust;
     console.log('[exhaust] toggle ->', exhaustState)
-        if (typeof TEL !== 'undefined' && TEL.saveExhaust) {
-            TEL.saveExhaust(exhaustState);
-        } else {
-            
-            try {
-                var xhr = new XMLHttpRequest();
-                xhr.open('GET', Qt.resolvedUrl('../../data/data.json'));
-                xhr.onreadystatechange = function() {
-                    if (xhr.readyState === XMLHttpRequest.DONE) {
-                        var obj = {};
-                        try { obj = JSON.parse(xhr.responseText) || {}; } catch(e) { obj = {}; }
-                        obj.exhaust = exhaustState;
-                        try {
-                            var xhr2 = new XMLHttpRequest();
-                            xhr2.send(JSON.stringify(obj));
-                        } catch(e2) {}
-                    }
-                }
-                xhr.send();
-            } catch(e) {}
-        }
-    
         _exhaustAutoExit = false;
     submenuInactivityTimer.restart();
     }
     
     onExhaustStateChanged: {
-        if (exhaustContainer.visible && exhaustPulse && exhaustPulse.restart) {
-            exhaustPulse.restart();
-        }
+        if (exhaustLoader.item) exhaustLoader.item.pulse();
     }
     function cycleWheelSelection() {
         if (wheelEditIndex === -1) wheelEditIndex = 0; else wheelEditIndex = (wheelEditIndex + 1) % 4;
@@ -550,16 +536,8 @@ Item {
         var nv = cur + delta;
         if (nv < wheelMin) nv = wheelMin; if (nv > wheelMax) nv = wheelMax;
         if (nv === cur) { submenuInactivityTimer.restart(); return; }
-    root[p] = nv;
-    if (windowRoot) windowRoot[p] = nv;
+        SETTINGS[p] = nv;
         submenuInactivityTimer.restart();
-    
-        if (typeof TEL !== 'undefined' && TEL.saveSuspension) {
-            TEL.saveSuspension(windowRoot ? windowRoot.fr : root.fr,
-                               windowRoot ? windowRoot.fl : root.fl,
-                               windowRoot ? windowRoot.rr : root.rr,
-                               windowRoot ? windowRoot.rl : root.rl);
-        }
     }
 
     Connections {
@@ -690,7 +668,6 @@ Item {
             if (typeof TEL !== 'undefined' && TEL.saveTrip) {
                 TEL.saveTrip(0.0); 
             }
-            if (windowRoot) windowRoot.tripValue = 0.0;
             if (windowRoot && windowRoot.animateTripReset) windowRoot.animateTripReset();
         } catch(e) {}
         inactivityTimer.restart();
@@ -0,0 +1,32 @@
+import QtQuick 2.15
+import Cluster 1.0
+
+// Progress arc + marker of a Gauge drawn by the Python RingGauge item
+// (scene-graph geometry) or, on the software backend, RingGaugePainted.
+// Loaded by Gauge.qml; if the Cluster module is not registered the Loader
+// fails and the gauge keeps its Canvas fallback.
+Loader {
+    id: ring
+    property Item gauge: null
+    sourceComponent: GraphicsInfo.api === GraphicsInfo.Software ? paintedRing : geometryRing
+
+    Component { id: geometryRing; RingGauge { } }
+    Component { id: paintedRing; RingGaugePainted { } }
+
+    onLoaded: bind()
+    onGaugeChanged: bind()
+
+    function bind() {
+        if (!item || !gauge) return
+        var names = ['min', 'max', 'startAngle', 'endAngle', 'orientationOffset', 'redFrom', 'warnFrom', 'warnTo',
+                     'redlineColor', 'warnColor', 'showInnerProgress', 'innerProgressRadius', 'innerProgressWidth',
+                     'innerProgressColor', 'innerProgressRoundCap', 'innerProgressGlow', 'innerProgressGlowSpreadPx',
+                     'innerProgressGlowPasses', 'innerProgressGlowMaxAlpha', 'innerProgressGlowFalloffPower',
+                     'innerProgressWhiteGlow', 'innerProgressWhiteGlowSpreadPx', 'innerProgressWhiteGlowPasses',
+                     'innerProgressWhiteGlowMaxAlpha', 'innerProgressWhiteGlowFalloffPower',
+                     'markerStartRadius', 'markerEndRadius', 'markerBaseWidth', 'markerColor', 'value']
+        var g = gauge
+        names.forEach(function(n) { item[n] = Qt.binding(function() { return g[n] }) })
+        item.markerValue = Qt.binding(function() { return g.smoothMarker ? g.markerSmoothedValue : g.value })
+    }
+}
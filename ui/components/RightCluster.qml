@@ -3,6 +3,9 @@ Item {
     id: root
     property int oilTemp: TEL ? TEL.oilTemp : 0
     property int waterTemp: TEL ? TEL.waterTemp : 0
+    // false until the first reading (v1 firmware never sends temperatures): grey "--", not 0
+    property bool oilTempAvailable: TEL ? TEL.oilTempAvailable : false
+    property bool waterTempAvailable: TEL ? TEL.waterTempAvailable : false
     property real afr: TEL ? TEL.afr : 0
     property real chargingVolt: TEL ? TEL.chargingVolt : 0
     property real oilPressure: TEL ? TEL.oilPressure : 0
@@ -41,7 +44,8 @@ Item {
         return px(Math.max(10, afrRight - thisLeft));
     }
 
-    function tempColor(t) { return t < 80 ? '#1e66ff' : (t > 114 ? '#d62828' : 'white'); }
+    property color noReadingColor: '#5f5f5f'
+    function tempColor(t, available) { return !available ? noReadingColor : t < 80 ? '#1e66ff' : (t > 114 ? '#d62828' : 'white'); }
 
     implicitWidth: 320
     implicitHeight: (rowHeight * 5) + (rowSpacing * 4)
@@ -99,7 +103,7 @@ Item {
                         anchors.centerIn: parent
                         width: parent.width
                         height: parent.height
-                        source: Qt.resolvedUrl('../../assets/oil_temp.png')
+                        source: 'image://icons/oil_temp'
                         fillMode: Image.PreserveAspectFit
                         smooth: true
                     }
@@ -110,7 +114,7 @@ Item {
                         width: oilTempImg.paintedWidth > 0 ? oilTempImg.paintedWidth : oilTempInner.width
                         height: oilTempImg.paintedHeight > 0 ? oilTempImg.paintedHeight : oilTempInner.height
                         radius: 6
-                        color: root.tempColor(oilTemp)
+                        color: root.tempColor(oilTemp, oilTempAvailable)
                         z: -1
                         anchors.verticalCenterOffset: 0
                         Behavior on color { ColorAnimation { duration: 180 } }
@@ -139,7 +143,7 @@ Item {
                     height: parent.height
                     width: (oilTemp <= tempBarMin) ? 0 : (oilTemp >= tempBarMax ? parent.width : parent.width * (oilTemp - tempBarMin) / (tempBarMax - tempBarMin))
                     radius: 0
-                    color: root.tempColor(oilTemp)
+                    color: root.tempColor(oilTemp, oilTempAvailable)
                     Behavior on color { ColorAnimation { duration: 180 } }
                     antialiasing: false
                     border.width: 0
@@ -176,7 +180,7 @@ Item {
                 height: barHeight + valueLineHeightAbove
                 x: (valueLineSnap ? Math.round(oilTrack.x + Math.min(oilTrack.width - valueLineWidth, Math.max(0, oilFill.width - valueLineWidth/2))) : oilTrack.x + Math.min(oilTrack.width - valueLineWidth, Math.max(0, oilFill.width - valueLineWidth/2)))
                 y: valueLineSnap ? Math.round(oilTrack.y - valueLineHeightAbove) : oilTrack.y - valueLineHeightAbove
-                color: root.tempColor(oilTemp)
+                color: root.tempColor(oilTemp, oilTempAvailable)
                 visible: oilTemp > tempBarMin && oilTemp < tempBarMax
                 antialiasing: false
                 border.width: 0
@@ -186,8 +190,8 @@ Item {
             }
             Text {
                 id: oilValue
-                text: oilTemp + '\u00B0C'
-                color: root.tempColor(oilTemp)
+                text: (oilTempAvailable ? oilTemp : '--') + '\u00B0C'
+                color: root.tempColor(oilTemp, oilTempAvailable)
                 Behavior on color { ColorAnimation { duration: 180 } }
                 font.pixelSize: valueFontSize
                 font.bold: true
@@ -215,12 +219,12 @@ Item {
             width: parent.width - 8
             height: parent.height - 8
                     radius: 6
-                    color: root.tempColor(waterTemp)
+                    color: root.tempColor(waterTemp, waterTempAvailable)
                     Behavior on color { ColorAnimation { duration: 180 } }
                 }
                 Image {
                     anchors.fill: parent
-                    source: Qt.resolvedUrl('../../assets/water_temp.png')
+                    source: 'image://icons/water_temp'
                     fillMode: Image.PreserveAspectFit
                     smooth: true
                 }
@@ -244,7 +248,7 @@ Item {
                     height: parent.height
                     width: (waterTemp <= tempBarMin) ? 0 : (waterTemp >= tempBarMax ? parent.width : parent.width * (waterTemp - tempBarMin) / (tempBarMax - tempBarMin))
                     radius: 0
-                    color: root.tempColor(waterTemp)
+                    color: root.tempColor(waterTemp, waterTempAvailable)
                     Behavior on color { ColorAnimation { duration: 180 } }
                     antialiasing: false
                     border.width: 0
@@ -280,7 +284,7 @@ Item {
                 height: barHeight + valueLineHeightAbove
                 x: (valueLineSnap ? Math.round(waterTrack.x + Math.min(waterTrack.width - valueLineWidth, Math.max(0, waterFill.width - valueLineWidth/2))) : waterTrack.x + Math.min(waterTrack.width - valueLineWidth, Math.max(0, waterFill.width - valueLineWidth/2)))
                 y: valueLineSnap ? Math.round(waterTrack.y - valueLineHeightAbove) : waterTrack.y - valueLineHeightAbove
-                color: root.tempColor(waterTemp)
+                color: root.tempColor(waterTemp, waterTempAvailable)
                 visible: waterTemp > tempBarMin && waterTemp < tempBarMax
                 antialiasing: false
                 border.width: 0
@@ -290,8 +294,8 @@ Item {
             }
             Text {
                 id: waterValue
-                text: waterTemp + '\u00B0C'
-                color: root.tempColor(waterTemp)
+                text: (waterTempAvailable ? waterTemp : '--') + '\u00B0C'
+                color: root.tempColor(waterTemp, waterTempAvailable)
                 Behavior on color { ColorAnimation { duration: 180 } }
                 font.pixelSize: valueFontSize
                 font.bold: true
@@ -319,7 +323,7 @@ Item {
                         anchors.centerIn: parent
                         width: parent.width
                         height: parent.height
-                        source: Qt.resolvedUrl('../../assets/charging.png')
+                        source: 'image://icons/charging'
                         fillMode: Image.PreserveAspectFit
                         smooth: true
                     }
@@ -433,7 +437,7 @@ Item {
                         anchors.centerIn: parent
                         width: parent.width
                         height: parent.height
-                        source: Qt.resolvedUrl('../../assets/oil_pressure.png')
+                        source: 'image://icons/oil_pressure'
                         fillMode: Image.PreserveAspectFit
                         smooth: true
                     }
@@ -562,7 +566,7 @@ Item {
                         // Add internal margin so bitmap edges never touch container edges
                         width: afrInner.width * 0.92
                         height: afrInner.height * 0.92
-                        source: Qt.resolvedUrl('../../assets/afr.png')
+                        source: 'image://icons/afr'
                         fillMode: Image.PreserveAspectFit
                         smooth: true
                         sourceSize.width: 128
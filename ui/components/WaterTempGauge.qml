@@ -2,6 +2,7 @@ import QtQuick 2.15
 Item {
     id: root
     property int tempC: 0
+    property bool available: true  // false: no reading yet, no fill and a grey icon instead of "cold"
     property int level: tempC
     property int minVisible: 50
     property int maxVisible: 130
@@ -16,7 +17,7 @@ Item {
 
     property int iconSize: 60
     property int iconGap: 8
-    property url iconSource: '../../assets/water_temp.png'
+    property url iconSource: 'image://icons/water_temp'
     property int iconBackingSideTrim: 6
     property real iconVerticalLift: (iconSize - fullLabelSize)/2
     property int iconExtraLift: -4
@@ -35,6 +36,7 @@ Item {
     property color lowTempColor: '#0078ff'
     property color neutralTempColor: '#F0F0E8'
     property color highTempColor: '#ff2a00'
+    property color noReadingColor: '#5f5f5f'
     property int coldGradientStart: 70   // <= -> fully blue
     property int coldGradientEnd: 80     // >= -> fully neutral
     property int hotGradientStart: 110   // <= -> still neutral
@@ -65,7 +67,6 @@ Item {
         }
         pts.push({x: rightX(bars[bars.length -1].shift), y: topFullY()})
         fullRightEdgePoints = pts
-        guideCanvas.requestPaint()
         fillCanvas.requestPaint()
     }
 
@@ -75,6 +76,7 @@ Item {
         onPaint: {
             var ctx = getContext('2d')
             ctx.reset(); ctx.clearRect(0,0,width,height)
+            if (!root.available) return
             var raw = root.tempC
             if (raw < root.minVisible) raw = root.minVisible
             if (raw > root.maxVisible) raw = root.maxVisible
@@ -134,6 +136,7 @@ Item {
     onHeightChanged: computeFullRightEdge()
     onLevelChanged: fillCanvas.requestPaint()
     onTempCChanged: fillCanvas.requestPaint()
+    onAvailableChanged: fillCanvas.requestPaint()
     Component.onCompleted: computeFullRightEdge()
 
     function blendChannel(a,b,t){ return Math.round(a + (b-a)*t) }
@@ -214,7 +217,7 @@ Item {
                     anchors.centerIn: parent
                     width: Math.max(4, parent.width - 2*iconBackingSideTrim)
                     height: parent.height - 12
-                    color: root.tempFillColor(root.tempC)
+                    color: root.available ? root.tempFillColor(root.tempC) : root.noReadingColor
                     radius: 4
                     Behavior on color { ColorAnimation { duration: 300; easing.type: Easing.InOutQuad } }
                 }
@@ -229,23 +232,25 @@ Item {
         }
     }
 
-    Canvas {
+    function paintGuide(ctx, w, h) {
+        var pts = fullRightEdgePoints
+        if (pts.length < 2) return
+        ctx.beginPath()
+        ctx.moveTo(pts[0].x, pts[0].y)
+        for (var i = 1; i < pts.length; ++i) ctx.lineTo(pts[i].x, pts[i].y)
+        ctx.lineWidth = guideWidth
+        ctx.strokeStyle = guideColor
+        ctx.globalAlpha = 0.95
+        ctx.stroke()
+    }
+
+    CachedLayer {
         id: guideCanvas
         anchors.fill: parent
         z: 100
         visible: showRightGuide && fullRightEdgePoints.length > 1
-        onPaint: {
-            var ctx = getContext('2d')
-            ctx.reset(); ctx.clearRect(0,0,width,height)
-            var pts = fullRightEdgePoints
-            if (!visible || pts.length < 2) return
-            ctx.beginPath()
-            ctx.moveTo(pts[0].x, pts[0].y)
-            for (var i = 1; i < pts.length; ++i) ctx.lineTo(pts[i].x, pts[i].y)
-            ctx.lineWidth = guideWidth
-            ctx.strokeStyle = guideColor
-            ctx.globalAlpha = 0.95
-            ctx.stroke()
-        }
+        layerName: 'water-guide'
+        paintFn: root.paintGuide
+        params: [JSON.stringify(fullRightEdgePoints), guideWidth, guideColor].join('|')
     }
 }